@@ -0,0 +1,110 @@
+// Live report of a geos_ats run, rendered from the status feed.
+// The page settings are defined in the html page: feedUrl, refreshSeconds, statusOrder and statusColors.
+// The feed is a script appended with one feedRecord call per record. It is loaded with a script tag,
+// which browsers allow for pages opened from the file system, unlike fetch.
+
+var feedCount = 0;
+var feedIndex = 0;
+var feedTests = {};
+var feedStart = null;
+var feedEnd = null;
+
+function feedRecord( record ) {
+  // The feed is read again from its start at each refresh, only the new records are applied
+  feedIndex++;
+  if ( feedIndex === 1 && feedStart && record.time !== feedStart.time ) {
+    // A new run rewrote the feed
+    feedCount = 0;
+  }
+  if ( feedIndex <= feedCount ) {
+    return;
+  }
+  feedCount = feedIndex;
+  if ( record.event === "start" ) {
+    feedStart = record;
+    feedEnd = null;
+    feedTests = {};
+    record.tests.forEach( function( t ) {
+      feedTests[ t[ 0 ] ] = { name: t[ 0 ], np: t[ 1 ], path: t[ 2 ], status: "CREATED", step: "", elapsed: 0 };
+    } );
+  } else if ( record.event === "end" ) {
+    feedEnd = record;
+  } else {
+    feedTests[ record.name ] = Object.assign( feedTests[ record.name ] || {}, record );
+  }
+}
+
+function formatElapsed( seconds ) {
+  var s = Math.round( seconds );
+  var h = Math.floor( s / 3600 );
+  var m = Math.floor( ( s % 3600 ) / 60 );
+  return ( h ? h + "h " : "" ) + ( h || m ? m + "m " : "" ) + ( s % 60 ) + "s";
+}
+
+function statusCell( status ) {
+  return "<span style=\"color: " + ( statusColors[ status ] || "black" ) + ";\">" + status + "</span>";
+}
+
+function render() {
+  var tests = Object.values( feedTests );
+  var counts = {};
+  tests.forEach( function( t ) {
+    counts[ t.status ] = ( counts[ t.status ] || 0 ) + 1;
+  } );
+
+  var info = "";
+  if ( feedStart ) {
+    info += "Started " + new Date( feedStart.time * 1000 ).toLocaleString();
+  }
+  if ( feedEnd ) {
+    info += ", finished " + new Date( feedEnd.time * 1000 ).toLocaleString();
+  } else {
+    info += ", updated " + new Date().toLocaleTimeString();
+  }
+  document.getElementById( "info" ).innerHTML = info;
+
+  var summary = "<tr><th>Status</th><th>Count</th></tr>";
+  statusOrder.forEach( function( s ) {
+    if ( counts[ s ] ) {
+      summary += "<tr><td>" + statusCell( s ) + "</td><td>" + counts[ s ] + "</td></tr>";
+    }
+  } );
+  document.getElementById( "summary" ).innerHTML = summary;
+
+  // Most severe status first, then by name
+  tests.sort( function( a, b ) {
+    return ( statusOrder.indexOf( b.status ) - statusOrder.indexOf( a.status ) ) || a.name.localeCompare( b.name );
+  } );
+  var rows = "<tr><th>Status</th><th>Name</th><th>TestStep</th><th>Elapsed</th><th>Resources</th><th>Retries</th><th>Log</th></tr>";
+  tests.forEach( function( t ) {
+    rows += "<tr><td>" + statusCell( t.status ) + "</td><td>" + t.name + "</td><td>" + ( t.step || "" ) +
+      "</td><td>" + formatElapsed( t.elapsed || 0 ) + "</td><td>" + t.np + "</td><td>" + ( t.retries || 0 ) +
+      "</td><td>" + ( t.log ? "<a href=\"" + t.log + "\">log</a>" : "" ) + "</td></tr>";
+  } );
+  document.getElementById( "tests" ).innerHTML = rows;
+}
+
+function refresh() {
+  var previous = document.getElementById( "feed" );
+  if ( previous ) {
+    previous.remove();
+  }
+  feedIndex = 0;
+  var script = document.createElement( "script" );
+  script.id = "feed";
+  // The query string prevents the browser from reusing a cached feed
+  script.src = feedUrl + "?" + Date.now();
+  script.onload = function() {
+    render();
+    if ( !feedEnd ) {
+      setTimeout( refresh, refreshSeconds * 1000 );
+    }
+  };
+  script.onerror = function() {
+    document.getElementById( "info" ).innerHTML = "Could not read " + feedUrl;
+    setTimeout( refresh, refreshSeconds * 1000 );
+  };
+  document.head.appendChild( script );
+}
+
+window.onload = refresh;
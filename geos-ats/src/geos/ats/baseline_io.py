@@ -9,6 +9,7 @@ import pathlib
 from functools import partial
 from tqdm.auto import tqdm
 from google.cloud import storage
+from geos.ats.baseline_store import BaselineStore
 
 logger = logging.getLogger( 'geos_ats' )
 tmpdir = tempfile.TemporaryDirectory()
@@ -261,6 +262,33 @@ def manage_baselines( options ):
             raise Exception(
                 f'Required information (baselines/{k}) missing from integrated test yaml file: {test_yaml}' )
 
+    # Manage baselines in a local content-addressed store
+    if options.baselineStore:
+        store = BaselineStore( options.baselineStore, jobs=options.baselineJobs )
+        if options.action in [ 'pack_baselines', 'upload_baselines' ]:
+            if not os.path.isdir( options.baselineDir ):
+                raise Exception( f'Could not find the requested baselines to pack: {options.baselineDir}' )
+            version = os.path.basename( options.baselineArchiveName )
+            if version.endswith( '.tar.gz' ):
+                version = version[ :-7 ]
+            if not version:
+                version = f'integrated_test_baseline_{int( time.time() )}'
+            store.pack( version, options.baselineDir )
+            logger.info( f'Added baseline version {version} to {store.root}' )
+
+            # Update the test config file
+            baseline_options[ 'baseline' ] = version
+            with open( test_yaml, 'w' ) as f:
+                yaml.dump( baseline_options, f )
+            quit()
+
+        store.unpack( os.path.basename( baseline_options[ 'baseline' ] ),
+                      options.baselineDir,
+                      force=options.update_baselines )
+        if options.action == 'download_baselines':
+            quit()
+        return
+
     # Manage baselines
     if options.action in [ 'pack_baselines', 'upload_baselines' ]:
         if os.path.isdir( options.baselineDir ):
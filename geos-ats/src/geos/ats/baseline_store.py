@@ -0,0 +1,268 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from geos.ats.common_utilities import atomic_write
+
+logger = logging.getLogger( 'geos_ats' )
+
+# Files are split in fixed size chunks, so that a restart file rewritten in place
+# only stores the chunks that actually changed
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Record of the baseline files present in a baseline directory
+LOCAL_MANIFEST = '.baseline_manifest.json'
+
+
+class BaselineIntegrityError( Exception ):
+    pass
+
+
+def list_files( baseline_path: str ):
+    """
+    List the baseline files, relative to the baseline directory
+
+    Args:
+        baseline_path (str): Path to the baselines
+
+    Returns:
+        list: Sorted relative file names
+    """
+    files = []
+    for root, _, fnames in os.walk( baseline_path ):
+        for fname in fnames:
+            rel = os.path.relpath( os.path.join( root, fname ), baseline_path )
+            if rel != LOCAL_MANIFEST and not fname.endswith( '.tmp' ):
+                files.append( rel.replace( os.sep, '/' ) )
+    return sorted( files )
+
+
+class BaselineStore( object ):
+    """
+    Content-addressed store of baseline versions in a local directory
+
+    Each chunk of a baseline file is stored once, compressed and named by its sha256,
+    under chunks/.  Each baseline version is a manifest under manifests/ listing the chunks
+    of its files.  Packing a new version only writes the chunks that are not in the store yet,
+    and unpacking a version only rebuilds the files that differ from the ones already unpacked.
+    """
+
+    def __init__( self, root: str, jobs: int = 0 ):
+        """
+        Args:
+            root (str): Store directory, created if required
+            jobs (int): Number of threads used to hash and unpack files (default = cpu count)
+        """
+        self.root = os.path.abspath( os.path.expanduser( root ) )
+        self.jobs = jobs if jobs > 0 else ( os.cpu_count() or 1 )
+        os.makedirs( os.path.join( self.root, 'chunks' ), exist_ok=True )
+        os.makedirs( os.path.join( self.root, 'manifests' ), exist_ok=True )
+
+    def chunk_path( self, digest: str ) -> str:
+        return os.path.join( self.root, 'chunks', digest[ :2 ], digest )
+
+    def manifest_path( self, name: str ) -> str:
+        return os.path.join( self.root, 'manifests', f'{name}.json' )
+
+    def versions( self ):
+        """
+        Returns:
+            list: Names of the baseline versions in the store
+        """
+        return sorted( f[ :-5 ] for f in os.listdir( os.path.join( self.root, 'manifests' ) ) if f.endswith( '.json' ) )
+
+    def load_manifest( self, name: str ) -> dict:
+        fname = self.manifest_path( name )
+        if not os.path.isfile( fname ):
+            raise FileNotFoundError( f'Could not find baseline version {name} in store {self.root}' )
+        with open( fname, 'r' ) as f:
+            return json.load( f )
+
+    def write_chunk( self, data: bytes ) -> str:
+        """
+        Add a chunk to the store, if it is not there yet
+
+        Returns:
+            str: Chunk digest
+        """
+        digest = hashlib.sha256( data ).hexdigest()
+        fname = self.chunk_path( digest )
+        if not os.path.isfile( fname ):
+            atomic_write( fname, zlib.compress( data, 1 ) )
+        return digest
+
+    def has_chunks( self, entry: dict ) -> bool:
+        """
+        Check that the chunks of a manifest entry are all in the store
+        """
+        return all( os.path.isfile( self.chunk_path( digest ) ) for digest in entry[ 'chunks' ] )
+
+    def read_chunk( self, digest: str ) -> bytes:
+        """
+        Read a chunk from the store, checking its contents against its digest
+        """
+        fname = self.chunk_path( digest )
+        try:
+            with open( fname, 'rb' ) as f:
+                data = zlib.decompress( f.read() )
+        except ( OSError, zlib.error ) as e:
+            raise BaselineIntegrityError( f'Could not read baseline chunk {digest}: {e}' ) from e
+        if hashlib.sha256( data ).hexdigest() != digest:
+            raise BaselineIntegrityError( f'Corrupted baseline chunk: {fname}' )
+        return data
+
+    def pack_file( self, fname: str ) -> dict:
+        """
+        Split a file into chunks and add them to the store
+
+        Returns:
+            dict: Manifest entry of the file
+        """
+        chunks = []
+        with open( fname, 'rb' ) as f:
+            while True:
+                data = f.read( CHUNK_SIZE )
+                if not data:
+                    break
+                chunks.append( self.write_chunk( data ) )
+        stat = os.stat( fname )
+        return { 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'mode': stat.st_mode & 0o777, 'chunks': chunks }
+
+    def unpack_file( self, entry: dict, fname: str ) -> dict:
+        """
+        Rebuild a file from its chunks
+
+        Returns:
+            dict: Local manifest entry of the file
+        """
+        dirname = os.path.dirname( fname )
+        os.makedirs( dirname, exist_ok=True )
+        fd, tmp_name = tempfile.mkstemp( dir=dirname, suffix='.tmp' )
+        try:
+            with os.fdopen( fd, 'wb' ) as f:
+                for digest in entry[ 'chunks' ]:
+                    f.write( self.read_chunk( digest ) )
+            if os.path.getsize( tmp_name ) != entry[ 'size' ]:
+                raise BaselineIntegrityError( f'Unexpected size for baseline file: {fname}' )
+            os.chmod( tmp_name, entry[ 'mode' ] )
+            os.replace( tmp_name, fname )
+        except BaseException:
+            if os.path.exists( tmp_name ):
+                os.remove( tmp_name )
+            raise
+        return dict( entry, mtime_ns=os.stat( fname ).st_mtime_ns )
+
+    def pack( self, name: str, baseline_path: str ) -> dict:
+        """
+        Add the contents of a baseline directory to the store as a new version
+
+        Files whose size and modification time match the last pack or unpack of the
+        directory with this store are not read again, as long as their chunks are still
+        in the store.
+
+        Args:
+            name (str): Name of the baseline version
+            baseline_path (str): Path to the baselines
+
+        Returns:
+            dict: Manifest of the version
+        """
+        baseline_path = os.path.abspath( os.path.expanduser( baseline_path ) )
+        local = read_local_manifest( baseline_path )
+        known = local.get( 'files', {} ) if local.get( 'store' ) == self.root else {}
+
+        files = {}
+        changed = []
+        for rel in list_files( baseline_path ):
+            entry = known.get( rel )
+            stat = os.stat( os.path.join( baseline_path, rel ) )
+            if ( entry and entry[ 'size' ] == stat.st_size and entry[ 'mtime_ns' ] == stat.st_mtime_ns
+                 and self.has_chunks( entry ) ):
+                files[ rel ] = entry
+            else:
+                changed.append( rel )
+
+        logger.info(
+            f'Packing {len( changed )} new or modified baseline files (out of {len( files ) + len( changed )})' )
+        with ThreadPoolExecutor( max_workers=self.jobs ) as executor:
+            entries = executor.map( lambda rel: self.pack_file( os.path.join( baseline_path, rel ) ), changed )
+            files.update( zip( changed, entries ) )
+
+        manifest = { 'name': name, 'files': dict( sorted( files.items() ) ) }
+        atomic_write( self.manifest_path( name ), json.dumps( manifest, indent=1 ).encode() )
+        write_local_manifest( baseline_path, dict( manifest, store=self.root ) )
+        return manifest
+
+    def unpack( self, name: str, baseline_path: str, force: bool = False ) -> dict:
+        """
+        Update a baseline directory to a version of the store
+
+        Only the files that are missing, modified or different in the requested version are
+        rebuilt, in parallel, and every chunk is checked against its digest.  Files of the
+        previously unpacked version that are not part of the requested one are removed.
+
+        Args:
+            name (str): Name of the baseline version
+            baseline_path (str): Path to unpack the baselines
+            force (bool): Rebuild every file, even if it looks up to date
+
+        Returns:
+            dict: Manifest of the version
+        """
+        baseline_path = os.path.abspath( os.path.expanduser( baseline_path ) )
+        manifest = self.load_manifest( name )
+        local = {} if force else read_local_manifest( baseline_path ).get( 'files', {} )
+
+        files = {}
+        changed = []
+        for rel, entry in manifest[ 'files' ].items():
+            known = local.get( rel )
+            fname = os.path.join( baseline_path, rel )
+            if known and known[ 'chunks' ] == entry[ 'chunks' ] and os.path.isfile( fname ):
+                stat = os.stat( fname )
+                if known[ 'size' ] == stat.st_size and known[ 'mtime_ns' ] == stat.st_mtime_ns:
+                    files[ rel ] = known
+                    continue
+            changed.append( rel )
+
+        for rel in set( local ) - set( manifest[ 'files' ] ):
+            fname = os.path.join( baseline_path, rel )
+            if os.path.isfile( fname ):
+                os.remove( fname )
+
+        logger.info( f'Unpacking {len( changed )} baseline files (out of {len( manifest[ "files" ] )})' )
+        with ThreadPoolExecutor( max_workers=self.jobs ) as executor:
+            entries = executor.map(
+                lambda rel: self.unpack_file( manifest[ 'files' ][ rel ], os.path.join( baseline_path, rel ) ),
+                changed )
+            files.update( zip( changed, entries ) )
+
+        write_local_manifest( baseline_path, {
+            'name': name,
+            'store': self.root,
+            'files': dict( sorted( files.items() ) )
+        } )
+        return manifest
+
+
+def read_local_manifest( baseline_path: str ) -> dict:
+    """
+    Read the record of the baseline files present in a directory, if any
+    """
+    fname = os.path.join( baseline_path, LOCAL_MANIFEST )
+    if not os.path.isfile( fname ):
+        return {}
+    try:
+        with open( fname, 'r' ) as f:
+            return json.load( f )
+    except ( OSError, ValueError ) as e:
+        logger.warning( f'Ignoring unreadable baseline manifest {fname}: {e}' )
+        return {}
+
+
+def write_local_manifest( baseline_path: str, manifest: dict ):
+    os.makedirs( baseline_path, exist_ok=True )
+    atomic_write( os.path.join( baseline_path, LOCAL_MANIFEST ), json.dumps( manifest, indent=1 ).encode() )
@@ -50,6 +50,14 @@ def build_command_line_parser():
 
     parser.add_argument( "--baselineArchiveName", type=str, help="Baseline archive name", default='' )
     parser.add_argument( "--baselineCacheDirectory", type=str, help="Baseline cache directory", default='' )
+    parser.add_argument( "--baselineStore",
+                         type=str,
+                         help="Local content-addressed baseline store, used instead of the archives",
+                         default='' )
+    parser.add_argument( "--baselineJobs",
+                         type=int,
+                         help="Number of threads used to pack and unpack baselines in the store",
+                         default=0 )
 
     parser.add_argument( "-d",
                          "--delete-old-baselines",
@@ -113,6 +121,16 @@ def build_command_line_parser():
 
     parser.add_argument( "-n", "-N", "--numNodes", type=int, default="2" )
 
+    parser.add_argument( "--changed-files",
+                         nargs='*',
+                         default=[],
+                         help="Only run the tests whose deck depends on one of these files (xml, mesh, table)" )
+
+    parser.add_argument( "--changed-blocks",
+                         nargs='*',
+                         default=[],
+                         help="Only run the tests whose deck uses one of these block types" )
+
     return parser
 
 
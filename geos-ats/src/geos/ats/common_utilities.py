@@ -5,6 +5,7 @@ import os
 import shutil
 import subprocess
 import logging
+import tempfile
 
 ################################################################################
 #  Common code for displaying information to the user.
@@ -12,6 +13,10 @@ import logging
 
 logger = logging.getLogger( 'geos-ats' )
 
+# The umask of the process, read once since it can only be read by changing it
+_UMASK = os.umask( 0 )
+os.umask( _UMASK )
+
 
 def Error( msg ):
     raise RuntimeError( "Error: %s" % msg )
@@ -252,3 +257,28 @@ def removeLogDirectories( dir ):
             pointsto = os.path.realpath( ff )
             if pointsto in deldir:
                 os.remove( ff )
+
+
+def atomic_write( fname, data ):
+    """
+    Write a file, replacing any previous version at once
+
+    The file gets the permissions of a file created with open, set by the umask,
+    instead of the private ones of the temporary file, so that shared files stay readable.
+
+    Args:
+        fname (str): Target file name
+        data (str | bytes): File contents
+    """
+    dirname = os.path.dirname( os.path.abspath( fname ) )
+    os.makedirs( dirname, exist_ok=True )
+    fd, tmp_name = tempfile.mkstemp( dir=dirname, suffix='.tmp' )
+    try:
+        with os.fdopen( fd, 'wb' if isinstance( data, bytes ) else 'w' ) as f:
+            f.write( data )
+        os.chmod( tmp_name, 0o666 & ~_UMASK )
+        os.replace( tmp_name, fname )
+    except BaseException:
+        if os.path.exists( tmp_name ):
+            os.remove( tmp_name )
+        raise
@@ -184,7 +184,8 @@ def initializeConfig( configFile, configOverride, options ):
     # reporting
     config.add( "report_html", bool, True, "True if HTML formatted results will be generated with the report action" )
     config.add( "report_html_file", str, "test_results.html", "Location to write the html report" )
-    config.add( "report_html_periodic", bool, True, "True to update the html file during the periodic reports" )
+    config.add( "report_html_periodic", bool, True,
+                "True to update the live html report (<report_html_file>_live.html) as the tests end" )
     config.add( "browser_command", str, "firefox -no-remote",
                 "Command to use to launch a browser to view html results" )
     config.add( "browser", bool, False, "If True, then launch the browser_command to view the report_html_file" )
@@ -199,6 +200,13 @@ def initializeConfig( configFile, configOverride, options ):
 
     config.add( "report_notations", type( [] ), [], "Lines of text that are inserted into the reports." )
 
+    config.add(
+        "run_history_file", str, "",
+        "Location of the database where the results of every run are appended (e.g. test_history.sqlite)."
+        " If empty, no history is recorded" )
+    config.add( "report_trend_runs", int, 20,
+                "Number of previous runs shown in the trend of each test in html reports" )
+
     config.add( "report_notbuilt_regexp", str, "(not built into this version)",
                 "Regular expression that must appear in output to indicate that feature is not built." )
 
@@ -209,8 +217,12 @@ def initializeConfig( configFile, configOverride, options ):
                 "Regular expression to not ignore in all checkmessages steps." )
 
     # timing and priority
-    config.add( "priority", str, "equal", "Method of prioritization of tests: [\"equal\", \"processors\",\"timing\"]" )
+    config.add( "priority", str, "equal",
+                "Method of prioritization of tests: [\"equal\", \"processors\",\"timing\",\"packing\"]" )
     config.add( "timing_file", str, "timing.txt", "Location of timing file" )
+    config.add( "timing_history_file", str, "",
+                "Location of the runtimes of the tests learned from the previous runs, not learned if empty" )
+    config.add( "timing_history_size", int, 5, "Number of previous runtimes used to predict the runtime of a test" )
 
     # batch
     config.add( "batch_dryrun", bool, False,
@@ -222,11 +234,29 @@ def initializeConfig( configFile, configOverride, options ):
     config.add( "batch_queue", str, "pbatch", "the batch queue." )
     config.add( "batch_header", type( [] ), [], "Additional lines to add to the batch header" )
 
+    # check steps
+    config.add(
+        "check_pool_cores", int, 0, "Number of cores reserved to the check steps within the processors of the machine,"
+        " which the simulations then do not use. The check steps then do not wait for the processors used by the"
+        " simulations. If 0, the check steps share the processors of the simulations." )
+    config.add(
+        "check_pool_memory", float, 0.0, "Maximum memory (GB) used by the check steps running at once, estimated"
+        " from the size of the files they compare. If 0, half of the physical memory is used." )
+
     # retry
     config.add( "max_retry", int, 2, "Maximum number of times to retry failed runs." )
     config.add( "retry_err_regexp", str,
                 "(launch failed|Failure in initializing endpoint|channel initialization failed)",
                 "Regular expression that must appear in error log in order to retry." )
+    config.add( "retry_max_timeout", int, 0, "Maximum number of times to retry runs that timed out." )
+    config.add( "retry_max_segfault", int, 0, "Maximum number of times to retry runs that crashed." )
+    config.add( "retry_backoff", float, 10.0,
+                "Seconds to wait before the first retry of a test, doubled at each retry of the same failure." )
+    config.add(
+        "retry_quarantine_flakiness", float, 0.3, "Tests whose rate of changes between passing and failing in the"
+        " run history reaches this value are quarantined: their failures are not retried, and are reported with the"
+        " QUARANTINED status in the reports and the log, apart from the other failures. If 0, no test is quarantined." )
+    config.add( "retry_quarantine_window", int, 20, "Number of previous runs used to find the flaky tests." )
 
     # timeout
     config.add( "default_timelimit", str, "30m",
@@ -345,6 +375,8 @@ def initializeConfig( configFile, configOverride, options ):
         config.priority = "processors"
     elif config.priority.lower().startswith( "tim" ):
         config.priority = "timing"
+    elif config.priority.lower().startswith( "pack" ):
+        config.priority = "packing"
     else:
         Error( "priority '%s' is not valid" % config.priority )
 
@@ -0,0 +1,86 @@
+import os
+import re
+import stat
+import time
+from dataclasses import dataclass, field
+
+# Listings made within this delay of the last change of a directory could miss a file created
+# during the same tick of a coarse modification time, they are not trusted.
+MTIME_GRANULARITY_NS = 1000000000
+
+
+@dataclass
+class DirectoryListing:
+    mtime_ns: int
+    racy: bool
+    names: tuple
+    max_matches: dict = field( default_factory=dict )
+
+
+class DirectoryIndex( object ):
+    """Cached listings of the directories searched by the test steps.
+
+    Each directory is listed once with os.scandir, and the listing is reused for every pattern
+    searched in it while the modification time of the directory is unchanged.  A query then
+    costs a single stat of the directory instead of a listing, which matters on parallel
+    filesystems where the metadata operations are slow.
+    """
+
+    def __init__( self ):
+        self.listings = {}
+
+    def clear( self ):
+        self.listings = {}
+
+    def listing( self, directory ):
+        """Get the up to date listing of a directory, or None if it is not a directory."""
+        key = os.path.abspath( directory )
+        try:
+            status = os.stat( key )
+        except OSError:
+            status = None
+        if status is None or not stat.S_ISDIR( status.st_mode ):
+            self.listings.pop( key, None )
+            return None
+
+        mtime_ns = status.st_mtime_ns
+        listing = self.listings.get( key )
+        if listing is None or listing.racy or listing.mtime_ns != mtime_ns:
+            scan_time_ns = time.time_ns()
+            try:
+                with os.scandir( key ) as entries:
+                    names = tuple( entry.name for entry in entries )
+            except OSError:
+                self.listings.pop( key, None )
+                return None
+            listing = DirectoryListing( mtime_ns, scan_time_ns - mtime_ns < MTIME_GRANULARITY_NS, names )
+            self.listings[ key ] = listing
+        return listing
+
+    def find_max_matching_file( self, file_path ):
+        """Find the greatest name in the directory of FILE_PATH matching its base name as a regular expression.
+
+        Returns:
+            str: The path of the match in the directory of FILE_PATH, or None if no match is found.
+        """
+        file_directory, pattern = os.path.split( file_path )
+        if file_directory == "":
+            file_directory = "."
+
+        listing = self.listing( file_directory )
+        if listing is None:
+            return None
+
+        if pattern not in listing.max_matches:
+            regex = re.compile( pattern )
+            listing.max_matches[ pattern ] = max( ( name for name in listing.names if regex.match( name ) ),
+                                                  default=None )
+        max_match = listing.max_matches[ pattern ]
+        if max_match is None:
+            return None
+
+        return os.path.join( file_directory, max_match )
+
+
+# The global directory index
+directory_index = DirectoryIndex()
@@ -4,39 +4,39 @@ import logging
 logger = logging.getLogger( 'geos-ats' )
 
 
-def permuteArray( data, shape, permutation ):
+def checkLayout( data, shape, permutation ):
+    """Check that the flat DATA can be laid out with the given SHAPE and PERMUTATION, return an error message if not."""
     if len( shape.shape ) != 1:
-        msg = "The shape must be a 1D array, not %s" % len( shape.shape )
-        return None, msg
+        return "The shape must be a 1D array, not %s" % len( shape.shape )
 
     if len( permutation.shape ) != 1:
-        msg = "The permutation must be a 1D array, not %s" % len( permutation.shape )
-        return None, msg
+        return "The permutation must be a 1D array, not %s" % len( permutation.shape )
 
     if shape.size != permutation.size:
-        msg = "The shape and permutation arrays must have the same length. %s != %s" % ( shape.size, permutation.size )
-        return None, msg
+        return "The shape and permutation arrays must have the same length. %s != %s" % ( shape.size, permutation.size )
 
     if np.prod( shape ) != data.size:
-        msg = "The shape is %s which yields a total size of %s but the real size is %s." % ( shape, np.prod( shape ),
-                                                                                             data.size )
-        return None, msg
+        return "The shape is %s which yields a total size of %s but the real size is %s." % ( shape, np.prod( shape ),
+                                                                                              data.size )
 
     if np.any( np.sort( permutation ) != np.arange( shape.size ) ):
-        msg = "The permutation is not valid: %s" % permutation
-        return None, msg
+        return "The permutation is not valid: %s" % permutation
+
+    return None
+
 
-    shape_in_memory = np.empty_like( shape )
-    for i in range( shape.size ):
-        shape_in_memory[ i ] = shape[ permutation[ i ] ]
+def memoryView( data, shape, permutation ):
+    """View the flat DATA with its dimensions in memory order: the i-th axis is the dimension PERMUTATION[ i ]."""
+    return data.reshape( shape[ permutation ] )
 
-    data = data.reshape( shape_in_memory )
 
-    reverse_permutation = np.empty_like( permutation )
-    for i in range( permutation.size ):
-        reverse_permutation[ permutation[ i ] ] = i
+def permuteArray( data, shape, permutation ):
+    msg = checkLayout( data, shape, permutation )
+    if msg is not None:
+        return None, msg
 
-    data = np.transpose( data, reverse_permutation )
+    # A strided view of the data, nothing is copied
+    data = np.transpose( memoryView( data, shape, permutation ), np.argsort( permutation ) )
     if np.any( data.shape != shape ):
         msg = "Reshaping failed. Shape is %s but should be %s" % ( data.shape, shape )
         return None, msg
@@ -44,6 +44,30 @@ def permuteArray( data, shape, permutation ):
     return data, None
 
 
+def alignLayouts( data, permutation, base_data, shape, base_permutation ):
+    """
+    View two arrays of the same SHAPE but possibly different permutations in the memory order of the baseline.
+
+    When the permutations match both arrays are plain views of their contiguous data, otherwise DATA is a
+    strided view, so that the arrays can be compared block by block without copying either of them.
+    The layouts must have been validated with checkLayout.
+
+    Returns the two views and a function mapping an index in the views to the index in the SHAPE order.
+    """
+    base_values = memoryView( base_data, shape, base_permutation )
+    values = memoryView( data, shape, permutation )
+    if np.any( permutation != base_permutation ):
+        values = np.transpose( values, np.argsort( permutation )[ base_permutation ] )
+
+    def logicalIndex( index ):
+        logical = [ 0 ] * len( index )
+        for axis, dimension in enumerate( base_permutation ):
+            logical[ dimension ] = index[ axis ]
+        return tuple( logical )
+
+    return values, base_values, logicalIndex
+
+
 if __name__ == "__main__":
 
     def testPermuteArray( shape, permutation ):
@@ -54,6 +78,17 @@ if __name__ == "__main__":
         assert ( error_msg is None )
         assert ( np.all( original_data == reshaped_data ) )
 
+    def testAlignLayouts( shape, permutation, base_permutation ):
+        original_data = np.arange( np.prod( shape ) ).reshape( shape )
+        data = original_data.transpose( permutation ).flatten()
+        base_data = original_data.transpose( base_permutation ).flatten()
+
+        values, base_values, logicalIndex = alignLayouts( data, permutation, base_data, shape, base_permutation )
+        assert ( np.all( values == base_values ) )
+        assert ( np.shares_memory( values, data ) and np.shares_memory( base_values, base_data ) )
+        index = tuple( ( axis + 1 ) % n for axis, n in enumerate( base_values.shape ) )
+        assert ( original_data[ logicalIndex( index ) ] == base_values[ index ] )
+
     testPermuteArray( np.array( [ 2, 3 ] ), np.array( [ 0, 1 ] ) )
     testPermuteArray( np.array( [ 2, 3 ] ), np.array( [ 1, 0 ] ) )
 
@@ -88,4 +123,9 @@ if __name__ == "__main__":
     testPermuteArray( np.array( [ 2, 3, 4, 5 ] ), np.array( [ 3, 2, 0, 1 ] ) )
     testPermuteArray( np.array( [ 2, 3, 4, 5 ] ), np.array( [ 3, 1, 2, 0 ] ) )
     testPermuteArray( np.array( [ 2, 3, 4, 5 ] ), np.array( [ 3, 2, 1, 0 ] ) )
+
+    testAlignLayouts( np.array( [ 2, 3, 4 ] ), np.array( [ 0, 1, 2 ] ), np.array( [ 0, 1, 2 ] ) )
+    testAlignLayouts( np.array( [ 2, 3, 4 ] ), np.array( [ 2, 0, 1 ] ), np.array( [ 0, 1, 2 ] ) )
+    testAlignLayouts( np.array( [ 2, 3, 4 ] ), np.array( [ 1, 2, 0 ] ), np.array( [ 2, 1, 0 ] ) )
+    testAlignLayouts( np.array( [ 2, 3, 4, 5 ] ), np.array( [ 3, 1, 0, 2 ] ), np.array( [ 1, 3, 2, 0 ] ) )
     logger.info( "Success" )
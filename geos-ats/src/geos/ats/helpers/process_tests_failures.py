@@ -8,6 +8,9 @@ import platform
 import shutil
 import logging
 import glob
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 logging.basicConfig( level=logging.INFO, format="%(levelname)s: %(message)s" )
 
@@ -23,98 +26,158 @@ def findFiles( folder, extension ):
     return glob.glob( os.path.join( folder, "**", pattern ), recursive=True )
 
 
-def find_error_indices( lines, matchStrings ):
+# What strings to look for in order to flag a line/block for output
+ERROR_STRINGS = [ 'Error:' ]
+
+# Line closing an error block
+BLOCK_END_STRING = '******************************************************************************'
+
+# Lines longer than this are truncated while reading, to bound the memory used per file
+MAX_LINE_LENGTH = 4096
+
+# Variable parts of an error message, removed from its signature
+SIGNATURE_PATTERNS = [ ( re.compile( r'(?:[\w.\-~]*/)+[\w.\-]*' ), '<path>' ),
+                       ( re.compile( r'0x[0-9a-fA-F]+' ), '<hex>' ),
+                       ( re.compile( r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?' ), '<n>' ),
+                       ( re.compile( r'\s+' ), ' ' ) ]
+
+
+def compile_any( strings ):
     """
-    Returns a list of indices where all `matchStrings` appear in the line.
+    Compile a regex matching any of the given literal strings, or None if there are none.
     """
-    indices = []
-    for idx, line in enumerate( lines ):
-        if all( matchString in line for matchString in matchStrings ):
-            indices.append( idx )
-    return indices
+    if not strings:
+        return None
+    return re.compile( '|'.join( re.escape( s ) for s in sorted( set( strings ), key=len, reverse=True ) ) )
 
 
-def process_error_blocks( lines, indices, numTrailingLines ):
+def error_signature( block_lines ):
     """
-    For each index in `indices`, collect the line itself plus a few trailing lines.
-    Returns a list of match blocks (strings).
+    Normalize the lines of an error block so that the same failure in different tests,
+    at different times or on different ranks has the same signature.
     """
-    match_blocks = []
-    for idx in indices:
-        # Prepare the current match block
-        match_block = []
-
-        # Safely get the previous line if idx > 0
-        if idx > 0:
-            match_block.append( '  ' + lines[ idx - 1 ] )
-
-        # Current line
-        match_block.append( '  ' + lines[ idx ] )
-
-        # Trailing lines
-        for j in range( 1, numTrailingLines + 1 ):
-            if idx + j >= len( lines ):
-                match_block.append(
-                    '  ***** No closing line. File truncated? Filters may not be properly applied! *****' )
-                break
-            match_block.append( '  ' + lines[ idx + j ] )
+    signature = ' | '.join( line.strip() for line in block_lines if line.strip() and BLOCK_END_STRING not in line )
+    for pattern, replacement in SIGNATURE_PATTERNS:
+        signature = pattern.sub( replacement, signature )
+    return signature.strip()
 
-            # If we see a "stop" condition, break out of the trailing loop
-            if '******************************************************************************' in lines[ idx + j ]:
-                break
 
-        # Convert match_block to a single string
-        match_blocks.append( '\n'.join( match_block ) )
+def scan_log_file( fileName, errorPattern, exclusionPattern, numTrailingLines ):
+    """
+    Stream a log file and collect the block of text around each error.
 
-    return match_blocks
+    A block holds the line before the error, the error line, and up to `numTrailingLines`
+    following lines, stopping at a line of stars.  Only the blocks still open are kept in memory.
 
+    Returns:
+        tuple: file name, number of matched blocks, and the (text, signature) of the blocks
+        that were not excluded
+    """
+    finished = []
+    active = []
+    previous = None
+    with open( fileName, errors='replace' ) as f:
+        while True:
+            line = f.readline( MAX_LINE_LENGTH )
+            if not line:
+                break
+            if not line.endswith( '\n' ):
+                # Skip the end of a truncated long line
+                while True:
+                    rest = f.readline( MAX_LINE_LENGTH )
+                    if not rest or rest.endswith( '\n' ):
+                        break
+            line = line.rstrip( '\r\n' )
+
+            # Extend the open blocks with their trailing lines
+            still_active = []
+            for block in active:
+                block[ 'lines' ].append( line )
+                block[ 'remaining' ] -= 1
+                if block[ 'remaining' ] == 0 or BLOCK_END_STRING in line:
+                    finished.append( block )
+                else:
+                    still_active.append( block )
+            active = still_active
+
+            if errorPattern.search( line ):
+                block = { 'lines': [ line ], 'context': previous, 'remaining': numTrailingLines }
+                if numTrailingLines > 0:
+                    active.append( block )
+                else:
+                    finished.append( block )
+            previous = line
+
+    for block in active:
+        block[ 'truncated' ] = True
+        finished.append( block )
+
+    included = []
+    for block in finished:
+        text_lines = [ block[ 'context' ] ] if block[ 'context' ] is not None else []
+        text_lines += block[ 'lines' ]
+        if block.get( 'truncated' ):
+            text_lines.append( '***** No closing line. File truncated? Filters may not be properly applied! *****' )
+        text = '\n'.join( '  ' + line for line in text_lines )
+        if exclusionPattern is None or not exclusionPattern.search( text ):
+            included.append( ( text, error_signature( block[ 'lines' ] ) ) )
+
+    return fileName, len( finished ), included
+
+
+def cluster_errors( results ):
+    """
+    Group the error blocks by signature.
 
-def parse_logs_and_filter_errors( directory, extension, exclusionStrings, numTrailingLines ):
+    Returns:
+        list: (signature, number of occurrences, affected tests, example block), most widespread first
+    """
+    clusters = {}
+    for fileName, _, blocks in results:
+        test = os.path.splitext( os.path.basename( fileName ) )[ 0 ]
+        for text, signature in blocks:
+            if signature not in clusters:
+                clusters[ signature ] = [ 0, set(), text ]
+            clusters[ signature ][ 0 ] += 1
+            clusters[ signature ][ 1 ].add( test )
+    ranked = [ ( signature, count, sorted( tests ), example )
+               for signature, ( count, tests, example ) in clusters.items() ]
+    ranked.sort( key=lambda c: ( -len( c[ 2 ] ), -c[ 1 ], c[ 0 ] ) )
+    return ranked
+
+
+def parse_logs_and_filter_errors( directory, extension, exclusionStrings, numTrailingLines, jobs=0 ):
     """
-    Returns a list of indices where all `matchStrings` appear in the line.
+    Scan the log files of a directory for errors, in parallel, and report the blocks that
+    were not excluded, grouped by failure mode.
     """
-    # What strings to look for in order to flag a line/block for output
-    errorStrings = [ 'Error:' ]
+    errorPattern = compile_any( ERROR_STRINGS )
+    exclusionPattern = compile_any( exclusionStrings )
+    fileNames = findFiles( directory, extension )
+    jobs = jobs if jobs > 0 else ( os.cpu_count() or 1 )
+
+    scan = partial( scan_log_file,
+                    errorPattern=errorPattern,
+                    exclusionPattern=exclusionPattern,
+                    numTrailingLines=numTrailingLines )
+    if jobs == 1 or len( fileNames ) < 2:
+        results = [ scan( fileName ) for fileName in fileNames ]
+    else:
+        with ProcessPoolExecutor( max_workers=min( jobs, len( fileNames ) ) ) as executor:
+            results = list( executor.map( scan, fileNames, chunksize=max( 1, len( fileNames ) // ( 4 * jobs ) ) ) )
 
     unfilteredErrors = {}
-    total_files_processed = 0
     files_with_excluded_errors = []
-
-    for fileName in findFiles( directory, extension ):
-        total_files_processed += 1
-        errors = ''
-
-        # Count how many blocks we matched and how many blocks we ended up including
-        matched_block_count = 0
-        included_block_count = 0
-
-        with open( fileName ) as f:
-            lines = f.readlines()
-
-            # 1. Find the indices where the errorStrings are found
-            indices = find_error_indices( lines, errorStrings )
-
-            # 2. Extract the block of text associated with each error.
-            matchBlock = process_error_blocks( lines, indices, numTrailingLines )
-
-            for block in matchBlock:
-                # if none of the exclusions appear in this block
-                matched_block_count += 1
-                if not any( excludeString in block for excludeString in exclusionStrings ):
-                    # ... then add it to `errors`
-                    included_block_count += 1
-                    errors += block + "\n"
-
-        # If at least 1 block was matched, and not all of them ended up in 'included_block_count'
+    for fileName, matched_block_count, blocks in results:
+        # If at least 1 block was matched, and not all of them were included
         # it means at least one block was excluded.
-        if matched_block_count > 0 and included_block_count < matched_block_count:
+        if matched_block_count > 0 and len( blocks ) < matched_block_count:
             files_with_excluded_errors.append( fileName )
-
-        if errors:
-            unfilteredErrors[ fileName ] = errors
+        if blocks:
+            unfilteredErrors[ fileName ] = ''.join( text + "\n" for text, _ in blocks )
 
     # --- Logging / Output ---
-    logging.info( f"Total number of log files processed: {total_files_processed}\n" )
+    logging.info( f"Total number of log files processed: {len( fileNames )}\n" )
 
     # Unfiltered errors
     if unfilteredErrors:
@@ -131,6 +194,18 @@ def parse_logs_and_filter_errors( directory, extension, exclusionStrings, numTra
         excluded_files_text = "\n".join( files_with_excluded_errors_basename )
         logging.info( f"The following file(s) had at least one error block that was filtered:\n{excluded_files_text}" )
 
+    # Distinct failure modes
+    clusters = cluster_errors( results )
+    if clusters:
+        summary = [ f"Distinct failure modes: {len( clusters )}" ]
+        for ii, ( signature, count, tests, example ) in enumerate( clusters ):
+            summary.append( f"\n{ii + 1}. {len( tests )} test(s), {count} occurrence(s): {signature}" )
+            summary.append( f"  Tests: {', '.join( tests )}" )
+            summary.append( f"  Example:\n{example}" )
+        logging.warning( "\n".join( summary ) )
+
+    return clusters
+
 
 def main():
 
@@ -161,6 +236,12 @@ def main():
                          default=[],
                          help='What stings to look for in order to exclude a block' )
 
+    parser.add_argument( '-j',
+                         '--jobs',
+                         type=int,
+                         default=0,
+                         help='number of processes used to scan the files (default = cpu count)' )
+
     args, unknown_args = parser.parse_known_args()
 
     if unknown_args:
@@ -168,7 +249,7 @@ def main():
 
     exclusionStrings = DEFAULT_EXCLUSION_STRINGS + args.exclusionStrings
     logging.info( f"exclusionStrings: {exclusionStrings}\n" )
-    parse_logs_and_filter_errors( args.directory, args.extension, exclusionStrings, args.numTrailingLines )
+    parse_logs_and_filter_errors( args.directory, args.extension, exclusionStrings, args.numTrailingLines, args.jobs )
 
 
 if __name__ == '__main__':
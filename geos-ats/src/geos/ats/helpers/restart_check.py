@@ -10,17 +10,86 @@ import time
 import string
 from pathlib import Path
 try:
-    from geos.ats.helpers.permute_array import permuteArray  # type: ignore[import]
+    from geos.ats.helpers.permute_array import alignLayouts, checkLayout  # type: ignore[import]
 except ImportError:
     # Fallback method to be used if geos-ats isn't found
-    from permute_array import permuteArray  # type: ignore[import]
+    from permute_array import alignLayouts, checkLayout  # type: ignore[import]
 
 RTOL_DEFAULT = 0.0
 ATOL_DEFAULT = 0.0
 EXCLUDE_DEFAULT = [ ".*/commandLine", ".*/schema$", ".*/globalToLocalMap", ".*/timeHistoryOutput.*/restart" ]
+# Number of values compared at once, which bounds the size of the temporary arrays
+COMPARISON_BLOCK_SIZE = 1 << 20
 logger = logging.getLogger( 'geos-ats' )
 
 
+def arrayBlocks( arr, base_arr ):
+    """
+    Iterate over matching blocks of two arrays of the same shape, split along their first axis.
+
+    ARR [in]: The array or hdf5 Dataset to compare.
+    BASE_ARR [in]: The array or hdf5 Dataset to compare against.
+
+    Yields the flat index of the start of the blocks and the two blocks.
+    """
+    row_size = int( np.prod( arr.shape[ 1: ] ) )
+    rows = max( 1, COMPARISON_BLOCK_SIZE // max( row_size, 1 ) )
+    for start in range( 0, arr.shape[ 0 ], rows ):
+        yield start * row_size, np.asarray( arr[ start:start + rows ] ), np.asarray( base_arr[ start:start + rows ] )
+
+
+class RunningMax( object ):
+    """
+    Maximum of an array computed block by block, with the flat index of its first occurrence.
+    As with np.argmax, a nan is the maximum.
+    """
+
+    def __init__( self ):
+        self.value = None
+        self.index = 0
+
+    def update( self, block, offset ):
+        i = int( np.argmax( block ) )
+        value = block.flat[ i ]
+        if self.value is None or ( not np.isnan( self.value ) and ( np.isnan( value ) or value > self.value ) ):
+            self.value = value
+            self.index = offset + i
+
+
+class RunningStatistics( object ):
+    """
+    Count, maximum, mean and standard deviation of a subset of the values of an array, computed block by block.
+    The mean and the sum of the squared deviations of each block are merged with those of the previous blocks
+    (Chan et al.), which does not lose precision when the standard deviation is small compared to the mean.
+    """
+
+    def __init__( self ):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.max = RunningMax()
+
+    def update( self, block, selected, offset ):
+        self.max.update( np.where( selected, block, 0 ), offset )
+        values = np.asarray( block[ selected ], dtype=np.float64 )
+        if values.size == 0:
+            return
+        block_mean = np.mean( values )
+        block_m2 = np.sum( np.square( values - block_mean ) )
+        count = self.count + values.size
+        delta = block_mean - self.mean
+        self.mean += delta * values.size / count
+        self.m2 += block_m2 + delta * delta * self.count * values.size / count
+        self.count = count
+
+    def meanStd( self, size ):
+        """Mean and standard deviation over SIZE values, the values that are not selected being zero."""
+        # merge the selected values with the SIZE - COUNT zeros
+        mean = self.mean * self.count / size
+        m2 = self.m2 + self.mean * self.mean * self.count * ( size - self.count ) / size
+        return mean, np.sqrt( m2 / size )
+
+
 def write( output, msg ):
     """
     Write MSG to both stdout and OUTPUT.
@@ -228,7 +297,7 @@ class FileComparison( object ):
             msg = "Scalar values of types %s and %s differ: %s, %s.\n" % ( val.dtype, base_val.dtype, val, base_val )
             self.errorMsg( path, msg, True )
 
-    def compareFloatArrays( self, path, arr, base_arr ):
+    def compareFloatArrays( self, path, arr, base_arr, index_map=None ):
         """
         Compares two arrays ARR and BASEARR of floating point values.
         Entries x1 and x2 are  considered equal iff:
@@ -253,13 +322,17 @@ class FileComparison( object ):
         entries is greater than 1.0 then the arrays are considered
         different and an error message is produced.
 
+        The arrays are compared block by block, so that only temporary
+        arrays of the size of a block are created.
+
         PATH [in]: The path at which the comparison takes place.
         ARR [in]: The hdf5 Dataset to compare.
         BASE_ARR [in]: The hdf5 Dataset to compare against.
+        INDEX_MAP [in]: Function mapping the indices of the arrays to the reported ones.
         """
         # If we have zero tolerance then just call the compareIntArrays function.
         if self.rtol == 0.0 and self.atol == 0.0:
-            return self.compareIntArrays( path, arr, base_arr )
+            return self.compareIntArrays( path, arr, base_arr, index_map )
 
         # If the shapes are different they can't be compared.
         if arr.shape != base_arr.shape:
@@ -268,17 +341,55 @@ class FileComparison( object ):
             self.errorMsg( path, msg, True )
             return
 
-        # First create a copy of the data in the datasets.
-        arr_cpy = np.copy( arr )
-        base_arr_cpy = np.copy( base_arr )
+        max_absolute = RunningMax()
+        max_relative = RunningMax()
+        max_q = RunningMax()
+        absolute_stats = RunningStatistics()
+        relative_stats = RunningStatistics()
+        n_offenders = 0
+        for offset, block, base_block in arrayBlocks( arr, base_arr ):
+            difference, relative_difference, q, absolute_limited = self.qValues( block, base_block )
 
-        # Now compute the difference and store the result in ARR1_CPY
-        # which is appropriately renamed DIFFERENCE.
-        difference = np.subtract( arr, base_arr, out=arr_cpy )
-        np.abs( difference, out=difference )
+            # Get the indices of the max absolute and relative error
+            max_absolute.update( difference, offset )
+            max_relative.update( relative_difference, offset )
+            max_q.update( q, offset )
 
-        # Take the absolute value of BASE_ARR_CPY and rename it to ABS_BASE_ARR
-        abs_base_arr = np.abs( base_arr_cpy, out=base_arr_cpy )
+            offenders = np.greater( q, 1.0 )
+            n_offenders += int( np.count_nonzero( offenders ) )
+            absolute_stats.update( q, np.logical_and( offenders, absolute_limited ), offset )
+            relative_stats.update( q, np.logical_and( offenders, np.logical_not( absolute_limited ) ), offset )
+
+        # If the maximum q value is greater than 1.0 than issue an error.
+        if max_q.value > 1.0:
+            size = int( np.prod( arr.shape ) )
+            location = self.arrayLocation( arr, base_arr, index_map )
+
+            message = "Arrays of types %s and %s have %d values of which %d fail both the relative and absolute tests.\n" % (
+                arr.dtype, base_arr.dtype, size, n_offenders )
+            message += "\tMax absolute difference is at index %s: value = %s, base_value = %s\n" % location(
+                max_absolute.index )
+            message += "\tMax relative difference is at index %s: value = %s, base_value = %s\n" % location(
+                max_relative.index )
+            for name, stats in ( ( "absolute", absolute_stats ), ( "relative", relative_stats ) ):
+                message += "Statistics of the q values greater than 1.0 defined by %s tolerance: N = %d\n" % (
+                    name, stats.count )
+                if stats.count > 0:
+                    message += "\tmax = %s, mean = %s, std = %s\n" % ( stats.max.value, *stats.meanStd( size ) )
+                    message += "\tmax is at index %s, value = %s, base_value = %s\n" % location( stats.max.index )
+            self.errorMsg( path, message, True )
+
+    def qValues( self, arr, base_arr ):
+        """
+        Compute the q values of two blocks of floating point values, see compareFloatArrays.
+
+        ARR [in]: The block to compare.
+        BASE_ARR [in]: The block to compare against.
+
+        Returns the absolute and relative differences, the q values and whether they are limited by the absolute tolerance.
+        """
+        difference = np.abs( np.subtract( arr, base_arr ) )
+        abs_base_arr = np.abs( base_arr )
 
         #        max_abs_base_arr = np.max( abs_base_arr )
         #         comm = MPI.COMM_WORLD
@@ -289,113 +400,66 @@ class FileComparison( object ):
         #        absTol = (1.0 + max_abs_base_arr) * self.atol
         absTol = self.atol
 
-        # Get the indices of the max absolute and relative error
-        max_absolute_index = np.unravel_index( np.argmax( difference ), difference.shape )
-
         relative_difference = difference / ( abs_base_arr + 1e-20 )
 
         # If the absolute tolerance is not zero, replace all nan's with zero.
         if self.atol != 0:
-            relative_difference = np.nan_to_num( relative_difference, 0 )
-
-        max_relative_index = np.unravel_index( np.argmax( relative_difference ), relative_difference.shape )
-
-        if self.rtol != 0.0:
-            relative_difference /= self.rtol
+            relative_difference = np.nan_to_num( relative_difference, copy=False )
 
         if self.rtol == 0.0:
-            difference /= absTol
-            q = difference
+            q = difference / absTol
             absolute_limited = np.ones( q.shape, dtype=bool )
         elif self.atol == 0.0:
-            q = relative_difference
+            q = relative_difference / self.rtol
             absolute_limited = np.zeros( q.shape, dtype=bool )
         else:
-            # Multiply ABS_BASE_ARR by RTOL and rename it to RTOL_ABS_BASE
-            rtol_abs_base = np.multiply( self.rtol, abs_base_arr, out=abs_base_arr )
-
-            # Calculate which entries are limited by the relative tolerance.
-            relative_limited = rtol_abs_base > absTol
+            # Calculate which entries are limited by the absolute tolerance.
+            absolute_limited = np.logical_not( self.rtol * abs_base_arr > absTol )
+            q = np.where( absolute_limited, difference / absTol, relative_difference / self.rtol )
 
-            # Rename DIFFERENCE to Q where we will store the scaling parameter q.
-            q = difference
-            q[ relative_limited ] = relative_difference[ relative_limited ]
+        return difference, relative_difference, q, absolute_limited
 
-            # Compute q for the entries which are limited by the absolute tolerance.
-            absolute_limited = np.logical_not( relative_limited, out=relative_limited )
-            q[ absolute_limited ] /= absTol
+    @staticmethod
+    def arrayLocation( arr, base_arr, index_map=None ):
+        """
+        Make a function giving the reported index and the values of ARR and BASE_ARR at a flat index.
+        """
 
-        # If the maximum q value is greater than 1.0 than issue an error.
-        if np.max( q ) > 1.0:
-            offenders = np.greater( q, 1.0 )
-            n_offenders = np.sum( offenders )
-
-            absolute_offenders = np.logical_and( offenders, absolute_limited, out=offenders )
-            q_num_absolute = np.sum( absolute_offenders )
-            if q_num_absolute > 0:
-                absolute_qs = q * absolute_offenders
-                q_max_absolute = np.max( absolute_qs )
-                q_max_absolute_index = np.unravel_index( np.argmax( absolute_qs ), absolute_qs.shape )
-                q_mean_absolute = np.mean( absolute_qs )
-                q_std_absolute = np.std( absolute_qs )
-
-            offenders = np.greater( q, 1.0, out=offenders )
-            relative_limited = np.logical_not( absolute_limited, out=absolute_limited )
-            relative_offenders = np.logical_and( offenders, relative_limited, out=offenders )
-            q_num_relative = np.sum( relative_offenders )
-            if q_num_relative > 0:
-                relative_qs = q * relative_offenders
-                q_max_relative = np.max( relative_qs )
-                q_max_relative_index = np.unravel_index( np.argmax( relative_qs ), q.shape )
-                q_mean_relative = np.mean( relative_qs )
-                q_std_relative = np.std( relative_qs )
+        def location( flat_index ):
+            index = tuple( int( i ) for i in np.unravel_index( flat_index, arr.shape ) )
+            return ( index if index_map is None else index_map( index ) ), arr[ index ], base_arr[ index ]
 
-            message = "Arrays of types %s and %s have %d values of which %d fail both the relative and absolute tests.\n" % (
-                arr.dtype, base_arr.dtype, offenders.size, n_offenders )
-            message += "\tMax absolute difference is at index %s: value = %s, base_value = %s\n" % (
-                max_absolute_index, arr[ max_absolute_index ], base_arr[ max_absolute_index ] )
-            message += "\tMax relative difference is at index %s: value = %s, base_value = %s\n" % (
-                max_relative_index, arr[ max_relative_index ], base_arr[ max_relative_index ] )
-            message += "Statistics of the q values greater than 1.0 defined by absolute tolerance: N = %d\n" % q_num_absolute
-            if q_num_absolute > 0:
-                message += "\tmax = %s, mean = %s, std = %s\n" % ( q_max_absolute, q_mean_absolute, q_std_absolute )
-                message += "\tmax is at index %s, value = %s, base_value = %s\n" % (
-                    q_max_absolute_index, arr[ q_max_absolute_index ], base_arr[ q_max_absolute_index ] )
-            message += "Statistics of the q values greater than 1.0 defined by relative tolerance: N = %d\n" % q_num_relative
-            if q_num_relative > 0:
-                message += "\tmax = %s, mean = %s, std = %s\n" % ( q_max_relative, q_mean_relative, q_std_relative )
-                message += "\tmax is at index %s, value = %s, base_value = %s\n" % (
-                    q_max_relative_index, arr[ q_max_relative_index ], base_arr[ q_max_relative_index ] )
-            self.errorMsg( path, message, True )
+        return location
 
-    def compareIntArrays( self, path, arr, base_arr ):
+    def compareIntArrays( self, path, arr, base_arr, index_map=None ):
         """
         Compare two integer datasets. Exact equality is used as the acceptance criteria.
 
         PATH [in]: The path at which the comparison takes place.
         ARR [in]: The hdf5 Dataset to compare.
         BASE_ARR [in]: The hdf5 Dataset to compare against.
+        INDEX_MAP [in]: Function mapping the indices of the arrays to the reported ones.
         """
         message = ""
         if arr.shape != base_arr.shape:
             message = "Datasets have different shapes and therefore can't be compared statistically: %s, %s.\n" % (
                 arr.shape, base_arr.shape )
         else:
-            # Calculate the absolute difference.
-            difference = np.subtract( arr, base_arr )
-            np.abs( difference, out=difference )
-
-            offenders = difference != 0.0
-            n_offenders = np.sum( offenders )
-
+            offender_stats = RunningStatistics()
+            for offset, block, base_block in arrayBlocks( arr, base_arr ):
+                # Calculate the absolute difference.
+                difference = np.subtract( block, base_block )
+                np.abs( difference, out=difference )
+                offender_stats.update( difference, difference != 0.0, offset )
+
+            n_offenders = offender_stats.count
             if n_offenders != 0:
-                max_index = np.unravel_index( np.argmax( difference ), difference.shape )
-                max_difference = difference[ max_index ]
-                offenders_mean = np.mean( difference[ offenders ] )
-                offenders_std = np.std( difference[ offenders ] )
+                max_index = self.arrayLocation( arr, base_arr, index_map )( offender_stats.max.index )[ 0 ]
+                max_difference = offender_stats.max.value
+                offenders_mean, offenders_std = offender_stats.meanStd( n_offenders )
 
                 message = "Arrays of types %s and %s have %s values of which %d have differing values.\n" % (
-                    arr.dtype, base_arr.dtype, offenders.size, n_offenders )
+                    arr.dtype, base_arr.dtype, int( np.prod( arr.shape ) ), n_offenders )
                 message += "Statistics of the differences greater than 0:\n"
                 message += "\tmax_index = %s, max = %s, mean = %s, std = %s\n" % ( max_index, max_difference,
                                                                                    offenders_mean, offenders_std )
@@ -484,13 +548,14 @@ class FileComparison( object ):
             message += "Baseline string  : %s\n" % "".join( base_arr[ : ] )
             self.errorMsg( path, message, True )
 
-    def compareData( self, path, arr, base_arr ):
+    def compareData( self, path, arr, base_arr, index_map=None ):
         """
         Compare the numerical portion of two datasets.
 
         PATH [in]: The path at which the comparison takes place.
         ARR [in]: The hdf5 Dataset to compare.
         BASE_ARR [in]: The hdf5 Dataset to compare against.
+        INDEX_MAP [in]: Function mapping the indices of the arrays to the reported ones.
         """
         # Get the type of comparison to do.
         np_floats = set( [ 'f', 'c' ] )
@@ -541,9 +606,9 @@ class FileComparison( object ):
 
         # Do the actual comparison.
         if float_compare:
-            return self.compareFloatArrays( path, arr, base_arr )
+            return self.compareFloatArrays( path, arr, base_arr, index_map )
         elif int_compare:
-            return self.compareIntArrays( path, arr, base_arr )
+            return self.compareIntArrays( path, arr, base_arr, index_map )
         elif string_compare:
             return self.compareStringArrays( path, arr, base_arr )
         else:
@@ -653,19 +718,23 @@ class FileComparison( object ):
             values = group[ "__values__" ][ : ]
             base_values = base_group[ "__values__" ][ : ]
 
-            values, errorMsg = permuteArray( values, dimensions, permutation )
-            if values is None:
+            errorMsg = checkLayout( values, dimensions, permutation )
+            if errorMsg is not None:
                 msg = "Failed to permute the LvArray: %s\n" % errorMsg
                 self.errorMsg( group.name, msg )
                 return True
 
-            base_values, errorMsg = permuteArray( base_values, base_dimensions, base_permutation )
-            if base_values is None:
+            errorMsg = checkLayout( base_values, base_dimensions, base_permutation )
+            if errorMsg is not None:
                 msg = "Failed to permute the baseline LvArray: %s\n" % errorMsg
                 self.errorMsg( group.name, msg )
                 return True
 
-            self.compareData( group.name, values, base_values )
+            # Compare the values in the memory order of the baseline, which does not require copying them,
+            # and report the indices in the order of the dimensions
+            values, base_values, index_map = alignLayouts( values, permutation, base_values, dimensions,
+                                                           base_permutation )
+            self.compareData( group.name, values, base_values, index_map )
             return True
 
         return False
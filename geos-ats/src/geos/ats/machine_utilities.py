@@ -3,6 +3,9 @@
 from geos.ats.configuration_record import config
 import re
 import os
+import logging
+
+logger = logging.getLogger( 'geos-ats' )
 
 
 def CheckForEarlyTimeOut( test, retval, fraction ):
@@ -18,3 +21,87 @@ def CheckForEarlyTimeOut( test, retval, fraction ):
                     if re.search( config.retry_err_regexp, erroutput ):
                         return 1, fraction
         return 0, fraction
+
+
+def physicalMemory():
+    """Physical memory of the machine in bytes, or 0 if unknown."""
+    try:
+        return os.sysconf( 'SC_PAGE_SIZE' ) * os.sysconf( 'SC_PHYS_PAGES' )
+    except ( ValueError, OSError, AttributeError ):
+        return 0
+
+
+class CheckStepPool( object ):
+    """Separate pool of cores and memory for the check steps.
+
+    Check steps (restartcheck, curvecheck) are mostly bound by I/O, so instead of waiting for
+    processors used by the simulations they run in a small pool of their own, overlapping with
+    the later simulations. The cores of the pool are reserved within the processors of the machine,
+    so that the node is not oversubscribed. Their memory is estimated from the size of the files
+    they compare, and the checks running at once are kept under a memory ceiling.
+    A check that does not fit under the memory ceiling still runs when no other check is running,
+    and a check needing more cores than the pool runs on the processors of the simulations.
+    """
+
+    def __init__( self, cores=None, memory=None ):
+        self.cores = config.check_pool_cores if cores is None else cores
+        if memory is None:
+            memory = config.check_pool_memory * 1024**3
+            if memory <= 0:
+                memory = physicalMemory() // 2
+        self.memory = memory
+        self.running = {}
+
+    @property
+    def enabled( self ):
+        return self.cores > 0
+
+    def reserve( self, numberMaxProcessors ):
+        """Reserve the cores of the pool within the processors of the machine, leaving at least one to the simulations.
+
+        Returns:
+            int: The number of processors reserved.
+        """
+        if self.cores >= numberMaxProcessors:
+            logger.warning( f'Cannot reserve {self.cores} cores to the check steps out of {numberMaxProcessors}' )
+            self.cores = max( numberMaxProcessors - 1, 0 )
+        return self.cores
+
+    def handles( self, test ):
+        """Whether the test is a check step run in this pool."""
+        step = getattr( test, 'geos_atsTestStep', None )
+        return self.enabled and step is not None and step.isCheck() and max( test.np, 1 ) <= self.cores
+
+    def canRunNow( self, test ):
+        if not self.running:
+            return True
+        profile = self.profile( test )
+        cores = sum( p[ 'cores' ] for p in self.running.values() )
+        memory = sum( p[ 'memory' ] for p in self.running.values() )
+        if cores + profile[ 'cores' ] > self.cores:
+            return False
+        return not self.memory or memory + profile[ 'memory' ] <= self.memory
+
+    def noteLaunch( self, test ):
+        self.running[ id( test ) ] = self.profile( test )
+
+    def noteEnd( self, test ):
+        self.running.pop( id( test ), None )
+        test.check_profile = None
+
+    @staticmethod
+    def profile( test ):
+        """The resources of the check, estimated once, when it is first considered for running."""
+        if getattr( test, 'check_profile', None ) is None:
+            try:
+                test.check_profile = test.geos_atsTestStep.resourceProfile()
+            except OSError as e:
+                logger.debug( f'Could not estimate the resources of {test.name}: {e}' )
+                test.check_profile = { 'cores': 1, 'memory': 0, 'io': True }
+        return test.check_profile
+
+    def report( self ):
+        cores = sum( p[ 'cores' ] for p in self.running.values() )
+        memory = sum( p[ 'memory' ] for p in self.running.values() )
+        return "CHECK STEPS: %d running, %d of %d cores, %.1f of %.1f GB." % ( len(
+            self.running ), cores, self.cores, memory / 1024**3, self.memory / 1024**3 )
@@ -8,6 +8,7 @@ from ats import log
 import shlex
 from ats.atsut import RUNNING, TIMEDOUT  # type: ignore[import]
 from ats import AtsTest
+from geos.ats.machine_utilities import CheckStepPool
 import logging
 
 
@@ -41,7 +42,9 @@ class OpenmpiMachine( machines.Machine ):
         else:
             self.numberMaxProcessors = options.openmpi_procspernode * options.openmpi_numnodes
         self.numberTestsRunningMax = self.numberMaxProcessors
-        self.numProcsAvailable = self.numberMaxProcessors
+        # the processors of the check steps pool are not used by the simulations
+        self.checkPool = CheckStepPool()
+        self.numProcsAvailable = self.numberMaxProcessors - self.checkPool.reserve( self.numberMaxProcessors )
 
         # Copy options for geos-ats config
         self.openmpi_numnodes = options.openmpi_numnodes
@@ -145,20 +148,30 @@ class OpenmpiMachine( machines.Machine ):
         np = max( test.np, 1 )
         if np > self.numberMaxProcessors:
             return "Too many processors needed (%d)" % np
+        if not self.checkPool.handles( test ) and np > self.numberMaxProcessors - self.checkPool.cores:
+            return "Too many processors needed (%d), %d are reserved to the check steps" % ( np, self.checkPool.cores )
 
     def canRunNow( self, test ):
         "Is this machine able to run this test now? Return True/False"
+        if self.checkPool.handles( test ):
+            return self.checkPool.canRunNow( test )
         np = max( test.np, 1 )
         return ( ( self.numtests < self.maxtests ) and ( self.numProcsAvailable >= np ) )
 
     def noteLaunch( self, test ):
         """A test has been launched."""
+        if self.checkPool.handles( test ):
+            self.checkPool.noteLaunch( test )
+            return
         np = max( test.np, 1 )
         self.numProcsAvailable -= np
         self.numtests += 1
 
     def noteEnd( self, test ):
         """A test has finished running. """
+        if self.checkPool.handles( test ):
+            self.checkPool.noteEnd( test )
+            return
         np = max( test.np, 1 )
         self.numProcsAvailable += np
         self.numtests -= 1
@@ -169,8 +182,12 @@ class OpenmpiMachine( machines.Machine ):
         terminal( "CURRENTLY RUNNING %d of %d tests." % ( self.numtests, self.maxtests ) )
         terminal( "-" * 80 )
         terminal( "CURRENTLY UTILIZING %d processors (max %d)." %
-                  ( self.numberMaxProcessors - self.numProcsAvailable, self.numberMaxProcessors ) )
+                  ( self.numberMaxProcessors - self.checkPool.cores - self.numProcsAvailable,
+                    self.numberMaxProcessors - self.checkPool.cores ) )
         terminal( "-" * 80 )
+        if self.checkPool.enabled:
+            terminal( self.checkPool.report() )
+            terminal( "-" * 80 )
 
     def kill( self, test ):
         "Final cleanup if any."
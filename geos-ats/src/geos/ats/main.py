@@ -6,7 +6,10 @@ import subprocess
 import time
 import logging
 import glob
+import socket
 from geos.ats import command_line_parsers, baseline_io, history
+from geos.ats.timing_history import timing_history
+from geos.ats.test_selection import test_selection
 
 test_actions = ( "run", "rerun", "check", "continue" )
 report_actions = ( "run", "rerun", "report", "continue" )
@@ -159,17 +162,23 @@ def create_log_directory( options ):
 
 def check_timing_file( options, config ):
     if options.action in [ "run", "rerun", "continue" ]:
+        from geos.ats import configuration_record
         if config.timing_file:
             if not os.path.isfile( config.timing_file ):
                 logger.warning( f'Timing file does not exist {config.timing_file}' )
-                return
+            else:
+                with open( config.timing_file, "r" ) as filep:
+                    for line in filep:
+                        if not line.startswith( '#' ):
+                            tokens = line.split()
+                            configuration_record.globalTestTimings[ tokens[ 0 ] ] = int( tokens[ 1 ] )
 
-            from geos.ats import configuration_record
-            with open( config.timing_file, "r" ) as filep:
-                for line in filep:
-                    if not line.startswith( '#' ):
-                        tokens = line.split()
-                        configuration_record.globalTestTimings[ tokens[ 0 ] ] = int( tokens[ 1 ] )
+        # Runtimes learned from the previous runs on this machine complete the timing file
+        if config.timing_history_file:
+            machine = options.machine or socket.gethostname()
+            timing_history.setup( config.timing_history_file, machine, config.timing_history_size )
+            for name, runtime in timing_history.predictions().items():
+                configuration_record.globalTestTimings.setdefault( name, runtime )
 
 
 def infoOptions( title, options ):
@@ -206,6 +215,19 @@ def info( args ):
     menu.process( args )
 
 
+def record_run( manager, options ):
+    """Append the results of the run to the run history, and save the learned runtimes"""
+    from geos.ats import ( reporting, configuration_record, run_history )
+
+    timing_history.save()
+
+    if configuration_record.config.run_history_file:
+        results = reporting.ReportBase( manager.testlist ).test_results
+        machine = options.machine or socket.gethostname()
+        run_history.record_run_history( configuration_record.config.run_history_file, results, machine,
+                                        history.git_history.commit )
+
+
 def report( manager ):
     """The report action"""
     from geos.ats import ( reporting, configuration_record )
@@ -216,8 +238,7 @@ def report( manager ):
 
     if configuration_record.config.report_ini:
         reporter = reporting.ReportIni( manager.testlist )
-        with open( configuration_record.config.report_ini_file, "w" ) as filep:
-            reporter.report( filep )
+        reporter.write( configuration_record.config.report_ini_file )
 
 
 def summary( manager, alog, short=False ):
@@ -227,9 +248,11 @@ def summary( manager, alog, short=False ):
     if len( manager.testlist ) == 0:
         return
 
+    # Only the tests that changed are appended to the live report, the full html report is written at the end
     if configuration_record.config.report_html and configuration_record.config.report_html_periodic:
-        reporter = reporting.ReportHTML( manager.testlist )
-        reporter.report( refresh=30 )
+        if not reporting.live_report.started:
+            reporting.live_report.start( manager.testlist, configuration_record.config.report_html_file )
+        reporting.live_report.update( manager.testlist )
 
 
 def append_geos_ats_summary( manager ):
@@ -286,6 +309,9 @@ def main():
     testcases = []
     configFile = ''
 
+    # Setup the test selection, before leaving the current directory
+    test_selection.setup( options.changed_files, options.changed_blocks )
+
     # Setup paths
     ats_root_dir = os.path.abspath( os.path.dirname( options.ats_target ) )
     os.chdir( ats_root_dir )
@@ -388,6 +414,11 @@ def main():
         if not options.allow_failed_tests:
             raise Exception( 'Some tests failed to build' )
 
+    if test_selection.active:
+        logger.info( f'Selected {len( test_selection.selected_tests() )} of {len( test_selection.index )} tests' )
+        if options.logs:
+            test_selection.write_index( os.path.join( options.logs, 'test_selection.json' ) )
+
     # Make sure all the testcases requested were found
     if testcases != "all":
         if len( testcases ):
@@ -395,14 +426,26 @@ def main():
             logger.error( f"ATS files: {str(ats_files)}" )
             sys.exit( 1 )
 
-    # Report:
+    # History and report:
+    if options.action in ( "run", "rerun", "continue" ):
+        record_run( ats.manager, options )
+
+    from geos.ats.reporting import live_report
+    if live_report.active:
+        live_report.update( ats.manager.testlist )
+        live_report.finish()
+
     if options.action in report_actions:
         report( ats.manager )
 
     # clean
     if options.action == "veryclean":
         common_utilities.removeLogDirectories( os.getcwd() )
-        files = [ config.report_html_file, config.report_ini_file ]
+        files = [
+            config.report_html_file, config.report_ini_file,
+            os.path.splitext( config.report_html_file )[ 0 ] + '_live.html',
+            os.path.join( os.path.dirname( config.report_html_file ), 'test_status.js' )
+        ]
         for f in files:
             if os.path.exists( f ):
                 os.remove( f )
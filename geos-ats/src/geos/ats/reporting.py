@@ -1,8 +1,13 @@
 import os
+import io
+import json
 import socket
+import sqlite3
 import time
 from geos.ats.configuration_record import config
+from geos.ats.common_utilities import atomic_write
 from geos.ats import assets
+from geos.ats.run_history import RunHistory
 from configparser import ConfigParser
 from tabulate import tabulate
 import glob
@@ -20,6 +25,13 @@ logger = logging.getLogger( 'geos-ats' )
 # Status value in priority order
 STATUS = ( EXPECTED, CREATED, BATCHED, FILTERED, SKIPPED, RUNNING, PASSED, TIMEDOUT, HALTED, LSFERROR, FAILED )
 
+# The failures of the flaky tests, not retried by the retry policy, are reported apart from the other failures
+QUARANTINED = 'QUARANTINED'
+
+# Status names of the live report in priority order, the quarantined failures come before the other failures
+LIVE_STATUS = [ s.name for s in STATUS ]
+LIVE_STATUS.insert( LIVE_STATUS.index( TIMEDOUT.name ), QUARANTINED )
+
 COLORS: Mapping[ str, str ] = {
     EXPECTED.name: "black",
     CREATED.name: "black",
@@ -32,6 +44,7 @@ COLORS: Mapping[ str, str ] = {
     HALTED.name: "brown",
     LSFERROR.name: "brown",
     FAILED.name: "red",
+    QUARANTINED: "purple",
 }
 
 
@@ -54,6 +67,8 @@ class TestCaseRecord:
     current_step: str
     resources: int
     path: str
+    retries: int = 0
+    quarantined: bool = False
 
 
 @dataclass
@@ -62,12 +77,35 @@ class TestGroupRecord:
     status: atsut._StatusCode
 
 
+def sparkline( records, width=100, height=20 ):
+    """Inline svg of the runtimes of the last runs of a test, colored by status."""
+    if len( records ) < 2:
+        return ''
+    max_elapsed = max( max( r.elapsed for r in records ), 1e-12 )
+    dx = ( width - 4 ) / ( len( records ) - 1 )
+    points = [ ( 2 + i * dx, height - 2 - ( height - 4 ) * r.elapsed / max_elapsed ) for i, r in enumerate( records ) ]
+    polyline = ' '.join( f'{x:.1f},{y:.1f}' for x, y in points )
+    svg = f'<svg width="{width}" height="{height}"><polyline points="{polyline}" fill="none" stroke="gray"/>'
+    for ( x, y ), r in zip( points, records ):
+        title = f'{r.git_commit[ :8 ]} {r.status} {hms( r.elapsed )}'
+        svg += f'<circle cx="{x:.1f}" cy="{y:.1f}" r="2" fill="{COLORS.get( r.status, "black" )}"><title>{title}</title></circle>'
+    return svg + '</svg>'
+
+
 def max_status( sa, sb ):
     Ia = STATUS.index( sa )
     Ib = STATUS.index( sb )
     return STATUS[ max( Ia, Ib ) ]
 
 
+def parse_step_name( t ):
+    """Get the name of the test case and of the group of tests of a test step"""
+    step_name = t.name[ t.name.find( '(' ) + 1:t.name.rfind( '_' ) ]
+    test_name = step_name[ :step_name.rfind( '_' ) ]
+    group_name = test_name[ :test_name.rfind( '_' ) ]
+    return test_name, group_name
+
+
 class ReportBase( object ):
     """Base class for reporting"""
 
@@ -78,10 +116,8 @@ class ReportBase( object ):
 
         for t in test_steps:
             # Parse the test step name
-            step_name = t.name[ t.name.find( '(' ) + 1:t.name.rfind( '_' ) ]
-            test_name = step_name[ :step_name.rfind( '_' ) ]
+            test_name, group_name = parse_step_name( t )
             test_id = t.group.number
-            group_name = test_name[ :test_name.rfind( '_' ) ]
             group_path = os.path.join( '.', t.options[ 'path' ], test_name )
 
             # Save data
@@ -100,6 +136,9 @@ class ReportBase( object ):
             if hasattr( t, 'endTime' ):
                 elapsed = t.endTime - t.startTime
             self.test_results[ test_name ].elapsed += elapsed
+            self.test_results[ test_name ].retries = max( self.test_results[ test_name ].retries,
+                                                          getattr( t.group, 'retries', 0 ) )
+            self.test_results[ test_name ].quarantined |= getattr( t.group, 'quarantined', False )
 
             # Add the step
             self.test_results[ test_name ].steps[ t.name ] = TestStepRecord( status=t.status,
@@ -124,7 +163,10 @@ class ReportBase( object ):
 
         # Collect status names
         for s in STATUS:
-            self.status_lists[ s.name ] = [ k for k, v in self.test_results.items() if v.status == s ]
+            self.status_lists[ s.name ] = [
+                k for k, v in self.test_results.items() if v.status == s and not v.quarantined
+            ]
+        self.status_lists[ QUARANTINED ] = [ k for k, v in self.test_results.items() if v.quarantined ]
 
         self.html_filename = config.report_html_file
 
@@ -163,6 +205,12 @@ class ReportIni( ReportBase ):
 
         configParser.write( fp )
 
+    def write( self, fname ):
+        """Write the ini report, replacing the previous one at once"""
+        fp = io.StringIO()
+        self.report( fp )
+        atomic_write( fname, fp.getvalue() )
+
 
 class ReportHTML( ReportBase ):
     """HTML Reporting"""
@@ -236,7 +284,18 @@ class ReportHTML( ReportBase ):
         sp.write( table_html )
 
     def writeTable( self, sp ):
-        header = ( "Status", "Name", "TestStep", "Elapsed", "Resources", "Logs", "Output" )
+        header = ( "Status", "Name", "TestStep", "Elapsed", "Trend", "Resources", "Logs", "Output" )
+
+        # Runtimes of the previous runs, when a history is available
+        trends = {}
+        if config.run_history_file and os.path.isfile( config.run_history_file ):
+            try:
+                with RunHistory( config.run_history_file ) as run_history:
+                    for k in self.test_results:
+                        trends[ k ] = sparkline( run_history.test_history( k, limit=config.report_trend_runs ) )
+            except sqlite3.Error as e:
+                logger.warning( f'Failed to read the run history {config.run_history_file}, no trend reported: {e}' )
+                trends = {}
 
         table = []
         table_filt = []
@@ -246,7 +305,10 @@ class ReportHTML( ReportBase ):
 
         for k, v in self.test_results.items():
             status_str = v.status.name
-            status_formatted = color_pattern.format( COLORS[ status_str ], k, status_str )
+            if v.quarantined:
+                status_formatted = color_pattern.format( COLORS[ QUARANTINED ], k, f'{status_str} ({QUARANTINED})' )
+            else:
+                status_formatted = color_pattern.format( COLORS[ status_str ], k, status_str )
             step_shortname = v.current_step[ v.current_step.rfind( '_' ) + 1:-1 ]
             elapsed_formatted = hms( v.elapsed )
 
@@ -290,8 +352,8 @@ class ReportHTML( ReportBase ):
             # Write row
             row = [
                 status_formatted,
-                k.replace( '_', ' ' ), step_shortname, elapsed_formatted, v.resources, ', '.join( log_links ),
-                ', '.join( other_links )
+                k.replace( '_', ' ' ), step_shortname, elapsed_formatted,
+                trends.get( k, '' ), v.resources, ', '.join( log_links ), ', '.join( other_links )
             ]
             if status_str == 'FILTERED':
                 table_filt.append( row )
@@ -316,3 +378,151 @@ class ReportHTML( ReportBase ):
         </html>
         """
         sp.write( footer )
+
+
+class ReportStream( object ):
+    """Live report, updated as the test steps end
+
+    Each change of a test case is appended to a status feed, a script with one feedRecord call
+    per json record, and a static page renders the feed in the browser. The page loads the feed
+    with a script tag, so it also works when opened from the file system.
+    The cost of an update does not depend on the number of tests.
+    """
+
+    def __init__( self ):
+        self.feed_file = ''
+        self.finished = False
+        self.test_results = {}
+        self.step_states = {}
+
+    @property
+    def started( self ):
+        return bool( self.feed_file )
+
+    @property
+    def active( self ):
+        return self.started and not self.finished
+
+    def start( self, test_steps, html_filename, feed_name='test_status.js', refresh=30 ):
+        """Start the feed with all the test cases, and write the page rendering it"""
+        html_dir = os.path.dirname( os.path.abspath( html_filename ) )
+        self.feed_file = os.path.join( html_dir, feed_name )
+        self.finished = False
+        self.html_dir = html_dir
+        self.test_results = {}
+        self.step_states = {}
+
+        tests = {}
+        for t in test_steps:
+            test_name, _ = parse_step_name( t )
+            np, path = tests.get( test_name, ( 1, t.options.get( 'path', '' ) ) )
+            tests[ test_name ] = ( max( np, t.np ), path )
+            self.step_states[ id( t ) ] = ( t.status, 0.0, False )
+        start = { 'event': 'start', 'time': time.time(), 'tests': [ [ k, *v ] for k, v in sorted( tests.items() ) ] }
+        self.write_records( [ start ], mode='w' )
+
+        html_assets = 'html_assets'
+        assets.create_assets_folder( os.path.join( html_dir, html_assets ) )
+        page_name = os.path.splitext( os.path.basename( html_filename ) )[ 0 ] + '_live.html'
+        settings = {
+            'feedUrl': feed_name,
+            'refreshSeconds': refresh,
+            'statusOrder': LIVE_STATUS,
+            'statusColors': dict( COLORS )
+        }
+        script = ''.join( f'   var {k} = {json.dumps( v )};\n' for k, v in settings.items() )
+        page = f"""<html>
+ <head>
+  <title>GEOS ATS Live Results</title>
+  <link rel="stylesheet" href="./{html_assets}/style.css">
+  <script>
+{script}  </script>
+  <script src="./{html_assets}/live_report.js"></script>
+ </head>
+<body>
+<div id="banner"><div id="banner-content"><h1>GEOS ATS Live Report</h1></div></div>
+</br></br></br>
+<p id="info"></p>
+<h1>Summary</h1>
+<table id="summary"></table>
+<h1>Tests</h1>
+<table id="tests"></table>
+</body>
+</html>
+"""
+        atomic_write( os.path.join( html_dir, page_name ), page )
+
+    def update( self, test_steps ):
+        """Append the test cases with a step whose status changed since the last update"""
+        records = []
+        for t in test_steps:
+            record = self.note_step( t )
+            if record is not None:
+                records.append( record )
+        self.write_records( records )
+
+    def test_ended( self, test ):
+        """Append the test case of a step that just ended"""
+        record = self.note_step( test )
+        if record is not None:
+            self.write_records( [ record ] )
+
+    def note_step( self, t ):
+        """Update the record of the test case of a step, and return it if it changed"""
+        elapsed = t.endTime - t.startTime if hasattr( t, 'endTime' ) else 0.0
+        quarantined = getattr( t.group, 'quarantined', False )
+        state = ( t.status, elapsed, quarantined )
+        previous_state = self.step_states.get( id( t ), ( None, 0.0, False ) )
+        if state == previous_state:
+            return None
+        previous_elapsed = previous_state[ 1 ]
+        self.step_states[ id( t ) ] = state
+
+        test_name, _ = parse_step_name( t )
+        if test_name not in self.test_results:
+            self.test_results[ test_name ] = TestCaseRecord( steps={},
+                                                             status=EXPECTED,
+                                                             previous_status=t.options.get( 'last_status' ),
+                                                             test_number=t.group.number,
+                                                             elapsed=0.0,
+                                                             current_step=' ',
+                                                             resources=t.np,
+                                                             path=t.options.get( 'path', '' ) )
+        v = self.test_results[ test_name ]
+        v.elapsed += elapsed - previous_elapsed
+        v.resources = max( v.resources, t.np )
+        v.retries = max( v.retries, getattr( t.group, 'retries', 0 ) )
+        v.quarantined = quarantined
+        v.steps[ t.name ] = t.status
+        v.status = EXPECTED
+        for status in v.steps.values():
+            v.status = max_status( status, v.status )
+        if t.status not in ( EXPECTED, CREATED, BATCHED, FILTERED, SKIPPED ):
+            v.current_step = t.name
+
+        log = ''
+        if getattr( t, 'outname', '' ):
+            log = os.path.relpath( t.outname, self.html_dir ).replace( os.sep, '/' )
+        return {
+            'name': test_name,
+            'status': QUARANTINED if v.quarantined else v.status.name,
+            'step': v.current_step[ v.current_step.rfind( '_' ) + 1:-1 ],
+            'elapsed': round( v.elapsed, 2 ),
+            'np': v.resources,
+            'retries': v.retries,
+            'log': log
+        }
+
+    def finish( self ):
+        self.write_records( [ { 'event': 'end', 'time': time.time() } ] )
+        self.finished = True
+
+    def write_records( self, records, mode='a' ):
+        if not self.active or not records:
+            return
+        with open( self.feed_file, mode ) as f:
+            f.write( ''.join( f"feedRecord({json.dumps( r, separators=( ',', ':' ) )});\n" for r in records ) )
+
+
+# The global live report
+live_report = ReportStream()
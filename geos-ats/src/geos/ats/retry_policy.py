@@ -0,0 +1,137 @@
+import os
+import re
+import logging
+from dataclasses import dataclass
+from geos.ats.configuration_record import config
+
+logger = logging.getLogger( 'geos-ats' )
+
+# Only the end of the logs is searched for the failure signatures
+LOG_TAIL_SIZE = 64 * 1024
+
+
+@dataclass
+class RetryRule:
+    """A class of failures and how often to retry them
+
+    A failure belongs to the class if any of the given conditions holds: one of the statuses,
+    one of the exit codes, or a match of the pattern in the end of the stderr/stdout logs.
+    """
+    name: str
+    max_retries: int
+    pattern: str = ''
+    statuses: tuple = ()
+    exit_codes: tuple = ()
+    check_steps: bool = False
+
+    def matches( self, test, log_text ):
+        if self.check_steps:
+            step = getattr( test, 'geos_atsTestStep', None )
+            return step is not None and step.isCheck()
+        if test.status in self.statuses:
+            return True
+        if getattr( test, 'returnCode', None ) in self.exit_codes:
+            return True
+        return bool( self.pattern ) and re.search( self.pattern, log_text ) is not None
+
+
+def read_log_tail( fname ):
+    try:
+        with open( fname, 'rb' ) as f:
+            f.seek( max( os.fstat( f.fileno() ).st_size - LOG_TAIL_SIZE, 0 ) )
+            return f.read().decode( errors='replace' )
+    except OSError:
+        return ''
+
+
+def log_files( test ):
+    """The stderr and stdout logs of a test, renamed by the scheduler before a retry"""
+    return ( test.geos_atsTestCase.errname, test.geos_atsTestCase.outname )
+
+
+def default_rules():
+    """The failure classes, in order of precedence, other failures are not retried"""
+    from ats.atsut import TIMEDOUT  # type: ignore[import]
+    return [
+        RetryRule( 'timeout', config.retry_max_timeout, statuses=( TIMEDOUT, ) ),
+        RetryRule( 'launch', config.max_retry, pattern=config.retry_err_regexp ),
+        RetryRule( 'segfault',
+                   config.retry_max_segfault,
+                   pattern=r'Segmentation fault|SIGSEGV|signal 11\b|Bus error|SIGBUS',
+                   exit_codes=( -11, 139, -7, 135 ) ),
+        # Differences with the baselines are deterministic
+        RetryRule( 'diff', 0, check_steps=True ),
+    ]
+
+
+class RetryPolicy( object ):
+    """Decide whether and when to retry a failed group of test steps
+
+    The failure is classified by the first matching rule, each class having its own retry limit.
+    A retry waits for an exponential backoff, starting from config.retry_backoff by default, and the
+    tests that flapped between passing and failing in the previous runs are quarantined: their
+    failures are not retried, and the scheduler reports them apart from the other failures.
+    The rules can be replaced or extended with add_rule.
+    """
+
+    def __init__( self, rules=None, backoff=None ):
+        self.rules = default_rules() if rules is None else rules
+        self.backoff = config.retry_backoff if backoff is None else backoff
+        self.quarantined = None
+
+    def add_rule( self, rule, index=0 ):
+        """Add a failure class, by default with the highest precedence"""
+        self.rules.insert( index, rule )
+
+    def classify( self, test ):
+        """Get the rule of the failure of a test"""
+        log_text = ''
+        if any( r.pattern for r in self.rules ):
+            log_text = ''.join( read_log_tail( fname ) for fname in log_files( test ) )
+        for rule in self.rules:
+            if rule.matches( test, log_text ):
+                return rule
+        return None
+
+    def is_quarantined( self, name ):
+        if self.quarantined is None:
+            self.quarantined = self.load_quarantine()
+        return name in self.quarantined
+
+    @staticmethod
+    def load_quarantine():
+        """Tests whose rate of changes between passing and failing exceeds the threshold in the run history"""
+        if config.retry_quarantine_flakiness <= 0 or not config.run_history_file or not os.path.isfile(
+                config.run_history_file ):
+            return set()
+        from geos.ats.run_history import RunHistory
+        try:
+            with RunHistory( config.run_history_file ) as run_history:
+                rates = run_history.flakiness( window=config.retry_quarantine_window )
+        except Exception as e:
+            logger.warning( f'Could not read the run history to quarantine flaky tests: {e}' )
+            return set()
+        return { k for k, v in rates.items() if v >= config.retry_quarantine_flakiness }
+
+    def decide( self, name, test, group ):
+        """Decide whether to retry a failed group
+
+        Args:
+            name (str): The test case name.
+            test: The failed test step.
+            group: The group of test steps of the test case.
+
+        Returns:
+            tuple: The failure class name, and the delay in seconds before the retry, or None to not retry.
+        """
+        rule = self.classify( test )
+        failure = rule.name if rule else 'unknown'
+        if rule is None or self.is_quarantined( name ):
+            return failure, None
+
+        attempts = getattr( group, 'retry_attempts', {} )
+        group.retry_attempts = attempts
+        if attempts.get( rule.name, 0 ) >= rule.max_retries:
+            return failure, None
+        attempts[ rule.name ] = attempts.get( rule.name, 0 ) + 1
+        return failure, self.backoff * 2**( attempts[ rule.name ] - 1 )
@@ -0,0 +1,184 @@
+import logging
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger( 'geos-ats' )
+
+PASSING_STATUS = ( 'PASSED', 'EXPECTED' )
+FAILING_STATUS = ( 'FAILED', 'TIMEDOUT', 'HALTED', 'LSFERROR' )
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time REAL NOT NULL,
+    machine TEXT NOT NULL,
+    git_commit TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs( id ),
+    test TEXT NOT NULL,
+    status TEXT NOT NULL,
+    elapsed REAL NOT NULL,
+    resources INTEGER NOT NULL,
+    retries INTEGER NOT NULL,
+    PRIMARY KEY ( run_id, test )
+);
+CREATE INDEX IF NOT EXISTS results_test ON results( test, run_id );
+"""
+
+
+@dataclass
+class TestRunRecord:
+    run_id: int
+    time: float
+    machine: str
+    git_commit: str
+    status: str
+    elapsed: float
+    resources: int
+    retries: int
+
+
+class RunHistory( object ):
+    """History of the test results of all the runs, stored in a sqlite database"""
+
+    def __init__( self, fname ):
+        self.fname = fname
+        self.connection = sqlite3.connect( fname )
+        try:
+            self.connection.executescript( SCHEMA )
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+    def close( self ):
+        self.connection.close()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, *args ):
+        self.close()
+
+    def record_run( self, test_results, machine, git_commit, run_time=None ):
+        """Append a run to the history.
+
+        Args:
+            test_results (dict): The TestCaseRecord of each test name, from the reports.
+            machine (str): The name of the machine.
+            git_commit (str): The GEOS commit that was tested.
+            run_time (float): The time of the run, defaults to now.
+
+        Returns:
+            int: The id of the new run.
+        """
+        with self.connection:
+            cursor = self.connection.execute( "INSERT INTO runs ( time, machine, git_commit ) VALUES ( ?, ?, ? )",
+                                              ( time.time() if run_time is None else run_time, machine, git_commit ) )
+            run_id = cursor.lastrowid
+            self.connection.executemany( "INSERT INTO results VALUES ( ?, ?, ?, ?, ?, ? )",
+                                         [ ( run_id, name, v.status.name, v.elapsed, v.resources, v.retries )
+                                           for name, v in test_results.items() ] )
+        return run_id
+
+    def test_history( self, test, machine=None, limit=None ):
+        """Get the last results of a test, oldest first.
+
+        Args:
+            test (str): The test name.
+            machine (str): Only keep the runs of this machine, if given.
+            limit (int): The maximum number of results, if given.
+
+        Returns:
+            list: The TestRunRecord of the test.
+        """
+        query = ( "SELECT runs.id, runs.time, runs.machine, runs.git_commit, status, elapsed, resources, retries "
+                  "FROM results JOIN runs ON runs.id = results.run_id WHERE test = ?" )
+        parameters = [ test ]
+        if machine is not None:
+            query += " AND runs.machine = ?"
+            parameters.append( machine )
+        query += " ORDER BY runs.id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append( limit )
+        rows = self.connection.execute( query, parameters ).fetchall()
+        return [ TestRunRecord( *row ) for row in reversed( rows ) ]
+
+    def tests( self ):
+        return [ row[ 0 ] for row in self.connection.execute( "SELECT DISTINCT test FROM results ORDER BY test" ) ]
+
+    def flakiness( self, window=20, machine=None ):
+        """Get the tests that both passed and failed among their last runs.
+
+        Args:
+            window (int): The number of last runs of each test considered.
+            machine (str): Only consider the runs of this machine, if given.
+
+        Returns:
+            dict: The rate of changes between passing and failing of each flaky test.
+        """
+        rates = {}
+        for test in self.tests():
+            outcomes = [
+                r.status in FAILING_STATUS for r in self.test_history( test, machine, window )
+                if r.status in PASSING_STATUS + FAILING_STATUS
+            ]
+            flips = sum( a != b for a, b in zip( outcomes, outcomes[ 1: ] ) )
+            if flips:
+                rates[ test ] = flips / ( len( outcomes ) - 1 )
+        return rates
+
+    def runtime_regressions( self, threshold=1.5, window=10, machine=None ):
+        """Get the tests whose last passed runtime is much longer than their previous ones.
+
+        Args:
+            threshold (float): The ratio to the median of the previous runtimes reported as a regression.
+            window (int): The number of previous passed runs used for the median.
+            machine (str): Only consider the runs of this machine, if given.
+
+        Returns:
+            dict: The (last runtime, median of the previous runtimes) of each test with a regression.
+        """
+        regressions = {}
+        for test in self.tests():
+            query = ( "SELECT elapsed FROM results JOIN runs ON runs.id = results.run_id "
+                      f"WHERE test = ? AND status IN ( {', '.join( '?' * len( PASSING_STATUS ) )} )" )
+            parameters = [ test, *PASSING_STATUS ]
+            if machine is not None:
+                query += " AND runs.machine = ?"
+                parameters.append( machine )
+            query += " ORDER BY runs.id DESC LIMIT ?"
+            parameters.append( window + 1 )
+            elapsed = [ row[ 0 ] for row in self.connection.execute( query, parameters ) ]
+            if len( elapsed ) < 2:
+                continue
+            reference = statistics.median( elapsed[ 1: ] )
+            if reference > 0 and elapsed[ 0 ] > threshold * reference:
+                regressions[ test ] = ( elapsed[ 0 ], reference )
+        return regressions
+
+    def first_failing_commit( self, test, machine=None ):
+        """Get the commit of the first run of the current failure streak of a test.
+
+        Returns:
+            str: The commit, or None if the last run of the test did not fail.
+        """
+        commit = None
+        for record in reversed( self.test_history( test, machine ) ):
+            if record.status in FAILING_STATUS:
+                commit = record.git_commit
+            elif record.status in PASSING_STATUS:
+                break
+        return commit
+
+
+def record_run_history( fname, test_results, machine, git_commit ):
+    """Append the results of a run to the history file, without failing the run if it is not writable."""
+    try:
+        with RunHistory( fname ) as run_history:
+            run_history.record_run( test_results, machine, git_commit )
+    except sqlite3.Error as e:
+        logger.error( f'Failed to record the run in {fname}: {e}' )
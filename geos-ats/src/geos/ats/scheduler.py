@@ -1,18 +1,137 @@
 """Defines GeosATS scheduler for interactive jobs."""
 import os
-import re
+import statistics
 import time
-from geos.ats.configuration_record import config
+from geos.ats.configuration_record import config, globalTestTimings
 from geos.ats.common_utilities import Log
+from geos.ats.timing_history import predict_makespan, timing_history
+from geos.ats.reporting import live_report, parse_step_name
+from geos.ats.retry_policy import RetryPolicy, log_files
 from ats.log import log  # type: ignore[import]
 from ats.atsut import PASSED, FAILED, CREATED, EXPECTED, TIMEDOUT  # type: ignore[import]
 from ats.schedulers import StandardScheduler  # type: ignore[import]
+from ats.times import hms  # type: ignore[import]
 
 
 class GeosAtsScheduler( StandardScheduler ):
-    """Custom scheduler for GeosATS"""
+    """Custom scheduler for GeosATS
+
+    With the "packing" priority, the groups are started longest first, their cost being
+    the predicted runtime times the number of processors, and shorter groups backfill
+    the idle processors. Runtimes are learned from the previous runs.
+    """
     name = "GeosATS Scheduler"
 
+    def load( self, interactiveTests ):
+        """Load the tests to run, and sort them by predicted cost for the packing priority."""
+        super( GeosAtsScheduler, self ).load( interactiveTests )
+        self.retryPolicy = RetryPolicy()
+        self.predictedMakespan = None
+        self.firstStartTime = None
+        self.lastEndTime = None
+        if config.report_html and config.report_html_periodic:
+            live_report.start( interactiveTests, config.report_html_file )
+        if config.priority != "packing" or not self.groups:
+            return
+
+        # Unknown tests are assumed to take as long as a typical test
+        defaultRuntime = statistics.median( globalTestTimings.values() ) if globalTestTimings else 1.0
+        # groups are lists, they are sorted along with their predicted runtime and number of processors
+        jobs = [ ( globalTestTimings.get( self.groupName( g ), defaultRuntime ), self.groupProcessors( g ), g )
+                 for g in self.groups ]
+        jobs.sort( key=lambda job: job[ 0 ] * job[ 1 ], reverse=True )
+        self.groups[ : ] = [ g for _, _, g in jobs ]
+        self.predictedMakespan = predict_makespan( [ ( runtime, np ) for runtime, np, _ in jobs ],
+                                                   self.numberOfProcessors() )
+        log( f"Predicted makespan: {hms( self.predictedMakespan )}", echo=True )
+
+    @staticmethod
+    def groupName( g ):
+        return next( iter( g ) ).geos_atsTestCase.name
+
+    @staticmethod
+    def groupProcessors( g ):
+        return max( getattr( t, "np", 1 ) or 1 for t in g )
+
+    def numberOfProcessors( self ):
+        """Number of processors of the machine, or of the largest group if unknown."""
+        import ats  # type: ignore[import]
+        for attr in ( "numberMaxProcessors", "numberTestsRunningMax" ):
+            nprocs = getattr( ats.manager.machine, attr, 0 )
+            if nprocs:
+                return nprocs
+        return max( self.groupProcessors( g ) for g in self.groups )
+
+    def recordTimings( self, g ):
+        """Keep the start and end of the run, and learn the runtime of a passed group."""
+        ended = [ t for t in g if hasattr( t, 'endTime' ) ]
+        if not ended:
+            return
+        starts = [ t.startTime for t in ended ]
+        ends = [ t.endTime for t in ended ]
+        if self.firstStartTime is None or min( starts ) < self.firstStartTime:
+            self.firstStartTime = min( starts )
+        if self.lastEndTime is None or max( ends ) > self.lastEndTime:
+            self.lastEndTime = max( ends )
+
+        if timing_history.fname and all( t.status in ( PASSED, EXPECTED ) for t in g ):
+            # the history is saved once at the end of the run
+            timing_history.record( self.groupName( g ), sum( t.endTime - t.startTime for t in ended ) )
+
+    def reportMakespan( self ):
+        if self.firstStartTime is None:
+            return
+        msg = f"Makespan: {hms( self.lastEndTime - self.firstStartTime )}"
+        if self.predictedMakespan is not None:
+            msg += f" (predicted {hms( self.predictedMakespan )})"
+        log( msg, echo=True )
+
+    def findNextTest( self ):
+        """Find the next test to run, leaving aside the groups waiting before a retry.
+
+        If only groups waiting for a retry could run and no test is running, wait for the first
+        of them: returning no test would let the base scheduler end the run or report it as stalled.
+        """
+        while True:
+            now = time.time()
+            waiting = [ g for g in self.groups if getattr( g, "retryAfter", 0 ) > now ]
+            if not waiting:
+                return super( GeosAtsScheduler, self ).findNextTest()
+
+            waitingIds = { id( g ) for g in waiting }
+            self.groups[ : ] = [ g for g in self.groups if id( g ) not in waitingIds ]
+            try:
+                t = super( GeosAtsScheduler, self ).findNextTest()
+            finally:
+                self.groups.extend( waiting )
+            if t is not None or self.running:
+                return t
+            time.sleep( min( g.retryAfter for g in waiting ) - now )
+
+    def retryGroup( self, test, g ):
+        """Reschedule a failed group at the end of the queue if the retry policy allows it."""
+        testName, _ = parse_step_name( test )
+        failure, delay = self.retryPolicy.decide( testName, test, g )
+        if delay is None:
+            if self.retryPolicy.is_quarantined( testName ):
+                # the failure is reported apart from the other failures
+                g.quarantined = True
+                live_report.test_ended( test )
+                Log( f"# quarantined test={testName} failure={failure}: flaky, not retried, reported as QUARANTINED" )
+            return False
+
+        for fname in log_files( test ):
+            if os.path.exists( fname ):
+                os.rename( fname, "%s.%d" % ( fname, g.retries ) )
+        g.retries += 1
+        g.retryAfter = time.time() + delay
+        for t in g:
+            t.status = CREATED
+        self.groups.remove( g )
+        self.groups.append( g )
+        Log( f"# retry test={testName} failure={failure} ({g.retries}) in {delay:.0f}s" )
+        return True
+
     def testEnded( self, test ):
         """Manage scheduling and reporting tasks for a test that ended.
         Log result for every test but only show certain ones on the terminal.
@@ -26,6 +145,7 @@ class GeosAtsScheduler( StandardScheduler ):
         if n > 1:
             msg += f" Group {g.number} #{test.groupSerialNumber} of {n}"
         log( msg, echo=echo )
+        live_report.test_ended( test )
 
         self.schedule( msg, time.asctime() )
         self.removeBlock( test )
@@ -33,18 +153,14 @@ class GeosAtsScheduler( StandardScheduler ):
             g.recordOutput()
             if not hasattr( g, "retries" ):
                 g.retries = 0
-            if test.status in [ FAILED, TIMEDOUT ] and g.retries < config.max_retry:
-                with open( test.geos_atsTestCase.errname ) as f:
-                    erroutput = f.read()
-                    if re.search( config.retry_err_regexp, erroutput ):
-                        f.close()
-                        os.rename( test.geos_atsTestCase.errname,
-                                   "%s.%d" % ( test.geos_atsTestCase.errname, g.retries ) )
-                        os.rename( test.geos_atsTestCase.outname,
-                                   "%s.%d" % ( test.geos_atsTestCase.outname, g.retries ) )
-                        g.retries += 1
-                        for t in g:
-                            t.status = CREATED
-                        Log( f"# retry test={test.geos_atsTestCase.name} ({g.retries}/{config.max_retry})" )
-                        return
+            if test.status in [ FAILED, TIMEDOUT ] and self.retryGroup( test, g ):
+                return
+            self.recordTimings( g )
             self.groups.remove( g )
+            if not self.groups:
+                self.reportMakespan()
+
+
+def scheduler():
+    """Scheduler used by the GeosATS machines."""
+    return GeosAtsScheduler()
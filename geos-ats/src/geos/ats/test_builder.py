@@ -1,3 +1,4 @@
+import glob
 import os
 from typing import (
     Iterable,
@@ -10,6 +11,7 @@ from lxml import etree
 import logging
 from .test_steps import geos
 from .test_case import TestCase
+from .test_selection import collect_deck_dependencies, test_selection
 
 test_build_failures = []
 logger = logging.getLogger( 'geos-ats' )
@@ -117,6 +119,14 @@ def generate_geos_tests( decks: Iterable[ TestDeck ], test_type='smoke' ):
 
             xml_blocks = collect_block_names( xml_file )
 
+            # Only run the tests affected by the selected changes, with all their steps
+            # so that the restart steps still find the outputs they restart from.
+            # Changing the .ats files of the current directory, which define the tests, selects them too
+            if test_selection.active and not test_selection.select(
+                    testcase_name, collect_deck_dependencies( xml_file, glob.glob( '*.ats' ) ) ):
+                logger.debug( f'Test not affected by the changes: {testcase_name}' )
+                continue
+
             checks = []
             if curvecheck_params:
                 checks.append( 'curve' )
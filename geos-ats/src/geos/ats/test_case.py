@@ -320,7 +320,7 @@ class TestCase( object ):
 
         if config.priority == "processors":
             priority = maxnp
-        elif config.priority == "timing":
+        elif config.priority in ( "timing", "packing" ):
             priority = max( globalTestTimings.get( self.name, 1 ) * maxnp, 1 )
         else:
             priority = 1
@@ -361,6 +361,7 @@ class TestCase( object ):
                             batch=self.batch.enabled,
                             **kw )
             atsTest.step_outputs = step.resultPaths()
+            atsTest.geos_atsTestStep = step
 
             # Override the status if previously passed
             if self.last_status == PASSED:
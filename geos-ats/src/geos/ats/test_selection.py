@@ -0,0 +1,137 @@
+import os
+import json
+import logging
+from lxml import etree
+
+logger = logging.getLogger( 'geos_ats' )
+
+
+def normalize_path( path ):
+    return os.path.normpath( path ).replace( os.sep, '/' )
+
+
+def _names_files( attribute_name ):
+    """Check whether an attribute holds file names, such as file, voxelFile, coordinateFiles or restartFileName."""
+    name = attribute_name.lower()
+    return name == 'include' or name.endswith( ( 'file', 'files', 'filename', 'filenames' ) )
+
+
+def _collect_xml_dependencies( fname, dependencies, parsed ):
+    """Add the blocks of an xml file and the files it references to the dependencies, then those of its includes."""
+    if fname in parsed:
+        return
+    parsed.add( fname )
+    dependencies[ 'files' ].add( fname )
+    dirname = os.path.dirname( fname )
+
+    parser = etree.XMLParser( remove_comments=True )
+    root = etree.parse( fname, parser=parser ).getroot()
+    for element in root.iter():
+        if not isinstance( element.tag, str ):
+            continue
+        dependencies[ 'blocks' ].add( element.tag )
+        for attribute_name, attribute in element.attrib.items():
+            if not _names_files( attribute_name ):
+                continue
+            for value in attribute.strip( '{} ' ).split( ',' ):
+                value = value.strip()
+                if value and os.path.isfile( os.path.join( dirname, value ) ):
+                    dependencies[ 'files' ].add( os.path.realpath( os.path.join( dirname, value ) ) )
+
+    for included_root in root.findall( 'Included' ):
+        for included_file in included_root.findall( 'File' ):
+            _collect_xml_dependencies( os.path.realpath( os.path.join( dirname, included_file.get( 'name' ) ) ),
+                                       dependencies, parsed )
+
+
+def collect_deck_dependencies( fname, definitions=() ):
+    """Collect the files and block types an xml deck depends on.
+
+    The values of the file attributes (file, include, and the names ending with File, Files,
+    FileName or FileNames) naming an existing file relative to the xml, such as a mesh, a table
+    or a fluid parameter file, are dependencies.
+
+    Args:
+        fname (str): The path to the xml
+        definitions (list): The .ats files defining the tests of the deck
+
+    Returns:
+        dict: Sorted lists of the real paths of the test definitions, of the xml files included
+        (transitively) and of the files they reference ('files'), and of the types of all the
+        blocks ('blocks')
+    """
+    dependencies = { 'files': { os.path.realpath( f ) for f in definitions }, 'blocks': set() }
+    _collect_xml_dependencies( os.path.realpath( fname ), dependencies, set() )
+    return { k: sorted( v ) for k, v in dependencies.items() }
+
+
+class TestSelection:
+    """Selection of the tests affected by a set of changes.
+
+    Each test is indexed by the files its deck depends on (the .ats file defining it, the deck,
+    the xml files it includes and the mesh and table files they reference) and by the block types used in the deck.
+    A test is selected if one of its files or block types changed.  When no change is given,
+    every test is selected.
+    """
+
+    def __init__( self ):
+        self.changed_files = []
+        self.changed_blocks = set()
+        self.index = {}
+
+    def setup( self, changed_files, changed_blocks ):
+        """Set the changes, the relative file names are resolved against the current directory."""
+        self.changed_files = sorted( { ( normalize_path( os.path.realpath( f ) ), normalize_path( f ) )
+                                       for f in changed_files } )
+        self.changed_blocks = set( changed_blocks )
+        self.index = {}
+
+    @property
+    def active( self ):
+        return bool( self.changed_files or self.changed_blocks )
+
+    def file_changed( self, fname ):
+        """Check whether a file changed, either by absolute path or by a path ending with a changed path."""
+        fname = normalize_path( fname )
+        for absolute, relative in self.changed_files:
+            if fname == absolute or ( not relative.startswith( '../' ) and fname.endswith( '/' + relative ) ):
+                return True
+        return False
+
+    def select( self, name, dependencies ):
+        """Record the dependencies of a test and check whether it is affected by the changes.
+
+        Args:
+            name (str): The test name.
+            dependencies (dict): The 'files' and 'blocks' the test depends on.
+
+        Returns:
+            bool: Whether the test should run.
+        """
+        reasons = []
+        if self.active:
+            reasons += [ f for f in dependencies[ 'files' ] if self.file_changed( f ) ]
+            reasons += [ b for b in dependencies[ 'blocks' ] if b in self.changed_blocks ]
+        selected = bool( reasons ) or not self.active
+        self.index[ name ] = dict( dependencies, selected=selected, reasons=reasons )
+        return selected
+
+    def selected_tests( self ):
+        return sorted( k for k, v in self.index.items() if v[ 'selected' ] )
+
+    def write_index( self, fname ):
+        """Write the dependencies and the selection of every test."""
+        with open( fname, 'w' ) as f:
+            json.dump(
+                {
+                    'changed_files': [ relative for _, relative in self.changed_files ],
+                    'changed_blocks': sorted( self.changed_blocks ),
+                    'tests': self.index
+                },
+                f,
+                indent=1,
+                sort_keys=True )
+
+
+# The global test selection
+test_selection = TestSelection()
@@ -5,11 +5,11 @@ import shutil
 import sys
 import textwrap
 import subprocess
-import re
 import logging
 from geos.ats import common_utilities, history
 from geos.ats.common_utilities import Error, Log
 from geos.ats.configuration_record import config
+from geos.ats.directory_index import directory_index
 
 logger = logging.getLogger( 'geos-ats' )
 
@@ -42,24 +42,10 @@ def findMaxMatchingFile( file_path ):
 
         "test/plot_*.hdf5" will return the file with the greatest name in the ./test directory
         that begins with "plot_" and ends with ".hdf5".
-    """
-    file_directory, pattern = os.path.split( file_path )
-    if file_directory == "":
-        file_directory = "."
-
-    if not os.path.isdir( file_directory ):
-        return None
-
-    max_match = ''
-    pattern = re.compile( pattern )
-    for file in os.listdir( file_directory ):
-        if pattern.match( file ) is not None:
-            max_match = max( file, max_match )
 
-    if not max_match:
-        return None
-
-    return os.path.join( file_directory, max_match )
+    The directory listings are cached for the whole run, see DirectoryIndex.
+    """
+    return directory_index.find_max_matching_file( file_path )
 
 
 class TestParam( object ):
@@ -312,6 +298,13 @@ class TestStepBase( object ):
     def timelimit( self ):
         return getattr( self.p, "timelimit", None )
 
+    def resourceProfile( self ):
+        """
+        Return the resources used by this step: number of cores, estimated memory (bytes),
+        and whether it is bound by I/O rather than by computations.
+        """
+        return { "cores": max( getattr( self.p, "np", 1 ) or 1, 1 ), "memory": 0, "io": False }
+
     def expectedResult( self ):
         return getattr( self.p, "expectedResult", "PASS" )
 
@@ -364,6 +357,28 @@ class CheckTestStepBase( TestStepBase ):
     def isCheck( self ):
         return True
 
+    def checkedFiles( self ):
+        """
+        Return the paths of the files and folders compared by this step.
+        """
+        return []
+
+    def resourceProfile( self ):
+        """
+        Check steps read the output and baseline files, their memory is estimated by the size of these files.
+        This is evaluated when the step is about to run, once the files are written.
+        """
+        memory = 0
+        for path in self.checkedFiles():
+            if os.path.isfile( path ):
+                memory += os.path.getsize( path )
+            elif os.path.isdir( path ):
+                for root, _, files in os.walk( path ):
+                    memory += sum( os.path.getsize( os.path.join( root, f ) ) for f in files )
+        profile = TestStepBase.resourceProfile( self )
+        profile.update( memory=memory, io=True )
+        return profile
+
     def handleCommonParams( self ):
         TestStepBase.handleCommonParams( self )
 
@@ -641,6 +656,14 @@ class restartcheck( CheckTestStepBase ):
             os.path.join( self.p.output_directory, "%s.restartcheck" % os.path.splitext( self.p.file_pattern )[ 0 ] )
         ]
 
+    def checkedFiles( self ):
+        paths = []
+        for regex in ( self.restart_file_regex, self.restart_baseline_regex ):
+            root_file_path = findMaxMatchingFile( regex )
+            if root_file_path is not None:
+                paths += [ root_file_path, os.path.splitext( root_file_path )[ 0 ] ]
+        return paths
+
     def clean( self ):
         self._clean( self.resultPaths() )
 
@@ -773,6 +796,9 @@ class curvecheck( CheckTestStepBase ):
     def resultPaths( self ):
         return [ self.target_file, os.path.join( self.figure_root, '*.png' ) ]
 
+    def checkedFiles( self ):
+        return [ self.target_file, self.baseline_file ]
+
     def clean( self ):
         self._clean( self.resultPaths() )
 
@@ -0,0 +1,98 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+from geos.ats.common_utilities import atomic_write
+
+logger = logging.getLogger( 'geos_ats' )
+
+
+class TimingHistory:
+    """Runtimes of the tests measured during the previous runs, per machine.
+
+    The last runtimes of each test are kept in a json file, and the runtime
+    of a test is predicted as their median.
+    """
+
+    def __init__( self, fname='', machine='', size=5 ):
+        self.fname = fname
+        self.machine = machine
+        self.size = size
+        self.timings = {}
+
+    def setup( self, fname, machine, size ):
+        """Set the history file and the machine, then load the history."""
+        self.fname = fname
+        self.machine = machine
+        self.size = size
+        self.load()
+
+    def load( self ):
+        self.timings = {}
+        if not self.fname or not os.path.isfile( self.fname ):
+            return
+        try:
+            with open( self.fname, 'r' ) as f:
+                self.timings = json.load( f )
+        except ( OSError, ValueError ) as e:
+            logger.warning( f'Could not read the timing history {self.fname}: {e}' )
+
+    def save( self ):
+        """Write the history, replacing the previous file at once."""
+        if not self.fname or not self.timings:
+            return
+        try:
+            atomic_write( self.fname, json.dumps( self.timings, indent=1, sort_keys=True ) )
+        except OSError as e:
+            logger.warning( f'Could not write the timing history {self.fname}: {e}' )
+
+    def record( self, name, elapsed ):
+        """Add a runtime of a test, only the last ones are kept."""
+        runtimes = self.timings.setdefault( self.machine, {} ).setdefault( name, [] )
+        runtimes.append( elapsed )
+        del runtimes[ :max( len( runtimes ) - self.size, 0 ) ]
+
+    def predictions( self ):
+        """Get the predicted runtime of each test known on this machine."""
+        return {
+            name: statistics.median( runtimes )
+            for name, runtimes in self.timings.get( self.machine, {} ).items() if runtimes
+        }
+
+
+def predict_makespan( jobs, nprocs ):
+    """Predict the makespan of jobs started in order as soon as enough processors are idle.
+
+    Later jobs fill the processors left idle by a job that does not fit yet.
+
+    Args:
+        jobs (list): The (runtime, number of processors) of each job, in order of priority.
+        nprocs (int): The number of processors of the machine.
+
+    Returns:
+        float: The predicted makespan.
+    """
+    pending = [ ( runtime, min( max( np, 1 ), nprocs ) ) for runtime, np in jobs ]
+    running: list = []
+    current_time = 0.0
+    idle = nprocs
+    makespan = 0.0
+    while pending:
+        waiting = []
+        for runtime, np in pending:
+            if np <= idle:
+                idle -= np
+                heapq.heappush( running, ( current_time + runtime, np ) )
+                makespan = max( makespan, current_time + runtime )
+            else:
+                waiting.append( ( runtime, np ) )
+        pending = waiting
+        if pending:
+            current_time, np = heapq.heappop( running )
+            idle += np
+    return makespan
+
+
+# The global timing history
+timing_history = TimingHistory()
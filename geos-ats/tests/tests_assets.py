@@ -0,0 +1,22 @@
+import os
+
+from geos.ats.assets import create_assets_folder
+
+
+def tests_create_assets_folder( tmp_path ):
+    target_dir = tmp_path / 'html_assets'
+    create_assets_folder( str( target_dir ) )
+    assert sorted( os.listdir( target_dir ) ) == [ 'lightbox', 'live_report.js', 'sorttable.js', 'style.css' ]
+
+
+def tests_complete_old_assets_folder( tmp_path ):
+    # folder created before live_report.js was added, with a customized style
+    target_dir = tmp_path / 'html_assets'
+    target_dir.mkdir()
+    ( target_dir / 'sorttable.js' ).write_text( '' )
+    ( target_dir / 'style.css' ).write_text( 'custom' )
+
+    create_assets_folder( str( target_dir ) )
+    assert ( target_dir / 'live_report.js' ).stat().st_size > 0
+    assert ( target_dir / 'lightbox' ).is_dir()
+    assert ( target_dir / 'style.css' ).read_text() == 'custom'
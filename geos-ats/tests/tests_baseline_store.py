@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from geos.ats import baseline_store, common_utilities
+from geos.ats.baseline_store import LOCAL_MANIFEST, BaselineIntegrityError, BaselineStore
+
+
+def _write_files( path, files ):
+    for rel, data in files.items():
+        fname = path / rel
+        fname.parent.mkdir( parents=True, exist_ok=True )
+        fname.write_bytes( data )
+
+
+def _read_files( path ):
+    return {
+        os.path.relpath( os.path.join( root, f ), path ).replace( os.sep, '/' ):
+        open( os.path.join( root, f ), 'rb' ).read()
+        for root, _, fnames in os.walk( path )
+        for f in fnames if f != LOCAL_MANIFEST
+    }
+
+
+@pytest.fixture
+def small_chunks( monkeypatch ):
+    monkeypatch.setattr( baseline_store, 'CHUNK_SIZE', 4 )
+
+
+def tests_pack_and_unpack( tmp_path, small_chunks ):
+    files = { 'a.txt': b'0123456789', 'sub/b.bin': b'abcdabcd', 'empty': b'' }
+    _write_files( tmp_path / 'baselines', files )
+    store = BaselineStore( str( tmp_path / 'store' ) )
+    manifest = store.pack( 'v1', str( tmp_path / 'baselines' ) )
+    assert store.versions() == [ 'v1' ]
+    assert [ len( manifest[ 'files' ][ rel ][ 'chunks' ] ) for rel in sorted( files ) ] == [ 3, 0, 2 ]
+    # identical chunks are only stored once
+    assert manifest[ 'files' ][ 'sub/b.bin' ][ 'chunks' ][ 0 ] == manifest[ 'files' ][ 'sub/b.bin' ][ 'chunks' ][ 1 ]
+
+    store.unpack( 'v1', str( tmp_path / 'unpacked' ) )
+    assert _read_files( tmp_path / 'unpacked' ) == files
+
+    with pytest.raises( FileNotFoundError ):
+        store.unpack( 'v2', str( tmp_path / 'unpacked' ) )
+
+
+def tests_unpack_updates_changed_files( tmp_path, small_chunks ):
+    store = BaselineStore( str( tmp_path / 'store' ) )
+    _write_files( tmp_path / 'baselines', { 'kept': b'kept', 'modified': b'v1', 'removed': b'removed' } )
+    store.pack( 'v1', str( tmp_path / 'baselines' ) )
+    ( tmp_path / 'baselines' / 'removed' ).unlink()
+    _write_files( tmp_path / 'baselines', { 'modified': b'v2', 'added': b'added' } )
+    store.pack( 'v2', str( tmp_path / 'baselines' ) )
+
+    unpacked = tmp_path / 'unpacked'
+    store.unpack( 'v1', str( unpacked ) )
+    kept_mtime = os.stat( unpacked / 'kept' ).st_mtime_ns
+    store.unpack( 'v2', str( unpacked ) )
+    assert _read_files( unpacked ) == { 'kept': b'kept', 'modified': b'v2', 'added': b'added' }
+    assert os.stat( unpacked / 'kept' ).st_mtime_ns == kept_mtime
+
+    # local modifications are detected and reverted
+    _write_files( unpacked, { 'kept': b'oops' } )
+    store.unpack( 'v2', str( unpacked ) )
+    assert ( unpacked / 'kept' ).read_bytes() == b'kept'
+
+
+def tests_pack_into_another_store( tmp_path, small_chunks ):
+    files = { 'a.txt': b'0123456789' }
+    _write_files( tmp_path / 'baselines', files )
+    BaselineStore( str( tmp_path / 'store_a' ) ).pack( 'v1', str( tmp_path / 'baselines' ) )
+
+    # the files known from the first store are still written to the second one
+    store_b = BaselineStore( str( tmp_path / 'store_b' ) )
+    store_b.pack( 'v1', str( tmp_path / 'baselines' ) )
+    store_b.unpack( 'v1', str( tmp_path / 'unpacked' ) )
+    assert _read_files( tmp_path / 'unpacked' ) == files
+
+
+def tests_pack_restores_missing_chunks( tmp_path, small_chunks ):
+    _write_files( tmp_path / 'baselines', { 'a.txt': b'0123456789' } )
+    store = BaselineStore( str( tmp_path / 'store' ) )
+    manifest = store.pack( 'v1', str( tmp_path / 'baselines' ) )
+    digest = manifest[ 'files' ][ 'a.txt' ][ 'chunks' ][ 0 ]
+    os.remove( store.chunk_path( digest ) )
+
+    store.pack( 'v2', str( tmp_path / 'baselines' ) )
+    assert os.path.isfile( store.chunk_path( digest ) )
+
+
+def tests_corrupted_chunk( tmp_path, small_chunks ):
+    _write_files( tmp_path / 'baselines', { 'a.txt': b'0123456789' } )
+    store = BaselineStore( str( tmp_path / 'store' ) )
+    manifest = store.pack( 'v1', str( tmp_path / 'baselines' ) )
+    digest = manifest[ 'files' ][ 'a.txt' ][ 'chunks' ][ 1 ]
+    with open( store.chunk_path( digest ), 'wb' ) as f:
+        f.write( b'garbage' )
+
+    with pytest.raises( BaselineIntegrityError ):
+        store.unpack( 'v1', str( tmp_path / 'unpacked' ) )
+    # the partial file is not left behind
+    assert not ( tmp_path / 'unpacked' / 'a.txt' ).exists()
+    assert not any( f.endswith( '.tmp' ) for f in os.listdir( tmp_path / 'unpacked' ) )
+
+
+def tests_shared_permissions( tmp_path, small_chunks, monkeypatch ):
+    monkeypatch.setattr( common_utilities, '_UMASK', 0o022 )
+    _write_files( tmp_path / 'baselines', { 'a.txt': b'0123456789' } )
+    os.chmod( tmp_path / 'baselines' / 'a.txt', 0o640 )
+    store = BaselineStore( str( tmp_path / 'store' ) )
+    manifest = store.pack( 'v1', str( tmp_path / 'baselines' ) )
+    store.unpack( 'v1', str( tmp_path / 'unpacked' ) )
+
+    # the store is readable by the other users, as files created with open
+    for digest in manifest[ 'files' ][ 'a.txt' ][ 'chunks' ]:
+        assert os.stat( store.chunk_path( digest ) ).st_mode & 0o777 == 0o644
+    assert os.stat( store.manifest_path( 'v1' ) ).st_mode & 0o777 == 0o644
+    # the unpacked files get the mode of the packed ones
+    assert os.stat( tmp_path / 'unpacked' / 'a.txt' ).st_mode & 0o777 == 0o640
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from geos.ats.machine_utilities import CheckStepPool
+
+GB = 1024**3
+
+
+def _test( np=1, memory=0, check=True ):
+    profile = { 'cores': max( np, 1 ), 'memory': memory, 'io': check }
+    return SimpleNamespace( name='test',
+                            np=np,
+                            geos_atsTestStep=SimpleNamespace( isCheck=lambda: check, resourceProfile=lambda: profile ) )
+
+
+def tests_can_run_now():
+    pool = CheckStepPool( cores=2, memory=10 * GB )
+    first, second, third = _test(), _test(), _test()
+    assert pool.handles( first )
+    assert pool.canRunNow( first )
+    pool.noteLaunch( first )
+    assert pool.canRunNow( second )
+    pool.noteLaunch( second )
+    # the two cores of the pool are used
+    assert not pool.canRunNow( third )
+    pool.noteEnd( first )
+    assert first.check_profile is None
+    assert pool.canRunNow( third )
+    pool.noteEnd( second )
+    assert not pool.running
+
+
+def tests_memory_ceiling():
+    pool = CheckStepPool( cores=4, memory=10 * GB )
+    small, large, huge = _test( memory=4 * GB ), _test( memory=7 * GB ), _test( memory=20 * GB )
+    pool.noteLaunch( small )
+    assert not pool.canRunNow( large )
+    assert pool.canRunNow( _test( memory=6 * GB ) )
+    assert not pool.canRunNow( huge )
+    pool.noteEnd( small )
+    # a check above the ceiling still runs alone
+    assert pool.canRunNow( huge )
+
+
+def tests_handles():
+    pool = CheckStepPool( cores=2, memory=0 )
+    assert not pool.handles( _test( check=False ) )
+    # a check needing more cores than the pool runs with the simulations
+    assert not pool.handles( _test( np=4 ) )
+    assert pool.handles( _test( np=2 ) )
+
+
+def tests_disabled():
+    pool = CheckStepPool( cores=0, memory=0 )
+    assert not pool.enabled
+    assert not pool.handles( _test() )
+    assert pool.reserve( 8 ) == 0
+
+
+def tests_reserve():
+    assert CheckStepPool( cores=2, memory=0 ).reserve( 8 ) == 2
+    # at least one processor is left to the simulations
+    pool = CheckStepPool( cores=4, memory=0 )
+    assert pool.reserve( 4 ) == 3
+    assert pool.cores == 3
+    assert CheckStepPool( cores=2, memory=0 ).reserve( 1 ) == 0
@@ -0,0 +1,89 @@
+import os
+import time
+
+from geos.ats.directory_index import MTIME_GRANULARITY_NS, DirectoryIndex
+
+
+def _set_mtime( path, mtime_ns ):
+    os.utime( path, ns=( mtime_ns, mtime_ns ) )
+
+
+def tests_file_created_in_same_mtime_tick( tmp_path ):
+    index = DirectoryIndex()
+    pattern = str( tmp_path / r'restart_\d+\.root' )
+    mtime_ns = time.time_ns()
+    ( tmp_path / 'restart_0001.root' ).write_text( '' )
+    _set_mtime( tmp_path, mtime_ns )
+    assert index.find_max_matching_file( pattern ) == str( tmp_path / 'restart_0001.root' )
+
+    # with a coarse modification time, the new file does not change that of the directory
+    ( tmp_path / 'restart_0002.root' ).write_text( '' )
+    _set_mtime( tmp_path, mtime_ns )
+    assert index.find_max_matching_file( pattern ) == str( tmp_path / 'restart_0002.root' )
+
+
+def tests_racy_listing_rescan( tmp_path ):
+    index = DirectoryIndex()
+    ( tmp_path / 'a' ).write_text( '' )
+
+    # a listing made in the same tick as the last change is scanned again at each query
+    _set_mtime( tmp_path, time.time_ns() )
+    listing = index.listing( tmp_path )
+    assert listing.racy
+    assert index.listing( tmp_path ) is not listing
+
+    # an older change is trusted, and the listing reused while the directory is unchanged
+    old_mtime_ns = time.time_ns() - 10 * MTIME_GRANULARITY_NS
+    _set_mtime( tmp_path, old_mtime_ns )
+    listing = index.listing( tmp_path )
+    assert not listing.racy
+    assert listing.names == ( 'a', )
+    assert index.listing( tmp_path ) is listing
+
+    ( tmp_path / 'b' ).write_text( '' )
+    _set_mtime( tmp_path, old_mtime_ns + MTIME_GRANULARITY_NS )
+    assert sorted( index.listing( tmp_path ).names ) == [ 'a', 'b' ]
+
+
+def tests_missing_directory( tmp_path ):
+    index = DirectoryIndex()
+    assert index.listing( tmp_path / 'missing' ) is None
+    assert index.find_max_matching_file( str( tmp_path / 'missing' / 'restart_.*' ) ) is None
+
+    # a file is not listed
+    ( tmp_path / 'file' ).write_text( '' )
+    assert index.listing( tmp_path / 'file' ) is None
+
+    # a removed directory is dropped from the cache
+    ( tmp_path / 'removed' ).mkdir()
+    assert index.listing( tmp_path / 'removed' ) is not None
+    ( tmp_path / 'removed' ).rmdir()
+    assert index.listing( tmp_path / 'removed' ) is None
+    assert str( tmp_path / 'removed' ) not in index.listings
+
+
+def tests_find_max_matching_file( tmp_path ):
+    index = DirectoryIndex()
+    old_mtime_ns = time.time_ns() - 10 * MTIME_GRANULARITY_NS
+    for name in [ 'restart_0001.root', 'restart_0010.root', 'other_0100.root' ]:
+        ( tmp_path / name ).write_text( '' )
+    _set_mtime( tmp_path, old_mtime_ns )
+
+    pattern = str( tmp_path / r'restart_\d+\.root' )
+    assert index.find_max_matching_file( pattern ) == str( tmp_path / 'restart_0010.root' )
+    assert index.find_max_matching_file( str( tmp_path / r'none_.*' ) ) is None
+    assert index.listing( tmp_path ).max_matches == {
+        r'restart_\d+\.root': 'restart_0010.root',
+        r'none_.*': None,
+    }
+
+    # the memoized maximum is dropped with the listing when the directory changes
+    ( tmp_path / 'restart_0020.root' ).write_text( '' )
+    _set_mtime( tmp_path, old_mtime_ns + MTIME_GRANULARITY_NS )
+    assert index.find_max_matching_file( pattern ) == str( tmp_path / 'restart_0020.root' )
+
+
+def tests_relative_path( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    ( tmp_path / 'restart_0001.root' ).write_text( '' )
+    assert DirectoryIndex().find_max_matching_file( r'restart_\d+\.root' ) == os.path.join( '.', 'restart_0001.root' )
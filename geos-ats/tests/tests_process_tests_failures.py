@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+
+from geos.ats.helpers.process_tests_failures import ( BLOCK_END_STRING, ERROR_STRINGS, compile_any,
+                                                      parse_logs_and_filter_errors, scan_log_file )
+
+STARS = BLOCK_END_STRING
+TRUNCATED = '***** No closing line. File truncated? Filters may not be properly applied! *****'
+
+LOGS = {
+    'sedov_01.log': [
+        'Time: 0s, dt: 1s, Cycle: 0',
+        'Error: Value 1.5 out of range in /path/to/sedov.xml',
+        '  at rank 0',
+        STARS,
+        'Time: 1s, dt: 1s, Cycle: 1',
+        'Error: logLevel is not a valid attribute',
+        STARS,
+        'Error: Newton failed after 12 iterations',
+        'Error: Value 2 out of range in /path/to/sedov.xml',
+        'trailing 1',
+        'trailing 2',
+        'trailing 3',
+        'Error: end of the file',
+    ],
+    'beam_04.log': [
+        'Error: Value -3e+02 out of range in /other/path/beam.xml',
+        '  at rank 3',
+        STARS,
+    ],
+    'clean_01.log': [ 'Time: 0s, dt: 1s, Cycle: 0' ],
+}
+
+
+def _old_blocks( lines, numTrailingLines, exclusionStrings ):
+    """Blocks of a log as the previous implementation, which read the whole file, output them."""
+    blocks = []
+    for idx in [ i for i, line in enumerate( lines ) if all( s in line for s in ERROR_STRINGS ) ]:
+        block = [ '  ' + lines[ idx - 1 ] ] if idx > 0 else []
+        block.append( '  ' + lines[ idx ] )
+        for j in range( 1, numTrailingLines + 1 ):
+            if idx + j >= len( lines ):
+                block.append( '  ' + TRUNCATED )
+                break
+            block.append( '  ' + lines[ idx + j ] )
+            if STARS in lines[ idx + j ]:
+                break
+        blocks.append( '\n'.join( block ) )
+    return len( blocks ), [ b for b in blocks if not any( s in b for s in exclusionStrings ) ]
+
+
+@pytest.fixture
+def log_dir( tmp_path ):
+    for name, lines in LOGS.items():
+        ( tmp_path / name ).write_text( '\n'.join( lines ) + '\n' )
+    return tmp_path
+
+
+@pytest.mark.parametrize( 'numTrailingLines', [ 0, 1, 3, 5 ] )
+def tests_scan_log_file( log_dir, numTrailingLines ):
+    exclusionStrings = [ 'logLevel' ]
+    for name, lines in LOGS.items():
+        fileName, count, blocks = scan_log_file( str( log_dir / name ), compile_any( ERROR_STRINGS ),
+                                                 compile_any( exclusionStrings ), numTrailingLines )
+        assert fileName == str( log_dir / name )
+        assert ( count, [ text for text, _ in blocks ] ) == _old_blocks( lines, numTrailingLines, exclusionStrings )
+
+
+def tests_blocks( log_dir ):
+    _, count, blocks = scan_log_file( str( log_dir / 'sedov_01.log' ), compile_any( ERROR_STRINGS ),
+                                      compile_any( [ 'logLevel' ] ), 3 )
+    assert count == 5
+    texts = [ text for text, _ in blocks ]
+    # the block stops at the line of stars
+    assert texts[ 0 ] == '\n'.join( '  ' + line for line in LOGS[ 'sedov_01.log' ][ :4 ] )
+    # trailing lines may hold another error, which starts its own block
+    assert texts[ 1 ].splitlines()[ -1 ] == '  trailing 2'
+    assert texts[ 2 ].splitlines()[ -1 ] == '  trailing 3'
+    assert texts[ 3 ].splitlines()[ -1 ] == '  ' + TRUNCATED
+
+
+def tests_long_lines( tmp_path, monkeypatch ):
+    from geos.ats.helpers import process_tests_failures
+    monkeypatch.setattr( process_tests_failures, 'MAX_LINE_LENGTH', 16 )
+    ( tmp_path / 'long.log' ).write_text( 'Error: ' + 'x' * 100 + '\nnext line\n' )
+    _, _, blocks = scan_log_file( str( tmp_path / 'long.log' ), compile_any( ERROR_STRINGS ), None, 1 )
+    assert blocks[ 0 ][ 0 ] == '  Error: xxxxxxxxx\n  next line'
+
+
+@pytest.mark.parametrize( 'jobs', [ 1, 2 ] )
+def tests_group_by_signature( log_dir, jobs, caplog ):
+    caplog.set_level( logging.INFO )
+    clusters = parse_logs_and_filter_errors( str( log_dir ), '.log', [ 'logLevel' ], 3, jobs=jobs )
+    # the same error in different tests, with different values, paths and ranks, has one signature
+    assert [ ( signature, count, tests ) for signature, count, tests, _ in clusters ] == [
+        ( 'Error: Value <n> out of range in <path> | at rank <n>', 2, [ 'beam_04', 'sedov_01' ] ),
+        ( 'Error: Newton failed after <n> iterations | Error: Value <n> out of range in <path> | trailing <n> | '
+          'trailing <n>', 1, [ 'sedov_01' ] ),
+        ( 'Error: Value <n> out of range in <path> | trailing <n> | trailing <n> | trailing <n>', 1, [ 'sedov_01' ] ),
+        ( 'Error: end of the file', 1, [ 'sedov_01' ] ),
+    ]
+
+    # the per file report is unchanged
+    assert 'Total number of log files processed: 3' in caplog.text
+    assert f'Found unfiltered diff in: {log_dir / "beam_04.log"}' in caplog.text
+    assert 'clean_01.log' not in caplog.text
+    assert 'had at least one error block that was filtered:\nsedov_01.log\n' in caplog.text
@@ -0,0 +1,23 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip( 'ats' )
+pytest.importorskip( 'tabulate' )
+
+from geos.ats import common_utilities, reporting
+
+
+def tests_reports_are_readable( tmp_path, monkeypatch ):
+    monkeypatch.setattr( common_utilities, '_UMASK', 0o022 )
+    html_file = str( tmp_path / 'test_results.html' )
+    monkeypatch.setattr( reporting, 'config', SimpleNamespace( report_html_file=html_file, report_notations=[] ) )
+
+    # the reports may be published, they get the permissions of files created with open
+    reporting.ReportIni( [] ).write( str( tmp_path / 'test_results.ini' ) )
+    assert os.stat( tmp_path / 'test_results.ini' ).st_mode & 0o777 == 0o644
+
+    live_report = reporting.ReportStream()
+    live_report.start( [], html_file )
+    assert os.stat( tmp_path / 'test_results_live.html' ).st_mode & 0o777 == 0o644
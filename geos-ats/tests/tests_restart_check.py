@@ -0,0 +1,96 @@
+import io
+import re
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip( 'h5py' )
+pytest.importorskip( 'mpi4py' )
+
+from geos.ats.helpers import restart_check  # noqa: E402
+from geos.ats.helpers.restart_check import FileComparison  # noqa: E402
+
+SHAPE = np.array( [ 4, 5, 6 ] )
+
+
+def _write_lvarray( fname, data, permutation ):
+    """Write an array as GEOS writes an LvArray, its values being stored in the memory order of the permutation."""
+    with h5py.File( fname, 'w' ) as f:
+        group = f.create_group( 'array' )
+        group[ '__dimensions__' ] = SHAPE
+        group[ '__permutation__' ] = np.array( permutation )
+        group[ '__values__' ] = np.transpose( data, permutation ).flatten()
+
+
+def _compare( tmp_path, data, permutation, base_data, base_permutation, rtol=0.0, atol=0.0 ):
+    _write_lvarray( tmp_path / 'run.hdf5', data, permutation )
+    _write_lvarray( tmp_path / 'base.hdf5', base_data, base_permutation )
+    output = io.StringIO()
+    comparison = FileComparison( str( tmp_path / 'run.hdf5' ), str( tmp_path / 'base.hdf5' ), rtol, atol, [], output,
+                                 False, False )
+    with h5py.File( tmp_path / 'run.hdf5', 'r' ) as f, h5py.File( tmp_path / 'base.hdf5', 'r' ) as base_f:
+        comparison.compareLvArrays( f[ 'array' ], base_f[ 'array' ],
+                                    { '__dimensions__', '__permutation__', '__values__' } )
+    return comparison.different, output.getvalue()
+
+
+def _statistics( message ):
+    return [ ( float( mean ), float( std ) ) for mean, std in re.findall( r'mean = (\S+), std = (\S+)', message ) ]
+
+
+@pytest.fixture
+def small_blocks( monkeypatch ):
+    # a single row of the baseline memory layout per block
+    monkeypatch.setattr( restart_check, 'COMPARISON_BLOCK_SIZE', 7 )
+
+
+@pytest.mark.parametrize( 'permutation', [ ( 0, 1, 2 ), ( 2, 0, 1 ), ( 1, 2, 0 ) ] )
+def tests_compare_int_arrays( tmp_path, small_blocks, permutation ):
+    base_data = np.arange( np.prod( SHAPE ), dtype=np.int64 ).reshape( SHAPE )
+    data = base_data.copy()
+    data[ 1, 2, 3 ] += 1000
+    data[ 3, 0, 5 ] -= 1001
+    data[ 2, 4, 0 ] += 1002
+
+    different, message = _compare( tmp_path, data, permutation, base_data, ( 2, 1, 0 ) )
+    assert different
+    assert 'have 120 values of which 3 have differing values' in message
+    # the max is reported at its index in the order of the dimensions
+    assert 'max_index = (2, 4, 0), max = 1002' in message
+    assert _statistics( message ) == [ pytest.approx( ( 1001.0, np.std( [ 1000, 1001, 1002 ] ) ) ) ]
+
+    # the result does not depend on the layout of the compared array
+    assert ( different, message ) == _compare( tmp_path, data, ( 2, 1, 0 ), base_data, ( 2, 1, 0 ) )
+    assert _compare( tmp_path, base_data, permutation, base_data, ( 2, 1, 0 ) ) == ( False, '' )
+
+
+@pytest.mark.parametrize( 'permutation', [ ( 0, 1, 2 ), ( 2, 0, 1 ), ( 1, 2, 0 ) ] )
+def tests_compare_float_arrays( tmp_path, small_blocks, permutation ):
+    # a large mean with a small spread, where the sum of the squares cancels catastrophically
+    base_data = np.full( SHAPE, 1e9 )
+    data = base_data + np.linspace( 0.0, 1e-3, int( np.prod( SHAPE ) ) ).reshape( SHAPE ) + 1e6
+
+    different, message = _compare( tmp_path, data, permutation, base_data, ( 0, 2, 1 ), rtol=0.0, atol=1.0 )
+    assert different
+    assert 'have 120 values of which 120 fail both the relative and absolute tests' in message
+    assert 'Max absolute difference is at index (3, 4, 5)' in message
+    q = ( data - base_data ).flatten()
+    assert _statistics( message ) == [ pytest.approx( ( np.mean( q ), np.std( q ) ), rel=1e-6 ) ]
+
+    assert ( different, message ) == _compare( tmp_path, data, ( 0, 2, 1 ), base_data, ( 0, 2, 1 ), rtol=0.0, atol=1.0 )
+    assert _compare( tmp_path, base_data, permutation, base_data, ( 0, 2, 1 ), rtol=0.0, atol=1.0 ) == ( False, '' )
+
+
+def tests_running_statistics():
+    values = np.array( [ 0.0, 3.0, 0.0, 5.0, 7.0, 0.0, 9.0 ] ) + 1e8
+    selected = np.array( [ False, True, False, True, True, False, True ] )
+    stats = restart_check.RunningStatistics()
+    for start in range( 0, values.size, 3 ):
+        stats.update( values[ start:start + 3 ], selected[ start:start + 3 ], start )
+    assert stats.count == 4
+    assert stats.max.value == values[ 6 ] and stats.max.index == 6
+    # over the selected values only
+    assert stats.meanStd( 4 ) == pytest.approx( ( np.mean( values[ selected ] ), np.std( values[ selected ] ) ) )
+    # over all the values, those that are not selected being zero
+    zeros = np.where( selected, values, 0.0 )
+    assert stats.meanStd( values.size ) == pytest.approx( ( np.mean( zeros ), np.std( zeros ) ) )
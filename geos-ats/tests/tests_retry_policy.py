@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+
+from geos.ats.retry_policy import LOG_TAIL_SIZE, RetryPolicy, RetryRule, read_log_tail
+
+RULES = [
+    RetryRule( 'timeout', 1, statuses=( 'TIMEDOUT', ) ),
+    RetryRule( 'launch', 2, pattern=r'launch failed' ),
+    RetryRule( 'segfault', 1, pattern=r'Segmentation fault', exit_codes=( -11, 139 ) ),
+    RetryRule( 'diff', 0, check_steps=True ),
+]
+
+
+def _failed_test( tmp_path, name='test', status='FAILED', returnCode=1, err='', out='', check=False ):
+    ( tmp_path / f'{name}.err' ).write_text( err )
+    ( tmp_path / f'{name}.out' ).write_text( out )
+    # the logs are those of the test case, as for the scheduler
+    return SimpleNamespace( status=status,
+                            returnCode=returnCode,
+                            errname=str( tmp_path / 'other.err' ),
+                            outname=str( tmp_path / 'other.out' ),
+                            geos_atsTestCase=SimpleNamespace( errname=str( tmp_path / f'{name}.err' ),
+                                                              outname=str( tmp_path / f'{name}.out' ) ),
+                            geos_atsTestStep=SimpleNamespace( isCheck=lambda: check ) )
+
+
+def _policy( quarantined=() ):
+    policy = RetryPolicy( [ RetryRule( **vars( r ) ) for r in RULES ], backoff=10.0 )
+    policy.quarantined = set( quarantined )
+    return policy
+
+
+@pytest.mark.parametrize( 'kwargs, failure', [
+    ( {
+        'status': 'TIMEDOUT',
+        'err': 'launch failed'
+    }, 'timeout' ),
+    ( {
+        'out': 'srun: launch failed'
+    }, 'launch' ),
+    ( {
+        'err': 'Segmentation fault (core dumped)'
+    }, 'segfault' ),
+    ( {
+        'returnCode': 139
+    }, 'segfault' ),
+    ( {
+        'check': True
+    }, 'diff' ),
+    ( {}, None ),
+] )
+def tests_classify( tmp_path, kwargs, failure ):
+    rule = _policy().classify( _failed_test( tmp_path, **kwargs ) )
+    assert ( rule.name if rule else None ) == failure
+
+
+def tests_add_rule( tmp_path ):
+    policy = _policy()
+    policy.add_rule( RetryRule( 'oom', 1, pattern=r'out of memory' ) )
+    test = _failed_test( tmp_path, returnCode=139, err='out of memory' )
+    assert policy.classify( test ).name == 'oom'
+    policy.rules.pop( 0 )
+    assert policy.classify( test ).name == 'segfault'
+
+
+def tests_backoff( tmp_path ):
+    policy = _policy()
+    group = SimpleNamespace()
+    launch = _failed_test( tmp_path, 'launch', err='launch failed' )
+    segfault = _failed_test( tmp_path, 'segfault', returnCode=-11 )
+    # each class has its own retry limit, and the delay doubles with each attempt of the class
+    assert policy.decide( 'test', launch, group ) == ( 'launch', 10.0 )
+    assert policy.decide( 'test', segfault, group ) == ( 'segfault', 10.0 )
+    assert policy.decide( 'test', launch, group ) == ( 'launch', 20.0 )
+    assert policy.decide( 'test', launch, group ) == ( 'launch', None )
+    assert policy.decide( 'test', segfault, group ) == ( 'segfault', None )
+    assert group.retry_attempts == { 'launch': 2, 'segfault': 1 }
+
+
+def tests_not_retried( tmp_path ):
+    group = SimpleNamespace()
+    assert _policy().decide( 'test', _failed_test( tmp_path, check=True ), group ) == ( 'diff', None )
+    assert _policy().decide( 'test', _failed_test( tmp_path ), group ) == ( 'unknown', None )
+    assert _policy( quarantined=[ 'test' ] ).decide( 'test', _failed_test( tmp_path, status='TIMEDOUT' ),
+                                                     group ) == ( 'timeout', None )
+
+
+def tests_read_log_tail( tmp_path ):
+    fname = tmp_path / 'test.log'
+    fname.write_text( 'Segmentation fault' + 'x' * LOG_TAIL_SIZE )
+    assert read_log_tail( str( fname ) ) == 'x' * LOG_TAIL_SIZE
+    assert read_log_tail( str( tmp_path / 'missing.log' ) ) == ''
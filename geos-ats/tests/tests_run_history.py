@@ -0,0 +1,94 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from geos.ats.run_history import RunHistory, record_run_history
+
+
+def _results( **tests ):
+    """Build the test results of a run from name=(status, elapsed) pairs, as the reports provide them."""
+    return {
+        name: SimpleNamespace( status=SimpleNamespace( name=status ), elapsed=elapsed, resources=1, retries=0 )
+        for name, ( status, elapsed ) in tests.items()
+    }
+
+
+def _record_runs( run_history, *runs, machine="machine" ):
+    for i, ( commit, results ) in enumerate( runs ):
+        run_history.record_run( results, machine, commit, run_time=float( i ) )
+
+
+def tests_record_and_history( tmp_path ):
+    fname = str( tmp_path / "history.db" )
+    with RunHistory( fname ) as run_history:
+        _record_runs( run_history, ( "a", _results( t1=( "PASSED", 1.0 ), t2=( "FAILED", 2.0 ) ) ),
+                      ( "b", _results( t1=( "PASSED", 1.5 ) ) ) )
+        run_history.record_run( _results( t1=( "FAILED", 3.0 ) ), "other_machine", "c" )
+
+    with RunHistory( fname ) as run_history:
+        assert run_history.tests() == [ "t1", "t2" ]
+        history = run_history.test_history( "t1" )
+        assert [ ( r.git_commit, r.status, r.elapsed ) for r in history ] == [ ( "a", "PASSED", 1.0 ),
+                                                                               ( "b", "PASSED", 1.5 ),
+                                                                               ( "c", "FAILED", 3.0 ) ]
+        assert [ r.git_commit for r in run_history.test_history( "t1", machine="machine" ) ] == [ "a", "b" ]
+        assert [ r.git_commit for r in run_history.test_history( "t1", limit=2 ) ] == [ "b", "c" ]
+
+
+def tests_flakiness( tmp_path ):
+    with RunHistory( str( tmp_path / "history.db" ) ) as run_history:
+        _record_runs( run_history, ( "a", _results( flaky=( "PASSED", 1.0 ), stable=( "PASSED", 1.0 ) ) ),
+                      ( "b", _results( flaky=( "FAILED", 1.0 ), stable=( "PASSED", 1.0 ) ) ),
+                      ( "c", _results( flaky=( "SKIPPED", 1.0 ), stable=( "PASSED", 1.0 ) ) ),
+                      ( "d", _results( flaky=( "PASSED", 1.0 ), stable=( "PASSED", 1.0 ) ) ) )
+        # the skipped run is ignored, leaving two flips among three outcomes
+        assert run_history.flakiness() == { "flaky": 1.0 }
+        assert run_history.flakiness( window=2 ) == {}
+
+
+def tests_runtime_regressions( tmp_path ):
+    with RunHistory( str( tmp_path / "history.db" ) ) as run_history:
+        _record_runs( run_history, ( "a", _results( slow=( "PASSED", 1.0 ), fast=( "PASSED", 1.0 ) ) ),
+                      ( "b", _results( slow=( "PASSED", 1.2 ), fast=( "PASSED", 1.0 ) ) ),
+                      ( "c", _results( slow=( "FAILED", 9.0 ), fast=( "PASSED", 1.0 ) ) ),
+                      ( "d", _results( slow=( "PASSED", 3.3 ), fast=( "PASSED", 1.1 ) ) ) )
+        assert run_history.runtime_regressions() == { "slow": ( 3.3, pytest.approx( 1.1 ) ) }
+        assert run_history.runtime_regressions( threshold=4.0 ) == {}
+
+
+def tests_first_failing_commit( tmp_path ):
+    with RunHistory( str( tmp_path / "history.db" ) ) as run_history:
+        _record_runs( run_history, ( "a", _results( t=( "PASSED", 1.0 ) ) ), ( "b", _results( t=( "FAILED", 1.0 ) ) ),
+                      ( "c", _results( t=( "TIMEDOUT", 1.0 ) ) ) )
+        assert run_history.first_failing_commit( "t" ) == "b"
+        run_history.record_run( _results( t=( "PASSED", 1.0 ) ), "machine", "d" )
+        assert run_history.first_failing_commit( "t" ) is None
+
+
+def tests_corrupted_history( tmp_path, caplog, monkeypatch ):
+    fname = tmp_path / "history.db"
+    fname.write_text( "not a sqlite database" )
+    connect = sqlite3.connect
+    connections = []
+
+    def recording_connect( *args ):
+        connections.append( connect( *args ) )
+        return connections[ -1 ]
+
+    monkeypatch.setattr( sqlite3, "connect", recording_connect )
+    with pytest.raises( sqlite3.DatabaseError ):
+        RunHistory( str( fname ) )
+    # the connection is not left open
+    with pytest.raises( sqlite3.ProgrammingError ):
+        connections[ 0 ].execute( "SELECT 1" )
+
+    # recording a run logs the error instead of failing the run
+    record_run_history( str( fname ), _results( t=( "PASSED", 1.0 ) ), "machine", "a" )
+    assert "Failed to record the run" in caplog.text
+
+
+def tests_history_is_off_by_default():
+    from geos.ats.configuration_record import config, initializeConfig
+    initializeConfig( None, {}, None )
+    assert config.run_history_file == ""
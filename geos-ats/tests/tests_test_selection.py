@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from geos.ats import test_selection
+from geos.ats.test_selection import collect_deck_dependencies
+
+DECK = """<Problem>
+  <Included>
+    <File name="./include/base.xml"/>
+  </Included>
+  <Mesh>
+    <VTKMesh name="mesh" file="mesh.vtu"/>
+  </Mesh>
+  <Constitutive>
+    <CO2BrineFluid name="fluid" phasePVTParaFiles="{ tables/density.txt, tables/missing.txt }"/>
+  </Constitutive>
+</Problem>
+"""
+
+INCLUDE = """<Problem>
+  <Functions>
+    <TableFunction name="pressure" coordinateFiles="{ ../tables/x.geos }" voxelFile="../tables/p.geos"/>
+  </Functions>
+  <Events>
+    <PeriodicEvent name="unused" target="../tables/unused.geos"/>
+  </Events>
+</Problem>
+"""
+
+
+@pytest.fixture
+def deck( tmp_path ):
+    files = {
+        'sedov.ats': '',
+        'sedov.xml': DECK,
+        'include/base.xml': INCLUDE,
+        'mesh.vtu': '',
+        'tables/density.txt': '',
+        'tables/x.geos': '',
+        'tables/p.geos': '',
+        'tables/unused.geos': '',
+    }
+    for rel, content in files.items():
+        ( tmp_path / rel ).parent.mkdir( parents=True, exist_ok=True )
+        ( tmp_path / rel ).write_text( content )
+    return tmp_path
+
+
+def _paths( root, *rels ):
+    return sorted( os.path.realpath( root / rel ) for rel in rels )
+
+
+def tests_collect_deck_dependencies( deck ):
+    dependencies = collect_deck_dependencies( str( deck / 'sedov.xml' ), [ str( deck / 'sedov.ats' ) ] )
+    assert dependencies[ 'files' ] == _paths( deck, 'sedov.ats', 'sedov.xml', 'include/base.xml', 'mesh.vtu',
+                                              'tables/density.txt', 'tables/x.geos', 'tables/p.geos' )
+    assert dependencies[ 'blocks' ] == sorted( [
+        'Problem', 'Included', 'File', 'Mesh', 'VTKMesh', 'Constitutive', 'CO2BrineFluid', 'Functions', 'TableFunction',
+        'Events', 'PeriodicEvent'
+    ] )
+
+
+def tests_file_changed( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    selection = test_selection.TestSelection()
+    selection.setup( [ 'inputFiles/sedov.xml', '../outside.xml' ], [] )
+    assert selection.file_changed( str( tmp_path / 'inputFiles' / 'sedov.xml' ) )
+    # a relative path also matches the same file in another checkout
+    assert selection.file_changed( '/other/checkout/inputFiles/sedov.xml' )
+    assert not selection.file_changed( '/other/checkout/inputFiles/other_sedov.xml' )
+    assert not selection.file_changed( '/other/outside.xml' )
+
+
+def tests_select( deck ):
+    dependencies = collect_deck_dependencies( str( deck / 'sedov.xml' ), [ str( deck / 'sedov.ats' ) ] )
+    selection = test_selection.TestSelection()
+    assert selection.select( 'sedov_01', dependencies )
+    assert not selection.index[ 'sedov_01' ][ 'reasons' ]
+
+    selection.setup( [ str( deck / 'tables' / 'x.geos' ) ], [ 'CO2BrineFluid' ] )
+    assert selection.select( 'sedov_01', dependencies )
+    assert selection.index[ 'sedov_01' ][ 'reasons' ] == _paths( deck, 'tables/x.geos' ) + [ 'CO2BrineFluid' ]
+
+    selection.setup( [ str( deck / 'sedov.ats' ) ], [] )
+    assert selection.select( 'sedov_01', dependencies )
+
+    selection.setup( [ str( deck / 'tables' / 'unused.geos' ) ], [ 'SolidMechanicsLagrangianFEM' ] )
+    assert not selection.select( 'sedov_01', dependencies )
+    assert selection.selected_tests() == []
@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+
+import pytest
+
+from geos.ats import common_utilities
+from geos.ats.timing_history import TimingHistory, predict_makespan
+
+# synthetic tests of the form name: (runtime in seconds, number of processors), in declaration order
+SLEEP_TESTS = {
+    "parallel": ( 0.1, 2 ),
+    "serial_a": ( 0.1, 1 ),
+    "serial_b": ( 0.1, 1 ),
+    "serial_c": ( 0.1, 1 ),
+    "serial_d": ( 0.1, 1 ),
+    "long_serial": ( 0.4, 1 ),
+}
+NPROCS = 2
+
+
+def _run_sleep_jobs( jobs, nprocs ):
+    """Run sleep jobs as the scheduler does, each job starting as soon as enough processors are idle.
+
+    Returns:
+        tuple: The makespan of the run and the measured runtime of each job.
+    """
+    idle = [ nprocs ]
+    runtimes = {}
+    condition = threading.Condition()
+
+    def run( name, runtime, np ):
+        start = time.perf_counter()
+        time.sleep( runtime )
+        runtimes[ name ] = time.perf_counter() - start
+        with condition:
+            idle[ 0 ] += np
+            condition.notify()
+
+    start = time.perf_counter()
+    threads = []
+    pending = list( jobs )
+    with condition:
+        while pending:
+            waiting = []
+            for name, runtime, np in pending:
+                if np <= idle[ 0 ]:
+                    idle[ 0 ] -= np
+                    threads.append( threading.Thread( target=run, args=( name, runtime, np ) ) )
+                    threads[ -1 ].start()
+                else:
+                    waiting.append( ( name, runtime, np ) )
+            pending = waiting
+            if pending:
+                condition.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, runtimes
+
+
+def tests_record_keeps_last_runtimes():
+    history = TimingHistory( machine="machine", size=2 )
+    for runtime in ( 1.0, 2.0, 3.0 ):
+        history.record( "test", runtime )
+    assert history.timings == { "machine": { "test": [ 2.0, 3.0 ] } }
+    assert history.predictions() == { "test": 2.5 }
+
+    history.size = 0
+    history.record( "test", 4.0 )
+    assert history.predictions() == {}
+
+
+def tests_save_and_load( tmp_path, monkeypatch ):
+    monkeypatch.setattr( common_utilities, '_UMASK', 0o022 )
+    fname = tmp_path / "timing_history.json"
+    history = TimingHistory( str( fname ), "machine" )
+    history.save()
+    assert not fname.exists()
+
+    history.record( "test", 1.0 )
+    history.save()
+    # the history is shared across runs and machines, it is readable by the other users
+    assert os.stat( fname ).st_mode & 0o777 == 0o644
+    loaded = TimingHistory()
+    loaded.setup( str( fname ), "machine", 5 )
+    assert loaded.predictions() == { "test": 1.0 }
+    loaded.setup( str( fname ), "other_machine", 5 )
+    assert loaded.predictions() == {}
+
+    # a history without file is only kept in memory
+    TimingHistory( "", "machine" ).save()
+    assert list( tmp_path.iterdir() ) == [ fname ]
+
+
+def tests_predict_makespan():
+    assert predict_makespan( [], 4 ) == 0.0
+    # the second job waits for the first one, the third one fills the idle processors meanwhile
+    assert predict_makespan( [ ( 2.0, 3 ), ( 1.0, 2 ), ( 2.0, 1 ) ], 4 ) == 3.0
+    # jobs larger than the machine run alone
+    assert predict_makespan( [ ( 1.0, 8 ), ( 1.0, 1 ) ], 4 ) == 2.0
+
+
+def tests_packing_sleep_tests():
+    # a first run in declaration order teaches the runtimes
+    declared = [ ( name, runtime, np ) for name, ( runtime, np ) in SLEEP_TESTS.items() ]
+    declared_makespan, runtimes = _run_sleep_jobs( declared, NPROCS )
+    history = TimingHistory( machine="machine" )
+    for name, runtime in runtimes.items():
+        history.record( name, runtime )
+    predictions = history.predictions()
+    for name, ( runtime, _ ) in SLEEP_TESTS.items():
+        assert predictions[ name ] == pytest.approx( runtime, abs=0.05 )
+    assert declared_makespan == pytest.approx( predict_makespan( [ ( runtimes[ name ], np )
+                                                                   for name, _, np in declared ], NPROCS ),
+                                               abs=0.1 )
+
+    # the next run packs the tests by predicted runtime times number of processors
+    packed = sorted( declared, key=lambda job: predictions[ job[ 0 ] ] * job[ 2 ], reverse=True )
+    predicted_makespan = predict_makespan( [ ( predictions[ name ], np ) for name, _, np in packed ], NPROCS )
+    packed_makespan, _ = _run_sleep_jobs( packed, NPROCS )
+    assert packed_makespan == pytest.approx( predicted_makespan, abs=0.1 )
+    assert packed_makespan < declared_makespan - 0.1
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Alexandre Benedicto, Martin Lemay
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Self
+
+from geos.geomechanics.model.MohrCircle import MohrCircle
+from geos.geomechanics.processing.geomechanicsCalculatorFunctions import (
+    computeStressPrincipalComponentsFromStressVector, )
+
+__doc__ = """
+MohrCircleCollection module defines a columnar store of Mohr's circles.
+
+Instead of one MohrCircle object per circle, principal components of all
+circles are stored in a single (n, 3) array, and computed from stress vectors
+with a single batched eigen value computation.
+
+To use the object:
+
+.. code-block:: python
+
+    from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
+
+    # Create the object from n stress vectors and n circle ids
+    stressVectors: npt.NDArray[np.float64]
+    circleIds: list[str]
+    mohrCircles: MohrCircleCollection = MohrCircleCollection.fromStressVectors(circleIds, stressVectors)
+
+    # Or directly from principal components (p3 <= p2 <= p1)
+    mohrCircles = MohrCircleCollection(circleIds, principalComponents)
+
+    # Access to members
+    p3, p2, p1: npt.NDArray[np.float64] = mohrCircles.getPrincipalComponents().T
+    radius: npt.NDArray[np.float64] = mohrCircles.getCircleRadius()
+    center: npt.NDArray[np.float64] = mohrCircles.getCircleCenter()
+    mohrCircle: MohrCircle = mohrCircles[0]
+"""
+
+
+class MohrCircleCollection:
+
+    def __init__( self: Self, circleIds: list[ str ], principalComponents: npt.NDArray[ np.float64 ] ) -> None:
+        """Store Mohr's circles from their principal components.
+
+        Args:
+            circleIds (list[str]): Mohr's circle ids.
+            principalComponents (npt.NDArray[np.float64]): (n, 3) array of principal
+                components sorted in ascending order (p3, p2, p1) for each circle.
+
+        Raises:
+            ValueError: Principal components must be a (n, 3) array sorted in ascending order.
+        """
+        principalComponents = np.asarray( principalComponents, dtype=np.float64 ).reshape( -1, 3 )
+        if principalComponents.shape[ 0 ] != len( circleIds ):
+            raise ValueError(
+                f"Expected {len( circleIds )} principal components, not {principalComponents.shape[ 0 ]}." )
+        if np.any( np.diff( principalComponents, axis=1 ) < 0.0 ):
+            raise ValueError( "Component order is wrong. Expected p3 <= p2 <= p1." )
+
+        self.circleIds: list[ str ] = list( circleIds )
+        self.principalComponents: npt.NDArray[ np.float64 ] = principalComponents
+
+    @classmethod
+    def fromStressVectors( cls, circleIds: list[ str ],
+                           stressVectors: npt.NDArray[ np.float64 ] ) -> "MohrCircleCollection":
+        """Compute Mohr's circles from stress vectors in a single batched call.
+
+        Args:
+            circleIds (list[str]): Mohr's circle ids.
+            stressVectors (npt.NDArray[np.float64]): (n, 6) stress vectors following GEOS
+                convention (XX, YY, ZZ, YZ, XZ, XY).
+
+        Returns:
+            MohrCircleCollection: Mohr's circles of the stress vectors.
+        """
+        stressVectors = np.asarray( stressVectors, dtype=np.float64 ).reshape( -1, 6 )
+        if stressVectors.shape[ 0 ] == 0:
+            return cls( circleIds, np.empty( ( 0, 3 ) ) )
+        # eigen values are sorted in descending order
+        eVal: npt.NDArray[ np.float64 ] = computeStressPrincipalComponentsFromStressVector( stressVectors )[ 0 ]
+        return cls( circleIds, np.ascontiguousarray( eVal[ :, ::-1 ] ) )
+
+    def __len__( self: Self ) -> int:
+        """Overload of __len__ method."""
+        return len( self.circleIds )
+
+    def __getitem__( self: Self, index: int ) -> MohrCircle:
+        """Get the Mohr's circle at the given index as a MohrCircle object."""
+        mohrCircle: MohrCircle = MohrCircle( self.circleIds[ index ] )
+        mohrCircle.setPrincipalComponents( *self.principalComponents[ index ].tolist() )
+        return mohrCircle
+
+    def getCircleIds( self: Self ) -> list[ str ]:
+        """Access the Ids of the Mohr's circles.
+
+        Returns:
+            list[str]: Ids of the Mohr's circles.
+        """
+        return self.circleIds
+
+    def getPrincipalComponents( self: Self ) -> npt.NDArray[ np.float64 ]:
+        """Get Mohr's circles principal components.
+
+        Returns:
+            npt.NDArray[np.float64]: (n, 3) array of principal components (p3, p2, p1).
+        """
+        return self.principalComponents
+
+    def getCircleRadius( self: Self ) -> npt.NDArray[ np.float64 ]:
+        """Compute and return Mohr's circles radius from principal components.
+
+        Returns:
+            npt.NDArray[np.float64]: Mohr's circles radius.
+        """
+        return ( self.principalComponents[ :, 2 ] - self.principalComponents[ :, 0 ] ) / 2.0
+
+    def getCircleCenter( self: Self ) -> npt.NDArray[ np.float64 ]:
+        """Compute and return Mohr's circles center from principal components.
+
+        Returns:
+            npt.NDArray[np.float64]: Mohr's circles center.
+        """
+        return ( self.principalComponents[ :, 2 ] + self.principalComponents[ :, 0 ] ) / 2.0
@@ -6,6 +6,9 @@ import numpy as np
 import numpy.typing as npt
 from typing_extensions import Any
 
+from geos.utils.algebraFunctions import getAttributeMatrixFromVector, getAttributeVectorFromMatrix
+from geos.utils.geometryFunctions import rotateVoigtTensors
+
 
 # ============================================================================
 # STRESS TENSOR OPERATIONS
@@ -77,3 +80,49 @@ class StressTensor:
             'shearStrike': tractionLocal[ 1 ],
             'shearDip': tractionLocal[ 2 ]
         }
+
+    @staticmethod
+    def rotateToFaultFrames( stressTensorArr: npt.NDArray[ np.float64 ], normals: npt.NDArray[ np.float64 ],
+                             tangents1: npt.NDArray[ np.float64 ],
+                             tangents2: npt.NDArray[ np.float64 ] ) -> dict[ str, Any ]:
+        """Rotate a batch of stress tensors to their fault local coordinate systems.
+
+        Batched version of rotateToFaultFrame: the i-th stress tensor is rotated to the
+        frame defined by the i-th normal and tangents, all at once with rotateVoigtTensors.
+
+        Args:
+            stressTensorArr (npt.NDArray[np.float64]): Stress tensors to rotate, of shape (n, 3, 3),
+                or in GEOS vector notation of shape (n, 6) or (n, 9).
+            normals (npt.NDArray[np.float64]): Surface normal vectors, of shape (n, 3).
+            tangents1 (npt.NDArray[np.float64]): Surface tangents vectors 1, of shape (n, 3).
+            tangents2 (npt.NDArray[np.float64]): Surface tangents vectors 2, of shape (n, 3).
+
+        Returns:
+            dict[str, Any]: Dictionary containing the arrays of local stress, normal stress, shear stress and strike and shear dip.
+        """
+        # Verify orthonormality
+        tangentNorms = np.linalg.norm( np.concatenate( ( tangents1, tangents2 ) ), axis=1 )
+        if np.any( np.abs( tangentNorms - 1.0 ) >= 1e-10 ):
+            raise ValueError( "Tangents expected to be normalized." )
+        dots = np.einsum( 'ni,nki->nk', normals, np.stack( ( tangents1, tangents2 ), axis=1 ) )
+        if np.any( np.abs( dots ) >= 1e-10 ):
+            raise ValueError( "Tangents and Normals expected to be orthogonal." )
+
+        # Rotation matrices: rows = local directions (n, t1, t2)
+        R = np.stack( ( normals, tangents1, tangents2 ), axis=1 )
+
+        # Rotate tensors
+        if stressTensorArr.ndim == 3:
+            stressTensorArr = getAttributeVectorFromMatrix( stressTensorArr, ( stressTensorArr.shape[ 0 ], 9 ) )
+        stressLocal = getAttributeMatrixFromVector( rotateVoigtTensors( stressTensorArr, R ) )
+
+        # Traction on fault plane (normal = [1,0,0] in local frame)
+        tractionLocal = stressLocal[ :, :, 0 ]
+
+        return {
+            'stressLocal': stressLocal,
+            'normalStress': tractionLocal[ :, 0 ],
+            'shearStress': np.sqrt( tractionLocal[ :, 1 ]**2 + tractionLocal[ :, 2 ]**2 ),
+            'shearStrike': tractionLocal[ :, 1 ],
+            'shearDip': tractionLocal[ :, 2 ]
+        }
@@ -16,6 +16,7 @@ if parent_dir_path not in sys.path:
     sys.path.append( parent_dir_path )
 
 from geos.geomechanics.model.MohrCircle import MohrCircle
+from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
 from geos.geomechanics.model.MohrCoulomb import MohrCoulomb
 
 circleId = "12453"
@@ -58,6 +59,30 @@ class TestsMohrCircle( unittest.TestCase ):
         self.assertAlmostEqual( obtained, expected, 3 )
 
 
+class TestsMohrCircleCollection( unittest.TestCase ):
+
+    def test_MohrCircleCollectionFromStressVectors( self: Self ) -> None:
+        """Test batched calculation of principal components."""
+        stressVectors: npt.NDArray[ np.float64 ] = np.array( [ stressVector, 2.0 * stressVector, -stressVector ] )
+        circleIds: list[ str ] = [ "0", "1", "2" ]
+        mohrCircles: MohrCircleCollection = MohrCircleCollection.fromStressVectors( circleIds, stressVectors )
+
+        self.assertEqual( len( mohrCircles ), 3 )
+        self.assertSequenceEqual( mohrCircles.getCircleIds(), circleIds )
+        for i, circleId in enumerate( circleIds ):
+            mohrCircle: MohrCircle = MohrCircle( circleId )
+            mohrCircle.computePrincipalComponents( stressVectors[ i ] )
+            np.testing.assert_allclose( mohrCircles.getPrincipalComponents()[ i ], mohrCircle.getPrincipalComponents() )
+            self.assertAlmostEqual( mohrCircles.getCircleRadius()[ i ], mohrCircle.getCircleRadius() )
+            self.assertAlmostEqual( mohrCircles.getCircleCenter()[ i ], mohrCircle.getCircleCenter() )
+            self.assertEqual( mohrCircles[ i ], mohrCircle )
+
+    def test_MohrCircleCollectionWrongOrder( self: Self ) -> None:
+        """Test principal components order check."""
+        with self.assertRaises( ValueError ):
+            MohrCircleCollection( [ circleId ], np.array( [ principalComponentsExpected[ ::-1 ] ] ) )
+
+
 class TestsMohrCoulomb( unittest.TestCase ):
 
     def test_MohrCoulombInit( self: Self ) -> None:
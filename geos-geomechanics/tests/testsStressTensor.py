@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2026 TotalEnergies.
+# SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from geos.geomechanics.model.StressTensor import StressTensor
+
+
+def test_rotateToFaultFrames() -> None:
+    """Test batched rotation to fault frames against the rotation face by face."""
+    rng = np.random.default_rng( 0 )
+    voigtStresses: npt.NDArray[ np.float64 ] = rng.normal( size=( 20, 6 ) )
+    stresses: npt.NDArray[ np.float64 ] = StressTensor.buildFromArray( voigtStresses )
+    # the rows of orthogonal matrices are orthonormal (normal, tangent1, tangent2) frames
+    frames: npt.NDArray[ np.float64 ] = np.linalg.qr( rng.normal( size=( 20, 3, 3 ) ) )[ 0 ]
+    normals, tangents1, tangents2 = frames[ :, 0 ], frames[ :, 1 ], frames[ :, 2 ]
+    obtained = StressTensor.rotateToFaultFrames( stresses, normals, tangents1, tangents2 )
+    for i in range( 20 ):
+        expected = StressTensor.rotateToFaultFrame( stresses[ i ], normals[ i ], tangents1[ i ], tangents2[ i ] )
+        for key, value in expected.items():
+            assert np.allclose( obtained[ key ][ i ], value ), key
+
+    # stresses in GEOS vector notation are rotated the same way
+    obtainedVoigt = StressTensor.rotateToFaultFrames( voigtStresses, normals, tangents1, tangents2 )
+    for key, value in obtained.items():
+        assert np.allclose( obtainedVoigt[ key ], value ), key
+
+    with pytest.raises( ValueError ):
+        StressTensor.rotateToFaultFrames( stresses, normals, 2 * tangents1, tangents2 )
+    with pytest.raises( ValueError ):
+        StressTensor.rotateToFaultFrames( stresses, normals, normals, tangents2 )
@@ -2,17 +2,28 @@
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Alexandre Benedicto
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Type, TypeAlias
 from typing_extensions import Self, Union
 from xml.etree import ElementTree as ET
-from vtkmodules.vtkCommonDataModel import vtkPointSet, vtkUnstructuredGrid, vtkDataSet
+
+import numpy as np
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonDataModel import ( VTK_POLYHEDRON, vtkDataObject, vtkDataObjectTreeIterator,
+                                            vtkMultiBlockDataSet, vtkPointSet, vtkUnstructuredGrid )
 from vtkmodules.vtkIOCore import vtkWriter
 from vtkmodules.vtkIOLegacy import vtkDataReader, vtkUnstructuredGridWriter, vtkUnstructuredGridReader
-from vtkmodules.vtkIOXML import ( vtkXMLGenericDataObjectReader, vtkXMLUnstructuredGridWriter, vtkXMLWriter,
-                                  vtkXMLStructuredGridWriter )
+from vtkmodules.vtkIOXML import ( vtkXMLGenericDataObjectReader, vtkXMLMultiBlockDataReader,
+                                  vtkXMLPUnstructuredGridReader, vtkXMLPolyDataReader, vtkXMLReader,
+                                  vtkXMLStructuredGridReader, vtkXMLUnstructuredGridReader,
+                                  vtkXMLUnstructuredGridWriter, vtkXMLWriter, vtkXMLStructuredGridWriter )
 
 from geos.utils.Logger import ( getLogger, Logger )
 
@@ -42,8 +53,16 @@ class VtkFormat( Enum ):
     PVTR = ".pvtr"
 
 
+class VtkCompression( Enum ):
+    """Enumeration for the compressors of the binary data of XML writers."""
+    NONE = "None"
+    ZLIB = "ZLib"
+    LZ4 = "LZ4"
+    LZMA = "LZMA"
+
+
 # Use TypeAlias for cleaner and more readable type hints
-VtkReaderClass: TypeAlias = Type[ vtkDataReader | vtkXMLGenericDataObjectReader ]
+VtkReaderClass: TypeAlias = Type[ vtkDataReader | vtkXMLReader ]
 VtkWriterClass: TypeAlias = Type[ vtkWriter | vtkXMLWriter ]
 
 # XML-based formats that can be read by vtkXMLGenericDataObjectReader
@@ -59,20 +78,40 @@ WRITER_MAP: dict[ VtkFormat, VtkWriterClass ] = {
     VtkFormat.VTU: vtkXMLUnstructuredGridWriter,
 }
 
+# Readers of the PVD datasets, which can skip the point and cell arrays that are not selected
+ARRAY_SELECTION_READER_MAP: dict[ str, Type[ vtkXMLReader ] ] = {
+    ".vtm": vtkXMLMultiBlockDataReader,
+    ".vtu": vtkXMLUnstructuredGridReader,
+    ".pvtu": vtkXMLPUnstructuredGridReader,
+    ".vtp": vtkXMLPolyDataReader,
+    ".vts": vtkXMLStructuredGridReader,
+}
+
+# Default memory limit of the datasets cached by the PVD reader, in bytes
+DEFAULT_PVD_CACHE_MEMORY_LIMIT: int = 2**30
+
 
 @dataclass( frozen=True )
 class VtkOutput:
     """Configuration for writing a VTK file."""
     output: str
     isDataModeBinary: bool = True
+    compression: VtkCompression = VtkCompression.ZLIB
 
 
-def _readData( filepath: str, readerClass: VtkReaderClass ) -> Optional[ vtkPointSet ]:
+def _readData( filepath: str,
+               readerClass: VtkReaderClass,
+               pointArrays: Optional[ Iterable[ str ] ] = None,
+               cellArrays: Optional[ Iterable[ str ] ] = None ) -> Optional[ vtkPointSet ]:
     """Generic helper to read a VTK file using a specific reader class.
 
     Args:
         filepath (str): Path to the VTK file.
         readerClass (VtkReaderClass): The VTK reader class to use.
+        pointArrays (Iterable[str] | None, optional): Names of the point arrays to read, only
+            used by the XML readers of ARRAY_SELECTION_READER_MAP. Defaults to None, all the arrays are read.
+        cellArrays (Iterable[str] | None, optional): Names of the cell arrays to read, only
+            used by the XML readers of ARRAY_SELECTION_READER_MAP. Defaults to None, all the arrays are read.
 
     Returns:
         Optional[ vtkPointSet ]: The read VTK point set, or None if reading failed.
@@ -90,6 +129,17 @@ def _readData( filepath: str, readerClass: VtkReaderClass ) -> Optional[ vtkPoin
             ioLogger.error( f"Reader {readerClass.__name__} reports it cannot read file '{filepath}'." )
             return None
 
+    if isinstance( reader, vtkXMLReader ) and readerClass in ARRAY_SELECTION_READER_MAP.values() and (
+            pointArrays is not None or cellArrays is not None ):
+        # The array selections are filled with the arrays of the file by UpdateInformation
+        reader.UpdateInformation()
+        for selection, arrayNames in ( ( reader.GetPointDataArraySelection(), pointArrays ),
+                                       ( reader.GetCellDataArraySelection(), cellArrays ) ):
+            if arrayNames is not None:
+                selection.DisableAllArrays()
+                for arrayName in arrayNames:
+                    selection.EnableArray( arrayName )
+
     reader.Update()
 
     # Check the reader's error code. This is the most reliable way to
@@ -99,7 +149,7 @@ def _readData( filepath: str, readerClass: VtkReaderClass ) -> Optional[ vtkPoin
             f"VTK reader {readerClass.__name__} reported an error code after attempting to read '{filepath}'." )
         return None
 
-    output = reader.GetOutput()
+    output = reader.GetOutputDataObject( 0 )
 
     if output is None:
         return None
@@ -112,7 +162,9 @@ def _writeData( mesh: vtkPointSet,
                 writerClass: VtkWriterClass,
                 output: str,
                 isBinary: bool,
-                logger: Union[ Logger, None ] = None ) -> int:
+                logger: Union[ Logger, None ] = None,
+                compression: VtkCompression = VtkCompression.ZLIB,
+                isAppended: bool = False ) -> int:
     """Generic helper to write a VTK file using a specific writer class.
 
     Args:
@@ -122,6 +174,10 @@ def _writeData( mesh: vtkPointSet,
         isBinary (bool): Whether to write the file in binary mode (True) or ASCII (False).
         logger (Union[Logger, None], optional): A logger to manage the output messages.
                     Defaults to None, an internal logger is used.
+        compression (VtkCompression, optional): Compressor of the binary data of XML writers.
+                    Defaults to VtkCompression.ZLIB.
+        isAppended (bool, optional): Whether to write the binary data of XML writers as raw data
+                    appended at the end of the file instead of base64 encoded data. Defaults to False.
 
     Returns:
         int: 1 if success, 0 otherwise.
@@ -136,12 +192,17 @@ def _writeData( mesh: vtkPointSet,
 
     # Set data mode only for XML writers that support it
     if isinstance( writer, vtkXMLWriter ):
-        if isBinary:
+        if isBinary and isAppended:
+            writer.SetDataModeToAppended()
+            writer.EncodeAppendedDataOff()
+            logger.info( "Data mode set to raw Appended." )
+        elif isBinary:
             writer.SetDataModeToBinary()
             logger.info( "Data mode set to Binary." )
         else:
             writer.SetDataModeToAscii()
             logger.info( "Data mode set to ASCII." )
+        getattr( writer, f"SetCompressorTypeTo{compression.value}" )()
 
     return writer.Write()
 
@@ -277,7 +338,8 @@ def writeMesh( mesh: vtkPointSet,
         if not writerClass:
             raise ValueError( f"Writing to extension '{outputPath.suffix}' is not supported." )
 
-        successCode = _writeData( mesh, writerClass, str( outputPath ), vtkOutput.isDataModeBinary, logger )
+        successCode = _writeData( mesh, writerClass, str( outputPath ), vtkOutput.isDataModeBinary, logger,
+                                  vtkOutput.compression )
         if not successCode:
             raise RuntimeError( f"VTK writer failed to write file '{outputPath}'." )
 
@@ -289,15 +351,84 @@ def writeMesh( mesh: vtkPointSet,
         raise
 
 
+def _getUnstructuredGridLeaves( dataObject: vtkDataObject ) -> list[ vtkUnstructuredGrid ]:
+    """Get the unstructured grids of a dataset or of the leaves of a multiblock dataset.
+
+    Args:
+        dataObject (vtkDataObject): Dataset or multiblock dataset.
+
+    Returns:
+        list[vtkUnstructuredGrid]: Unstructured grids in the order of the tree traversal.
+    """
+    if not isinstance( dataObject, vtkMultiBlockDataSet ):
+        return [ dataObject ] if isinstance( dataObject, vtkUnstructuredGrid ) else []
+    leaves: list[ vtkUnstructuredGrid ] = []
+    iterator: vtkDataObjectTreeIterator = vtkDataObjectTreeIterator()
+    iterator.SetDataSet( dataObject )
+    iterator.VisitOnlyLeavesOn()
+    iterator.GoToFirstItem()
+    while iterator.GetCurrentDataObject() is not None:
+        leaf = iterator.GetCurrentDataObject()
+        if isinstance( leaf, vtkUnstructuredGrid ):
+            leaves.append( leaf )
+        iterator.GoToNextItem()
+    return leaves
+
+
+def _hasSameGeometry( grid: vtkUnstructuredGrid, reference: vtkUnstructuredGrid ) -> bool:
+    """Check if two unstructured grids have the same points and cells.
+
+    Args:
+        grid (vtkUnstructuredGrid): Grid to check.
+        reference (vtkUnstructuredGrid): Reference grid.
+
+    Returns:
+        bool: True if points and cells are the same, False otherwise.
+    """
+    if ( grid.GetNumberOfPoints() != reference.GetNumberOfPoints()
+         or grid.GetNumberOfCells() != reference.GetNumberOfCells() or grid.GetPoints() is None
+         or reference.GetPoints() is None ):
+        return False
+    cellTypes = vtk_to_numpy( reference.GetCellTypesArray() )
+    if np.any( cellTypes == VTK_POLYHEDRON ):
+        # polyhedron faces are not shared
+        return False
+    cells, referenceCells = grid.GetCells(), reference.GetCells()
+    return ( np.array_equal( vtk_to_numpy( grid.GetCellTypesArray() ), cellTypes ) and np.array_equal(
+        vtk_to_numpy( cells.GetOffsetsArray() ), vtk_to_numpy( referenceCells.GetOffsetsArray() ) ) and np.array_equal(
+            vtk_to_numpy( cells.GetConnectivityArray() ), vtk_to_numpy( referenceCells.GetConnectivityArray() ) )
+             and np.array_equal( vtk_to_numpy( grid.GetPoints().GetData() ),
+                                 vtk_to_numpy( reference.GetPoints().GetData() ) ) )
+
+
 class PVDReader:
 
-    def __init__( self: Self, filename: str, logger: Union[ Logger, None ] = None ) -> None:
+    def __init__( self: Self,
+                  filename: str,
+                  logger: Union[ Logger, None ] = None,
+                  pointArrays: Optional[ Iterable[ str ] ] = None,
+                  cellArrays: Optional[ Iterable[ str ] ] = None,
+                  cacheMemoryLimit: int = DEFAULT_PVD_CACHE_MEMORY_LIMIT,
+                  prefetch: bool = False ) -> None:
         """PVD Reader class.
 
+        Read datasets are kept in a cache bounded by cacheMemoryLimit, and the points and cells
+        of unstructured grids are shared between timesteps when the mesh does not change. When
+        prefetch is enabled, the dataset of the next time index is read in a background thread,
+        which is stopped by close() or when leaving the context of the reader.
+
         Args:
             filename (str): PVD filename with full path.
             logger (Union[Logger, None], optional): A logger to manage the output messages.
                     Defaults to None, an internal logger is used.
+            pointArrays (Iterable[str] | None, optional): Names of the point arrays to read.
+                    Defaults to None, all the point arrays are read.
+            cellArrays (Iterable[str] | None, optional): Names of the cell arrays to read.
+                    Defaults to None, all the cell arrays are read.
+            cacheMemoryLimit (int, optional): Memory limit of the cached datasets in bytes.
+                    Defaults to DEFAULT_PVD_CACHE_MEMORY_LIMIT.
+            prefetch (bool, optional): True to read the next time index in the background.
+                    Defaults to False.
         """
         self.logger: Logger
         if logger is None:
@@ -310,6 +441,18 @@ class PVDReader:
         self.filename = filename
         self.dir = Path( filename ).parent
         self.datasets = {}
+        self.pointArrays: Optional[ list[ str ] ] = None if pointArrays is None else list( pointArrays )
+        self.cellArrays: Optional[ list[ str ] ] = None if cellArrays is None else list( cellArrays )
+        self.cacheMemoryLimit: int = cacheMemoryLimit
+        self.prefetch: bool = prefetch
+
+        self._lock = threading.Lock()
+        # cached datasets by time index, from the least to the most recently used, with their memory size
+        self._cache: OrderedDict[ int, tuple[ vtkDataObject, int ] ] = OrderedDict()
+        self._prefetches: dict[ int, Future[ vtkDataObject ] ] = {}
+        self._executor: Optional[ ThreadPoolExecutor ] = None
+        # unstructured grids whose points and cells are shared with the next timesteps
+        self._geometries: list[ vtkUnstructuredGrid ] = []
         self._read()
 
     def _read( self ) -> None:
@@ -324,16 +467,40 @@ class PVDReader:
 
         self.logger.info( "All filenames from PVD file have been read." )
 
-    def getDataSetAtTimeIndex( self: Self, timeIndex: int ) -> vtkDataSet:
+    def getDataSetAtTimeIndex( self: Self, timeIndex: int ) -> vtkDataObject:
         """Get the dataset corresponding to requested time index.
 
+        The dataset is a shallow copy of the cached one: arrays can be added or removed, but
+        array values must not be modified in place.
+
         Args:
             timeIndex (int): Time index
 
         Returns:
-            vtkDataSet: Dataset
+            vtkDataObject: Dataset
         """
-        return readMesh( self.dir / self.datasets[ timeIndex ][ 1 ] )
+        if timeIndex not in self.datasets:
+            raise KeyError( f"Time index {timeIndex} is not in the PVD file '{self.filename}'." )
+
+        with self._lock:
+            cached = self._cache.get( timeIndex )
+            if cached is not None:
+                self._cache.move_to_end( timeIndex )
+            future = self._prefetches.get( timeIndex )
+
+        if cached is not None:
+            dataset = cached[ 0 ]
+        elif future is not None:
+            dataset = future.result()
+        else:
+            dataset = self._loadTimeIndex( timeIndex )
+
+        if self.prefetch and timeIndex + 1 in self.datasets:
+            self._prefetchTimeIndex( timeIndex + 1 )
+
+        output = dataset.NewInstance()
+        output.ShallowCopy( dataset )
+        return output
 
     def getAllTimestepsValues( self: Self ) -> list[ float ]:
         """Get the list of all timesteps values from the PVD.
@@ -343,6 +510,124 @@ class PVDReader:
         """
         return [ value[ 0 ] for _, value in self.datasets.items() ]
 
+    def __enter__( self: Self ) -> Self:
+        """Enter the context of the reader."""
+        return self
+
+    def __exit__( self: Self, *args: object ) -> None:
+        """Stop the prefetching thread when leaving the context."""
+        self.close()
+
+    def close( self: Self ) -> None:
+        """Stop the prefetching thread and clear the cache."""
+        if self._executor is not None:
+            self._executor.shutdown( wait=True, cancel_futures=True )
+            self._executor = None
+        with self._lock:
+            self._prefetches.clear()
+            self._cache.clear()
+            self._geometries = []
+
+    def _prefetchTimeIndex( self: Self, timeIndex: int ) -> None:
+        """Read the dataset of a time index in the background if it is not cached yet.
+
+        Args:
+            timeIndex (int): Time index.
+        """
+        with self._lock:
+            if timeIndex in self._cache or timeIndex in self._prefetches:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor( max_workers=1, thread_name_prefix="PVDReader" )
+            self._prefetches[ timeIndex ] = self._executor.submit( self._loadTimeIndex, timeIndex )
+
+    def _loadTimeIndex( self: Self, timeIndex: int ) -> vtkDataObject:
+        """Read the dataset of a time index and add it to the cache.
+
+        Args:
+            timeIndex (int): Time index.
+
+        Returns:
+            vtkDataObject: Dataset.
+        """
+        try:
+            filepath: Path = self.dir / self.datasets[ timeIndex ][ 1 ]
+            readerClass = ARRAY_SELECTION_READER_MAP.get( filepath.suffix )
+            dataset: Optional[ vtkDataObject ] = None
+            if readerClass is not None:
+                dataset = _readData( str( filepath ), readerClass, self.pointArrays, self.cellArrays )
+            if dataset is None:
+                dataset = readMesh( str( filepath ) )
+            memorySize: int = dataset.GetActualMemorySize() * 1024 - self._shareGeometry( dataset )
+
+            with self._lock:
+                self._cache[ timeIndex ] = ( dataset, memorySize )
+                totalSize: int = sum( size for _, size in self._cache.values() )
+                # the least recently used datasets are removed, the last one is always kept
+                while totalSize > self.cacheMemoryLimit and len( self._cache ) > 1:
+                    _, ( _, size ) = self._cache.popitem( last=False )
+                    totalSize -= size
+            return dataset
+        finally:
+            with self._lock:
+                self._prefetches.pop( timeIndex, None )
+
+    def _shareGeometry( self: Self, dataset: vtkDataObject ) -> int:
+        """Share the points and cells of the dataset with the previous timesteps if they are the same.
+
+        Args:
+            dataset (vtkDataObject): Dataset read from the file.
+
+        Returns:
+            int: Memory size of the shared points and cells in bytes.
+        """
+        leaves: list[ vtkUnstructuredGrid ] = _getUnstructuredGridLeaves( dataset )
+        with self._lock:
+            references: list[ vtkUnstructuredGrid ] = self._geometries
+
+        if len( leaves ) != len( references ) or not all(
+                _hasSameGeometry( leaf, reference ) for leaf, reference in zip( leaves, references, strict=True ) ):
+            # only the points and cells are kept as reference, not the arrays of the timestep
+            geometries: list[ vtkUnstructuredGrid ] = []
+            for leaf in leaves:
+                geometry = vtkUnstructuredGrid()
+                if leaf.GetPoints() is not None:
+                    geometry.SetPoints( leaf.GetPoints() )
+                    geometry.SetCells( leaf.GetCellTypesArray(), leaf.GetCells() )
+                geometries.append( geometry )
+            with self._lock:
+                self._geometries = geometries
+            return 0
+
+        sharedSize: int = 0
+        for leaf, reference in zip( leaves, references, strict=True ):
+            sharedSize += ( reference.GetPoints().GetActualMemorySize() + reference.GetCells().GetActualMemorySize() +
+                            reference.GetCellTypesArray().GetActualMemorySize() ) * 1024
+            leaf.SetPoints( reference.GetPoints() )
+            leaf.SetCells( reference.GetCellTypesArray(), reference.GetCells() )
+        return sharedSize
+
+
+def _writePVDFile( pvdPath: Path, outputFiles: Iterable[ tuple[ float, Union[ str, Path ] ] ] ) -> None:
+    """Write a PVD collection file atomically.
+
+    The file is written under a temporary name and then renamed, so that readers
+    always find a complete PVD file.
+
+    Args:
+        pvdPath (Path): PVD file path.
+        outputFiles (Iterable[tuple[float, str | Path]]): Timestep values and filenames of the datasets.
+    """
+    tmpPath: Path = pvdPath.with_name( f".{pvdPath.name}.tmp" )
+    with open( tmpPath, 'w' ) as f:
+        f.write( '<VTKFile type="Collection" version="0.1">\n' )
+        f.write( '  <Collection>\n' )
+        for t, fname in outputFiles:
+            f.write( f'    <DataSet timestep="{t}" file="{fname}"/>\n' )
+        f.write( '  </Collection>\n' )
+        f.write( '</VTKFile>\n' )
+    os.replace( tmpPath, pvdPath )
+
 
 def createPVD( outputDir: Path,
                pvdFilename: str,
@@ -361,12 +646,133 @@ def createPVD( outputDir: Path,
         logger = getLogger( "createPVD", True )
 
     pvdPath = outputDir / pvdFilename
-    with open( pvdPath, 'w' ) as f:
-        f.write( '<VTKFile type="Collection" version="0.1">\n' )
-        f.write( '  <Collection>\n' )
-        for t, fname in outputFiles:
-            f.write( f'    <DataSet timestep="{t}" file="{fname}"/>\n' )
-        f.write( '  </Collection>\n' )
-        f.write( '</VTKFile>\n' )
+    _writePVDFile( pvdPath, outputFiles )
 
     logger.info( f"PVD created: {pvdPath}." )
+
+
+class PVDWriter:
+
+    def __init__( self: Self,
+                  outputDir: Union[ str, Path ],
+                  pvdFilename: str,
+                  compression: VtkCompression = VtkCompression.LZ4,
+                  maxWorkers: Optional[ int ] = None,
+                  logger: Union[ Logger, None ] = None ) -> None:
+        """PVD time series writer.
+
+        Timesteps are written by a pool of threads as raw appended binary data with the
+        requested compression. Each file is written under a temporary name and renamed
+        once complete, then the PVD file is rewritten atomically with all the timesteps
+        written so far, so that a partial run remains readable.
+
+        To use the writer:
+
+        .. code-block:: python
+
+            with PVDWriter( outputDir, "output.pvd" ) as writer:
+                for time, mesh in timeSeries:
+                    writer.write( time, mesh, f"output_{time}.vtu" )
+
+        Args:
+            outputDir (str | Path): Output directory of the PVD and dataset files.
+            pvdFilename (str): PVD filename.
+            compression (VtkCompression, optional): Compressor of the data arrays.
+                    Defaults to VtkCompression.LZ4.
+            maxWorkers (int | None, optional): Number of writing threads.
+                    Defaults to None, the default of ThreadPoolExecutor.
+            logger (Union[Logger, None], optional): A logger to manage the output messages.
+                    Defaults to None, an internal logger is used.
+        """
+        self.logger: Logger = getLogger( "PVD Writer", True ) if logger is None else logger
+        self.outputDir: Path = Path( outputDir )
+        self.pvdPath: Path = self.outputDir / pvdFilename
+        self.compression: VtkCompression = compression
+
+        self._executor = ThreadPoolExecutor( max_workers=maxWorkers, thread_name_prefix="PVDWriter" )
+        self._futures: list[ Future[ None ] ] = []
+        self._lock = threading.Lock()
+        # timestep value of each written filename
+        self._writtenFiles: dict[ str, float ] = {}
+
+    def __enter__( self: Self ) -> Self:
+        """Enter the context of the writer."""
+        return self
+
+    def __exit__( self: Self, excType: Optional[ type[ BaseException ] ], *args: object ) -> None:
+        """Wait for the timesteps to be written when leaving the context.
+
+        If the context is left by an exception, the timesteps already submitted are still
+        written, but their errors are only logged so that the exception is not hidden.
+        """
+        if excType is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except RuntimeError as e:
+            self.logger.error( f"{e} {e.__cause__}" )
+
+    def write( self: Self, time: float, mesh: vtkPointSet, filename: str ) -> Future[ None ]:
+        """Write the dataset of a timestep in the background.
+
+        The mesh is shallow copied, arrays can then be added or removed by the caller, but
+        array values must not be modified in place until the returned future is done.
+
+        Args:
+            time (float): Timestep value.
+            mesh (vtkPointSet): Dataset of the timestep.
+            filename (str): Filename of the dataset, relative to the output directory.
+                The writer is chosen from the extension, see WRITER_MAP.
+
+        Raises:
+            ValueError: If the file extension is not a supported XML write format.
+
+        Returns:
+            Future[None]: Future done when the dataset and the PVD file are written.
+        """
+        writerClass = WRITER_MAP.get( VtkFormat( Path( filename ).suffix ) )
+        if writerClass is None or not issubclass( writerClass, vtkXMLWriter ):
+            raise ValueError( f"Writing a time series to extension '{Path( filename ).suffix}' is not supported." )
+
+        meshCopy = mesh.NewInstance()
+        meshCopy.ShallowCopy( mesh )
+        future = self._executor.submit( self._writeTimestep, time, meshCopy, filename, writerClass )
+        self._futures.append( future )
+        return future
+
+    def close( self: Self ) -> None:
+        """Wait for all the timesteps to be written.
+
+        Raises:
+            RuntimeError: If a timestep could not be written.
+        """
+        self._executor.shutdown( wait=True )
+        errors: list[ BaseException ] = [ e for e in ( f.exception() for f in self._futures ) if e is not None ]
+        self._futures.clear()
+        if errors:
+            raise RuntimeError( f"{len( errors )} timesteps could not be written." ) from errors[ 0 ]
+        self.logger.info( f"PVD created: {self.pvdPath}." )
+
+    def _writeTimestep( self: Self, time: float, mesh: vtkPointSet, filename: str,
+                        writerClass: VtkWriterClass ) -> None:
+        """Write the dataset of a timestep and add it to the PVD file.
+
+        Args:
+            time (float): Timestep value.
+            mesh (vtkPointSet): Dataset of the timestep.
+            filename (str): Filename of the dataset, relative to the output directory.
+            writerClass (VtkWriterClass): The VTK writer class to use.
+        """
+        outputPath: Path = self.outputDir / filename
+        tmpPath: Path = outputPath.with_name( f".{outputPath.name}.tmp" )
+        if not _writeData( mesh, writerClass, str( tmpPath ), True, self.logger, self.compression, True ):
+            tmpPath.unlink( missing_ok=True )
+            raise RuntimeError( f"VTK writer failed to write file '{outputPath}'." )
+        os.replace( tmpPath, outputPath )
+
+        with self._lock:
+            self._writtenFiles[ filename ] = time
+            _writePVDFile(
+                self.pvdPath,
+                sorted( ( ( t, fname ) for fname, t in self._writtenFiles.items() ), key=lambda item: item[ 0 ] ) )
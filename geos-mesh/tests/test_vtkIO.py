@@ -1,10 +1,12 @@
 import pytest
 import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 from vtkmodules.vtkCommonCore import vtkPoints
-from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid, vtkStructuredGrid, VTK_TETRA
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkUnstructuredGrid, vtkStructuredGrid, VTK_TETRA
+from vtkmodules.vtkIOXML import vtkXMLMultiBlockDataWriter
 from geos.mesh.utils.genericHelpers import createSingleCellMesh
-from geos.mesh.io.vtkIO import ( VtkFormat, VtkOutput, readMesh, readUnstructuredGrid, writeMesh, XML_FORMATS,
-                                 WRITER_MAP )
+from geos.mesh.io.vtkIO import ( PVDReader, PVDWriter, VtkCompression, VtkFormat, VtkOutput, createPVD, readMesh,
+                                 readUnstructuredGrid, writeMesh, XML_FORMATS, WRITER_MAP )
 
 __doc__ = """
 Test module for vtkIO module.
@@ -439,3 +441,130 @@ class TestEdgeCases:
         # And read back
         readResult = readUnstructuredGrid( str( outputFile ) )
         assert readResult.GetNumberOfPoints() == simpleUnstructuredMesh.GetNumberOfPoints()
+
+
+@pytest.fixture
+def pvdFile( tmp_path ):
+    """Fixture for a PVD file of 3 timesteps of a multiblock dataset with a constant mesh."""
+    outputFiles = []
+    for timeIndex in range( 3 ):
+        multiBlock = vtkMultiBlockDataSet()
+        for block in range( 2 ):
+            mesh = createSingleCellMesh( VTK_TETRA,
+                                         np.array( [ [ 0, 0, 0 ], [ 1, 0, 0 ], [ 0, 1, 0 ], [ 0, 0, 1 ] ] ) + block )
+            for name in ( "pressure", "temperature" ):
+                array = numpy_to_vtk( np.full( 4, timeIndex, dtype=float ), deep=True )
+                array.SetName( name )
+                mesh.GetPointData().AddArray( array )
+                array = numpy_to_vtk( np.full( 1, timeIndex, dtype=float ), deep=True )
+                array.SetName( name )
+                mesh.GetCellData().AddArray( array )
+            multiBlock.SetBlock( block, mesh )
+        writer = vtkXMLMultiBlockDataWriter()
+        writer.SetFileName( str( tmp_path / f"output_{timeIndex}.vtm" ) )
+        writer.SetInputData( multiBlock )
+        writer.Write()
+        outputFiles.append( ( 10 * timeIndex, f"output_{timeIndex}.vtm" ) )
+    createPVD( tmp_path, "output.pvd", outputFiles )
+    return str( tmp_path / "output.pvd" )
+
+
+class TestPVDReader:
+    """Test class for PVDReader."""
+
+    def test_readTimesteps( self, pvdFile ):
+        """Test reading every timestep with the cache and the prefetching."""
+        with PVDReader( pvdFile, prefetch=True ) as reader:
+            assert reader.getAllTimestepsValues() == [ 0.0, 10.0, 20.0 ]
+            for timeIndex in range( 3 ):
+                dataset = reader.getDataSetAtTimeIndex( timeIndex )
+                assert isinstance( dataset, vtkMultiBlockDataSet )
+                block = dataset.GetBlock( 1 )
+                assert isinstance( block, vtkUnstructuredGrid )
+                values = vtk_to_numpy( block.GetCellData().GetArray( "pressure" ) )
+                assert np.all( values == timeIndex )
+            with pytest.raises( KeyError ):
+                reader.getDataSetAtTimeIndex( 3 )
+            assert reader._executor is not None
+        # the prefetching thread is stopped when leaving the context
+        assert reader._executor is None and not reader._cache
+
+    def test_arraySelection( self, pvdFile ):
+        """Test that only the requested arrays are read."""
+        reader = PVDReader( pvdFile, pointArrays=[], cellArrays=[ "pressure" ] )
+        block = reader.getDataSetAtTimeIndex( 0 ).GetBlock( 0 )
+        assert block.GetPointData().GetNumberOfArrays() == 0
+        assert block.GetCellData().GetNumberOfArrays() == 1
+        assert block.GetCellData().GetArray( "pressure" ) is not None
+
+    def test_cacheAndGeometry( self, pvdFile ):
+        """Test that datasets are cached and that the unchanged mesh is shared between timesteps."""
+        reader = PVDReader( pvdFile )
+        dataset0 = reader.getDataSetAtTimeIndex( 0 )
+        dataset1 = reader.getDataSetAtTimeIndex( 1 )
+        for block in range( 2 ):
+            assert dataset0.GetBlock( block ).GetPoints() is dataset1.GetBlock( block ).GetPoints()
+            assert dataset0.GetBlock( block ).GetCells() is dataset1.GetBlock( block ).GetCells()
+
+        # returned datasets are copies of the cached ones
+        dataset1.GetBlock( 0 ).GetCellData().RemoveArray( "pressure" )
+        cached = reader.getDataSetAtTimeIndex( 1 )
+        assert cached.GetBlock( 0 ).GetCellData().GetArray( "pressure" ) is not None
+        assert cached.GetBlock( 0 ).GetCellData().GetArray( "temperature" ) is dataset1.GetBlock(
+            0 ).GetCellData().GetArray( "temperature" )
+
+        # with no memory, only the last dataset is kept
+        reader = PVDReader( pvdFile, cacheMemoryLimit=0 )
+        for timeIndex in range( 3 ):
+            reader.getDataSetAtTimeIndex( timeIndex )
+        assert list( reader._cache ) == [ 2 ]
+
+
+class TestPVDWriter:
+    """Test class for PVDWriter."""
+
+    @pytest.mark.parametrize( "compression", list( VtkCompression ) )
+    def test_writeTimeSeries( self, simpleUnstructuredMesh, tmp_path, compression ):
+        """Test writing a time series and reading it back."""
+        with PVDWriter( tmp_path, "series.pvd", compression=compression, maxWorkers=2 ) as writer:
+            for timeIndex in range( 4 ):
+                mesh = vtkUnstructuredGrid()
+                mesh.DeepCopy( simpleUnstructuredMesh )
+                array = numpy_to_vtk( np.full( 1, timeIndex, dtype=float ), deep=True )
+                array.SetName( "pressure" )
+                mesh.GetCellData().AddArray( array )
+                writer.write( 5.0 * timeIndex, mesh, f"series_{timeIndex}.vtu" )
+                # arrays can be removed once the mesh has been submitted
+                mesh.GetCellData().RemoveArray( "pressure" )
+
+        assert sorted( path.name for path in tmp_path.iterdir() ) == [
+            "series.pvd", "series_0.vtu", "series_1.vtu", "series_2.vtu", "series_3.vtu"
+        ]
+        reader = PVDReader( str( tmp_path / "series.pvd" ) )
+        assert reader.getAllTimestepsValues() == [ 0.0, 5.0, 10.0, 15.0 ]
+        for timeIndex in range( 4 ):
+            dataset = reader.getDataSetAtTimeIndex( timeIndex )
+            assert dataset.GetNumberOfCells() == simpleUnstructuredMesh.GetNumberOfCells()
+            assert vtk_to_numpy( dataset.GetCellData().GetArray( "pressure" ) )[ 0 ] == timeIndex
+
+    def test_writeUnsupportedFormat( self, simpleUnstructuredMesh, tmp_path ):
+        """Test that only XML formats can be written as time series."""
+        with PVDWriter( tmp_path, "series.pvd" ) as writer, pytest.raises( ValueError ):
+            writer.write( 0.0, simpleUnstructuredMesh, "series_0.vtk" )
+
+    def test_writeFailure( self, simpleUnstructuredMesh, tmp_path ):
+        """Test that write failures are raised and that written timesteps remain readable."""
+        writer = PVDWriter( tmp_path, "series.pvd", maxWorkers=1 )
+        writer.write( 0.0, simpleUnstructuredMesh, "series_0.vtu" )
+        writer.write( 1.0, simpleUnstructuredMesh, "missingDirectory/series_1.vtu" )
+        with pytest.raises( RuntimeError ):
+            writer.close()
+        assert PVDReader( str( tmp_path / "series.pvd" ) ).getAllTimestepsValues() == [ 0.0 ]
+
+    def test_exceptionInContext( self, simpleUnstructuredMesh, tmp_path ):
+        """Test that an exception raised in the context is not hidden and that submitted timesteps are written."""
+        with pytest.raises( KeyError ), PVDWriter( tmp_path, "series.pvd", maxWorkers=1 ) as writer:
+            writer.write( 0.0, simpleUnstructuredMesh, "series_0.vtu" )
+            writer.write( 1.0, simpleUnstructuredMesh, "missingDirectory/series_1.vtu" )
+            raise KeyError( "processing failed" )
+        assert PVDReader( str( tmp_path / "series.pvd" ) ).getAllTimestepsValues() == [ 0.0 ]
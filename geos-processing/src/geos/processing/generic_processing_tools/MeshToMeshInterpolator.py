@@ -5,12 +5,16 @@
 import numpy as np
 import numpy.typing as npt
 import logging
+from enum import Enum
+from scipy.spatial import cKDTree
+from typing import Iterator
 from typing_extensions import Self, Union, Any
-from vtkmodules.util.numpy_support import vtk_to_numpy, numpy_to_vtk
-from vtkmodules.vtkCommonDataModel import vtkDataSet, vtkKdTree, vtkBoundingBox, vtkSelectionNode, vtkSelection, vtkUnstructuredGrid
+from vtkmodules.util.numpy_support import ID_TYPE_CODE, vtk_to_numpy, numpy_to_vtk
+from vtkmodules.vtkCommonDataModel import ( vtkDataSet, vtkBoundingBox, vtkCellTypes, vtkSelectionNode, vtkSelection,
+                                            vtkUnstructuredGrid )
 from vtkmodules.vtkFiltersExtraction import vtkExtractSelection
 from vtkmodules.vtkFiltersCore import vtkCellCenters, vtkAppendFilter
-from vtkmodules.vtkCommonCore import reference, vtkIdTypeArray, vtkPoints
+from vtkmodules.vtkCommonCore import VTK_ID_TYPE, vtkIdTypeArray, vtkPoints
 from geos.mesh.utils.arrayHelpers import ( getAttributeSet )
 from geos.utils.Logger import ( getLogger, Logger, CountVerbosityHandler, isHandlerInLogger, getLoggerHandlerType )
 from geos.utils.pieceEnum import Piece
@@ -19,7 +23,9 @@ __doc__ = """
 MeshToMeshInterpolator is a vtk filter that map data from a source mesh to a target mesh using by default nearest
 neighbor interpolation rules.
 
-It leverage KdPointTree structure to do so efficiently and numpy array storate for fast indexing.
+It leverage KdPointTree structure to do so efficiently and numpy array storate for fast indexing. All the target points
+are queried at once, optionally on their k nearest source points, and values are reduced (nearest, mean, min, max or
+inverse distance weighting) with vectorized numpy operations. Targets are processed by chunks to bound the memory used.
 
 To use the filter:
 
@@ -38,6 +44,10 @@ To use the filter:
     meshToMeshInterpolator.setFillInValue(42.0)
     # opt. for region-restricted mappings
     meshToMeshInterpolator.setCellRegionsIds("attribures",set({2,3}))
+    # opt. for k-nearest interpolation (default to nearest neighbor)
+    meshToMeshInterpolator.setInterpolationMethod(InterpolationMethod.IDW, 4)
+    # opt. for the memory used by the transfer (default to 512 MiB)
+    meshToMeshInterpolator.setMemoryLimit(2**28)
 
     try:
         meshToMeshInterpolator.applyFilter()
@@ -52,6 +62,18 @@ To use the filter:
 
 loggerTitle: str = "Mesh to mesh Mapping"
 
+DEFAULT_MEMORY_LIMIT: int = 2**29
+
+
+class InterpolationMethod( str, Enum ):
+    """Reduction of the values of the nearest source points of a target point."""
+    NEAREST = "nearest"
+    MEAN = "mean"
+    MIN = "min"
+    MAX = "max"
+    IDW = "inverse distance weighting"
+
+
 #TODO for efficient/robust vtm->vtm need s->t block adjacency and selective merge blocks
 #TODO makes a perf log tooling
 
@@ -102,6 +124,9 @@ class MeshToMeshInterpolator:
         self.attrName: str = ''
         self.regionIds: list = []
         self.fieldnc: dict = {}
+        self.method: InterpolationMethod = InterpolationMethod.NEAREST
+        self.nbNeighbors: int = 1
+        self.memoryLimit: int = DEFAULT_MEMORY_LIMIT
 
         # sorting attribute to map by support
         for piece in [ Piece.POINTS, Piece.CELLS ]:
@@ -154,6 +179,32 @@ class MeshToMeshInterpolator:
         """
         self.fillInValue = val
 
+    def setInterpolationMethod( self: Self, method: InterpolationMethod, nbNeighbors: int = 1 ) -> None:
+        """Set the reduction of the values of the nearest source points of each target point.
+
+        Args:
+            method (InterpolationMethod): reduction of the neighbors values.
+            nbNeighbors (int, optional): number of source neighbors, ignored for nearest method.
+                Defaults to 1.
+        """
+        if nbNeighbors < 1:
+            raise ValueError( f"The number of neighbors must be positive, not {nbNeighbors}." )
+        self.method = method
+        self.nbNeighbors = 1 if method == InterpolationMethod.NEAREST else nbNeighbors
+
+    def setMemoryLimit( self: Self, memoryLimit: int = DEFAULT_MEMORY_LIMIT ) -> None:
+        """Set the memory in bytes the temporary arrays of the transfer may use, defining the size of target chunks.
+
+        The limit bounds the neighbor distances, ids and values of a chunk of targets. The source and target
+        coordinates, the KD-tree, the vectorized source fields and the mapped fields are not covered by it.
+
+        Args:
+            memoryLimit (int): memory limit in bytes. Defaults to 512 MiB.
+        """
+        if memoryLimit <= 0:
+            raise ValueError( f"The memory limit must be positive, not {memoryLimit}." )
+        self.memoryLimit = memoryLimit
+
     def setCellRegionsIds( self: Self, attrName: str, regionIds: list[ int ] ) -> None:
         """Set a conditional integer flag for painting in the source mesh, with true equality check values.
 
@@ -232,48 +283,119 @@ class MeshToMeshInterpolator:
                                vtkDataSet,
                            ],
                            _getPoints: Any,
-                           toMask: npt.NDArray = np.ndarray( [] ) ) -> list:
-        """Clamp interpolation of points from meshSource to meshTarget, return list of list of tuple (distance,id_closer) for each point in target mesh.
+                           toMask: npt.NDArray = np.ndarray( [] ),
+                           nbNeighbors: int = 1,
+                           chunkSize: int = 2**20 ) -> Iterator[ tuple[ slice, npt.NDArray, npt.NDArray ] ]:
+        """Clamp interpolation of points from meshSource to meshTarget with k-nearest queries by chunks of targets.
+
+        Targets outside the (inflated) source bounding box or out of the restriction mask get an infinite distance
+        and a -1 id.
 
         Args:
             meshSource (Union[vtkDataSet, ]): source mesh
             meshTarget (Union[vtkDataSet, ]): target mesh
             _getPoints (Any): function to get points from mesh (e.g. cell centers or points)
             toMask (npt.NDArray): optional restriction list
-        """
-        #because of distributed vtm format we use distributed datastruct (e.g. list are list of list then reduced)
-        kd = vtkKdTree()
-        kd.BuildLocatorFromPoints( _getPoints( meshSource ) )
-
-        tgPts = _getPoints( meshTarget )
-        source2target: list = [ [] for i in range( tgPts.GetNumberOfPoints() ) ]  # map index from source to target
-        box = vtkBoundingBox( meshSource.GetBounds() )
-        getLogger( loggerTitle, True ).info( f"[before] Inflate clamping target={[box.GetBound(i) for i in range(6)]}" )
-        box.Inflate( .05 * box.GetLength( 0 ), .05 * box.GetLength( 1 ), .05 * box.GetLength( 2 ) )
-        getLogger( loggerTitle, True ).info( f"[after] Inflate clamping target={[box.GetBound(i) for i in range(6)]}" )
-
-        for i in range( tgPts.GetNumberOfPoints() ):
-            dist = reference( 0. )
-            idSource = kd.FindClosestPoint( tgPts.GetPoint( i ), dist )  # type: ignore[call-overload]
-            if np.ndim( toMask ) == 0 or ( np.ndim( toMask ) == 1 and toMask[ i ] ):
-                if box.ContainsPoint( tgPts.GetPoint( i ) ):
-                    source2target[ i ].append( ( dist, idSource ) )
-                else:
-                    source2target[ i ].append( ( np.inf, -1 ) )
-            else:
-                source2target[ i ].append( ( np.inf, -1 ) )
+            nbNeighbors (int): number of nearest source points to find for each target point
+            chunkSize (int): number of target points queried at once
 
-        return source2target
+        Yields:
+            tuple[slice, npt.NDArray, npt.NDArray]: the targets of the chunk and their (n, k) arrays of distances and
+            ids of the closest source points, sorted by increasing distance.
+        """
+        srcPts, tgPts = ( np.empty( ( 0, 3 ) ) if points is None else vtk_to_numpy( points.GetData() )
+                          for points in ( _getPoints( meshSource ), _getPoints( meshTarget ) ) )
+        nbNeighbors = max( 1, min( nbNeighbors, srcPts.shape[ 0 ] ) )
+        inBox = np.zeros( tgPts.shape[ 0 ], dtype=bool )
+        if srcPts.shape[ 0 ] > 0:
+            kd = cKDTree( srcPts )
+
+            box = vtkBoundingBox( meshSource.GetBounds() )
+            getLogger( loggerTitle,
+                       True ).info( f"[before] Inflate clamping target={[box.GetBound(i) for i in range(6)]}" )
+            box.Inflate( .05 * box.GetLength( 0 ), .05 * box.GetLength( 1 ), .05 * box.GetLength( 2 ) )
+            getLogger( loggerTitle,
+                       True ).info( f"[after] Inflate clamping target={[box.GetBound(i) for i in range(6)]}" )
+            bounds = np.array( [ box.GetBound( i ) for i in range( 6 ) ] )
+
+            inBox = np.all( ( tgPts >= bounds[ 0::2 ] ) & ( tgPts <= bounds[ 1::2 ] ), axis=1 )
+            if np.ndim( toMask ) == 1:
+                inBox &= toMask.astype( bool )
+
+        for start in range( 0, tgPts.shape[ 0 ], chunkSize ):
+            chunk = slice( start, min( start + chunkSize, tgPts.shape[ 0 ] ) )
+            distances = np.full( ( chunk.stop - start, nbNeighbors ), np.inf )
+            ids = np.full( ( chunk.stop - start, nbNeighbors ), -1, dtype=np.int64 )
+            targetIds = np.flatnonzero( inBox[ chunk ] )
+            if targetIds.size > 0:
+                dist, idSource = kd.query( tgPts[ start + targetIds ], k=nbNeighbors, workers=-1 )
+                distances[ targetIds ] = dist.reshape( -1, nbNeighbors )
+                ids[ targetIds ] = idSource.reshape( -1, nbNeighbors )
+            yield chunk, distances, ids
 
     @staticmethod
-    def _reduce( listOfList: list ) -> list:
-        """Reduction of list of list of tuple (float,int) to list of index based on the first values.
+    def _reduce( distances: npt.NDArray,
+                 ids: npt.NDArray,
+                 values: npt.NDArray,
+                 method: InterpolationMethod = InterpolationMethod.NEAREST ) -> npt.NDArray:
+        """Reduction of the values of the k nearest source points of each target point.
 
         Args:
-            listOfList(list) : list of list of tuples of (distance,id_closer)
+            distances (npt.NDArray): (n, k) distances to the closest source points, sorted by increasing distance.
+            ids (npt.NDArray): (n, k) ids of the closest source points, -1 if none.
+            values (npt.NDArray): source values, the last row holding the fill-in value.
+            method (InterpolationMethod): reduction of the neighbors values.
+
+        Returns:
+            npt.NDArray: reduced values of the n target points.
+        """
+        fillIn: int = values.shape[ 0 ] - 1
+        ids = np.where( ids < 0, fillIn, ids )
+        if method == InterpolationMethod.NEAREST or ids.shape[ 1 ] == 1:
+            return values[ ids[ :, 0 ] ]
+
+        neighborValues = values[ ids ]
+        if method == InterpolationMethod.MEAN:
+            return neighborValues.mean( axis=1 )
+        if method == InterpolationMethod.MIN:
+            return neighborValues.min( axis=1 )
+        if method == InterpolationMethod.MAX:
+            return neighborValues.max( axis=1 )
+
+        # inverse distance weighting, exact matches and targets without neighbors take their nearest value
+        with np.errstate( divide="ignore" ):
+            weights = 1.0 / distances**2
+        weights[ ~np.isfinite( weights ) ] = 0.0
+        exact = ( distances[ :, 0 ] == 0.0 ) | ( ids[ :, 0 ] == fillIn )
+        weights[ exact ] = 0.0
+        weights[ exact, 0 ] = 1.0
+        weights /= weights.sum( axis=1, keepdims=True )
+        return np.einsum( "nk,nk...->n...", weights, neighborValues )
+
+    def _transfer( self: Self,
+                   meshFrom: Union[
+                       vtkDataSet,
+                   ],
+                   _getPoints: Any,
+                   sourceVec: npt.NDArray,
+                   transfer: npt.NDArray,
+                   toMask: npt.NDArray = np.ndarray( [] ) ) -> None:
+        """Add the source values transferred to the target points by chunks bounded by the memory limit.
 
+        Args:
+            meshFrom (Union[vtkDataSet, ]): source mesh
+            _getPoints (Any): function to get points from mesh (e.g. cell centers or points)
+            sourceVec (npt.NDArray): source values, the last row holding the fill-in value.
+            transfer (npt.NDArray): values of the target points, updated in place.
+            toMask (npt.NDArray): optional restriction list
         """
-        return [ min( llist )[ 1 ] for llist in listOfList ]
+        # distance, id and gathered values of each neighbor of a target, then the reduced values
+        bytesPerTarget: int = 8 * ( self.nbNeighbors * ( 2 + sourceVec[ 0 ].size ) + sourceVec[ 0 ].size )
+        chunkSize: int = max( 1, self.memoryLimit // bytesPerTarget )
+
+        for chunk, distances, ids in MeshToMeshInterpolator._clampInterpolate( meshFrom, self.meshTo, _getPoints,
+                                                                               toMask, self.nbNeighbors, chunkSize ):
+            transfer[ chunk ] += MeshToMeshInterpolator._reduce( distances, ids, sourceVec, self.method )
 
     @staticmethod
     def _getCellCenters( mesh: Union[
@@ -374,20 +496,20 @@ class MeshToMeshInterpolator:
         Args:
             mesh (vtkDataSet): input mesh to filter
         """
-        volumeIds = vtkIdTypeArray()
-        surfaceIds = vtkIdTypeArray()
-        nVolume = nSurface = nOther = 0
-
-        for i in range( mesh.GetNumberOfCells() ):
-            dim = mesh.GetCell( i ).GetCellDimension()
-            if dim == 3:
-                volumeIds.InsertNextValue( i )
-                nVolume += 1
-            elif dim == 2:
-                surfaceIds.InsertNextValue( i )
-                nSurface += 1
-            else:
-                nOther += 1
+        if isinstance( mesh, vtkUnstructuredGrid ):
+            cellTypes = vtk_to_numpy( mesh.GetCellTypesArray() )
+        else:
+            cellTypes = np.fromiter( ( mesh.GetCellType( i ) for i in range( mesh.GetNumberOfCells() ) ),
+                                     dtype=np.uint8,
+                                     count=mesh.GetNumberOfCells() )
+        # dimension of each cell from a lookup table on the cell types
+        distinctTypes, inverse = np.unique( cellTypes, return_inverse=True )
+        dimensions = np.array( [ vtkCellTypes.GetDimension( int( cellType ) ) for cellType in distinctTypes ],
+                               dtype=int )[ inverse ]
+        volumeIds = MeshToMeshInterpolator._toVtkIds( np.flatnonzero( dimensions == 3 ) )
+        nVolume = volumeIds.GetNumberOfTuples()
+        nSurface = int( np.count_nonzero( dimensions == 2 ) )
+        nOther = mesh.GetNumberOfCells() - nVolume - nSurface
 
         getLogger( loggerTitle, True ).info( f"  Cell types: {nVolume} volume (3D) | "
                                              f"{nSurface} surface (2D) | {nOther} other" )
@@ -431,6 +553,15 @@ class MeshToMeshInterpolator:
 
         return mesh.NewInstance(), mesh.NewInstance()
 
+    @staticmethod
+    def _toVtkIds( ids: npt.NDArray ) -> vtkIdTypeArray:
+        """Convert an array of indices to a vtkIdTypeArray.
+
+        Args:
+            ids (npt.NDArray): indices
+        """
+        return numpy_to_vtk( ids.astype( ID_TYPE_CODE ), deep=True, array_type=VTK_ID_TYPE )
+
     def _extractRegion( self: Self, meshFrom: Union[
         vtkDataSet,
     ], mask: npt.NDArray ) -> vtkUnstructuredGrid:
@@ -441,9 +572,7 @@ class MeshToMeshInterpolator:
             mask (npt.NDArray): boolean array of cells to extract
         """
         # Build vtkIdTypeArray of selected indices
-        idArr = vtkIdTypeArray()
-        for idx in np.where( mask )[ 0 ]:
-            idArr.InsertNextValue( int( idx ) )
+        idArr = MeshToMeshInterpolator._toVtkIds( np.flatnonzero( mask ) )
 
         sn = vtkSelectionNode()
         sn.SetFieldType( vtkSelectionNode.CELL )
@@ -464,7 +593,6 @@ class MeshToMeshInterpolator:
 
     def _apply( self: Self, regionId: int = -1 ) -> tuple[ npt.NDArray, npt.NDArray ]:
         """Apply the filter globally."""
-        s2t = {}
         sourceVec = {}
         transferCell, transferPoint = np.zeros( shape=( self.meshTo.GetNumberOfCells(),
                                                         len( self.attributes[ Piece.CELLS ] ),
@@ -483,22 +611,13 @@ class MeshToMeshInterpolator:
         if len( self.attributes[ Piece.CELLS ] ) > 0:
             sourceVec[ Piece.CELLS ], self.fieldnc[ Piece.CELLS ] = self._vectorizeFieldsOut(
                 self.attributes[ Piece.CELLS ], meshFrom, Piece.CELLS )
-            s2t[ Piece.CELLS ] = [
-                i if i != -1 else meshFrom.GetNumberOfCells() for i in MeshToMeshInterpolator._reduce(
-                    MeshToMeshInterpolator._clampInterpolate(
-                        meshFrom, self.meshTo, lambda m: MeshToMeshInterpolator._getCellCenters( m ), maskId ) )
-            ]
-
-            transferCell += sourceVec[ Piece.CELLS ][ s2t[ Piece.CELLS ], :, : ]
+            self._transfer( meshFrom, lambda m: MeshToMeshInterpolator._getCellCenters( m ), sourceVec[ Piece.CELLS ],
+                            transferCell, maskId )
 
         if len( self.attributes[ Piece.POINTS ] ) > 0:
             sourceVec[ Piece.POINTS ], self.fieldnc[ Piece.POINTS ] = self._vectorizeFieldsOut(
                 self.attributes[ Piece.POINTS ], meshFrom, Piece.POINTS )
-            s2t[ Piece.POINTS ] = [
-                i if i != -1 else self.meshFrom.GetNumberOfPoints() for i in MeshToMeshInterpolator._reduce(
-                    MeshToMeshInterpolator._clampInterpolate( self.meshFrom, self.meshTo, lambda m: m.GetPoints() ) )
-            ]
-            transferPoint += sourceVec[ Piece.CELLS ][ s2t[ Piece.CELLS ], :, : ]
+            self._transfer( meshFrom, lambda m: m.GetPoints(), sourceVec[ Piece.POINTS ], transferPoint )
 
         return transferCell, transferPoint
 
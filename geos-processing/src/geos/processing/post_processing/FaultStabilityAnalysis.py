@@ -8,11 +8,12 @@ from pathlib import Path
 from vtkmodules.vtkCommonDataModel import vtkDataSet, vtkUnstructuredGrid
 
 from geos.mesh.utils.multiblockModifiers import ( mergeBlocks )
-from geos.mesh.io.vtkIO import ( PVDReader, createPVD, writeMesh, VtkOutput )
+from geos.mesh.io.vtkIO import ( PVDReader, PVDWriter )
 
 from geos.processing.tools.FaultGeometry import ( FaultGeometry )
 from geos.processing.tools.FaultVisualizer import ( Visualizer )
 from geos.processing.tools.MohrCoulomb import ( MohrCoulombAnalysis )
+from geos.processing.tools.ProfileExtractor import ( ProfileExtractor )
 from geos.processing.tools.SensitivityAnalyzer import ( SensitivityAnalyzer )
 from geos.processing.tools.StressProjector import ( StressProjector, StressProjectorWeightingScheme )
 
@@ -134,6 +135,9 @@ class FaultStabilityAnalysis:
             self.logger.setLevel( logging.INFO )
             self.logger.propagate = False
 
+        # Profiles are shared by the plots of all the timesteps
+        self.profileExtractor = ProfileExtractor( logger=self.logger )
+
         counter: CountVerbosityHandler = CountVerbosityHandler()
         self.counter: CountVerbosityHandler
         self.nbWarnings: int = 0
@@ -166,9 +170,8 @@ class FaultStabilityAnalysis:
 
     def _getInitialMesh( self: Self ) -> vtkUnstructuredGrid:
         """Get the mesh from timestep 0 in the PVD output file and merge the blocks."""
-        reader = PVDReader( self.pvdFile, logger=self.logger )
-
-        datasetT0 = reader.getDataSetAtTimeIndex( 0 )
+        with PVDReader( self.pvdFile, logger=self.logger ) as reader:
+            datasetT0 = reader.getDataSetAtTimeIndex( 0 )
 
         return mergeBlocks( datasetT0, keepPartialAttributes=True, logger=self.logger )
 
@@ -187,13 +190,13 @@ class FaultStabilityAnalysis:
             vtkUnstructuredGrid: Fault mesh.
         """
         self.logger.info( "Reading PVD file" )
-        reader = PVDReader( self.pvdFile, self.logger )
+        # the next timestep is read in the background while the current one is processed
+        reader = PVDReader( self.pvdFile, self.logger, prefetch=True )
         timeValues = reader.getAllTimestepsValues()
 
         if self.timeIndexes:
             timeValues = timeValues[ self.timeIndexes ]
 
-        outputFiles = []
         dataInitial = None
 
         # Get pre-computed data from faultGeometry
@@ -211,70 +214,66 @@ class FaultStabilityAnalysis:
         self.logger.info( "Time Series Processing" )
         self.logger.info( "=" * 70 )
 
-        for i, time in enumerate( timeValues ):
-            self.logger.info( f"***Step {i+1}/{len(timeValues)}: {time/(365.25*24*3600):.2f} years***" )
-
-            # Read time step
-            idx = self.timeIndexes[ i ] if self.timeIndexes else i
-            dataset = reader.getDataSetAtTimeIndex( idx )
-
-            # Merge blocks
-            volumeData = mergeBlocks( dataset, keepPartialAttributes=True, logger=self.logger )
-
-            if dataInitial is None:
-                dataInitial = volumeData
-
-            # -----------------------------------
-            # Projection using pre-computed topology
-            # -----------------------------------
-            # Projection
-            surfaceResult, volumeMarked, contributingCells = projector.projectStressToFault(
-                volumeData,
-                dataInitial,
-                surface,
-                time=timeValues[ i ],  # Simulation time
-                timestep=i,  # Timestep index
-                weightingScheme=self.weightingScheme,
-                computePrincipalStresses=self.computePrincipalStresses )
-
-            # -----------------------------------
-            # Mohr-Coulomb analysis
-            # -----------------------------------
-            cohesion = self.cohesion  # bar
-            frictionAngle = self.frictionAngle  # degrees
-
-            mc = MohrCoulombAnalysis( surfaceResult, cohesion, frictionAngle, logger=self.logger )
-            surfaceResult = mc.analyze()
-
-            # -----------------------------------
-            # Visualize
-            # -----------------------------------
-            self._plotResults( surfaceResult, contributingCells, time )
-
-            # -----------------------------------
-            # Sensitivity analysis
-            # -----------------------------------
-            if self.runSensitivity:
-                if len( self.sensitivityFrictionAngles ) == 0 or len( self.sensitivityCohesions ) == 0:
-                    raise ValueError(
-                        "Sensitivity friction angles and cohesions required if runSensitivity is set to True" )
-                analyzer = SensitivityAnalyzer( self.outputDir, self.logger )
-                analyzer.runAnalysis( surfaceResult, time, self.sensitivityFrictionAngles, self.sensitivityCohesions,
-                                      self.profileStartPoints, self.profileSearchRadius )
-
-            # Save
-            filename = self.outputDir / f'fault_analysis_{i:04d}.vtu'
-            writeMesh( mesh=surfaceResult,
-                       vtkOutput=VtkOutput( str( filename ) ),
-                       canOverwrite=True,
-                       logger=self.logger )
-            outputFiles.append( ( time, filename ) )
-            self.logger.info( f"   Saved: {filename}" )
-
-            self.logger.info( "=" * 60 )
-
-        # Create master PVD
-        createPVD( self.outputDir, 'fault_analysis.pvd', outputFiles, self.logger )
+        # Timesteps are written in the background while the next ones are processed
+        # and all of them are written when leaving the context, even if the processing fails
+        with reader, PVDWriter( self.outputDir, 'fault_analysis.pvd', logger=self.logger ) as writer:
+            for i, time in enumerate( timeValues ):
+                self.logger.info( f"***Step {i+1}/{len(timeValues)}: {time/(365.25*24*3600):.2f} years***" )
+
+                # Read time step
+                idx = self.timeIndexes[ i ] if self.timeIndexes else i
+                dataset = reader.getDataSetAtTimeIndex( idx )
+
+                # Merge blocks
+                volumeData = mergeBlocks( dataset, keepPartialAttributes=True, logger=self.logger )
+
+                if dataInitial is None:
+                    dataInitial = volumeData
+
+                # -----------------------------------
+                # Projection using pre-computed topology
+                # -----------------------------------
+                # Projection
+                surfaceResult, volumeMarked, contributingCells = projector.projectStressToFault(
+                    volumeData,
+                    dataInitial,
+                    surface,
+                    time=timeValues[ i ],  # Simulation time
+                    timestep=i,  # Timestep index
+                    weightingScheme=self.weightingScheme,
+                    computePrincipalStresses=self.computePrincipalStresses )
+
+                # -----------------------------------
+                # Mohr-Coulomb analysis
+                # -----------------------------------
+                cohesion = self.cohesion  # bar
+                frictionAngle = self.frictionAngle  # degrees
+
+                mc = MohrCoulombAnalysis( surfaceResult, cohesion, frictionAngle, logger=self.logger )
+                surfaceResult = mc.analyze()
+
+                # -----------------------------------
+                # Visualize
+                # -----------------------------------
+                self._plotResults( surfaceResult, contributingCells, time )
+
+                # -----------------------------------
+                # Sensitivity analysis
+                # -----------------------------------
+                if self.runSensitivity:
+                    if len( self.sensitivityFrictionAngles ) == 0 or len( self.sensitivityCohesions ) == 0:
+                        raise ValueError(
+                            "Sensitivity friction angles and cohesions required if runSensitivity is set to True" )
+                    analyzer = SensitivityAnalyzer( self.outputDir, self.logger, self.profileExtractor )
+                    analyzer.runAnalysis( surfaceResult, time, self.sensitivityFrictionAngles,
+                                          self.sensitivityCohesions, self.profileStartPoints )
+
+                # Save
+                filename = f'fault_analysis_{i:04d}.vtu'
+                writer.write( time, surfaceResult, filename )
+                self.logger.info( f"   Saving: {self.outputDir / filename}" )
+
+                self.logger.info( "=" * 60 )
 
         return surfaceResult
 
@@ -310,7 +309,8 @@ class FaultStabilityAnalysis:
                                  self.minDepthProfiles,
                                  self.maxDepthProfiles,
                                  savePlots=self.savePlots,
-                                 logger=self.logger )
+                                 logger=self.logger,
+                                 profileExtractor=self.profileExtractor )
 
         visualizer.plotMohrCoulombDiagram(
             surface,
@@ -13,8 +13,9 @@ from vtkmodules.vtkCommonDataModel import vtkPolyData
 
 from geos.mesh.utils.arrayModifiers import createAttribute
 from geos.mesh.utils.arrayHelpers import ( getArrayInObject, getAttributeSet, isAttributeInObject )
-from geos.mesh.utils.genericHelpers import ( getLocalBasisVectors, convertAttributeFromLocalToXYZ )
+from geos.mesh.utils.genericHelpers import getLocalBasisVectors
 import geos.geomechanics.processing.geomechanicsCalculatorFunctions as fcts
+from geos.utils.geometryFunctions import getLocalFrameMatrices, rotateVoigtTensors
 from geos.utils.pieceEnum import Piece
 from geos.utils.Logger import ( getLogger, Logger, CountVerbosityHandler, isHandlerInLogger, getLoggerHandlerType )
 from geos.utils.PhysicalConstants import ( DEFAULT_FRICTION_ANGLE_RAD, DEFAULT_ROCK_COHESION )
@@ -359,8 +360,6 @@ class SurfaceGeomechanics:
         Raises:
             ValueError: Error with the shape of attrArray or the computation of the attribute coordinates.
         """
-        attrXYZ: npt.NDArray[ np.float64 ] = np.zeros_like( attrArray )
-
         # Get all local basis vectors
         localBasis: npt.NDArray[ np.float64 ] = getLocalBasisVectors( self.outputMesh, self.logger )
 
@@ -369,9 +368,17 @@ class SurfaceGeomechanics:
                 f"Inconsistent number of components for attribute. Expected 3, 6 or 9 but got { len( attrArray[0].shape ) }."
             )
 
-            # Compute attribute XYZ components
-        # cellLocalBasis: npt.NDArray[ np.float64 ] = localBasis[ :, i, : ]
-        attrXYZ = convertAttributeFromLocalToXYZ( attrArray, localBasis )
+        # Rotation matrices of all the cells, rows = local directions (n, t1, t2), the XYZ components
+        # are obtained with their transpose
+        localToXYZ: npt.NDArray[ np.float64 ] = getLocalFrameMatrices( localBasis[ :, :, 0 ],
+                                                                       localBasis[ :, :, 1 ] ).transpose( 0, 2, 1 )
+        attrXYZ: npt.NDArray[ np.float64 ]
+        if len( attrArray[ 0 ] ) == 3:
+            # 3 components are the diagonal of the tensor, the diagonal of the rotated tensor is kept
+            diagonalTensors: npt.NDArray[ np.float64 ] = np.hstack( ( attrArray, np.zeros_like( attrArray ) ) )
+            attrXYZ = rotateVoigtTensors( diagonalTensors, localToXYZ )[ :, :3 ]
+        else:
+            attrXYZ = rotateVoigtTensors( attrArray, localToXYZ )
 
         if not np.any( np.isfinite( attrXYZ ) ):
             raise ValueError( "Attribute new coordinates calculation failed." )
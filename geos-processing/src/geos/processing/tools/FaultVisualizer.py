@@ -26,7 +26,8 @@ class Visualizer:
                   minDepthProfiles: float | None = None,
                   maxDepthProfiles: float | None = None,
                   savePlots: bool = True,
-                  logger: Union[ Logger, None ] = None ) -> None:
+                  logger: Union[ Logger, None ] = None,
+                  profileExtractor: ProfileExtractor | None = None ) -> None:
         """Visualization utilities.
 
         Args:
@@ -37,6 +38,8 @@ class Visualizer:
                     Defaults is True,
             logger (Union[Logger, None], optional): A logger to manage the output messages.
                     Defaults to None, an internal logger is used.
+            profileExtractor (ProfileExtractor | None, optional): Profile extractor whose cached
+                    profiles are shared with other plots. Defaults to None, a new extractor is used.
         """
         self.profileSearchRadius = profileSearchRadius
         self.minDepthProfiles = minDepthProfiles
@@ -52,6 +55,9 @@ class Visualizer:
             self.logger.setLevel( logging.INFO )
             self.logger.propagate = False
 
+        self.profileExtractor = profileExtractor if profileExtractor is not None else ProfileExtractor(
+            logger=self.logger )
+
     def plotMohrCoulombDiagram( self: Self,
                                 surface: vtkUnstructuredGrid,
                                 time: float,
@@ -157,13 +163,8 @@ class Visualizer:
         yMin, yMax = np.min( centers[ :, 1 ] ), np.max( centers[ :, 1 ] )
         zMin, zMax = np.min( depth ), np.max( depth )
 
-        # Auto-compute search radius if not provided
         xRange = xMax - xMin
         yRange = yMax - yMin
-        zMax - zMin
-
-        searchRadius = self.profileSearchRadius if self.profileSearchRadius is not None else min( xRange,
-                                                                                                  yRange ) * 0.15
 
         # Auto-generate profile points if not provided
         if profileStartPoints is None:
@@ -201,25 +202,25 @@ class Visualizer:
         # ===================================================================
         # EXTRACT AND PLOT PROFILES
         # ===================================================================
+        profiles = self.profileExtractor.extractProfiles( centers, profileStartPoints, {
+            "sigmaN": sigmaN,
+            "tau": tau,
+            "SCU": scu
+        } )
+
         for i, ( xPos, yPos ) in enumerate( profileStartPoints ):
             self.logger.info( f"     -> Profile {i+1}: starting at ({xPos:.1f}, {yPos:.1f})" )
 
-            depthsSigma, profileSigmaN, PathXSigma, PathYSigma = ProfileExtractor(
-                logger=self.logger ).extractAdaptiveProfile( centers, sigmaN, xPos, yPos, searchRadius )
-
-            depthsTau, profileTau, _, _ = ProfileExtractor( logger=self.logger ).extractAdaptiveProfile(
-                centers, tau, xPos, yPos, searchRadius )
-
-            depthsSCU, profileSCU, _, _ = ProfileExtractor( logger=self.logger ).extractAdaptiveProfile(
-                centers, scu, xPos, yPos, searchRadius )
-
-            depthsDeltaSCU, profileDeltaSCU, _, _ = ProfileExtractor( logger=self.logger ).extractAdaptiveProfile(
-                centers, scu, xPos, yPos, searchRadius )
+            profile = profiles[ profiles[ "profileId" ] == i ]
+            depthsSigma = depthsTau = depthsSCU = depthsDeltaSCU = profile[ "depth" ].to_numpy()
+            PathXSigma = profile[ "x" ].to_numpy()
+            profileSigmaN = profile[ "sigmaN" ].to_numpy()
+            profileTau = profile[ "tau" ].to_numpy()
+            profileSCU = profileDeltaSCU = profile[ "SCU" ].to_numpy()
 
             # Calculate path length
             if len( PathXSigma ) > 1:
-                pathLength = np.sum(
-                    np.sqrt( np.diff( PathXSigma )**2 + np.diff( PathYSigma )**2 + np.diff( depthsSigma )**2 ) )
+                pathLength = profile[ "arcLength" ].iloc[ -1 ]
                 self.logger.info(
                     f"        Path length: {pathLength:.1f}m (horizontal displacement: {np.abs(PathXSigma[-1] - PathXSigma[0]):.1f}m)"
                 )
@@ -432,6 +433,13 @@ class Visualizer:
             cellDataPlus[ key ] = getArrayInObject( volumeMesh, key )[ maskPlus ]
             cellDataMinus[ key ] = getArrayInObject( volumeMesh, key )[ maskMinus ]
 
+        # Attributes sampled along the profiles
+        sidePlusAttributes = { "sigma1": sigma1Plus, "sigma2": sigma2Plus, "sigma3": sigma3Plus }
+        sideMinusAttributes = { "sigma1": sigma1Minus, "sigma2": sigma2Minus, "sigma3": sigma3Minus }
+        if pressure is not None:
+            sidePlusAttributes[ "pressure" ] = pressurePlus
+            sideMinusAttributes[ "pressure" ] = pressureMinus
+
         self.logger.info( f"   Plus side: {len(centersPlus):,} cells" )
         self.logger.info( f"   Minus side: {len(centersMinus):,} cells" )
 
@@ -450,10 +458,6 @@ class Visualizer:
 
         xRange = xMax - xMin
         yRange = yMax - yMin
-        zMax - zMin
-
-        # Search radius
-        searchRadius = self.profileSearchRadius if self.profileSearchRadius is not None else min( xRange, yRange ) * 0.2
 
         # ===================================================================
         # AUTO-GENERATE PROFILE POINTS IF NOT PROVIDED
@@ -497,6 +501,20 @@ class Visualizer:
         # EXTRACT AND PLOT PROFILES FOR BOTH SIDES
         # ===================================================================
 
+        if len( centersPlus ) > 0:
+            self.logger.info( "        Processing PLUS side..." )
+            profilesPlus = self.profileExtractor.extractProfiles( centersPlus,
+                                                                  profileStartPoints,
+                                                                  sidePlusAttributes,
+                                                                  cellData=cellDataPlus )
+
+        if len( centersMinus ) > 0:
+            self.logger.info( "        Processing MINUS side..." )
+            profilesMinus = self.profileExtractor.extractProfiles( centersMinus,
+                                                                   profileStartPoints,
+                                                                   sideMinusAttributes,
+                                                                   cellData=cellDataMinus )
+
         for i, ( xPos, yPos, zPos ) in enumerate( profileStartPoints ):
             self.logger.info( f"     -> Profile {i+1}: starting at ({xPos:.1f}, {yPos:.1f}, {zPos:.1f})" )
 
@@ -504,44 +522,15 @@ class Visualizer:
             # PLUS SIDE
             # ================================================================
             if len( centersPlus ) > 0:
-                self.logger.info( "        Processing PLUS side..." )
-
-                depthsSigma1Plus, profileSigma1Plus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersPlus,
-                                                                 sigma1Plus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataPlus )
-
-                depthsSigma2Plus, profileSigma2Plus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersPlus,
-                                                                 sigma2Plus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataPlus )
-
-                depthsSigma3Plus, profileSigma3Plus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersPlus,
-                                                                 sigma3Plus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataPlus )
+                profilePlus = profilesPlus[ profilesPlus[ "profileId" ] == i ]
+                depthsSigma1Plus = depthsSigma2Plus = depthsSigma3Plus = profilePlus[ "depth" ].to_numpy()
+                profileSigma1Plus = profilePlus[ "sigma1" ].to_numpy()
+                profileSigma2Plus = profilePlus[ "sigma2" ].to_numpy()
+                profileSigma3Plus = profilePlus[ "sigma3" ].to_numpy()
 
                 if pressure is not None:
-                    depthsPressurePlus, profilePressurePlus, _, _ = ProfileExtractor(
-                        logger=self.logger ).extractAdaptiveProfile( centersPlus,
-                                                                     pressurePlus,
-                                                                     xPos,
-                                                                     yPos,
-                                                                     zPos,
-                                                                     searchRadius,
-                                                                     cellData=cellDataPlus )
+                    depthsPressurePlus = depthsSigma1Plus
+                    profilePressurePlus = profilePlus[ "pressure" ].to_numpy()
 
                 if len( depthsSigma1Plus ) >= 3:
                     labelPlus = 'Plus side'
@@ -627,44 +616,15 @@ class Visualizer:
             # MINUS SIDE
             # ================================================================
             if len( centersMinus ) > 0:
-                self.logger.info( "        Processing MINUS side..." )
-
-                depthsSigma1Minus, profileSigma1Minus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersMinus,
-                                                                 sigma1Minus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataMinus )
-
-                depthsSigma2Minus, profileSigma2Minus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersMinus,
-                                                                 sigma2Minus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataMinus )
-
-                depthsSigma3Minus, profileSigma3Minus, _, _ = ProfileExtractor(
-                    logger=self.logger ).extractAdaptiveProfile( centersMinus,
-                                                                 sigma3Minus,
-                                                                 xPos,
-                                                                 yPos,
-                                                                 zPos,
-                                                                 searchRadius,
-                                                                 cellData=cellDataMinus )
+                profileMinus = profilesMinus[ profilesMinus[ "profileId" ] == i ]
+                depthsSigma1Minus = depthsSigma2Minus = depthsSigma3Minus = profileMinus[ "depth" ].to_numpy()
+                profileSigma1Minus = profileMinus[ "sigma1" ].to_numpy()
+                profileSigma2Minus = profileMinus[ "sigma2" ].to_numpy()
+                profileSigma3Minus = profileMinus[ "sigma3" ].to_numpy()
 
                 if pressure is not None:
-                    depthsPressureMinus, profilePressureMinus, _, _ = ProfileExtractor(
-                        logger=self.logger ).extractAdaptiveProfile( centersMinus,
-                                                                     pressureMinus,
-                                                                     xPos,
-                                                                     yPos,
-                                                                     zPos,
-                                                                     searchRadius,
-                                                                     cellData=cellDataMinus )
+                    depthsPressureMinus = depthsSigma1Minus
+                    profilePressureMinus = profileMinus[ "pressure" ].to_numpy()
 
                 if len( depthsSigma1Minus ) >= 3:
                     labelMinus = 'Minus side'
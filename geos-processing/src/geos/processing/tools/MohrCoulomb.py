@@ -3,6 +3,7 @@
 # SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
 import logging
 import numpy as np
+import numpy.typing as npt
 from typing_extensions import Self, Union
 
 from vtkmodules.vtkCommonDataModel import ( vtkDataSet )
@@ -45,6 +46,37 @@ class MohrCoulombAnalysis:
             self.logger.setLevel( logging.INFO )
             self.logger.propagate = False
 
+    @staticmethod
+    def computeSCU(
+        sigmaN: npt.NDArray[ np.float64 ], tau: npt.NDArray[ np.float64 ], cohesion: float | npt.NDArray[ np.float64 ],
+        frictionAngle: float | npt.NDArray[ np.float64 ]
+    ) -> tuple[ npt.NDArray[ np.float64 ], npt.NDArray[ np.float64 ] ]:
+        """Compute the critical shear stress and the Shear Capacity Utilization (SCU).
+
+        Inputs are broadcast together, so that several cohesions and friction angles
+        can be evaluated at once.
+
+        Args:
+            sigmaN (npt.NDArray[np.float64]): Effective normal stress in bar
+            tau (npt.NDArray[np.float64]): Effective shear stress in bar
+            cohesion (float | npt.NDArray[np.float64]): Cohesion in bar
+            frictionAngle (float | npt.NDArray[np.float64]): Friction angle in degrees
+
+        Returns:
+            tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: Critical shear stress and SCU.
+        """
+        mu = np.tan( np.radians( frictionAngle ) )
+
+        # Mohr-Coulomb failure envelope
+        tauCritical = cohesion - sigmaN * mu
+
+        # Shear Capacity Utilization: SCU = tau / tau_crit
+        scu = np.divide( tau,
+                         tauCritical,
+                         out=np.zeros( np.broadcast_shapes( np.shape( tau ), tauCritical.shape ) ),
+                         where=tauCritical != 0 )
+        return tauCritical, scu
+
     def analyze( self: Self ) -> vtkDataSet:
         """Perform Mohr-Coulomb stability analysis.
 
@@ -57,15 +89,12 @@ class MohrCoulombAnalysis:
         sigmaN = getArrayInObject( self.surface, "sigmaNEffective", Piece.CELLS )
         tau = getArrayInObject( self.surface, "tauEffective", Piece.CELLS )
 
-        # Mohr-Coulomb failure envelope
-        tauCritical = self.cohesion - sigmaN * mu
+        # Mohr-Coulomb failure envelope and Shear Capacity Utilization
+        tauCritical, scu = self.computeSCU( sigmaN, tau, self.cohesion, self.frictionAngle )
 
         # Coulomb Failure Stress
         cfs = tau - mu * sigmaN
 
-        # Shear Capacity Utilization: SCU = tau / tau_crit
-        scu = np.divide( tau, tauCritical, out=np.zeros_like( tau ), where=tauCritical != 0 )
-
         if not isAttributeInObject( self.surface, "SCUInitial", Piece.CELLS ):
             # First timestep: store as initial reference
             scuInitial = scu.copy()
@@ -2,8 +2,12 @@
 # SPDX-FileCopyrightText: Copyright 2023-2026 TotalEnergies.
 # SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
 import logging
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
+from scipy.spatial import cKDTree
 from typing_extensions import Self, Union
 from enum import Enum
 
@@ -14,16 +18,30 @@ from geos.utils.Logger import ( Logger, getLogger )
 
 loggerTitle = "Profile Extractor"
 
+#: Number of profile tables kept in the cache of a ProfileExtractor
+PROFILE_CACHE_SIZE: int = 8
+
+#: Geometric columns of the profile tables
+PROFILE_COLUMNS: tuple[ str, ...] = ( "profileId", "cellId", "x", "y", "depth", "arcLength" )
+
 
 class ProfileExtractor:
 
     def __init__( self: Self, logger: Union[ Logger, None ] = None ) -> None:
         """Utility class for extracting profiles along fault surfaces.
 
+        Profiles are extracted as columnar tables, see extractProfiles. Their geometry
+        only depends on the cell centers and on the start points, so it is cached and
+        shared by all the calls of the same extractor sampling other attributes.
+
         Args:
             logger (Union[Logger, None], optional): A logger to manage the output messages.
                     Defaults to None, an internal logger is used.
         """
+        # cached profile tables with the cell centers and fault ids they were computed from
+        self._cache: OrderedDict[ tuple[ object, ...], tuple[ npt.NDArray[ np.float64 ], npt.NDArray[ np.float64 ]
+                                                              | None, pd.DataFrame ] ] = OrderedDict()
+
         # Logger
         self.logger: Logger
         if logger is None:
@@ -42,7 +60,7 @@ class ProfileExtractor:
         zStart: float | None = None,
         stepSize: float = 20.0,
         maxSteps: int = 500,
-        cellData: vtkCellData | None = None
+        cellData: vtkCellData | Mapping[ str, npt.NDArray[ np.float64 ] ] | None = None
     ) -> tuple[ npt.NDArray[ np.float64 ], npt.NDArray[ np.float64 ], npt.NDArray[ np.float64 ],
                 npt.NDArray[ np.float64 ] ]:
         """Extract a vertical depth profile with automatic fault detection.
@@ -58,6 +76,8 @@ class ProfileExtractor:
             5. For each slice, selecting the nearest cell in the XY plane to build the
                 final vertical profile.
 
+        This is the single profile version of extractProfiles.
+
         Args:
             centers (np.ndarray): Array of cell centers with shape ``(nCells, 3)``.
             values (np.ndarray): Scalar values associated with each cell (shape ``(nCells,)``).
@@ -69,7 +89,7 @@ class ProfileExtractor:
                 Default is 20.0.
             maxSteps (int): Maximum number of vertical layers to traverse.
                 Default is 500.
-            cellData (vtkCellData | None): VTK cell data object containing fields such as
+            cellData (vtkCellData | Mapping[str, np.ndarray] | None): Cell data containing fields such as
                 ``attribute``, ``FaultMask``, or other identifiers used to detect and filter
                 the target fault.
 
@@ -77,139 +97,239 @@ class ProfileExtractor:
             tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
                 depth, profile values, X and Y coordinates of the profile path.
         """
-        # Convert to np arrays
-        centers = np.asarray( centers )
-        values = np.asarray( values )
+        startPoint = ( xStart, yStart ) if zStart is None else ( xStart, yStart, zStart )
+        profile = self.extractProfiles( centers, [ startPoint ], { "values": values }, cellData )
+        return ( profile[ "depth" ].to_numpy(), profile[ "values" ].to_numpy(), profile[ "x" ].to_numpy(),
+                 profile[ "y" ].to_numpy() )
 
-        if len( centers ) == 0:
-            raise ValueError( "No cell provided." )
-
-        # ===================================================================
-        # STEP 1 : Find starting point
-        # ===================================================================
+    def extractProfiles(
+        self: Self,
+        centers: npt.NDArray[ np.float64 ],
+        startPoints: Sequence[ Sequence[ float ] ],
+        attributes: Mapping[ str, npt.NDArray[ np.float64 ] ] | None = None,
+        cellData: vtkCellData | Mapping[ str, npt.NDArray[ np.float64 ] ] | None = None,
+    ) -> pd.DataFrame:
+        """Extract the adaptive vertical profiles of several start points at once.
 
-        if zStart is None:
-            # Look in 2D (XY), take the highest values
-            self.logger.info( f"        Searching near ({xStart:.1f}, {yStart:.1f})" )
+        The profiles follow the algorithm of extractAdaptiveProfile. The start cells of
+        all the profiles are found with a single k-d tree query, and the cells of each
+        profile are selected for all the depth slices at once.
 
-            dXY = np.sqrt( ( centers[ :, 0 ] - xStart )**2 + ( centers[ :, 1 ] - yStart )**2 )
-            closestIndices = np.argsort( dXY )[ :20 ]
+        Args:
+            centers (np.ndarray): Array of cell centers with shape ``(nCells, 3)``.
+            startPoints (Sequence[Sequence[float]]): Start points of the profiles, either
+                (x, y) to start from the highest cell near this position or (x, y, z).
+            attributes (Mapping[str, np.ndarray] | None): Cell values to sample along the
+                profiles, for instance one entry per attribute and timestep. Defaults to None.
+            cellData (vtkCellData | Mapping[str, np.ndarray] | None): Cell data containing the
+                fault identifiers used to keep each profile on its fault. Defaults to None.
 
-            if len( closestIndices ) == 0:
-                raise ValueError( "No cells found near start point" )
+        Returns:
+            pd.DataFrame: Table with one row per profile point, ordered by profile and by
+            decreasing depth, with the columns of PROFILE_COLUMNS and one column per attribute.
+        """
+        centers = np.asarray( centers )
+        if len( centers ) == 0:
+            raise ValueError( "No cell provided." )
 
-            # Take the highest Z value
-            closestDepths = centers[ closestIndices, 2 ]
-            startIdx = closestIndices[ np.argmax( closestDepths ) ]
+        faultIds = self._getFaultIds( cellData, len( centers ) )
+        # the cached table is only reused if it was computed from the same cell centers and fault ids
+        key = ( centers.shape, tuple( tuple( point ) for point in startPoints ), faultIds is None )
+        cached = self._cache.get( key )
+        if cached is not None and self._isSameArray( cached[ 0 ], centers ) and self._isSameArray(
+                cached[ 1 ], faultIds ):
+            self._cache.move_to_end( key )
+            table = cached[ 2 ]
         else:
-            # Look in 3D
-            self.logger.info( f"        Searching near ({xStart:.1f}, {yStart:.1f}, {zStart:.1f})" )
+            table = self._computeProfiles( centers, startPoints, faultIds )
+            self._cache[ key ] = ( centers.copy(), None if faultIds is None else faultIds.copy(), table )
+            self._cache.move_to_end( key )
+            if len( self._cache ) > PROFILE_CACHE_SIZE:
+                self._cache.popitem( last=False )
+
+        profiles = table.copy()
+        if attributes is not None:
+            cellIds = profiles[ "cellId" ].to_numpy()
+            for name, values in attributes.items():
+                profiles[ name ] = np.asarray( values )[ cellIds ]
+        return profiles
+
+    @staticmethod
+    def _isSameArray( cached: npt.NDArray[ np.float64 ] | None, array: npt.NDArray[ np.float64 ] | None ) -> bool:
+        """Check whether an array is equal to a cached one, None being only equal to None.
 
-            d3D = np.sqrt( ( centers[ :, 0 ] - xStart )**2 + ( centers[ :, 1 ] - yStart )**2 +
-                           ( centers[ :, 2 ] - zStart )**2 )
-            startIdx = np.argmin( d3D )
+        Args:
+            cached (np.ndarray | None): Cached array.
+            array (np.ndarray | None): Array to compare.
 
-        startPoint = centers[ startIdx ]
+        Returns:
+            bool: True if both arrays have the same shape and values.
+        """
+        if cached is None or array is None:
+            return cached is array
+        return bool( np.array_equal( cached, array ) )
 
-        self.logger.info( f"        Starting point: ({startPoint[0]:.1f}, {startPoint[1]:.1f}, {startPoint[2]:.1f}) -"
-                          f" Cell index: {startIdx}" )
+    def _getFaultIds( self: Self, cellData: vtkCellData | Mapping[ str, npt.NDArray[ np.float64 ] ] | None,
+                      nCells: int ) -> npt.NDArray[ np.float64 ] | None:
+        """Get the first fault identification field of the cell data.
 
-        # ===================================================================
-        # STEP 2: Auto-detection of target fault
-        # ===================================================================
-        faultIds = None
-        targetFaultId = None
+        Args:
+            cellData (vtkCellData | Mapping[str, np.ndarray] | None): Cell data to search.
+            nCells (int): Number of cells of the profile dataset.
 
-        if cellData is not None:
-            faultFieldNames = [ 'attribute', 'FaultMask', 'faultId', 'region' ]
+        Returns:
+            np.ndarray | None: Fault identifiers of the cells, None if no field is found.
+        """
+        if cellData is None:
+            return None
+
+        faultFieldNames = [ 'attribute', 'FaultMask', 'faultId', 'region' ]
+        for fieldName in faultFieldNames:
+            if isinstance( cellData, vtkCellData ):
+                if not cellData.HasArray( fieldName ):
+                    continue
+                faultIds = vtk_to_numpy( cellData.GetArray( fieldName ) )
+            elif fieldName in cellData:
+                faultIds = np.asarray( cellData[ fieldName ] )
+            else:
+                continue
 
-            for fieldName in faultFieldNames:
-                if cellData.HasArray( fieldName ):
-                    faultIds = vtk_to_numpy( cellData.GetArray( fieldName ) )
+            if len( faultIds ) != nCells:
+                self.logger.warning( f"         Field '{fieldName}' length mismatch, skipping" )
+                continue
 
-                    if len( faultIds ) != len( centers ):
-                        self.logger.warning( f"         Field '{fieldName}' length mismatch, skipping" )
-                        continue
+            self.logger.info( f"        Found fault field: '{fieldName}'" )
+            self.logger.info( f"        Available fault IDs: {np.unique( faultIds )}" )
+            return faultIds
 
-                    # Get starting ID
-                    targetFaultId = faultIds[ startIdx ]
+        self.logger.warning( "         No fault identification field found" )
+        return None
 
-                    uniqueIds = np.unique( faultIds )
-                    self.logger.info( f"        Found fault field: '{fieldName}'" )
-                    self.logger.info( f"        Available fault IDs: {uniqueIds}" )
-                    self.logger.info( f"        Target fault ID at start point: {targetFaultId}" )
+    def _findStartCells( self: Self, centers: npt.NDArray[ np.float64 ],
+                         startPoints: Sequence[ Sequence[ float ] ] ) -> npt.NDArray[ np.int64 ]:
+        """Find the start cell of each profile.
 
-                    break
+        For (x, y) start points, this is the highest cell among the 20 closest cells in
+        the XY plane. For (x, y, z) start points, this is the closest cell.
 
-        # ===================================================================
-        # STEP 3: Filter dataset to keep only fault cells
-        # ===================================================================
-        if targetFaultId is not None:
-            maskSameFault = ( faultIds == targetFaultId )
-            nTotal = len( centers )
-            nOnFault = np.sum( maskSameFault )
+        Args:
+            centers (np.ndarray): Array of cell centers with shape ``(nCells, 3)``.
+            startPoints (Sequence[Sequence[float]]): Start points of the profiles.
 
-            self.logger.info(
-                f"        Filtering to fault ID={targetFaultId}: {nOnFault}/{nTotal} cells ({nOnFault/nTotal*100:.1f}%)"
-            )
+        Returns:
+            np.ndarray: Index of the start cell of each profile.
+        """
+        startIds = np.zeros( len( startPoints ), dtype=np.int64 )
+        is2D = np.array( [ len( point ) == 2 for point in startPoints ], dtype=bool )
 
-            if nOnFault == 0:
-                raise ValueError( "No cells found on target fault." )
+        if np.any( is2D ):
+            points2D = np.array( [ point for point in startPoints if len( point ) == 2 ], dtype=float )
+            tree2D = cKDTree( centers[ :, :2 ] )
+            # all the cells as close as the 20th closest cell are candidates
+            radii, _ = tree2D.query( points2D, k=[ min( 20, len( centers ) ) ] )
+            candidates = tree2D.query_ball_point( points2D, radii[ :, 0 ] * ( 1 + 1e-12 ) )
+            startIds[ is2D ] = [
+                ids[ np.argmax( centers[ ids, 2 ] ) ] for ids in ( np.sort( ids ) for ids in candidates )
+            ]
 
-            # Replace centers and values by the filtered subset
-            centers = centers[ maskSameFault ].copy()
-            values = values[ maskSameFault ].copy()
+        if not np.all( is2D ):
+            points3D = np.array( [ point for point in startPoints if len( point ) != 2 ], dtype=float )
+            _, startIds[ ~is2D ] = cKDTree( centers ).query( points3D )
 
-            # Find new starting index in the subset
-            dToStart = np.sqrt( np.sum( ( centers - startPoint )**2, axis=1 ) )
-            startIdx = np.argmin( dToStart )
+        return startIds
 
-            self.logger.info( f"         Profile will stay on fault ID={targetFaultId}" )
-        else:
-            self.logger.warning( "         No fault identification field found" )
+    def _computeProfiles( self: Self, centers: npt.NDArray[ np.float64 ], startPoints: Sequence[ Sequence[ float ] ],
+                          faultIds: npt.NDArray[ np.float64 ] | None ) -> pd.DataFrame:
+        """Compute the geometric table of the profiles.
 
-        # ===================================================================
-        # STEP 4: Z-slicing of the fault
-        # ===================================================================
+        Args:
+            centers (np.ndarray): Array of cell centers with shape ``(nCells, 3)``.
+            startPoints (Sequence[Sequence[float]]): Start points of the profiles.
+            faultIds (np.ndarray | None): Fault identifiers of the cells.
 
-        refX = centers[ startIdx, 0 ]
-        refY = centers[ startIdx, 1 ]
+        Returns:
+            pd.DataFrame: Table with the columns of PROFILE_COLUMNS.
+        """
+        startIds = self._findStartCells( centers, startPoints )
+
+        # Profiles starting on the same fault share the fault cells
+        targetFaultIds = np.zeros( len( startIds ) ) if faultIds is None else faultIds[ startIds ]
+        profileCellIds: list[ npt.NDArray[ np.int64 ] ] = [ np.zeros( 0, dtype=np.int64 ) ] * len( startIds )
+        for targetFaultId in np.unique( targetFaultIds ):
+            profileIds = np.flatnonzero( targetFaultIds == targetFaultId )
+            if faultIds is None:
+                faultCellIds = np.arange( len( centers ) )
+            else:
+                faultCellIds = np.flatnonzero( faultIds == targetFaultId )
+                self.logger.info( f"        Filtering to fault ID={targetFaultId}: {len( faultCellIds )}/"
+                                  f"{len( centers )} cells ({len( faultCellIds )/len( centers )*100:.1f}%)" )
 
-        self.logger.info( f"        Reference XY: ({refX:.1f}, {refY:.1f})" )
+            faultProfileCellIds = self._profileCellIds( centers[ faultCellIds ], centers[ startIds[ profileIds ], :2 ] )
+            for profileId, ids in zip( profileIds, faultProfileCellIds, strict=True ):
+                profileCellIds[ profileId ] = faultCellIds[ ids ]
 
-        # ===================================================================
-        # STEP 5: Fault geometry
-        # ===================================================================
+        for profileIndex, ( startCellId, ids ) in enumerate( zip( startIds, profileCellIds, strict=True ) ):
+            startPoint = centers[ startCellId ]
+            depths = centers[ ids, 2 ]
+            self.logger.info(
+                f"        Profile {profileIndex}: starting point ({startPoint[0]:.1f}, {startPoint[1]:.1f},"
+                f" {startPoint[2]:.1f}) - Cell index: {startCellId} - Extracted {len( ids )} points"
+                f" - Depth range: [{depths.max():.1f}, {depths.min():.1f}]m" )
+
+        cellIds = np.concatenate( profileCellIds )
+        path = centers[ cellIds ]
+        # arc length along each profile path
+        arcLength = np.concatenate( [
+            np.concatenate( ( [ 0.0 ], np.cumsum( np.linalg.norm( np.diff( centers[ ids ], axis=0 ), axis=1 ) ) ) )
+            for ids in profileCellIds if len( ids ) > 0
+        ] + [ np.zeros( 0 ) ] )
+        return pd.DataFrame( {
+            "profileId":
+            np.repeat( np.arange( len( startIds ) ), [ len( ids ) for ids in profileCellIds ] ),
+            "cellId":
+            cellIds,
+            "x":
+            path[ :, 0 ],
+            "y":
+            path[ :, 1 ],
+            "depth":
+            path[ :, 2 ],
+            "arcLength":
+            arcLength,
+        } )
+
+    def _profileCellIds( self: Self, centers: npt.NDArray[ np.float64 ],
+                         references: npt.NDArray[ np.float64 ] ) -> list[ npt.NDArray[ np.int64 ] ]:
+        """Select the cells of the profiles of one fault.
+
+        The fault is split into depth slices, and each profile keeps the closest cell of
+        each slice to its XY reference position, ordered by decreasing depth.
 
-        xRange = np.max( centers[ :, 0 ] ) - np.min( centers[ :, 0 ] )
-        yRange = np.max( centers[ :, 1 ] ) - np.min( centers[ :, 1 ] )
-        zRange = np.max( centers[ :, 2 ] ) - np.min( centers[ :, 2 ] )
+        Args:
+            centers (np.ndarray): Centers of the fault cells with shape ``(nCells, 3)``.
+            references (np.ndarray): XY reference position of each profile, with shape ``(nProfiles, 2)``.
 
+        Returns:
+            list[np.ndarray]: Indices of the cells of each profile.
+        """
+        zRange = np.max( centers[ :, 2 ] ) - np.min( centers[ :, 2 ] )
         if zRange <= 0:
             raise ValueError( f"Invalid zRange: {zRange}" )
 
-        lateralExtent = max( xRange, yRange )
-        xyTolerance = max( lateralExtent * 0.3, 100.0 )
-
-        self.logger.info( f"        Fault extent: X={xRange:.1f}m, Y={yRange:.1f}m, Z={zRange:.1f}m" )
-        self.logger.info( f"        XY tolerance: {xyTolerance:.1f}m" )
-
         # ===================================================================
-        # STEP 6: Slice computation
+        # Slice computation
         # ===================================================================
-
-        zCoordsSorted = np.sort( centers[ :, 2 ] )
+        zOrder = np.argsort( centers[ :, 2 ], kind="stable" )
+        zCoordsSorted = centers[ zOrder, 2 ]
         zDiffs = np.diff( zCoordsSorted )
         zDiffsPositive = zDiffs[ zDiffs > 1e-6 ]
 
         if len( zDiffsPositive ) == 0:
             self.logger.warning( "         All cells at same Z" )
-
-            dXY = np.sqrt( ( centers[ :, 0 ] - refX )**2 + ( centers[ :, 1 ] - refY )**2 )
-            sortedIndices = np.argsort( dXY )
-
-            return ( centers[ sortedIndices, 2 ], values[ sortedIndices ], centers[ sortedIndices,
-                                                                                    0 ], centers[ sortedIndices, 1 ] )
+            return [
+                np.argsort( np.sqrt( ( centers[ :, 0 ] - refX )**2 + ( centers[ :, 1 ] - refY )**2 ), kind="stable" )
+                for refX, refY in references
+            ]
 
         medianZSpacing = np.median( zDiffsPositive )
 
@@ -217,90 +337,43 @@ class ProfileExtractor:
         if medianZSpacing <= 0 or medianZSpacing > zRange:
             medianZSpacing = zRange / 100  # Fallback
 
-        sliceThickness = medianZSpacing
-
-        zMin = np.min( centers[ :, 2 ] )
-        zMax = np.max( centers[ :, 2 ] )
-
-        nSlices = int( np.ceil( zRange / sliceThickness ) )
+        nSlices = int( np.ceil( zRange / medianZSpacing ) )
         nSlices = min( nSlices, 10000 )  # Limit to 10k slices max
 
-        if nSlices <= 0:
-            raise ValueError( f"         Invalid nSlices: {nSlices}" )
-
         self.logger.info( f"        Median Z spacing: {medianZSpacing:.1f}m" )
         self.logger.info( f"        Creating {nSlices} slices" )
 
-        zSlices = np.linspace( zMax, zMin, nSlices + 1 )
-
-        # ===================================================================
-        # STEP 7: Slice extraction
-        # ===================================================================
-
-        profileIndices = []
-
-        for i in range( len( zSlices ) - 1 ):
-            zTop = zSlices[ i ]
-            zBottom = zSlices[ i + 1 ]
-
-            # Cells in this slice
-            maskInSlice = ( centers[ :, 2 ] <= zTop ) & ( centers[ :, 2 ] >= zBottom )
-            indicesInSlice = np.where( maskInSlice )[ 0 ]
-
-            if len( indicesInSlice ) == 0:
-                continue
-
-            # XY distance from reference
-            dXYInSlice = np.sqrt( ( centers[ indicesInSlice, 0 ] - refX )**2 +
-                                  ( centers[ indicesInSlice, 1 ] - refY )**2 )
-
-            validMask = dXYInSlice < xyTolerance
-
-            if not np.any( validMask ):
-                closestInSlice = indicesInSlice[ np.argmin( dXYInSlice ) ]
-            else:
-                validIndices = indicesInSlice[ validMask ]
-                dXYValid = dXYInSlice[ validMask ]
-                closestInSlice = validIndices[ np.argmin( dXYValid ) ]
-
-            profileIndices.append( closestInSlice )
+        zSlices = np.linspace( zCoordsSorted[ -1 ], zCoordsSorted[ 0 ], nSlices + 1 )
+
+        # Cells of slice i are the cells sorted by Z in [ lower[ i ], upper[ i ] ), the bounds
+        # of the slices belong to both adjacent slices. The cells of all the slices are
+        # gathered slice by slice to be reduced per slice.
+        lower = np.searchsorted( zCoordsSorted, zSlices[ 1: ], side="left" )
+        upper = np.searchsorted( zCoordsSorted, zSlices[ :-1 ], side="right" )
+        nonEmpty = upper > lower
+        lower, upper = lower[ nonEmpty ], upper[ nonEmpty ]
+        sliceStarts = np.concatenate( ( [ 0 ], np.cumsum( upper - lower )[ :-1 ] ) )
+        sliceCellIds = zOrder[ np.arange( np.sum( upper - lower ) ) - np.repeat( sliceStarts - lower, upper - lower ) ]
+        sliceOfCells = np.repeat( np.arange( len( lower ) ), upper - lower )
+        sliceX = centers[ sliceCellIds, 0 ]
+        sliceY = centers[ sliceCellIds, 1 ]
 
         # ===================================================================
-        # STEP 8: Delete duplicate and sort
+        # Slice extraction
         # ===================================================================
-        seen = set()
-        uniqueIndices = []
-        for idx in profileIndices:
-            if idx not in seen:
-                seen.add( idx )
-                uniqueIndices.append( idx )
-
-        if len( uniqueIndices ) == 0:
-            raise ValueError( "No points extracted for profile {idx}" )
-        profileIndicesArr = np.array( uniqueIndices )
-
-        # Sort by decreasing depth
-        sortOrder = np.argsort( -centers[ profileIndicesArr, 2 ] )
-        profileIndicesArr = profileIndicesArr[ sortOrder ]
-
-        # Extract results
-        depths = centers[ profileIndicesArr, 2 ]
-        profileValues = values[ profileIndicesArr ]
-        pathX = centers[ profileIndicesArr, 0 ]
-        pathY = centers[ profileIndicesArr, 1 ]
-
-        # ===================================================================
-        # STATISTICS
-        # ===================================================================
-        depthCoverage = ( depths.max() - depths.min() ) / zRange * 100 if zRange > 0 else 0
-        xyDisplacement = np.sqrt( ( pathX[ -1 ] - pathX[ 0 ] )**2 + ( pathY[ -1 ] - pathY[ 0 ] )**2 )
-
-        self.logger.info( f"         Extracted {len(profileIndices)} points" )
-        self.logger.info( f"           Depth range: [{depths.max():.1f}, {depths.min():.1f}]m" )
-        self.logger.info( f"           Coverage: {depthCoverage:.1f}% of fault depth" )
-        self.logger.info( f"           XY displacement: {xyDisplacement:.1f}m" )
-
-        return ( depths, profileValues, pathX, pathY )
+        cellIds = []
+        for refX, refY in references:
+            # closest cell in the XY plane of each slice, ties broken by cell index
+            dXY = np.sqrt( ( sliceX - refX )**2 + ( sliceY - refY )**2 )
+            isClosest = dXY == np.minimum.reduceat( dXY, sliceStarts )[ sliceOfCells ]
+            profileIndices = np.minimum.reduceat( np.where( isClosest, sliceCellIds, len( centers ) ), sliceStarts )
+
+            # Delete duplicates and sort by decreasing depth
+            _, firstIndices = np.unique( profileIndices, return_index=True )
+            profileIndices = profileIndices[ np.sort( firstIndices ) ]
+            cellIds.append( profileIndices[ np.argsort( -centers[ profileIndices, 2 ], kind="stable" ) ] )
+
+        return cellIds
 
 
 class ProfileExtractorMethod( str, Enum ):
@@ -3,14 +3,16 @@
 # SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
 import logging
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
+import numpy.typing as npt
 from matplotlib.colors import Normalize
 from matplotlib.cm import ScalarMappable
 import matplotlib.pyplot as plt
 from typing_extensions import Any, Self, Union
 
-from vtkmodules.vtkCommonDataModel import vtkDataSet, vtkUnstructuredGrid
+from vtkmodules.vtkCommonDataModel import vtkDataSet
 
 from geos.utils.pieceEnum import ( Piece )
 from geos.mesh.utils.arrayHelpers import ( getArrayInObject )
@@ -21,11 +23,107 @@ from geos.utils.Logger import ( Logger, getLogger )
 
 loggerTitle = "Sensitivity Analyzer"
 
+#: Maximum number of (friction angle, cohesion, cell) values evaluated at once by the sweep
+DEFAULT_SWEEP_CHUNK_SIZE: int = 2**22
+
+
+def computeSweepStatistics( sigmaN: npt.NDArray[ np.float64 ],
+                            tau: npt.NDArray[ np.float64 ],
+                            frictionAngles: list[ float ],
+                            cohesions: list[ float ],
+                            chunkSize: int = DEFAULT_SWEEP_CHUNK_SIZE ) -> dict[ str, npt.NDArray[ Any ] ]:
+    """Compute the Mohr-Coulomb statistics of all (friction angle, cohesion) pairs of a sweep.
+
+    The Mohr-Coulomb criterion is broadcast over a (friction angle, cohesion, cell) grid,
+    evaluated by chunks of cells so that at most chunkSize values are held in memory,
+    and reduced per parameter pair.
+
+    Args:
+        sigmaN (npt.NDArray[np.float64]): Effective normal stress of the fault cells in bar
+        tau (npt.NDArray[np.float64]): Effective shear stress of the fault cells in bar
+        frictionAngles (list[float]): Friction angles to analyze (in degrees)
+        cohesions (list[float]): Cohesions to analyze (in bar)
+        chunkSize (int, optional): Maximum number of values of the grid evaluated at once.
+            Defaults to DEFAULT_SWEEP_CHUNK_SIZE.
+
+    Raises:
+        ValueError: There is no fault cell.
+
+    Returns:
+        dict[str, npt.NDArray[Any]]: Number of cells, numbers and percentages of stable, critical and unstable cells,
+        mean and max SCU, mean failure probability, mean and min safety margin, each as an array of
+        shape (len(frictionAngles), len(cohesions)).
+    """
+    nCells = sigmaN.size
+    if nCells == 0:
+        raise ValueError( "The sweep statistics require at least one fault cell." )
+
+    # (friction angle, cohesion) pairs are flattened and evaluated by blocks of pairs and cells
+    shape = ( len( frictionAngles ), len( cohesions ) )
+    nPairs = shape[ 0 ] * shape[ 1 ]
+    frictionPairs = np.repeat( np.asarray( frictionAngles, dtype=float ), shape[ 1 ] )[ :, None ]
+    cohesionPairs = np.tile( np.asarray( cohesions, dtype=float ), shape[ 0 ] )[ :, None ]
+
+    nCritical = np.zeros( nPairs, dtype=int )
+    nUnstable = np.zeros( nPairs, dtype=int )
+    sumSCU = np.zeros( nPairs )
+    maxSCU = np.full( nPairs, -np.inf )
+    sumFailureProba = np.zeros( nPairs )
+    sumSafetyMargin = np.zeros( nPairs )
+    minSafetyMargin = np.full( nPairs, np.inf )
+
+    # a block holds at most chunkSize values, even when there are more pairs than chunkSize
+    pairStep = max( 1, min( nPairs, chunkSize ) )
+    cellStep = max( 1, chunkSize // pairStep )
+    for pairStart in range( 0, nPairs, pairStep ):
+        pairs = slice( pairStart, pairStart + pairStep )
+        for cellStart in range( 0, nCells, cellStep ):
+            sigmaNChunk = sigmaN[ None, cellStart:cellStart + cellStep ]
+            tauChunk = tau[ None, cellStart:cellStart + cellStep ]
+            tauCritical, scu = MohrCoulombAnalysis.computeSCU( sigmaNChunk, tauChunk, cohesionPairs[ pairs ],
+                                                               frictionPairs[ pairs ] )
+
+            # Stability classification
+            unstable = np.count_nonzero( scu >= 1.0, axis=1 )
+            nUnstable[ pairs ] += unstable
+            nCritical[ pairs ] += np.count_nonzero( scu >= 0.8, axis=1 ) - unstable
+
+            sumSCU[ pairs ] += np.sum( scu, axis=1 )
+            maxSCU[ pairs ] = np.maximum( maxSCU[ pairs ], np.max( scu, axis=1 ) )
+
+            # Failure probability (sigmoid)
+            sumFailureProba[ pairs ] += np.sum( 1.0 / ( 1.0 + np.exp( -10.0 * ( scu - 1.0 ) ) ), axis=1 )
+
+            # Safety margin
+            safety = tauCritical - tauChunk
+            sumSafetyMargin[ pairs ] += np.sum( safety, axis=1 )
+            minSafetyMargin[ pairs ] = np.minimum( minSafetyMargin[ pairs ], np.min( safety, axis=1 ) )
+
+    nStable = nCells - nCritical - nUnstable
+    stats = {
+        'nCells': np.full( nPairs, nCells ),
+        'nStable': nStable,
+        'nCritical': nCritical,
+        'nUnstable': nUnstable,
+        'pctUnstable': nUnstable / nCells * 100,
+        'pctCritical': nCritical / nCells * 100,
+        'pctStable': nStable / nCells * 100,
+        'meanSCU': sumSCU / nCells,
+        'maxSCU': maxSCU,
+        'meanFailureProb': sumFailureProba / nCells,
+        'meanSafetyMargin': sumSafetyMargin / nCells,
+        'minSafetyMargin': minSafetyMargin
+    }
+    return { key: value.reshape( shape ) for key, value in stats.items() }
+
 
 class SensitivityAnalyzer:
     """Performs sensitivity analysis on Mohr-Coulomb parameters."""
 
-    def __init__( self: Self, outputDir: str = ".", logger: Union[ Logger, None ] = None ) -> None:
+    def __init__( self: Self,
+                  outputDir: str = ".",
+                  logger: Union[ Logger, None ] = None,
+                  profileExtractor: ProfileExtractor | None = None ) -> None:
         """Init.
 
         Args:
@@ -35,6 +133,8 @@ class SensitivityAnalyzer:
                     Defaults is True.
             logger (Union[Logger, None], optional): A logger to manage the output messages.
                     Defaults to None, an internal logger is used.
+            profileExtractor (ProfileExtractor | None, optional): Profile extractor whose cached
+                    profiles are shared with other plots. Defaults to None, a new extractor is used.
         """
         self.outputDir = Path( outputDir )
         self.outputDir.mkdir( exist_ok=True )
@@ -49,18 +149,31 @@ class SensitivityAnalyzer:
             self.logger.setLevel( logging.INFO )
             self.logger.propagate = False
 
-    def runAnalysis( self: Self, surfaceWithStress: vtkDataSet, time: float, sensitivityFrictionAngles: list[ float ],
-                     sensitivityCohesions: list[ float ], profileStartPoints: list[ tuple[ float, float ] ],
-                     profileSearchRadius: float ) -> list[ dict[ str, Any ] ]:
+        self.profileExtractor = profileExtractor if profileExtractor is not None else ProfileExtractor(
+            logger=self.logger )
+
+    def runAnalysis( self: Self,
+                     surfaceWithStress: vtkDataSet,
+                     time: float,
+                     sensitivityFrictionAngles: list[ float ],
+                     sensitivityCohesions: list[ float ],
+                     profileStartPoints: list[ tuple[ float, float ] ],
+                     chunkSize: int = DEFAULT_SWEEP_CHUNK_SIZE,
+                     nbWorkers: int = 1 ) -> list[ dict[ str, Any ] ]:
         """Run sensitivity analysis for multiple friction angles and cohesions.
 
+        All the parameter pairs are evaluated at once by computeSweepStatistics.
+
         Args:
             surfaceWithStress (vtkDataSet): Surface to analyze. Should contain stress attribute
             time (float): Time
             sensitivityFrictionAngles (list[float]): List of friction angles to analyze (in degrees)
             sensitivityCohesions (list[float]): List of cohesion to analyze (in bar)
             profileStartPoints (list[tuple[float, float]]): List of start points for profile analysis
-            profileSearchRadius (float): Searching radius for determination of profile.
+            chunkSize (int, optional): Maximum number of (friction angle, cohesion, cell) values evaluated at once.
+                Defaults to DEFAULT_SWEEP_CHUNK_SIZE.
+            nbWorkers (int, optional): Number of processes sharing the friction angles.
+                Defaults to 1, the sweep runs in the current process.
 
         Returns:
             dict[str, Any]: Metrics from input surface.
@@ -74,25 +187,32 @@ class SensitivityAnalyzer:
         self.logger.info( f"Cohesions: {cohesions}" )
         self.logger.info( f"Total combinations: {len(frictionAngles) * len(cohesions)}" )
 
-        results = []
-        for frictionAngle in frictionAngles:
-            for cohesion in cohesions:
-                self.logger.info( f"Testing phi={frictionAngle}°, C={cohesion} bar" )
-
-                surfaceCopy = type( surfaceWithStress )()
-                surfaceCopy.DeepCopy( surfaceWithStress )
-
-                mc = MohrCoulombAnalysis( surfaceCopy, cohesion, frictionAngle, logger=self.logger )
-
-                surfaceAnalyzed = mc.analyze()
+        sigmaN = getArrayInObject( surfaceWithStress, "sigmaNEffective", Piece.CELLS )
+        tau = getArrayInObject( surfaceWithStress, "tauEffective", Piece.CELLS )
+
+        if nbWorkers > 1 and len( frictionAngles ) > 1:
+            blocks = [
+                block.tolist() for block in np.array_split( np.asarray( frictionAngles ), nbWorkers ) if block.size > 0
+            ]
+            with ProcessPoolExecutor( max_workers=len( blocks ) ) as executor:
+                blockStats = list(
+                    executor.map( computeSweepStatistics, [ sigmaN ] * len( blocks ), [ tau ] * len( blocks ), blocks,
+                                  [ cohesions ] * len( blocks ), [ chunkSize ] * len( blocks ) ) )
+            sweepStats = { key: np.concatenate( [ stats[ key ] for stats in blockStats ] ) for key in blockStats[ 0 ] }
+        else:
+            sweepStats = computeSweepStatistics( sigmaN, tau, frictionAngles, cohesions, chunkSize )
 
-                stats = self._extractStatistics( surfaceAnalyzed )
+        results = []
+        for i, frictionAngle in enumerate( frictionAngles ):
+            for j, cohesion in enumerate( cohesions ):
+                stats: dict[ str, Any ] = { key: values[ i, j ] for key, values in sweepStats.items() }
                 stats[ "frictionAngle" ] = frictionAngle
                 stats[ "cohesion" ] = cohesion
 
                 results.append( stats )
 
-                self.logger.info( f"   Unstable: {stats['nUnstable']}, "
+                self.logger.info( f"phi={frictionAngle}°, C={cohesion} bar - "
+                                  f"Unstable: {stats['nUnstable']}, "
                                   f"Critical: {stats['nCritical']}, "
                                   f"Stable: {stats['nStable']}" )
 
@@ -102,51 +222,10 @@ class SensitivityAnalyzer:
         self._plotSensitivityResults( results, time )
 
         # Plot SCU vs depth
-        self._plotSCUDepthProfiles( results, time, surfaceWithStress, profileStartPoints, profileSearchRadius )
+        self._plotSCUDepthProfiles( results, time, surfaceWithStress, profileStartPoints )
 
         return results
 
-    def _extractStatistics( self: Self, surface: vtkUnstructuredGrid ) -> dict[ str, Any ]:
-        """Extract statistical metrics from analyzed surface.
-
-        These metrics include the following:
-            - number and percentage of stable cells
-            - number and percentage of critical cells
-            - number and percentage of unstable cells
-            - average and max SCU
-            - average failure probability
-            - average and min safety margin
-
-        Args:
-            surface (vtkUnstructuredGrid): Surface to consider.
-
-        Return:
-            dict[str, Any]: Statistical metrics.
-        """
-        stability = getArrayInObject( surface, "stabilityState", Piece.CELLS )
-        scu = getArrayInObject( surface, "SCU", Piece.CELLS )
-        failureProba = getArrayInObject( surface, "failureProbability", Piece.CELLS )
-        safetyMargin = getArrayInObject( surface, "safetyMargin", Piece.CELLS )
-
-        nCells = surface.GetNumberOfCells()
-
-        stats = {
-            'nCells': nCells,
-            'nStable': np.sum( stability == 0 ),
-            'nCritical': np.sum( stability == 1 ),
-            'nUnstable': np.sum( stability == 2 ),
-            'pctUnstable': np.sum( stability == 2 ) / nCells * 100,
-            'pctCritical': np.sum( stability == 1 ) / nCells * 100,
-            'pctStable': np.sum( stability == 0 ) / nCells * 100,
-            'meanSCU': np.mean( scu ),
-            'maxSCU': np.max( scu ),
-            'meanFailureProb': np.mean( failureProba ),
-            'meanSafetyMargin': np.mean( safetyMargin ),
-            'minSafetyMargin': np.min( safetyMargin )
-        }
-
-        return stats
-
     def _plotSensitivityResults( self: Self, results: list[ dict[ str, Any ] ], time: float ) -> None:
         """Create comprehensive sensitivity analysis plots.
 
@@ -208,7 +287,6 @@ class SensitivityAnalyzer:
                                time: float,
                                surfaceWithStress: vtkDataSet,
                                profileStartPoints: list[ tuple[ float, float ] ] | None = None,
-                               profileSearchRadius: float | None = None,
                                maxDepthProfiles: float | None = None,
                                extractionMethod: ProfileExtractorMethod = ProfileExtractorMethod.ADAPTATIVE ) -> None:
         """Plot SCU depth profiles for all parameter combinations.
@@ -221,8 +299,6 @@ class SensitivityAnalyzer:
             surfaceWithStress (vtkDataSet): Fault mesh with stress attribute.
             profileStartPoints (list[tuple[float, float]], optional): List of start points for profile analysis
                 Defaults is None.
-            profileSearchRadius (float, optional): Searching radius for determination of profile
-                Defaults is None.
             maxDepthProfiles (float, optional): Maximum depth for profile display
             extractionMethod (ProfileExtractorMethod): Profile extraction method
         """
@@ -230,6 +306,8 @@ class SensitivityAnalyzer:
 
         # Extract depth data
         centers = getArrayInObject( surfaceWithStress, 'elementCenter', Piece.CELLS )
+        sigmaN = getArrayInObject( surfaceWithStress, "sigmaNEffective", Piece.CELLS )
+        tau = getArrayInObject( surfaceWithStress, "tauEffective", Piece.CELLS )
         centers[ :, 2 ]
 
         # Auto-generate if not provided
@@ -252,18 +330,7 @@ class SensitivityAnalyzer:
 
             profileStartPoints = [ ( xPos, yPos ) ]
 
-        # Get search radius from config or auto-compute
-        if profileSearchRadius is None:
-            xMin, xMax = np.min( centers[ :, 0 ] ), np.max( centers[ :, 0 ] )
-            yMin, yMax = np.min( centers[ :, 1 ] ), np.max( centers[ :, 1 ] )
-            xRange = xMax - xMin
-            yRange = yMax - yMin
-            searchRadius = min( xRange, yRange ) * 0.15
-        else:
-            searchRadius = profileSearchRadius
-
-        self.logger.info( f"Using {len(profileStartPoints)} profile point(s),"
-                          f" search radius: {searchRadius:.1f}m" )
+        self.logger.info( f"Using {len(profileStartPoints)} profile point(s)" )
 
         # Create colormap for parameter combinations
         nCombinations = len( results )
@@ -279,34 +346,30 @@ class SensitivityAnalyzer:
         if nProfiles == 1:
             axes = [ axes ]
 
+        # The profile cells do not depend on the parameters, they are extracted once
+        if extractionMethod == ProfileExtractorMethod.ADAPTATIVE:
+            profiles = self.profileExtractor.extractProfiles( centers, profileStartPoints )
+        else:
+            raise ValueError( f"Unrecognized profile extraction method '{extractionMethod}'." )
+
         # Plot each profile point
         for profileIdx, ( xPos, yPos ) in enumerate( profileStartPoints ):
             ax = axes[ profileIdx ]
 
             self.logger.info( f" Profile {profileIdx+1} at ({xPos:.1f}, {yPos:.1f}):" )
+            profile = profiles[ profiles[ "profileId" ] == profileIdx ]
+            depthsSCU = profile[ "depth" ].to_numpy()
+            profileCellIds = profile[ "cellId" ].to_numpy()
 
             # Plot each parameter combination
             for idx, params in enumerate( results ):
                 frictionAngle = params[ 'frictionAngle' ]
                 cohesion = params[ 'cohesion' ]
 
-                # Re-analyze surface with these parameters
-                surfaceCopy = type( surfaceWithStress )()
-                surfaceCopy.DeepCopy( surfaceWithStress )
-
-                mc = MohrCoulombAnalysis( surfaceCopy, cohesion, frictionAngle, logger=self.logger )
-
-                surfaceAnalyzed = mc.analyze()
-
-                # Extract SCU
-                scu = np.abs( getArrayInObject( surfaceAnalyzed, "SCU", Piece.CELLS ) )
-
-                # Extract profile using adaptive method
-                if extractionMethod == ProfileExtractorMethod.ADAPTATIVE:
-                    depthsSCU, profileSCU, _, _ = ProfileExtractor( logger=self.logger ).extractAdaptiveProfile(
-                        centers, scu, xPos, yPos, searchRadius )
-                else:
-                    raise ValueError( f"Unrecognized profile extraction method '{extractionMethod}'." )
+                # Compute SCU with these parameters
+                _, profileSCU = MohrCoulombAnalysis.computeSCU( sigmaN[ profileCellIds ], tau[ profileCellIds ],
+                                                                cohesion, frictionAngle )
+                profileSCU = np.abs( profileSCU )
 
                 if len( depthsSCU ) >= 3:
                     color = cmap( norm( idx ) )
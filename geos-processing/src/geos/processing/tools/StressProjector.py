@@ -20,6 +20,7 @@ from geos.mesh.utils.genericHelpers import ( extractCellSelection )
 from geos.mesh.utils.arrayHelpers import ( isAttributeInObject, getArrayInObject, computeCellCenterCoordinates )
 from geos.mesh.utils.arrayModifiers import ( createAttribute, updateAttribute )
 from geos.utils.pieceEnum import ( Piece )
+from geos.utils.geometryFunctions import ( getLocalFrameMatrices )
 
 from geos.utils.Logger import ( Logger, getLogger )
 from geos.utils.GeosOutputsConstants import ( GeosMeshOutputsEnum, PostProcessingOutputsEnum )
@@ -140,22 +141,20 @@ class StressProjector:
         pressureInitial = getArrayInObject( volumeInitial, "pressure", Piece.CELLS ) / 1e5
         biot = getArrayInObject( volumeData, self.biotName, Piece.CELLS )
 
-        stressEffective = StressTensor.buildFromArray(
-            getArrayInObject( volumeData, self.stressName, Piece.CELLS ) / 1e5 )
-        stressEffectiveInitial = StressTensor.buildFromArray(
-            getArrayInObject( volumeInitial, self.stressName, Piece.CELLS ) / 1e5 )
+        # Stresses are kept in GEOS vector notation, the diagonal terms first
+        stressTotal = getArrayInObject( volumeData, self.stressName, Piece.CELLS ) / 1e5
+        stressTotalInitial = getArrayInObject( volumeInitial, self.stressName, Piece.CELLS ) / 1e5
 
         # Convert effective stress to total stress
-        arrI = np.eye( 3 )[ None, :, : ]
-        stressTotal = stressEffective - biot[ :, None, None ] * pressure[ :, None, None ] * arrI
-        stressTotalInitial = stressEffectiveInitial - biot[ :, None, None ] * pressureInitial[ :, None, None ] * arrI
+        stressTotal[ :, :3 ] -= ( biot * pressure )[ :, None ]
+        stressTotalInitial[ :, :3 ] -= ( biot * pressureInitial )[ :, None ]
 
         # =====================================================================
         # 3. PREPARE FAULT GEOMETRY
         # =====================================================================
-        normals = vtk_to_numpy( faultSurface.GetCellData().GetNormals() )
-        tangent1 = vtk_to_numpy( faultSurface.GetCellData().GetArray( "Tangents1" ) )
-        tangent2 = vtk_to_numpy( faultSurface.GetCellData().GetArray( "Tangents2" ) )
+        # Orthonormal direct (normal, tangent1, tangent2) frames, the rows of the rotation matrices
+        frames = getLocalFrameMatrices( vtk_to_numpy( faultSurface.GetCellData().GetNormals() ),
+                                        vtk_to_numpy( faultSurface.GetCellData().GetArray( "Tangents1" ) ) )
 
         faultCenters = vtk_to_numpy( computeCellCenterCoordinates( faultSurface ) )
         updateAttribute( faultSurface, faultCenters, 'elementCenter', Piece.CELLS, logger=self.logger )
@@ -198,105 +197,82 @@ class StressProjector:
         # =====================================================================
         # 6. PROJECT STRESS FOR EACH FAULT CELL
         # =====================================================================
-        sigmaNArr = np.zeros( nFault )
-        tauArr = np.zeros( nFault )
-        tauDipArr = np.zeros( nFault )
-        tauStrikeArr = np.zeros( nFault )
-        deltaSigmaNArr = np.zeros( nFault )
-        deltaTauArr = np.zeros( nFault )
-        nContributors = np.zeros( nFault, dtype=int )
-
         self.logger.info( f"Projecting stress to {nFault} fault cells..." )
         self.logger.info( f"   Weighting scheme: {weightingScheme.value}" )
 
-        for faultIdx in range( nFault ):
-            if faultIdx not in self.adjacencyMapping:
-                continue
+        # Flatten the adjacency into (fault cell, volume cell) contribution pairs
+        contributors = [ ( faultIdx,
+                           self.adjacencyMapping[ faultIdx ][ 'plus' ] + self.adjacencyMapping[ faultIdx ][ 'minus' ] )
+                         for faultIdx in range( nFault ) if faultIdx in self.adjacencyMapping ]
+        pairFault = np.repeat( np.array( [ faultIdx for faultIdx, _ in contributors ], dtype=int ),
+                               [ len( allVol ) for _, allVol in contributors ] )
+        pairVol = np.fromiter( ( volIdx for _, allVol in contributors for volIdx in allVol ),
+                               dtype=int,
+                               count=pairFault.size )
+        nContributors = np.bincount( pairFault, minlength=nFault )
 
-            volPlus = self.adjacencyMapping[ faultIdx ][ 'plus' ]
-            volMinus = self.adjacencyMapping[ faultIdx ][ 'minus' ]
-            allVol = volPlus + volMinus
+        # ===================================================================
+        # CALCULATE WEIGHTS (using pre-computed properties)
+        # ===================================================================
 
-            if len( allVol ) == 0:
-                continue
+        if weightingScheme == StressProjectorWeightingScheme.ARITHMETIC or weightingScheme == StressProjectorWeightingScheme.HARM:
+            weights = np.ones( pairVol.size )
 
-            # ===================================================================
-            # CALCULATE WEIGHTS (using pre-computed properties)
-            # ===================================================================
+        elif weightingScheme == StressProjectorWeightingScheme.DIST:
+            # Use pre-computed distances
+            dists = np.maximum( np.asarray( self.distanceToFault )[ pairVol ], 1e-6 )
+            weights = 1.0 / dists
 
-            if weightingScheme == StressProjectorWeightingScheme.ARITHMETIC or weightingScheme == StressProjectorWeightingScheme.HARM:
-                weights = np.ones( len( allVol ) ) / len( allVol )
+        elif weightingScheme == StressProjectorWeightingScheme.VOL:
+            # Use pre-computed volumes
+            weights = np.asarray( self.volumeCellVolumes, dtype=float )[ pairVol ]
 
-            elif weightingScheme == StressProjectorWeightingScheme.DIST:
-                # Use pre-computed distances
-                dists = np.array( [ self.distanceToFault[ v ] for v in allVol ] )
-                dists = np.maximum( dists, 1e-6 )
-                invDists = 1.0 / dists
-                weights = invDists / np.sum( invDists )
+        elif weightingScheme == StressProjectorWeightingScheme.DIST_VOL:
+            # Use pre-computed volumes and distances
+            vols = np.asarray( self.volumeCellVolumes, dtype=float )[ pairVol ]
+            dists = np.maximum( np.asarray( self.distanceToFault )[ pairVol ], 1e-6 )
+            weights = vols / dists
 
-            elif weightingScheme == StressProjectorWeightingScheme.VOL:
-                # Use pre-computed volumes
-                vols = np.array( [ self.volumeCellVolumes[ v ] for v in allVol ] )
-                weights = vols / np.sum( vols )
+        elif weightingScheme == StressProjectorWeightingScheme.INV_SQ_DIST:
+            # Use pre-computed distances
+            dists = np.maximum( np.asarray( self.distanceToFault )[ pairVol ], 1e-6 )
+            weights = 1.0 / ( dists**2 )
 
-            elif weightingScheme == StressProjectorWeightingScheme.DIST_VOL:
-                # Use pre-computed volumes and distances
-                vols = np.array( [ self.volumeCellVolumes[ v ] for v in allVol ] )
-                dists = np.array( [ self.distanceToFault[ v ] for v in allVol ] )
-                dists = np.maximum( dists, 1e-6 )
+        else:
+            raise ValueError( f"Unknown weighting scheme: {weightingScheme}" )
 
-                weights = vols / dists
-                weights = weights / np.sum( weights )
+        # Normalize the weights per fault cell
+        weights = weights / np.bincount( pairFault, weights, minlength=nFault )[ pairFault ]
 
-            elif weightingScheme == StressProjectorWeightingScheme.INV_SQ_DIST:
-                # Use pre-computed distances
-                dists = np.array( [ self.distanceToFault[ v ] for v in allVol ] )
-                dists = np.maximum( dists, 1e-6 )
-                invSquareDistance = 1.0 / ( dists**2 )
-                weights = invSquareDistance / np.sum( invSquareDistance )
+        # ===================================================================
+        # ROTATE ALL CONTRIBUTIONS AT ONCE
+        # ===================================================================
 
-            else:
-                raise ValueError( f"Unknown weighting scheme: {weightingScheme}" )
-
-            # ===================================================================
-            # ACCUMULATE WEIGHTED CONTRIBUTIONS
-            # ===================================================================
-
-            sigmaN = 0.0
-            tau = 0.0
-            tauDip = 0.0
-            tauStrike = 0.0
-            deltaSigmaN = 0.0
-            deltaTau = 0.0
-
-            for volIdx, w in zip( allVol, weights ):
-
-                # Total stress (with pressure)
-                sigmaFinal = stressTotal[ volIdx ] + pressureFault[ volIdx ] * np.eye( 3 )
-                sigmaInit = stressTotalInitial[ volIdx ] + pressureInitial[ volIdx ] * np.eye( 3 )
-
-                # Rotate to fault frame
-                resFinal = StressTensor.rotateToFaultFrame( sigmaFinal, normals[ faultIdx ], tangent1[ faultIdx ],
-                                                            tangent2[ faultIdx ] )
-
-                resInitial = StressTensor.rotateToFaultFrame( sigmaInit, normals[ faultIdx ], tangent1[ faultIdx ],
-                                                              tangent2[ faultIdx ] )
-
-                # Accumulate weighted contributions
-                sigmaN += w * resFinal[ 'normalStress' ]
-                tau += w * resFinal[ 'shearStress' ]
-                tauDip += w * resFinal[ 'shearDip' ]
-                tauStrike += w * resFinal[ 'shearStrike' ]
-                deltaSigmaN += w * ( resFinal[ 'normalStress' ] - resInitial[ 'normalStress' ] )
-                deltaTau += w * ( resFinal[ 'shearStress' ] - resInitial[ 'shearStress' ] )
-
-            sigmaNArr[ faultIdx ] = sigmaN
-            tauArr[ faultIdx ] = tau
-            tauDipArr[ faultIdx ] = tauDip
-            tauStrikeArr[ faultIdx ] = tauStrike
-            deltaSigmaNArr[ faultIdx ] = deltaSigmaN
-            deltaTauArr[ faultIdx ] = deltaTau
-            nContributors[ faultIdx ] = len( allVol )
+        # Total stress (with pressure)
+        sigmaFinal = stressTotal[ pairVol ]
+        sigmaFinal[ :, :3 ] += pressureFault[ pairVol, None ]
+        sigmaInit = stressTotalInitial[ pairVol ]
+        sigmaInit[ :, :3 ] += pressureInitial[ pairVol, None ]
+
+        # Rotate to fault frame
+        pairFrames = frames[ pairFault ]
+        resFinal = StressTensor.rotateToFaultFrames( sigmaFinal, pairFrames[ :, 0 ], pairFrames[ :, 1 ],
+                                                     pairFrames[ :, 2 ] )
+        resInitial = StressTensor.rotateToFaultFrames( sigmaInit, pairFrames[ :, 0 ], pairFrames[ :, 1 ],
+                                                       pairFrames[ :, 2 ] )
+
+        # ===================================================================
+        # ACCUMULATE WEIGHTED CONTRIBUTIONS
+        # ===================================================================
+
+        def accumulate( values: npt.NDArray[ np.float64 ] ) -> npt.NDArray[ np.float64 ]:
+            return np.asarray( np.bincount( pairFault, weights * values, minlength=nFault ), dtype=np.float64 )
+
+        sigmaNArr = accumulate( resFinal[ 'normalStress' ] )
+        tauDipArr = accumulate( resFinal[ 'shearDip' ] )
+        tauStrikeArr = accumulate( resFinal[ 'shearStrike' ] )
+        deltaSigmaNArr = accumulate( resFinal[ 'normalStress' ] - resInitial[ 'normalStress' ] )
+        deltaTauArr = accumulate( resFinal[ 'shearStress' ] - resInitial[ 'shearStress' ] )
 
         # =====================================================================
         # 7. STORE RESULTS ON FAULT SURFACE
@@ -8,9 +8,9 @@ from vtkmodules.numpy_interface import dataset_adapter as dsa
 from collections import Counter
 import numpy as np
 
-from geos.processing.generic_processing_tools.MeshToMeshInterpolator import MeshToMeshInterpolator
+from geos.processing.generic_processing_tools.MeshToMeshInterpolator import InterpolationMethod, MeshToMeshInterpolator
 from vtkmodules.vtkCommonDataModel import vtkDataSet
-from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 
 @pytest.mark.parametrize( "meshFromName, meshToName, attributeNames", [
@@ -103,3 +103,59 @@ def test_ExtractNonVol_MeshToMeshInterpolator( dataSetTest: Any, meshFromName: s
         counts[ i ] = Counter( cell_types )
 
     assert ( counts[ 0 ] == counts[ 1 ] )
+
+
+def test_Reduce_MeshToMeshInterpolator() -> None:
+    """Test the vectorized reductions of the k nearest source values."""
+    # 3 source values and the fill-in value as last row
+    values = np.array( [ 1., 2., 4., -1. ] ).reshape( -1, 1, 1 )
+    distances = np.array( [ [ 1., 1., 2. ], [ 0., 1., 1. ], [ np.inf, np.inf, np.inf ] ] )
+    ids = np.array( [ [ 0, 1, 2 ], [ 2, 0, 1 ], [ -1, -1, -1 ] ] )
+
+    expected = {
+        InterpolationMethod.NEAREST: [ 1., 4., -1. ],
+        InterpolationMethod.MEAN: [ 7. / 3., 7. / 3., -1. ],
+        InterpolationMethod.MIN: [ 1., 1., -1. ],
+        InterpolationMethod.MAX: [ 4., 4., -1. ],
+        InterpolationMethod.IDW: [ ( 1. + 2. + 4. / 4. ) / 2.25, 4., -1. ],
+    }
+    for method, values_expected in expected.items():
+        reduced = MeshToMeshInterpolator._reduce( distances, ids, values, method )
+        assert reduced.ravel() == pytest.approx( values_expected ), method
+
+
+@pytest.mark.parametrize( "method, nbNeighbors", [
+    ( InterpolationMethod.NEAREST, 1 ),
+    ( InterpolationMethod.MEAN, 4 ),
+    ( InterpolationMethod.IDW, 8 ),
+] )
+def test_MemoryLimit_MeshToMeshInterpolator( dataSetTest: Any, method: InterpolationMethod, nbNeighbors: int ) -> None:
+    """Test that processing the targets by chunks does not change the transfer."""
+    outputs = []
+    for memoryLimit in ( None, 4096 ):
+        meshFrom: vtkDataSet = dataSetTest( "rank0" )
+        meshTo: vtkDataSet = dataSetTest( "extractAndMergeVolume" )
+        meshToMeshInterpolator = MeshToMeshInterpolator( meshFrom, meshTo, { "elementVolume" } )
+        meshToMeshInterpolator.setInterpolationMethod( method, nbNeighbors )
+        if memoryLimit is not None:
+            meshToMeshInterpolator.setMemoryLimit( memoryLimit )
+        meshToMeshInterpolator.applyFilter()
+        outputs.append( vtk_to_numpy( meshTo.GetCellData().GetArray( "mappedElementvolume" ) ).copy() )
+
+    np.testing.assert_allclose( outputs[ 0 ], outputs[ 1 ] )
+
+
+def test_PointData_MeshToMeshInterpolator( dataSetTest: Any ) -> None:
+    """Test the transfer of point data on the same mesh."""
+    meshFrom: vtkDataSet = dataSetTest( "rank0" )
+    meshTo: vtkDataSet = dataSetTest( "rank0" )
+    coordinates = vtk_to_numpy( meshFrom.GetPoints().GetData() )
+    pointArray = numpy_to_vtk( coordinates[ :, 2 ].copy() )
+    pointArray.SetName( "depth" )
+    meshFrom.GetPointData().AddArray( pointArray )
+
+    meshToMeshInterpolator = MeshToMeshInterpolator( meshFrom, meshTo, { "depth" } )
+    meshToMeshInterpolator.applyFilter()
+
+    mapped = vtk_to_numpy( meshTo.GetPointData().GetArray( "mappedDepth" ) )
+    np.testing.assert_allclose( mapped, coordinates[ :, 2 ] )
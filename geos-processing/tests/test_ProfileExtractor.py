@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2026 TotalEnergies.
+# SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from geos.processing.tools.ProfileExtractor import PROFILE_COLUMNS, ProfileExtractor
+
+startPoints: list[ tuple[ float, ...] ] = [ ( 120.0, 36.0 ), ( 610.0, 183.0 ), ( 480.0, 144.0, -300.0 ) ]
+
+
+def _referenceProfileCellIds( centers: npt.NDArray[ np.float64 ],
+                              startPoint: Sequence[ float ] ) -> npt.NDArray[ np.int64 ]:
+    """Extract the cells of a profile slice by slice, as the former extractAdaptiveProfile did."""
+    if len( startPoint ) == 2:
+        dXY = np.sqrt( ( centers[ :, 0 ] - startPoint[ 0 ] )**2 + ( centers[ :, 1 ] - startPoint[ 1 ] )**2 )
+        closestIndices = np.argsort( dXY )[ :20 ]
+        startId = closestIndices[ np.argmax( centers[ closestIndices, 2 ] ) ]
+    else:
+        startId = np.argmin( np.linalg.norm( centers - np.asarray( startPoint ), axis=1 ) )
+    refX, refY = centers[ startId, :2 ]
+
+    zCoords = centers[ :, 2 ]
+    zDiffs = np.diff( np.sort( zCoords ) )
+    zRange = np.max( zCoords ) - np.min( zCoords )
+    nSlices = min( int( np.ceil( zRange / np.median( zDiffs[ zDiffs > 1e-6 ] ) ) ), 10000 )
+    zSlices = np.linspace( np.max( zCoords ), np.min( zCoords ), nSlices + 1 )
+
+    profileIndices: list[ int ] = []
+    for zTop, zBottom in zip( zSlices[ :-1 ], zSlices[ 1: ] ):
+        indicesInSlice = np.flatnonzero( ( zCoords <= zTop ) & ( zCoords >= zBottom ) )
+        if len( indicesInSlice ) > 0:
+            dXYInSlice = np.sqrt( ( centers[ indicesInSlice, 0 ] - refX )**2 +
+                                  ( centers[ indicesInSlice, 1 ] - refY )**2 )
+            profileIndices.append( indicesInSlice[ np.argmin( dXYInSlice ) ] )
+
+    uniqueIndices = np.array( list( dict.fromkeys( profileIndices ) ) )
+    return uniqueIndices[ np.argsort( -zCoords[ uniqueIndices ], kind="stable" ) ]
+
+
+@pytest.fixture
+def centers() -> npt.NDArray[ np.float64 ]:
+    """Build the cell centers of a noisy vertical fault."""
+    xs, zs = np.meshgrid( np.arange( 50 ) * 20.0, -np.arange( 80 ) * 10.0 )
+    points = np.stack( [ xs.ravel(), 0.3 * xs.ravel(), zs.ravel() ], axis=1 )
+    return points + np.random.default_rng( 0 ).normal( scale=2.0, size=points.shape )
+
+
+def test_extractProfiles( centers: npt.NDArray[ np.float64 ] ) -> None:
+    """Test the profile table against a slice by slice extraction of each profile."""
+    values = np.random.default_rng( 1 ).random( len( centers ) )
+    extractor = ProfileExtractor()
+    profiles = extractor.extractProfiles( centers, startPoints, { "values": values } )
+    assert list( profiles.columns ) == [ *PROFILE_COLUMNS, "values" ]
+
+    for i, startPoint in enumerate( startPoints ):
+        profile = profiles[ profiles[ "profileId" ] == i ]
+        assert np.array_equal( profile[ "cellId" ], _referenceProfileCellIds( centers, startPoint ) )
+        depth, profileValues, x, y = ProfileExtractor().extractAdaptiveProfile( centers, values, *startPoint )
+        assert len( depth ) >= 3
+        assert np.array_equal( profile[ "depth" ], depth )
+        assert np.array_equal( profile[ "values" ], profileValues )
+        assert np.array_equal( profile[ "x" ], x )
+        assert np.array_equal( profile[ "y" ], y )
+        assert np.all( np.diff( depth ) <= 0 )
+
+        segments = np.sqrt( np.diff( x )**2 + np.diff( y )**2 + np.diff( depth )**2 )
+        assert np.allclose( profile[ "arcLength" ], np.concatenate( ( [ 0.0 ], np.cumsum( segments ) ) ) )
+
+
+def test_extractProfilesCache( centers: npt.NDArray[ np.float64 ] ) -> None:
+    """Test that the profile geometry is reused for new attributes and faults."""
+    extractor = ProfileExtractor()
+    profiles = extractor.extractProfiles( centers, startPoints )
+    assert len( extractor._cache ) == 1
+
+    values = centers[ :, 0 ] * 2.0
+    withValues = extractor.extractProfiles( centers, startPoints, { "values": values } )
+    assert len( extractor._cache ) == 1
+    assert np.array_equal( withValues[ "values" ], values[ profiles[ "cellId" ] ] )
+    assert "values" not in extractor.extractProfiles( centers, startPoints ).columns
+
+    # Profiles stay on the fault of their start cell
+    faultIds = ( centers[ :, 0 ] > 500.0 ).astype( float )
+    faultProfiles = extractor.extractProfiles( centers, startPoints, cellData={ "FaultMask": faultIds } )
+    assert len( extractor._cache ) == 2
+    for _, profile in faultProfiles.groupby( "profileId" ):
+        assert len( np.unique( faultIds[ profile[ "cellId" ] ] ) ) == 1
+
+    # Cell centers modified in place are not served from the cache
+    centers[ :, 0 ] = centers[ ::-1, 0 ]
+    moved = extractor.extractProfiles( centers, startPoints )
+    assert len( extractor._cache ) == 2
+    assert not np.array_equal( moved[ "x" ], profiles[ "x" ] )
+    assert np.array_equal( moved, ProfileExtractor().extractProfiles( centers, startPoints ) )
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2026 TotalEnergies.
+# SPDX-FileContributor: Nicolas Pillardou, Paloma Martinez
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from vtkmodules.vtkCommonDataModel import vtkDataSet, vtkPolyData
+from vtkmodules.vtkFiltersSources import vtkPlaneSource
+
+from geos.mesh.utils.arrayHelpers import getArrayInObject
+from geos.processing.tools.MohrCoulomb import MohrCoulombAnalysis
+from geos.processing.tools.SensitivityAnalyzer import SensitivityAnalyzer, computeSweepStatistics
+from geos.utils.pieceEnum import Piece
+
+frictionAngles: list[ float ] = [ 10.0, 20.0, 30.0 ]
+cohesions: list[ float ] = [ 0.0, 5.0 ]
+
+
+@pytest.fixture
+def surface() -> vtkPolyData:
+    """Build a vertical fault surface with random effective stresses."""
+    plane = vtkPlaneSource()
+    plane.SetOrigin( 0.0, 0.0, -1000.0 )
+    plane.SetPoint1( 1000.0, 0.0, -1000.0 )
+    plane.SetPoint2( 0.0, 0.0, 0.0 )
+    plane.SetResolution( 10, 20 )
+    plane.Update()
+    mesh: vtkPolyData = plane.GetOutput()
+
+    rng = np.random.default_rng( 0 )
+    nCells: int = mesh.GetNumberOfCells()
+    centers = np.zeros( ( nCells, 3 ) )
+    centers[ :, 0 ] = np.tile( np.arange( 10 ) * 100.0 + 50.0, 20 )
+    centers[ :, 2 ] = np.repeat( np.arange( 20 ) * 50.0 - 975.0, 10 )
+    for name, values in ( ( "sigmaNEffective", -rng.uniform( 0.0, 100.0, nCells ) ),
+                          ( "tauEffective", rng.uniform( 0.0, 40.0, nCells ) ), ( "elementCenter", centers ) ):
+        array = numpy_to_vtk( values, deep=True )
+        array.SetName( name )
+        mesh.GetCellData().AddArray( array )
+    return mesh
+
+
+def cellStatistics( surface: vtkDataSet ) -> dict[ str, Any ]:
+    """Compute the statistics of a surface analyzed by MohrCoulombAnalysis."""
+    stability = getArrayInObject( surface, "stabilityState", Piece.CELLS )
+    scu = getArrayInObject( surface, "SCU", Piece.CELLS )
+    failureProba = getArrayInObject( surface, "failureProbability", Piece.CELLS )
+    safetyMargin = getArrayInObject( surface, "safetyMargin", Piece.CELLS )
+    nCells = surface.GetNumberOfCells()
+    return {
+        'nCells': nCells,
+        'nStable': np.sum( stability == 0 ),
+        'nCritical': np.sum( stability == 1 ),
+        'nUnstable': np.sum( stability == 2 ),
+        'pctUnstable': np.sum( stability == 2 ) / nCells * 100,
+        'pctCritical': np.sum( stability == 1 ) / nCells * 100,
+        'pctStable': np.sum( stability == 0 ) / nCells * 100,
+        'meanSCU': np.mean( scu ),
+        'maxSCU': np.max( scu ),
+        'meanFailureProb': np.mean( failureProba ),
+        'meanSafetyMargin': np.mean( safetyMargin ),
+        'minSafetyMargin': np.min( safetyMargin )
+    }
+
+
+@pytest.mark.parametrize( "chunkSize", [ 2, 7, 10**6 ] )
+def test_computeSweepStatistics( surface: vtkPolyData, chunkSize: int ) -> None:
+    """Test the vectorized sweep against a Mohr-Coulomb analysis for each parameter pair."""
+    sigmaN = vtk_to_numpy( surface.GetCellData().GetArray( "sigmaNEffective" ) )
+    tau = vtk_to_numpy( surface.GetCellData().GetArray( "tauEffective" ) )
+    sweepStats = computeSweepStatistics( sigmaN, tau, frictionAngles, cohesions, chunkSize )
+
+    for i, frictionAngle in enumerate( frictionAngles ):
+        for j, cohesion in enumerate( cohesions ):
+            surfaceCopy = vtkPolyData()
+            surfaceCopy.DeepCopy( surface )
+            expected = cellStatistics( MohrCoulombAnalysis( surfaceCopy, cohesion, frictionAngle ).analyze() )
+            for key, value in expected.items():
+                assert sweepStats[ key ][ i, j ] == pytest.approx( value ), key
+
+
+def test_computeSweepStatisticsNoCell() -> None:
+    """Test that a sweep without fault cell raises an error."""
+    with pytest.raises( ValueError ):
+        computeSweepStatistics( np.zeros( 0 ), np.zeros( 0 ), frictionAngles, cohesions )
+
+
+def test_runAnalysisWorkers( surface: vtkPolyData, tmp_path: Path ) -> None:
+    """Test that the sweep shared between processes gives the same results."""
+    analyzer = SensitivityAnalyzer( str( tmp_path ) )
+    expected = analyzer.runAnalysis( surface, 0.0, frictionAngles, cohesions, [ ( 500.0, 0.0 ) ] )
+    obtained = analyzer.runAnalysis( surface,
+                                     0.0,
+                                     frictionAngles,
+                                     cohesions, [ ( 500.0, 0.0 ) ],
+                                     chunkSize=16,
+                                     nbWorkers=2 )
+    assert len( obtained ) == len( frictionAngles ) * len( cohesions )
+    for stats, expectedStats in zip( obtained, expected, strict=True ):
+        assert stats == pytest.approx( expectedStats )
+    assert ( tmp_path / "sensitivity_analysis_0y.png" ).exists()
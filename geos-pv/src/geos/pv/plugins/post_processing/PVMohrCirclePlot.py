@@ -20,7 +20,8 @@ from paraview.detail.loghandler import VTKHandler  # type: ignore[import-not-fou
 # source: https://github.com/Kitware/ParaView/blob/master/Wrapping/Python/paraview/detail/loghandler.py
 
 from vtkmodules.vtkCommonCore import vtkDataArraySelection as vtkDAS
-from vtkmodules.vtkCommonCore import vtkInformation, vtkInformationVector, vtkStringArray, vtkIntArray
+from vtkmodules.vtkCommonCore import VTK_INT, vtkInformation, vtkInformationVector, vtkStringArray
+from vtkmodules.util.numpy_support import numpy_to_vtk
 from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid
 
 # Update sys.path to load all GEOS Python Package dependencies
@@ -30,7 +31,7 @@ from geos.pv.utils.config import update_paths
 
 update_paths()
 
-from geos.geomechanics.model.MohrCircle import MohrCircle
+from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
 from geos.utils.pieceEnum import Piece
 from geos.utils.Logger import CountVerbosityHandler
 from geos.utils.enumUnits import Pressure, enumerationDomainUnit
@@ -63,7 +64,8 @@ To use it:
 This plugin requires the presence of a `stressEffective` attribute in the mesh. Moreover, several timesteps should also be detected.
 
 .. Warning::
-    The whole ParaView pipeline will be executed for all timesteps present in the initial PVD file. Please be aware that the number of pipeline filters and timesteps should be as limited as possible. Otherwise, please consider going to get a cup of coffee.
+    The whole ParaView pipeline will be executed for each selected timestep. Please be aware that the number of pipeline filters and selected timesteps should be as limited as possible.
+    Only the stress of the selected cells is extracted, and Mohr's circles of all selected cells and timesteps are computed at once.
 
 * Load the plugin in Paraview: Tools > Manage Plugins ... > Load New ... > .../geosPythonPackages/geos-pv/src/geos/pv/plugins/post_processing/PVMohrCirclePlot
 
@@ -138,8 +140,8 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
         self.requestedCellIds: list[ str ] = []
         self.requestedTimeStepsIndexes: list[ int ] = []
 
-        # List of mohr circles
-        self.mohrCircles: set[ MohrCircle ] = set()
+        # Stress of requested cells at requested time steps (nbCells, nbTimeSteps, 6)
+        self.stressTimeSeries: npt.NDArray[ np.float64 ] = np.empty( ( 0, 0, 6 ) )
 
         # Failure envelop parameters
         self.rockCohesion: float = DEFAULT_ROCK_COHESION
@@ -700,18 +702,22 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
 
         # Update requestDataStep
         self.requestDataStep += 1
-        # Update time according to requestDataStep iterator
+        # Update time according to requestDataStep iterator, only requested time steps are loaded
         if self.requestDataStep == 0:
             self._updateRequestedTimeSteps()
+            self._updateRequestedCellIds()
+            self.stressTimeSeries = np.full( ( len( self.requestedCellIds ), len( self.requestedTimeStepsIndexes ), 6 ),
+                                             np.nan )
 
-        if self.requestDataStep < len( self.timeSteps ):
+        if self.requestDataStep < len( self.requestedTimeStepsIndexes ):
+            timeStep: float = self.timeSteps[ self.requestedTimeStepsIndexes[ self.requestDataStep ] ]
             inInfo.GetInformationObject( 0 ).Set(
                 executive.UPDATE_TIME_STEP(),  # type: ignore[no-any-return]
-                self.timeSteps[ self.requestDataStep ],
+                timeStep,
             )
             outInfoVec.GetInformationObject( 0 ).Set(
                 executive.UPDATE_TIME_STEP(),  # type: ignore[no-any-return]
-                self.timeSteps[ self.requestDataStep ],
+                timeStep,
             )
 
             # update all objects according to new time info
@@ -763,18 +769,12 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
             inputMesh: vtkUnstructuredGrid = self.GetInputData( inInfoVec, 0, 0 )
             executive = self.GetExecutive()
 
-            if self.requestDataStep == 1:
-                self.logger.info( "Computing Mohr circles for requested time steps and cell Ids." )
+            if self.requestDataStep == 0:
+                self.logger.info( "Extracting stress of requested cell Ids at requested time steps." )
 
-            if self.requestDataStep < len( self.timeSteps ):
+            if self.requestDataStep < len( self.requestedTimeStepsIndexes ):
                 request.Set( executive.CONTINUE_EXECUTING(), 1 )  # type: ignore[no-any-return]
-                currentTimeStep: float = (
-                    inInfoVec[ 0 ].GetInformationObject( 0 ).Get(
-                        executive.UPDATE_TIME_STEP() )  # type: ignore[no-any-return]
-                )
-
-                if self.requestDataStep in self.requestedTimeStepsIndexes:
-                    self.mohrCircles.update( self._createMohrCirclesAtTimeStep( inputMesh, currentTimeStep ) )
+                self._extractStressAtTimeStep( inputMesh, self.requestDataStep )
 
             # Plot mohr circles
             else:
@@ -784,7 +784,7 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
 
                 assert self.pythonView is not None, "No Python View was found."
                 self._defineCurvesAspect()
-                mohrCircles: list[ MohrCircle ] = self._filterMohrCircles()
+                mohrCircles: MohrCircleCollection = self._createMohrCircles()
 
                 self.pythonView.Script = mcf.buildPythonViewScript(
                     geos_pv_path,
@@ -805,17 +805,15 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
                 cellId.SetName( "CellId" )
                 cellId.SetNumberOfValues( nbCells )
 
-                activeCellMask = vtkIntArray()
+                originalCellIds: npt.NDArray[ Any ] = getArrayInObject(
+                    inputMesh, GeosMeshOutputsEnum.VTK_ORIGINAL_CELL_ID.attributeName, Piece.CELLS )
+                activeCells: npt.NDArray[ np.int64 ] = mcf.getCellRowIndexes( originalCellIds, self.requestedCellIds )
+                mask: npt.NDArray[ np.int32 ] = np.zeros( nbCells, dtype=np.int32 )
+                mask[ activeCells ] = 1
+                activeCellMask = numpy_to_vtk( mask, deep=True, array_type=VTK_INT )
                 activeCellMask.SetName( "ActiveCellMask" )
-                activeCellMask.SetNumberOfValues( nbCells )
-
-                originalCellIds = inputMesh.GetCellData().GetArray( "vtkOriginalCellIds" )
-                for localCellId in range( nbCells ):
-                    if str( originalCellIds.GetValue( localCellId ) ) in self.requestedCellIds:
-                        cellId.SetValue( localCellId, f"{ originalCellIds.GetValue( localCellId ) }" )
-                        activeCellMask.SetValue( localCellId, 1 )
-                    else:
-                        activeCellMask.SetValue( localCellId, 0 )
+                for localCellId in activeCells.tolist():
+                    cellId.SetValue( localCellId, f"{ originalCellIds[ localCellId ] }" )
 
                 outputMesh.GetCellData().AddArray( cellId )
                 outputMesh.GetCellData().AddArray( activeCellMask )
@@ -836,51 +834,42 @@ class PVMohrCirclePlot( VTKPythonAlgorithmBase ):
 
         return 1
 
-    def _createMohrCirclesAtTimeStep(
-        self: Self,
-        mesh: vtkUnstructuredGrid,
-        currentTimeStep: float,
-    ) -> set[ MohrCircle ]:
-        """Create mohr circles of all cells at the current time step.
+    def _extractStressAtTimeStep( self: Self, mesh: vtkUnstructuredGrid, timeStepIndex: int ) -> None:
+        """Store the stress of requested cells at the current time step.
 
         Args:
-            mesh (Union[vtkUnstructuredGrid, vtkMultiBlockDataSet]): input mesh.
-            currentTimeStep (float): current time step
-
-        Returns:
-            list[MohrCircle]: list of MohrCircles for the current time step.
+            mesh (vtkUnstructuredGrid): input mesh.
+            timeStepIndex (int): index of the current time step among requested time steps.
         """
         # Get effective stress array
         stressArray: npt.NDArray[ np.float64 ] = getArrayInObject( mesh,
                                                                    GeosMeshOutputsEnum.AVERAGE_STRESS.attributeName,
                                                                    Piece.CELLS )
-        # Get stress convention
-        stressConvention = StressConventionEnum.GEOS_STRESS_CONVENTION if self.useGeosStressConvention else StressConventionEnum.COMMON_STRESS_CONVENTION
-
-        # Get the cell IDs requested by the user
-        self._updateRequestedCellIds()
+        if stressArray.shape[ 1 ] != 6:
+            raise ValueError( f"Expected 6 components for stress array, not {stressArray.shape[ 1 ]}.\n \
+            Cannot proceed with the creation of Mohr circles." )
 
-        return mcf.createMohrCircleAtTimeStep( stressArray, self.requestedCellIds, str( currentTimeStep ),
-                                               stressConvention )
+        # Only rows of the cell ids requested by the user are kept
+        originalCellIds: npt.NDArray[ Any ] = getArrayInObject( mesh,
+                                                                GeosMeshOutputsEnum.VTK_ORIGINAL_CELL_ID.attributeName,
+                                                                Piece.CELLS )
+        rows: npt.NDArray[ np.int64 ] = mcf.getCellRowIndexes( originalCellIds, self.requestedCellIds )
+        self.stressTimeSeries[ :, timeStepIndex, : ] = stressArray[ rows ]
 
-    def _filterMohrCircles( self: Self ) -> list[ MohrCircle ]:
-        """Filter the list of all MohrCircle to get those to plot.
+    def _createMohrCircles( self: Self ) -> MohrCircleCollection:
+        """Create Mohr's circles of requested cells at requested time steps.
 
         Mohr circles are sorted by cell indexes first, then by timesteps.
 
         Returns:
-            list[MohrCircle]: list of MohrCircle to plot.
+            MohrCircleCollection: Mohr's circles to plot.
         """
-        # Circle ids to plot
-        circleIds: list[ str ] = self._getCircleIds()
-        mohrCircleToPlot: list[ MohrCircle ] = [ MohrCircle( "-1" ) for i in range( len( circleIds ) ) ]
-        for mohrCircle in self.mohrCircles:
-            try:
-                mohrCircleToPlot[ circleIds.index( str( mohrCircle.getCircleId() ) ) ] = mohrCircle
-            except ValueError:
-                continue
-
-        return mohrCircleToPlot
+        # Get stress convention
+        stressConvention = StressConventionEnum.GEOS_STRESS_CONVENTION if self.useGeosStressConvention else StressConventionEnum.COMMON_STRESS_CONVENTION
+        timeSteps: list[ str ] = [ str( self.timeSteps[ index ] ) for index in self.requestedTimeStepsIndexes ]
+
+        return mcf.createMohrCirclesFromStressTimeSeries( self.stressTimeSeries, self.requestedCellIds, timeSteps,
+                                                          stressConvention )
 
     def _updateRequestedTimeSteps( self: Self ) -> None:
         """Update the requestedTimeStepsIndexes attribute from user choice."""
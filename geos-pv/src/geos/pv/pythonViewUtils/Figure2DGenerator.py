@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Alexandre Benedicto
-from typing import Any
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
 
 import pandas as pd  # type: ignore[import-untyped]
+import matplotlib.pyplot as plt  # type: ignore[import-untyped]
 from matplotlib import axes, figure, lines  # type: ignore[import-untyped]
+from matplotlib.legend import Legend  # type: ignore[import-untyped]
 from matplotlib.font_manager import (  # type: ignore[import-untyped]
     FontProperties,  # type: ignore[import-untyped]
 )
@@ -12,10 +15,31 @@ from typing_extensions import Self
 
 import geos.pv.pythonViewUtils.functionsFigure2DGenerator as fcts
 
+# User choices that only change the aspect of an existing figure. Changing any other
+# choice requires to plot a new figure.
+STYLE_USER_CHOICES: frozenset[ str ] = frozenset( {
+    "curvesAspect",
+    "title",
+    "titleStyle",
+    "titleWeight",
+    "titleSize",
+    "minorticks",
+    "customAxisLim",
+    "limMinX",
+    "limMaxX",
+    "limMinY",
+    "limMaxY",
+    "legendPosition",
+    "legendSize",
+} )
+
 
 class Figure2DGenerator:
 
-    def __init__( self: Self, dataframe: pd.DataFrame, userChoices: dict[ str, list[ str ] ] ) -> None:
+    def __init__( self: Self,
+                  dataframe: pd.DataFrame,
+                  userChoices: dict[ str, list[ str ] ],
+                  dataKey: Optional[ Hashable ] = None ) -> None:
         """Utility to create cross plots using Python View.
 
         We want to plot f(X) = Y where in this class,
@@ -24,13 +48,18 @@ class Figure2DGenerator:
         Args:
             dataframe (pd.DataFrame): Data to plot.
             userChoices (dict[str, list[str]]): User choices.
+            dataKey (Hashable | None, optional): Key identifying the version of the data,
+                used to reuse the figure while the data is unchanged. Defaults to None,
+                the figure is never reused.
         """
         self.m_dataframe: pd.DataFrame = dataframe
         self.m_userChoices: dict[ str, Any ] = userChoices
+        self.m_dataKey: Optional[ Hashable ] = dataKey
         self.m_fig: figure.Figure
         self.m_axes: list[ axes._axes.Axes ] = []
         self.m_lines: list[ lines.Line2D ] = []
         self.m_labels: list[ str ] = []
+        self.m_axesLimits: list[ tuple[ tuple[ float, float ], tuple[ float, float ] ] ] = []
 
         # Apply minus 1 multiplication on certain columns.
         self.initMinus1Multiplication()
@@ -102,6 +131,13 @@ class Figure2DGenerator:
 
     def changeAxisLimits( self: Self ) -> None:
         """Update axis limits."""
+        if not self.m_axesLimits:
+            # Limits fitting the data, restored when the custom limits change.
+            self.m_axesLimits = [ ( ax.get_xlim(), ax.get_ylim() ) for ax in self.m_axes ]
+        else:
+            for ax, ( xlim, ylim ) in zip( self.m_axes, self.m_axesLimits, strict=True ):
+                ax.set_xlim( xlim )
+                ax.set_ylim( ylim )
         if self.m_userChoices[ "customAxisLim" ]:
             for ax in self.m_axes:
                 xmin, xmax = ax.get_xlim()
@@ -118,6 +154,60 @@ class Figure2DGenerator:
                     ymax = self.m_userChoices[ "limMaxY" ]
                 ax.set_ylim( ymin, ymax )
 
+    def canUpdate( self: Self, dataKey: Optional[ Hashable ], userChoices: dict[ str, Any ] ) -> bool:
+        """Check if the figure can be updated in place with new user choices.
+
+        Args:
+            dataKey (Hashable | None): Key identifying the version of the data to plot.
+            userChoices (dict[str, Any]): New user choices.
+
+        Returns:
+            bool: True if the data and the layout of the figure are unchanged, False otherwise.
+        """
+        if dataKey is None or dataKey != self.m_dataKey:
+            return False
+        keys: set[ str ] = ( set( userChoices ) | set( self.m_userChoices ) ) - STYLE_USER_CHOICES
+        if any( userChoices.get( key ) != self.m_userChoices.get( key ) for key in keys ):
+            return False
+        # Lines whose aspect is no longer customized would need their default aspect back.
+        return set( self.m_userChoices[ "curvesAspect" ] ) <= set( userChoices[ "curvesAspect" ] )
+
+    def updateUserChoices( self: Self, userChoices: dict[ str, Any ] ) -> None:
+        """Apply new style user choices to the existing lines and axes without plotting again.
+
+        Args:
+            userChoices (dict[str, Any]): New user choices, see canUpdate.
+        """
+        self.m_userChoices = userChoices
+        curvesAspect: dict[ str, tuple[ tuple[ float, float, float ], str, float, str,
+                                        float ] ] = userChoices[ "curvesAspect" ]
+        for line in self.m_lines:
+            label: str = str( line.get_label() )
+            if label in curvesAspect:
+                fcts.setLineAspect( line, curvesAspect[ label ] )
+        self.changeLegends()
+        self.enhanceFigure()
+
+    def changeLegends( self: Self ) -> None:
+        """Create again the legends so that they match the aspect of the lines."""
+        for ax in self.m_axes:
+            # get_legend returns None when the subplot has no legend, although it is not typed so.
+            legend: Optional[ Legend ] = ax.get_legend()
+            if legend is None:
+                continue
+            # Lines of the subplot are drawn on the axes sharing an axis with the legend one.
+            subplotAxes = set( ax.get_shared_x_axes().get_siblings( ax ) ) | set(
+                ax.get_shared_y_axes().get_siblings( ax ) )
+            subplotLines: list[ lines.Line2D ] = [ line for line in self.m_lines if line.axes in subplotAxes ]
+            labels, linesList = fcts.smartLabelsSorted( [ line.get_label() for line in subplotLines ], subplotLines,
+                                                        self.m_userChoices )
+            ax.legend(
+                linesList,
+                labels,
+                loc=self.m_userChoices[ "legendPosition" ],
+                fontsize=self.m_userChoices[ "legendSize" ],
+            )
+
     def getFigure( self: Self ) -> figure.Figure:
         """access the m_fig attribute.
 
@@ -125,3 +215,37 @@ class Figure2DGenerator:
             figure.Figure: Figure containing all the plots.
         """
         return self.m_fig
+
+
+# Attribute of a Python View holding its figure generator.
+FIGURE_GENERATOR_ATTRIBUTE: str = "geosFigure2DGenerator"
+
+
+def getFigure2DGenerator( view: Any, dataKey: Optional[ Hashable ], userChoices: dict[ str, Any ],
+                          loadDataframe: Callable[ [], pd.DataFrame ] ) -> Figure2DGenerator:
+    """Get the figure generator of a Python View, reusing its previous figure when possible.
+
+    The generator is stored on the view, so that it lives as long as the view. If the data
+    and the layout are unchanged since the previous call for the same view, the previous
+    figure is only restyled. Otherwise, the data are loaded and a new figure is plotted.
+
+    Args:
+        view (Any): Python View owning the figure.
+        dataKey (Hashable | None): Key identifying the version of the data, for instance
+            the modification time of the sources. If None, a new figure is always plotted.
+        userChoices (dict[str, Any]): User choices.
+        loadDataframe (Callable[[], pd.DataFrame]): Function loading the data to plot.
+
+    Returns:
+        Figure2DGenerator: Figure generator of the view.
+    """
+    generator: Optional[ Figure2DGenerator ] = getattr( view, FIGURE_GENERATOR_ATTRIBUTE, None )
+    if generator is not None and generator.canUpdate( dataKey, userChoices ):
+        if userChoices != generator.m_userChoices:
+            generator.updateUserChoices( userChoices )
+        return generator
+    if generator is not None:
+        plt.close( generator.getFigure() )
+    generator = Figure2DGenerator( loadDataframe(), userChoices, dataKey )
+    setattr( view, FIGURE_GENERATOR_ATTRIBUTE, generator )
+    return generator
@@ -18,6 +18,9 @@ import geos.pv.geosLogReaderUtils.geosLogReaderFunctions as fcts
 Plotting tools for 2D figure and axes generation.
 """
 
+# Number of columns used to decimate the curves, above the width in pixels of a Python View.
+DECIMATION_PIXEL_COLUMNS: int = 2048
+
 
 def oneSubplot(
         df: pd.DataFrame,
@@ -102,7 +105,7 @@ def oneSubplotInverted(
         ax_to_use: axes.Axes = setupAxeToUse( all_ax, cpt_ax, ax_name, True )
         for propName in propertyNames:
             x: npt.NDArray[ np.float64 ] = df[ propName ].to_numpy()
-            plotAxe( ax_to_use, x, y, propName, cpt_cmap, curvesAspect )
+            plotAxe( ax_to_use, x, y, propName, cpt_cmap, curvesAspect, False )
             cpt_cmap += 1
         new_lines, new_labels = ax_to_use.get_legend_handles_labels()
         linesList += new_lines  # type: ignore[arg-type]
@@ -247,7 +250,7 @@ def multipleSubplotsInverted(
             ax_to_use: axes.Axes = setupAxeToUse( all_ax, cpt_ax, ax_name, True )
             for propName in propertyNames:
                 x: npt.NDArray[ np.float64 ] = df[ propName ].to_numpy()
-                plotAxe( ax_to_use, x, y, propName, cpt_cmap, curvesAspect )
+                plotAxe( ax_to_use, x, y, propName, cpt_cmap, curvesAspect, False )
                 ax_to_use.set_xlim( propertiesExtremas[ ax_name ] )
                 cpt_cmap += 1
             new_lines, new_labels = ax_to_use.get_legend_handles_labels()
@@ -344,9 +347,12 @@ def plotAxe(
     propertyName: str,
     cpt_cmap: int,
     curvesAspect: dict[ str, tuple[ tuple[ float, float, float ], str, float, str, float ] ],
+    variableAlongX: bool = True,
 ) -> None:
     """Plot x, y data using input ax_to_use according to curvesAspect.
 
+    Large series are decimated along the variable axis before plotting, see decimateMinMax.
+
     Args:
         ax_to_use (axes.Axes): Subplot to use.
         x (npt.NDArray[np.float64]): Abscissa data.
@@ -355,25 +361,77 @@ def plotAxe(
         cpt_cmap (int): Colormap to use.
         curvesAspect (dict[str, tuple[tuple[float, float, float],str, float, str, float]]):
             User choices on curve aspect.
+        variableAlongX (bool, optional): True if the variable is along the X axis,
+            False if it is along the Y axis. Defaults to True.
     """
     cmap = plt.rcParams[ "axes.prop_cycle" ].by_key()[ "color" ][ cpt_cmap % 10 ]
     mask = np.logical_and( np.isnan( x ), np.isnan( y ) )
     not_mask = ~mask
     # Plot only when x and y values are not nan values.
+    x, y = x[ not_mask ], y[ not_mask ]
+    variable, values = ( x, y ) if variableAlongX else ( y, x )
+    ids: npt.NDArray[ np.int64 ] = decimateMinMax( variable, values, DECIMATION_PIXEL_COLUMNS )
+    line: lines.Line2D = ax_to_use.plot( x[ ids ], y[ ids ], label=propertyName, color=cmap )[ 0 ]
     if propertyName in curvesAspect:
-        asp: tuple[ tuple[ float, float, float ], str, float, str, float ] = curvesAspect[ propertyName ]
-        ax_to_use.plot(
-            x[ not_mask ],
-            y[ not_mask ],
-            label=propertyName,
-            color=asp[ 0 ],
-            linestyle=asp[ 1 ],
-            linewidth=asp[ 2 ],
-            marker=asp[ 3 ],
-            markersize=asp[ 4 ],
-        )
+        setLineAspect( line, curvesAspect[ propertyName ] )
+
+
+def setLineAspect( line: lines.Line2D, aspect: tuple[ tuple[ float, float, float ], str, float, str, float ] ) -> None:
+    """Apply a curve aspect chosen by the user to a line.
+
+    Args:
+        line (lines.Line2D): Line to modify.
+        aspect (tuple[tuple[float, float, float], str, float, str, float]): Curve aspect as
+            (color, lineStyle, lineWidth, marker, markerSize).
+    """
+    line.set_color( aspect[ 0 ] )
+    line.set_linestyle( aspect[ 1 ] )
+    line.set_linewidth( aspect[ 2 ] )
+    line.set_marker( aspect[ 3 ] )
+    line.set_markersize( aspect[ 4 ] )
+
+
+def decimateMinMax( variable: npt.NDArray[ np.float64 ], values: npt.NDArray[ np.float64 ],
+                    nbColumns: int ) -> npt.NDArray[ np.int64 ]:
+    """Get the ids of the points to draw a curve with min/max decimation.
+
+    The variable range is split in nbColumns columns, and only the points with the minimum
+    and the maximum value of each column are kept, in their original order. When each
+    column is narrower than a pixel, the drawn curve is the same as the full one.
+    Series that are not monotonic along the variable or that are small enough are not
+    decimated, and points with nan values are always kept to preserve the gaps.
+
+    Args:
+        variable (npt.NDArray[np.float64]): Data along the variable axis.
+        values (npt.NDArray[np.float64]): Data along the curve axis.
+        nbColumns (int): Number of columns to split the variable range.
+
+    Returns:
+        npt.NDArray[np.int64]: Sorted ids of the points to draw.
+    """
+    allIds: npt.NDArray[ np.int64 ] = np.arange( variable.size )
+    if variable.size <= 2 * nbColumns:
+        return allIds
+    finite: npt.NDArray[ np.bool_ ] = np.isfinite( variable ) & np.isfinite( values )
+    finiteIds: npt.NDArray[ np.int64 ] = allIds[ finite ]
+    finiteVariable: npt.NDArray[ np.float64 ] = variable[ finiteIds ]
+    steps: npt.NDArray[ np.float64 ] = np.diff( finiteVariable )
+    if finiteIds.size <= 2 * nbColumns or not ( np.all( steps >= 0.0 ) or np.all( steps <= 0.0 ) ):
+        return allIds
+
+    vMin, vMax = finiteVariable.min(), finiteVariable.max()
+    if vMax == vMin:
+        columns: npt.NDArray[ np.int64 ] = np.zeros( finiteIds.size, dtype=np.int64 )
     else:
-        ax_to_use.plot( x[ not_mask ], y[ not_mask ], label=propertyName, color=cmap )
+        columns = np.minimum( ( ( finiteVariable - vMin ) / ( vMax - vMin ) * nbColumns ).astype( np.int64 ),
+                              nbColumns - 1 )
+    # sort the points by column, then by value: the first and last point of each column are its extremas
+    order: npt.NDArray[ np.int64 ] = np.lexsort( ( values[ finiteIds ], columns ) )
+    sortedColumns: npt.NDArray[ np.int64 ] = columns[ order ]
+    firsts: npt.NDArray[ np.int64 ] = np.flatnonzero( np.diff( sortedColumns, prepend=-1 ) )
+    lasts: npt.NDArray[ np.int64 ] = np.append( firsts[ 1: ] - 1, sortedColumns.size - 1 )
+    extremaIds: npt.NDArray[ np.int64 ] = finiteIds[ order[ np.concatenate( ( firsts, lasts ) ) ] ]
+    return np.union1d( extremaIds, allIds[ ~finite ] )
 
 
 def getExtremaAllAxes( axes: list[ axes.Axes ], ) -> tuple[ tuple[ float, float ], tuple[ float, float ] ]:
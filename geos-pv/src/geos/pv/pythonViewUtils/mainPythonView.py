@@ -4,29 +4,43 @@
 # type: ignore
 # ruff: noqa
 try:
-    import matplotlib.pyplot as plt
     from paraview import python_view
 
     import geos.pv.utils.paraviewTreatments as pvt
     from geos.pv.pythonViewUtils.Figure2DGenerator import (
-        Figure2DGenerator, )
+        FIGURE_GENERATOR_ATTRIBUTE,
+        getFigure2DGenerator,
+    )
 
-    plt.close()
     if len( sourceNames ) == 0:  # noqa: F821
         raise ValueError( "No source name was found. Please check at least one source in <<Input Sources>>." )
 
-    dataframes = pvt.getDataframesFromMultipleVTKSources(
-        sourceNames,
-        variableName  # noqa: F821
-    )
-    dataframe = pvt.mergeDataframes( dataframes, variableName )  # noqa: F821
-    obj_figure = Figure2DGenerator( dataframe, userChoices )  # noqa: F821
-    fig = obj_figure.getFigure()
+    # only convert the arrays of the curves to plot or to multiply by -1
+    columnsToPlot = set()
+    for curveName in ( *userChoices[ "curveNames" ], *userChoices[ "curveConvention" ] ):  # noqa: F821
+        for sourceName in sourceNames:  # noqa: F821
+            if curveName.endswith( "__" + sourceName ):
+                columnsToPlot.add( curveName[ :-len( "__" + sourceName ) ] )
+
+    def loadDataframe():  # noqa
+        dataframes = pvt.getDataframesFromMultipleVTKSources(
+            sourceNames,  # noqa: F821
+            variableName,  # noqa: F821
+            columnsToPlot )
+        return pvt.mergeDataframes( dataframes, variableName )  # noqa: F821
 
     def setup_data( view ) -> None:  # noqa
-        pass
+        # the figure of the view is only restyled while the sources are not modified
+        modificationTimes = pvt.getSourcesModificationTime( sourceNames )  # noqa: F821
+        dataKey = None
+        if modificationTimes is not None:
+            dataKey = ( modificationTimes, variableName, frozenset( columnsToPlot ) )  # noqa: F821
+        getFigure2DGenerator( view, dataKey, userChoices, loadDataframe )  # noqa: F821
 
     def render( view, width: int, height: int ):  # noqa
+        if not hasattr( view, FIGURE_GENERATOR_ATTRIBUTE ):
+            setup_data( view )
+        fig = getattr( view, FIGURE_GENERATOR_ATTRIBUTE ).getFigure()
         fig.set_size_inches( float( width ) / 100.0, float( height ) / 100.0 )
         imageToReturn = python_view.figure_to_image( fig )
         return imageToReturn
@@ -6,7 +6,7 @@ from typing import Any
 from enum import Enum
 import numpy as np
 import numpy.typing as npt
-from geos.geomechanics.model.MohrCircle import MohrCircle
+from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
 from geos.geomechanics.model.MohrCoulomb import MohrCoulomb
 
 from geos.pv.utils.mohrCircles import (
@@ -32,7 +32,7 @@ class StressConventionEnum( Enum ):
 
 def buildPythonViewScript(
     dirpath: str,
-    mohrCircles: list[ MohrCircle ],
+    mohrCircles: MohrCircleCollection,
     rockCohesion: float,
     frictionAngle: float,
     userChoices: dict[ str, Any ],
@@ -43,7 +43,7 @@ def buildPythonViewScript(
 
     Args:
         dirpath (str): Root directory path for the script creation.
-        mohrCircles (list[MohrCircle]): List of MohrCircle objects.
+        mohrCircles (MohrCircleCollection): Mohr's circles to plot.
         rockCohesion (float): Rock cohesion (Pa).
         frictionAngle (float): Friction angle (rad).
         userChoices (dict[str, Any]): Dictionary of user plot parameters.
@@ -53,9 +53,10 @@ def buildPythonViewScript(
     """
     pathPythonViewScript: str = os.path.join( dirpath, MOHR_CIRCLE_PATH, MOHR_CIRCLE_ANALYSIS_MAIN )
 
-    mohrCircleParams: list[ tuple[ str, float, float,
-                                   float ] ] = [ ( mohrCircle.getCircleId(), *( mohrCircle.getPrincipalComponents() ) )
-                                                 for mohrCircle in mohrCircles ]
+    mohrCircleParams: list[ tuple[ str, float, float, float ] ] = [
+        ( circleId, *components ) for circleId, components in zip(
+            mohrCircles.getCircleIds(), mohrCircles.getPrincipalComponents().tolist(), strict=True )
+    ]
 
     script: str = ""
     script += f"mohrCircleParams = {mohrCircleParams}\n"
@@ -68,26 +69,6 @@ def buildPythonViewScript(
     return script
 
 
-def findAnnotateTuples( mohrCircle: MohrCircle, ) -> tuple[ str, str, tuple[ float, float ], tuple[ float, float ] ]:
-    """Get the values and location of min and max normal stress or Mohr's circle.
-
-    Args:
-        mohrCircle (MohrCircle): Mohr's circle to consider.
-        maxTau (float): Max shear stress.
-
-    Returns:
-        tuple[str, str, tuple[float, float], tuple[float, float]]: Labels and
-            location of labels.
-    """
-    p3, _, p1 = mohrCircle.getPrincipalComponents()
-    xMaxDisplay: str = f"{p1:.2E}"
-    xMinDisplay: str = f"{p3:.2E}"
-    yPosition: float = 0.0
-    xyMax: tuple[ float, float ] = ( p1, yPosition )
-    xyMin: tuple[ float, float ] = ( p3, yPosition )
-    return ( xMaxDisplay, xMinDisplay, xyMax, xyMin )
-
-
 def getMohrCircleId( cellId: str, timeStep: str ) -> str:
     """Get Mohr's circle ID from cell ID and time step.
 
@@ -101,56 +82,79 @@ def getMohrCircleId( cellId: str, timeStep: str ) -> str:
     return f"Cell_{cellId}@{timeStep}"
 
 
-def createMohrCircleAtTimeStep(
-    stressArray: npt.NDArray[ np.float64 ],
+def getCellRowIndexes( originalCellIds: npt.NDArray[ Any ], cellIds: list[ str ] ) -> npt.NDArray[ np.int64 ]:
+    """Get the row indexes of the given cell ids in the mesh.
+
+    Args:
+        originalCellIds (npt.NDArray[Any]): Original cell ids of the mesh, one per cell.
+        cellIds (list[str]): List of cell ids to find.
+
+    Raises:
+        ValueError: A cell id does not exist in the mesh.
+
+    Returns:
+        npt.NDArray[np.int64]: Row index of each cell id in the mesh arrays.
+    """
+    requestedIds: npt.NDArray[ np.int64 ] = np.array( [ int( cellId ) for cellId in cellIds ], dtype=np.int64 )
+    meshIds: npt.NDArray[ np.int64 ] = np.asarray( originalCellIds ).astype( np.int64 )
+    sorter: npt.NDArray[ np.int64 ] = np.argsort( meshIds, kind="stable" )
+    positions: npt.NDArray[ np.int64 ] = np.searchsorted( meshIds, requestedIds, sorter=sorter )
+    found: npt.NDArray[ np.bool_ ] = positions < meshIds.size
+    found[ found ] = meshIds[ sorter[ positions[ found ] ] ] == requestedIds[ found ]
+    if not np.all( found ):
+        raise ValueError( f"Cell ids {[ cellIds[ i ] for i in np.flatnonzero( ~found ) ]} do not exist in the mesh." )
+    return sorter[ positions ]
+
+
+def createMohrCirclesFromStressTimeSeries(
+    stressTimeSeries: npt.NDArray[ np.float64 ],
     cellIds: list[ str ],
-    timeStep: str,
+    timeSteps: list[ str ],
     convention: StressConventionEnum,
-) -> set[ MohrCircle ]:
-    """Create MohrCircle object(s) at a given time step for all cell ids.
+) -> MohrCircleCollection:
+    """Create Mohr's circles of all cell ids at all time steps with a single batched computation.
+
+    Circles are sorted by cell ids first, then by time steps. Stresses that were not filled (NaN),
+    such as those of time steps not loaded yet, have no circle.
 
     Args:
-        stressArray (npt.NDArray[np.float64]): Stress numpy array
-        cellIds (list[str]): List of cell ids
-        timeStep (str): Time step
+        stressTimeSeries (npt.NDArray[np.float64]): (nbCells, nbTimeSteps, 6) stress array.
+        cellIds (list[str]): List of cell ids.
+        timeSteps (list[str]): List of time steps.
         convention (StressConventionEnum): Convention used for compression.
 
     Raises:
-        ValueError: Stress array must consists of 6 components.
+        ValueError: Stress array must be consistent with cell ids and time steps.
 
     Returns:
-        set[MohrCircle]: Set of MohrCircle objects.
+        MohrCircleCollection: Mohr's circles of the cells at each time step.
     """
-    if stressArray.shape[ 1 ] != 6:
-        raise ValueError( "Expected 6 components for stress array, not {stressArray.shape[ 1 ]}.\n \
-        Cannot proceed with the creation of Mohr circles." )
-
-    mohrCircles: set[ MohrCircle ] = set()
-    for i, cellId in enumerate( cellIds ):
-        ide: str = getMohrCircleId( cellId, timeStep )
-        mohrCircle: MohrCircle = MohrCircle( ide )
-        mohrCircle.computePrincipalComponents( stressArray[ i ] * convention.value )
-        mohrCircles.add( mohrCircle )
+    if stressTimeSeries.shape != ( len( cellIds ), len( timeSteps ), 6 ):
+        raise ValueError( f"Expected stress array of shape {( len( cellIds ), len( timeSteps ), 6 )}, " +
+                          f"not {stressTimeSeries.shape}." )
 
-    return mohrCircles
+    stressVectors: npt.NDArray[ np.float64 ] = stressTimeSeries.reshape( -1, 6 )
+    filled: npt.NDArray[ np.bool_ ] = np.all( np.isfinite( stressVectors ), axis=1 )
+    circleIds: list[ str ] = [ getMohrCircleId( cellId, timeStep ) for cellId in cellIds for timeStep in timeSteps ]
+    return MohrCircleCollection.fromStressVectors(
+        [ circleId for circleId, isFilled in zip( circleIds, filled ) if isFilled ],
+        stressVectors[ filled ] * convention.value )
 
 
 def createMohrCirclesFromPrincipalComponents(
-        mohrCircleParams: list[ tuple[ str, float, float, float ] ] ) -> list[ MohrCircle ]:
-    """Create Mohr's circle objects from principal components.
+        mohrCircleParams: list[ tuple[ str, float, float, float ] ] ) -> MohrCircleCollection:
+    """Create Mohr's circles from principal components.
 
     Args:
         mohrCircleParams (list[tuple[str, float, float, float]]): List of Mohr's circle parameters
 
     Returns:
-        list[MohrCircle]: List of Mohr's circle objects.
+        MohrCircleCollection: Mohr's circles.
     """
-    mohrCircles: list[ MohrCircle ] = []
-    for circleId, p3, p2, p1 in mohrCircleParams:
-        mohrCircle: MohrCircle = MohrCircle( circleId )
-        mohrCircle.setPrincipalComponents( p3, p2, p1 )
-        mohrCircles.append( mohrCircle )
-    return mohrCircles
+    circleIds: list[ str ] = [ params[ 0 ] for params in mohrCircleParams ]
+    principalComponents: npt.NDArray[ np.float64 ] = np.array( [ params[ 1: ] for params in mohrCircleParams ],
+                                                               dtype=np.float64 ).reshape( -1, 3 )
+    return MohrCircleCollection( circleIds, principalComponents )
 
 
 def createMohrCoulombEnvelope( rockCohesion: float, frictionAngle: float ) -> MohrCoulomb:
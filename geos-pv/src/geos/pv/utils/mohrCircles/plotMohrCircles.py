@@ -8,10 +8,10 @@ import numpy.typing as npt
 
 from matplotlib import ticker
 from matplotlib.axes import Axes  # type: ignore[import-untyped]
+from matplotlib.collections import LineCollection  # type: ignore[import-untyped]
 from matplotlib.figure import Figure  # type: ignore[import-untyped]
 from matplotlib.lines import Line2D  # type: ignore[import-untyped]
 
-import geos.pv.utils.mohrCircles.functionsMohrCircle as mcf
 from geos.pv.pyplotUtils.matplotlibOptions import (
     FontStyleEnum,
     FontWeightEnum,
@@ -20,24 +20,24 @@ from geos.pv.pyplotUtils.matplotlibOptions import (
     MarkerStyleEnum,
 )
 
-from geos.geomechanics.model.MohrCircle import MohrCircle
+from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
 from geos.geomechanics.model.MohrCoulomb import MohrCoulomb
 from geos.utils.enumUnits import Pressure, Unit, convert
 from geos.utils.GeosOutputsConstants import FAILURE_ENVELOPE
 
 __doc__ = """
 plotMohrCircles module provides a set of functions to plot multiple Mohr's
-circles and a failure envelope from a list of MohrCircle and MohrCoulomb
+circles and a failure envelope from MohrCircleCollection and MohrCoulomb
 objects respectively.
 """
 
 
-def createMohrCirclesFigure( mohrCircles: list[ MohrCircle ], mohrCoulomb: MohrCoulomb,
+def createMohrCirclesFigure( mohrCircles: MohrCircleCollection, mohrCoulomb: MohrCoulomb,
                              userChoices: dict[ str, Any ] ) -> Figure:
     """Create Mohr's circle figure.
 
     Args:
-        mohrCircles (list[MohrCircle]): List of MohrCircle objects.
+        mohrCircles (MohrCircleCollection): Mohr's circles to plot.
         mohrCoulomb (MohrCoulomb): MohrCoulomb object defining the failure envelope.
         userChoices (dict[str, Any]): Dictionnary to define figure properties.
 
@@ -52,67 +52,100 @@ def createMohrCirclesFigure( mohrCircles: list[ MohrCircle ], mohrCoulomb: MohrC
     # Plot Mohr's Circles
     curvesAspect: dict[ str, Any ] = userChoices.get( "curvesAspect", {} )
     annotate: bool = userChoices.get( "annotateCircles", False )
-    _plotMohrCircles( ax, mohrCircles, curvesAspect, annotate )
+    legend: bool = userChoices.get( "displayLegend", False )
+    circleHandles: list[ Line2D ] = _plotMohrCircles( ax, mohrCircles, curvesAspect, annotate, legend )
 
     # Plot Mohr Coulomb failure envelop
     failureEnvelopeAspect: dict[ str, Any ] = curvesAspect.get( FAILURE_ENVELOPE, {} )
     _plotMohrCoulomb( ax, mohrCoulomb, failureEnvelopeAspect )
 
     # Set user preferences
-    _setUserChoices( ax, userChoices )
+    _setUserChoices( ax, userChoices, circleHandles )
 
     return fig
 
 
 def _plotMohrCircles(
     ax: Axes,
-    mohrCircles: list[ MohrCircle ],
+    mohrCircles: MohrCircleCollection,
     circlesAspect: dict[ str, dict[ str, Any ] ],
     annotate: bool,
-) -> None:
+    legend: bool = True,
+) -> list[ Line2D ]:
     """Plot multiple Mohr's circles on input Axes.
 
+    All the circles are drawn at once with a single LineCollection, markers are
+    only added for the circles whose aspect defines one.
+
     Args:
         ax (Axes): Axes where to plot Mohr's circles
-        mohrCircles (list[MohrCircle]): List of MohrCircle objects to plot.
+        mohrCircles (MohrCircleCollection): Mohr's circles to plot.
         circlesAspect (dict[str, dict[str, Any]]): Dictionnary defining Mohr's circle line properties.
         annotate (bool): If True, display min and max normal stress.
+        legend (bool, optional): If True, legend handles of the circles are created.
+            Defaults to True.
+
+    Returns:
+        list[Line2D]: Legend handles of the Mohr's circles, they are not added to the Axes.
     """
+    nbCircles: int = len( mohrCircles )
+    if nbCircles == 0:
+        return []
+
     nbPts: int = 361
     ang: npt.NDArray[ np.float64 ] = np.linspace( 0.0, np.pi, nbPts ).astype( np.float64 )
-    for mohrCircle in mohrCircles:
-        radius: float = mohrCircle.getCircleRadius()
-        xCoords: float = mohrCircle.getCircleCenter() + radius * np.cos( ang )
-        yCoords: npt.NDArray[ np.float64 ] = radius * ( np.sin( ang ) )
-        label: str = mohrCircle.getCircleId()
-
-        p: list[ Line2D ]  # plotted lines to get the color later
-        if label in circlesAspect:
-            circleAspect: dict[ str, Any ] = circlesAspect[ label ]
-            color: tuple[ float, float, float ] = circleAspect.get( "color", "k" )
-            linestyle: str = circleAspect.get( "linestyle", LineStyleEnum.SOLID.optionValue )
-            linewidth: float = circleAspect.get( "linewidth", 1 )
-            marker: str = circleAspect.get( "marker", MarkerStyleEnum.NONE.optionValue )
-            markersize: float = circleAspect.get( "markersize", 1 )
-            p = ax.plot(
-                xCoords,
-                yCoords,
-                label=label,
-                color=color,
-                linestyle=linestyle,
-                linewidth=linewidth,
-                marker=marker,
-                markersize=markersize,
-            )
-        else:
-            p = ax.plot( xCoords, yCoords, label=label, linestyle="-", marker="" )
-
-        if annotate:
-            fontColor = p[ 0 ].get_color()
-            annot: tuple[ str, str, tuple[ float, float ], tuple[ float,
-                                                                  float ] ] = ( mcf.findAnnotateTuples( mohrCircle ) )
-            ax.annotate( annot[ 0 ], xy=annot[ 2 ], ha="left", rotation=30, color=fontColor )
-            ax.annotate( annot[ 1 ], xy=annot[ 3 ], ha="right", rotation=30, color=fontColor )
+    radius: npt.NDArray[ np.float64 ] = mohrCircles.getCircleRadius()
+    center: npt.NDArray[ np.float64 ] = mohrCircles.getCircleCenter()
+    # (nbCircles, nbPts, 2) array of circle coordinates
+    segments: npt.NDArray[ np.float64 ] = np.stack(
+        ( center[ :, None ] + radius[ :, None ] * np.cos( ang ), radius[ :, None ] * np.sin( ang ) ), axis=-1 )
+
+    # Default aspect uses the color cycle, then user-defined aspects are applied
+    defaultColors: list[ Any ] = plt.rcParams[ "axes.prop_cycle" ].by_key().get( "color", [ "k" ] )
+    colors: list[ Any ] = [ defaultColors[ i % len( defaultColors ) ] for i in range( nbCircles ) ]
+    linestyles: list[ str ] = [ LineStyleEnum.SOLID.optionValue ] * nbCircles
+    linewidths: list[ float ] = [ 1.0 ] * nbCircles
+    markers: list[ str ] = [ MarkerStyleEnum.NONE.optionValue ] * nbCircles
+    markersizes: list[ float ] = [ 1.0 ] * nbCircles
+    circleIds: list[ str ] = mohrCircles.getCircleIds()
+    for i, label in enumerate( circleIds ):
+        if label not in circlesAspect:
+            continue
+        circleAspect: dict[ str, Any ] = circlesAspect[ label ]
+        colors[ i ] = circleAspect.get( "color", "k" )
+        linestyles[ i ] = circleAspect.get( "linestyle", LineStyleEnum.SOLID.optionValue )
+        linewidths[ i ] = circleAspect.get( "linewidth", 1 )
+        markers[ i ] = circleAspect.get( "marker", MarkerStyleEnum.NONE.optionValue )
+        markersizes[ i ] = circleAspect.get( "markersize", 1 )
+        if markers[ i ] != MarkerStyleEnum.NONE.optionValue:
+            ax.plot( segments[ i, :, 0 ],
+                     segments[ i, :, 1 ],
+                     color=colors[ i ],
+                     linestyle="None",
+                     marker=markers[ i ],
+                     markersize=markersizes[ i ] )
+
+    # one segment view per circle, LineCollection is typed for a sequence of segments
+    ax.add_collection( LineCollection( list( segments ), colors=colors, linestyles=linestyles, linewidths=linewidths ) )
+    ax.autoscale_view()
+
+    if annotate:
+        p3, _, p1 = mohrCircles.getPrincipalComponents().T
+        for i in range( nbCircles ):
+            ax.annotate( f"{p1[ i ]:.2E}", xy=( p1[ i ], 0.0 ), ha="left", rotation=30, color=colors[ i ] )
+            ax.annotate( f"{p3[ i ]:.2E}", xy=( p3[ i ], 0.0 ), ha="right", rotation=30, color=colors[ i ] )
+
+    if not legend:
+        return []
+    return [
+        Line2D( [], [],
+                label=circleIds[ i ],
+                color=colors[ i ],
+                linestyle=linestyles[ i ],
+                linewidth=linewidths[ i ],
+                marker=markers[ i ],
+                markersize=markersizes[ i ] ) for i in range( nbCircles )
+    ]
 
 
 def _plotMohrCoulomb( ax: Axes, mohrCoulomb: MohrCoulomb, curvesAspect: dict[ str, Any ] ) -> None:
@@ -142,12 +175,13 @@ def _plotMohrCoulomb( ax: Axes, mohrCoulomb: MohrCoulomb, curvesAspect: dict[ st
     )
 
 
-def _setUserChoices( ax: Axes, userChoices: dict[ str, Any ] ) -> None:
+def _setUserChoices( ax: Axes, userChoices: dict[ str, Any ], circleHandles: list[ Line2D ] ) -> None:
     """Set user preferences on input Axes.
 
     Args:
         ax (Axes): Axes object to modify.
         userChoices (dict[str, Any]): User-defined properties.
+        circleHandles (list[Line2D]): Legend handles of the Mohr's circles.
     """
     _updateAxis( ax, userChoices )
 
@@ -157,7 +191,7 @@ def _setUserChoices( ax: Axes, userChoices: dict[ str, Any ] ) -> None:
 
     # Set legend
     if userChoices.get( "displayLegend", False ):
-        _updateLegend( ax, userChoices )
+        _updateLegend( ax, userChoices, circleHandles )
 
     if userChoices.get( "customAxisLim", False ):
         _updateAxisLimits( ax, userChoices )
@@ -218,16 +252,18 @@ def updateTitle( ax: Axes, userChoices: dict[ str, Any ] ) -> None:
     ax.set_title( title, fontstyle=style, weight=weight, fontsize=size )
 
 
-def _updateLegend( ax: Axes, userChoices: dict[ str, Any ] ) -> None:
+def _updateLegend( ax: Axes, userChoices: dict[ str, Any ], circleHandles: list[ Line2D ] ) -> None:
     """Update legend.
 
     Args:
         ax (Axes): Axes object.
         userChoices (dict[str, Any]): User-defined properties.
+        circleHandles (list[Line2D]): Legend handles of the Mohr's circles.
     """
     loc = userChoices.get( "legendPosition", LegendLocationEnum.BEST.optionValue )
     size = userChoices.get( "legendSize", 10 )
-    ax.legend( loc=loc, fontsize=size )
+    handles, _ = ax.get_legend_handles_labels()
+    ax.legend( handles=circleHandles + handles, loc=loc, fontsize=size )
 
 
 def _updateAxisLimits( ax: Axes, userChoices: dict[ str, Any ] ) -> None:
@@ -4,7 +4,7 @@
 # ruff: noqa: E402 # disable Module level import not at top of file
 import logging
 from enum import Enum
-from typing import Any, Union
+from typing import Any, Collection, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -17,6 +17,7 @@ from paraview.detail.loghandler import (  # type: ignore[import-not-found]
     VTKHandler, )
 import vtkmodules.util.numpy_support as vnp
 from vtkmodules.vtkCommonCore import (
+    VTK_DOUBLE,
     vtkDataArray,
     vtkDataArraySelection,
     vtkDoubleArray,
@@ -45,34 +46,42 @@ from geos.mesh.utils.multiblockModifiers import mergeBlocks
 HARD_CODED_VALID_PVC_TYPE: set[ str ] = { "GeosLogReader", "RenameArrays" }
 
 
-def vtkTableToDataframe( table: vtkTable ) -> pd.DataFrame:
+def vtkTableToDataframe( table: vtkTable, columns: Optional[ Collection[ str ] ] = None ) -> pd.DataFrame:
     """From a vtkTable, creates and returns a pandas dataframe.
 
+    Numeric columns are wrapped with vtk_to_numpy so that no value by value copy
+    is done. Multi-component columns are split into one column per component.
+
     Args:
         table (vtkTable): vtkTable object.
+        columns (Collection[str] | None, optional): Names of the dataframe columns to convert.
+            Defaults to None, all the columns are converted.
 
     Returns:
         pd.DataFrame: Pandas dataframe.
     """
-    data: list[ dict[ str, Any ] ] = []
-    for rowIndex in range( table.GetNumberOfRows() ):
-        rowData: dict[ str, Any ] = {}
-        for colIndex in range( table.GetNumberOfColumns() ):
-            colName: str = table.GetColumnName( colIndex )
-            cellValue: Any = table.GetValue( rowIndex, colIndex )
-            # we have a vtkVariant value, we need a float
-            cellValueF: float = cellValue.ToFloat()
-            rowData[ colName ] = cellValueF
-        data.append( rowData )
-    df: pd.DataFrame = pd.DataFrame( data )
-    return df
-
-
-def vtkPolyDataToPointsDataframe( polydata: vtkPolyData ) -> pd.DataFrame:
+    data: dict[ str, npt.NDArray[ Any ] ] = {}
+    for colIndex in range( table.GetNumberOfColumns() ):
+        colName: str = table.GetColumnName( colIndex )
+        column = table.GetColumn( colIndex )
+        if isinstance( column, vtkDataArray ):
+            _addVtkArrayToDict( data, column, colName, columns )
+        elif columns is None or colName in columns:
+            # non numeric arrays (vtkStringArray...), values are converted one by one as floats
+            data[ colName ] = np.array(
+                [ table.GetValue( rowIndex, colIndex ).ToFloat() for rowIndex in range( table.GetNumberOfRows() ) ],
+                dtype=np.float64 )
+    return pd.DataFrame( data, copy=False )
+
+
+def vtkPolyDataToPointsDataframe( polydata: vtkPolyData,
+                                  columns: Optional[ Collection[ str ] ] = None ) -> pd.DataFrame:
     """Creates a pandas dataframe containing points data from vtkPolyData.
 
     Args:
         polydata (vtkPolyData): vtkPolyData object.
+        columns (Collection[str] | None, optional): Names of the dataframe columns to convert.
+            Defaults to None, all the columns are converted.
 
     Returns:
         pd.DataFrame: Pandas dataframe containing the points data.
@@ -80,41 +89,27 @@ def vtkPolyDataToPointsDataframe( polydata: vtkPolyData ) -> pd.DataFrame:
     points: vtkPoints = polydata.GetPoints()
     assert points is not None, "Points is undefined."
     nbrPoints: int = points.GetNumberOfPoints()
-    data: dict[ str, Any ] = {
-        "Point ID": np.empty( nbrPoints ),
-        "PointsX": np.empty( nbrPoints ),
-        "PointsY": np.empty( nbrPoints ),
-        "PointsZ": np.empty( nbrPoints ),
-    }
-    for pointID in range( nbrPoints ):
-        point: tuple[ float, float, float ] = points.GetPoint( pointID )
-        data[ "Point ID" ][ pointID ] = pointID
-        data[ "PointsX" ][ pointID ] = point[ 0 ]
-        data[ "PointsY" ][ pointID ] = point[ 1 ]
-        data[ "PointsZ" ][ pointID ] = point[ 2 ]
+    data: dict[ str, npt.NDArray[ Any ] ] = { "Point ID": np.arange( nbrPoints, dtype=np.float64 ) }
+    coords: npt.NDArray[ Any ] = vnp.vtk_to_numpy( points.GetData() ).reshape( nbrPoints, 3 )
+    for axis, name in enumerate( ( "PointsX", "PointsY", "PointsZ" ) ):
+        if columns is None or name in columns:
+            data[ name ] = coords[ :, axis ]
+
     pointData = polydata.GetPointData()
-    nbrArrays: int = pointData.GetNumberOfArrays()
-    for i in range( nbrArrays ):
-        arrayToUse = pointData.GetArray( i )
-        arrayName: str = pointData.GetArrayName( i )
-        subArrayNames: list[ str ] = findSubArrayNames( arrayToUse, arrayName )
-        # Collect the data for each sub array
-        for ind, name in enumerate( subArrayNames ):
-            data[ name ] = np.empty( nbrPoints )
-            for k in range( nbrPoints ):
-                # Every element of the tuple correspond to one distinct
-                # sub array so we only need one value at a time
-                value: float = arrayToUse.GetTuple( k )[ ind ]
-                data[ name ][ k ] = value
-    df: pd.DataFrame = pd.DataFrame( data ).set_index( "Point ID" )
+    for i in range( pointData.GetNumberOfArrays() ):
+        _addVtkArrayToDict( data, pointData.GetArray( i ), pointData.GetArrayName( i ), columns )
+    df: pd.DataFrame = pd.DataFrame( data, copy=False ).set_index( "Point ID" )
     return df
 
 
-def vtkUnstructuredGridCellsToDataframe( grid: vtkUnstructuredGrid ) -> pd.DataFrame:
-    """Creates a pandas dataframe containing points data from vtkUnstructuredGrid.
+def vtkUnstructuredGridCellsToDataframe( grid: vtkUnstructuredGrid,
+                                         columns: Optional[ Collection[ str ] ] = None ) -> pd.DataFrame:
+    """Creates a pandas dataframe containing cells data from vtkUnstructuredGrid.
 
     Args:
         grid (vtkUnstructuredGrid): vtkUnstructuredGrid object.
+        columns (Collection[str] | None, optional): Names of the dataframe columns to convert.
+            Defaults to None, all the columns are converted.
 
     Returns:
         pd.DataFrame: Pandas dataframe.
@@ -131,43 +126,63 @@ def vtkUnstructuredGridCellsToDataframe( grid: vtkUnstructuredGrid ) -> pd.DataF
         cellIdAttributeName = "GlobalCellIds"
         assert cellData.HasArray( cellIdAttributeName ), "Invalid global ids array name selected."
 
-    numberCells: int = grid.GetNumberOfCells()
-    data: dict[ str, Any ] = {}
+    # cell ids are always converted since they are used as index
+    selection: Optional[ set[ str ] ] = None if columns is None else { *columns, cellIdAttributeName }
+    data: dict[ str, npt.NDArray[ Any ] ] = {}
     for i in range( cellData.GetNumberOfArrays() ):
-        arrayToUse = cellData.GetArray( i )
-        arrayName: str = cellData.GetArrayName( i )
-        subArrayNames: list[ str ] = findSubArrayNames( arrayToUse, arrayName )
-        # Collect the data for each sub array
-        for ind, name in enumerate( subArrayNames ):
-            data[ name ] = np.empty( numberCells )
-            for k in range( numberCells ):
-                # Every element of the tuple correspond to one distinct
-                # sub array so we only need one value at a time
-                value: float = arrayToUse.GetTuple( k )[ ind ]
-                data[ name ][ k ] = value
-    df: pd.DataFrame = pd.DataFrame( data ).astype( { cellIdAttributeName: int } )
+        _addVtkArrayToDict( data, cellData.GetArray( i ), cellData.GetArrayName( i ), selection )
+    df: pd.DataFrame = pd.DataFrame( data, copy=False ).astype( { cellIdAttributeName: int } )
 
     # set cell ids as index
-
-    # df = df.astype({cellIdAttributeName: int})
     return df.set_index( cellIdAttributeName )
 
 
-def vtkToDataframe( dataset: vtkDataObject ) -> pd.DataFrame:
+def _addVtkArrayToDict( data: dict[ str, npt.NDArray[ Any ] ],
+                        vtkArray: Optional[ vtkDataArray ],
+                        arrayName: str,
+                        columns: Optional[ Collection[ str ] ] = None ) -> None:
+    """Add the components of a vtk array to a dictionary of numpy arrays.
+
+    Components are numpy views of the vtk array memory, so no copy is done. The
+    array is not converted at all if none of its sub array names is selected.
+
+    Args:
+        data (dict[str, npt.NDArray[Any]]): Dictionary to fill, keys are sub array names.
+        vtkArray (vtkDataArray | None): Array from vtk library.
+        arrayName (str): Name of the array.
+        columns (Collection[str] | None, optional): Sub array names to keep.
+            Defaults to None, all the components are kept.
+    """
+    # arrays that are not vtkDataArray (vtkStringArray...) are returned as None
+    if vtkArray is None:
+        return
+    subArrayNames: list[ str ] = findSubArrayNames( vtkArray, arrayName )
+    if columns is not None and not any( name in columns for name in subArrayNames ):
+        return
+    values: npt.NDArray[ Any ] = vnp.vtk_to_numpy( vtkArray )  # type: ignore[no-untyped-call]
+    values = values.reshape( vtkArray.GetNumberOfTuples(), len( subArrayNames ) )
+    for ind, name in enumerate( subArrayNames ):
+        if columns is None or name in columns:
+            data[ name ] = values[ :, ind ]
+
+
+def vtkToDataframe( dataset: vtkDataObject, columns: Optional[ Collection[ str ] ] = None ) -> pd.DataFrame:
     """Creates a dataframe containing points data from vtkTable or vtkPolyData.
 
     Args:
         dataset (Any): dataset to convert if possible.
+        columns (Collection[str] | None, optional): Names of the dataframe columns to convert.
+            Defaults to None, all the columns are converted.
 
     Returns:
         pd.DataFrame: if the dataset is in the right format.
     """
     if isinstance( dataset, vtkTable ):
-        return vtkTableToDataframe( dataset )
+        return vtkTableToDataframe( dataset, columns )
     elif isinstance( dataset, vtkPolyData ):
-        return vtkPolyDataToPointsDataframe( dataset )
+        return vtkPolyDataToPointsDataframe( dataset, columns )
     elif isinstance( dataset, vtkUnstructuredGrid ):
-        return vtkUnstructuredGridCellsToDataframe( dataset )
+        return vtkUnstructuredGridCellsToDataframe( dataset, columns )
     else:
         raise AssertionError( f"Invalid dataset format {type(dataset)}. " +
                               "Supported formats are: vtkTable, vtkpolyData and vtkUnstructuredGrid" )
@@ -206,25 +221,28 @@ def findSubArrayNames( vtkArray: vtkDataArray, arrayName: str ) -> list[ str ]:
     return subArrayNames
 
 
-def getDataframesFromMultipleVTKSources( sourceNames: set[ str ], commonColumn: str ) -> list[ pd.DataFrame ]:
+def getDataframesFromMultipleVTKSources( sourceNames: set[ str ],
+                                         commonColumn: str,
+                                         columns: Optional[ Collection[ str ] ] = None ) -> list[ pd.DataFrame ]:
     """Creates the dataframe from each source if they have the commonColumn.
 
     Args:
         sourceNames (set[str]): list of sources.
         commonColumn (str): common column name.
+        columns (Collection[str] | None, optional): Names of the columns to convert in
+            addition to commonColumn. Defaults to None, all the columns are converted.
 
     Returns:
         list[pd.DataFrame]: output dataframe.
     """
-    # indexSource: int = commonColumn.rfind("__")
-    # commonColumnNoSource: str = commonColumn[:indexSource]
+    selection: Optional[ set[ str ] ] = None if columns is None else { *columns, commonColumn }
     validDataframes: list[ pd.DataFrame ] = []
     for name in sourceNames:
         source = FindSource( name )
         assert source is not None, "Source is undefined."
         dataset = servermanager.Fetch( source )
         assert dataset is not None, "Dataset is undefined."
-        currentDF: pd.DataFrame = vtkToDataframe( dataset )
+        currentDF: pd.DataFrame = vtkToDataframe( dataset, selection )
         if commonColumn in currentDF.columns:
             dfModified = currentDF.rename(
                 columns={ col: col + "__" + name
@@ -236,9 +254,40 @@ def getDataframesFromMultipleVTKSources( sourceNames: set[ str ], commonColumn:
     return validDataframes
 
 
+def getSourcesModificationTime( sourceNames: Collection[ str ] ) -> Optional[ tuple[ tuple[ str, int ], ...] ]:
+    """Get the modification time of the output data of each source.
+
+    The pipeline of each source is updated first, so that a new modification time
+    means new data. The modification times can only be read when the data are on the
+    client side, that is with a builtin connection.
+
+    Args:
+        sourceNames (Collection[str]): Names of the sources.
+
+    Returns:
+        tuple[tuple[str, int], ...] | None: Pairs of source name and modification time
+        sorted by source name, or None if a modification time is not available.
+    """
+    if servermanager.ActiveConnection is None or servermanager.ActiveConnection.IsRemote():
+        return None
+    modificationTimes: list[ tuple[ str, int ] ] = []
+    for name in sorted( sourceNames ):
+        source = FindSource( name )
+        if source is None:
+            return None
+        source.UpdatePipeline()
+        dataset = source.GetClientSideObject().GetOutputDataObject( 0 )
+        if dataset is None:
+            return None
+        modificationTimes.append( ( name, dataset.GetMTime() ) )
+    return tuple( modificationTimes )
+
+
 def mergeDataframes( dataframes: list[ pd.DataFrame ], commonColumn: str ) -> pd.DataFrame:
     """Merge all dataframes into a single one by using the common column.
 
+    Dataframes are indexed by the common column and joined all at once.
+
     Args:
         dataframes (list[pd.DataFrame]): List of dataframes from
             getDataframesFromMultipleVTKSources.
@@ -252,14 +301,9 @@ def mergeDataframes( dataframes: list[ pd.DataFrame ], commonColumn: str ) -> pd
     assert len( dataframes ) > 0
     if len( dataframes ) == 1:
         return dataframes[ 0 ]
-    else:
-        df0: pd.DataFrame = dataframes[ 0 ]
-        df1: pd.DataFrame = dataframes[ 1 ]
-        merged: pd.DataFrame = df0.merge( df1, on=commonColumn, how="outer" )
-        if len( dataframes ) > 2:
-            for df in dataframes[ 2: ]:
-                merged = merged.merge( df, on=commonColumn, how="outer" )
-        return merged
+    indexed: list[ pd.DataFrame ] = [ df.set_index( commonColumn ) for df in dataframes ]
+    merged: pd.DataFrame = indexed[ 0 ].join( indexed[ 1: ], how="outer", sort=True )
+    return merged.rename_axis( commonColumn ).reset_index()
 
 
 def addDataframeColumnsToVtkPolyData( polyData: vtkPolyData, df: pd.DataFrame ) -> vtkPolyData:
@@ -271,14 +315,18 @@ def addDataframeColumnsToVtkPolyData( polyData: vtkPolyData, df: pd.DataFrame )
 
     Returns:
         vtkPolyData: vtkPolyData with new arrays.
+
+    Raises:
+        ValueError: The dataframe has fewer rows than the vtkPolyData has points.
     """
+    nbrPoints: int = polyData.GetNumberOfPoints()
+    if len( df ) < nbrPoints:
+        raise ValueError( f"The dataframe has {len( df )} rows but the vtkPolyData has {nbrPoints} points." )
     for column_name in df.columns:
-        column = df[ column_name ].values
-        array = vtkDoubleArray()
+        column: npt.NDArray[ np.float64 ] = df[ column_name ].to_numpy( dtype=np.float64 )[ :nbrPoints ]
+        array: vtkDataArray = vnp.numpy_to_vtk(  # type: ignore[no-untyped-call]
+            np.ascontiguousarray( column ), deep=True, array_type=VTK_DOUBLE )
         array.SetName( column_name )
-        array.SetNumberOfValues( polyData.GetNumberOfPoints() )
-        for i in range( polyData.GetNumberOfPoints() ):
-            array.SetValue( i, column[ i ] )
         polyData.GetPointData().AddArray( array )
 
     # Update vtkPolyData object
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Alexandre Benedicto
+# ruff: noqa: E402 # disable Module level import not at top of file
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+import matplotlib
+
+matplotlib.use( "Agg" )
+import numpy as np
+import numpy.typing as npt
+import pandas as pd  # type: ignore[import-untyped]
+from typing_extensions import Self
+
+dir_path = os.path.dirname( os.path.realpath( __file__ ) )
+parent_dir_path = os.path.join( os.path.dirname( dir_path ), "src" )
+if parent_dir_path not in sys.path:
+    sys.path.append( parent_dir_path )
+
+from geos.pv.pythonViewUtils import functionsFigure2DGenerator as fcts
+from geos.pv.pythonViewUtils.Figure2DGenerator import FIGURE_GENERATOR_ATTRIBUTE, getFigure2DGenerator
+
+pressureName: str = "Reservoir__PressureMin__Pa__job1"
+temperatureName: str = "Reservoir__TemperatureAvg__K__job1"
+nbRows: int = 100000
+
+
+def buildDataframe() -> pd.DataFrame:
+    """Build a dataframe with two curves along time."""
+    time: npt.NDArray[ np.float64 ] = np.linspace( 0.0, 10.0, nbRows )
+    return pd.DataFrame( {
+        "Time": time,
+        pressureName: np.sin( 50.0 * time ),
+        temperatureName: np.cos( time ),
+    } )
+
+
+def buildUserChoices( **choices: Any ) -> dict[ str, Any ]:
+    """Build user choices of the Python View configurator."""
+    userChoices: dict[ str, Any ] = {
+        "variableName": "Time",
+        "curveNames": ( pressureName, temperatureName ),
+        "curveConvention": (),
+        "inputNames": [ "job1" ],
+        "plotRegions": False,
+        "reverseXY": False,
+        "logScaleX": False,
+        "logScaleY": False,
+        "minorticks": False,
+        "displayTitle": True,
+        "title": "title1",
+        "titleStyle": "normal",
+        "titleWeight": "bold",
+        "titleSize": 12,
+        "displayLegend": True,
+        "legendPosition": "best",
+        "legendSize": 10,
+        "removeJobName": True,
+        "removeRegions": False,
+        "curvesAspect": {},
+        "ratio": 1.5,
+        "customAxisLim": False,
+        "limMinX": None,
+        "limMaxX": None,
+        "limMinY": None,
+        "limMaxY": None,
+    }
+    userChoices.update( choices )
+    return userChoices
+
+
+class TestsFigure2DGenerator( unittest.TestCase ):
+
+    def test_decimateMinMax( self: Self ) -> None:
+        """Test decimateMinMax function."""
+        variable: npt.NDArray[ np.float64 ] = np.arange( 1000, dtype=float )
+        values: npt.NDArray[ np.float64 ] = np.sin( variable )
+        values[ 500 ] = np.nan
+        ids: npt.NDArray[ np.int64 ] = fcts.decimateMinMax( variable, values, 10 )
+        self.assertLessEqual( ids.size, 21 )
+        self.assertTrue( np.all( np.diff( ids ) > 0 ) )
+        self.assertIn( 500, ids )
+        # extremas of each column are kept
+        for column in range( 10 ):
+            columnIds = np.arange( 100 * column, 100 * ( column + 1 ) )
+            columnIds = columnIds[ columnIds != 500 ]
+            self.assertIn( columnIds[ np.argmin( values[ columnIds ] ) ], ids )
+            self.assertIn( columnIds[ np.argmax( values[ columnIds ] ) ], ids )
+
+        # small or non monotonic series are not decimated
+        self.assertEqual( fcts.decimateMinMax( variable, values, 1000 ).size, 1000 )
+        self.assertEqual( fcts.decimateMinMax( values, variable, 10 ).size, 1000 )
+
+    def test_getFigure2DGenerator( self: Self ) -> None:
+        """Test that a figure is restyled while data and layout are unchanged."""
+        dataframe: pd.DataFrame = buildDataframe()
+        view = SimpleNamespace()
+        generator = getFigure2DGenerator( view, 1, buildUserChoices(), lambda: dataframe )
+        self.assertEqual( len( generator.m_lines ), 2 )
+        for line in generator.m_lines:
+            self.assertLessEqual( len( line.get_xdata() ), 2 * fcts.DECIMATION_PIXEL_COLUMNS )
+        xlim: tuple[ float, float ] = generator.m_axes[ 0 ].get_xlim()
+
+        def failToLoad() -> pd.DataFrame:
+            raise AssertionError( "Data must not be loaded again." )
+
+        aspect = ( ( 1.0, 0.0, 0.0 ), "--", 2.0, "o", 3.0 )
+        userChoices = buildUserChoices( curvesAspect={ pressureName: aspect }, customAxisLim=True, limMinX=2.0 )
+        restyled = getFigure2DGenerator( view, 1, userChoices, failToLoad )
+        self.assertIs( restyled, generator )
+        line = next( line for line in generator.m_lines if line.get_label() == pressureName )
+        self.assertEqual( line.get_color(), aspect[ 0 ] )
+        self.assertEqual( line.get_linestyle(), "--" )
+        legend = generator.m_axes[ 0 ].get_legend()
+        self.assertIn( aspect[ 0 ], [ handle.get_color() for handle in legend.legend_handles ] )
+        self.assertEqual( generator.m_axes[ 0 ].get_xlim()[ 0 ], 2.0 )
+
+        # custom limits are removed
+        userChoices = buildUserChoices( curvesAspect={ pressureName: aspect } )
+        self.assertIs( getFigure2DGenerator( view, 1, userChoices, failToLoad ), generator )
+        self.assertEqual( generator.m_axes[ 0 ].get_xlim(), xlim )
+
+        # new data or new layout plot a new figure
+        self.assertIsNot( getFigure2DGenerator( view, 2, userChoices, lambda: dataframe ), generator )
+        generator = getFigure2DGenerator( view, 2, userChoices, failToLoad )
+        self.assertIsNot( getFigure2DGenerator( view, 2, buildUserChoices( reverseXY=True ), lambda: dataframe ),
+                          generator )
+        self.assertIsNot( getFigure2DGenerator( view, None, userChoices, lambda: dataframe ),
+                          getFigure2DGenerator( view, None, userChoices, lambda: dataframe ) )
+
+        # each view owns its figure
+        otherView = SimpleNamespace()
+        otherGenerator = getFigure2DGenerator( otherView, 2, userChoices, lambda: dataframe )
+        self.assertIsNot( otherGenerator, getattr( view, FIGURE_GENERATOR_ATTRIBUTE ) )
+        self.assertIs( getFigure2DGenerator( otherView, 2, userChoices, failToLoad ), otherGenerator )
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Alexandre Benedicto
+# ruff: noqa: E402 # disable Module level import not at top of file
+import os
+import sys
+import unittest
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Self
+
+dir_path = os.path.dirname( os.path.realpath( __file__ ) )
+parent_dir_path = os.path.join( os.path.dirname( dir_path ), "src" )
+if parent_dir_path not in sys.path:
+    sys.path.append( parent_dir_path )
+
+from geos.geomechanics.model.MohrCircleCollection import MohrCircleCollection
+from geos.pv.utils.mohrCircles import functionsMohrCircle as mcf
+
+
+class TestsFunctionsMohrCircle( unittest.TestCase ):
+
+    def test_createMohrCirclesFromStressTimeSeries( self: Self ) -> None:
+        """Test that the circles are created by cell then time step, skipping the time steps not filled."""
+        stressTimeSeries: npt.NDArray[ np.float64 ] = np.full( ( 2, 3, 6 ), np.nan )
+        stressTimeSeries[ 0, 0 ] = [ -1.0, -2.0, -3.0, 0.0, 0.0, 0.0 ]
+        stressTimeSeries[ 0, 2 ] = [ -4.0, -5.0, -6.0, 0.0, 0.0, 0.0 ]
+        stressTimeSeries[ 1, 0 ] = [ -7.0, -8.0, -9.0, 0.0, 0.0, 0.0 ]
+
+        mohrCircles: MohrCircleCollection = mcf.createMohrCirclesFromStressTimeSeries(
+            stressTimeSeries, [ "1", "5" ], [ "0.0", "1.0", "2.0" ], mcf.StressConventionEnum.GEOS_STRESS_CONVENTION )
+        self.assertEqual( mohrCircles.getCircleIds(), [ "Cell_1@0.0", "Cell_1@2.0", "Cell_5@0.0" ] )
+        np.testing.assert_allclose( mohrCircles.getPrincipalComponents(),
+                                    [ [ 1.0, 2.0, 3.0 ], [ 4.0, 5.0, 6.0 ], [ 7.0, 8.0, 9.0 ] ] )
+
+        with self.assertRaises( ValueError ):
+            mcf.createMohrCirclesFromStressTimeSeries( stressTimeSeries, [ "1" ], [ "0.0" ],
+                                                       mcf.StressConventionEnum.GEOS_STRESS_CONVENTION )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Lionel Untereiner
+import importlib
+from functools import cache
+
+from xsdata.utils import text
+from xsdata_pydantic.bindings import XmlContext
+
+SCHEMA_MODULE = "geos.trame.schema_generated.schema_mod"
+
+
+class SchemaXmlContext( XmlContext ):
+    """XmlContext whose xsi type index only covers the classes of the generated schema.
+
+    The default context indexes every binding model of the interpreter and rebuilds
+    this index each time a module is imported. Since the schema does not change at
+    runtime, the index is built once from the schema module and kept afterwards.
+    """
+
+    def __init__( self, schema_module: str = SCHEMA_MODULE ) -> None:
+        """Constructor.
+
+        Input:
+            schema_module: name of the module holding the generated schema classes
+        """
+        super().__init__(
+            element_name_generator=text.pascal_case,
+            attribute_name_generator=text.camel_case,
+            models_package=schema_module,
+        )
+        self.schema_module = schema_module
+
+    def build_xsi_cache( self ) -> None:
+        """Index the schema classes by their xsi:type qualified name, only once."""
+        if self.xsi_cache:
+            return
+
+        module = importlib.import_module( self.schema_module )
+        builder = self.get_builder()
+        for clazz in vars( module ).values():
+            if isinstance( clazz, type ) and self.is_binding_model( clazz ):
+                meta = builder.build_class_meta( clazz )
+                if meta.target_qname:
+                    self.xsi_cache[ meta.target_qname ].append( clazz )
+
+    def build_schema_metadata( self ) -> None:
+        """Precompile the binding metadata of all the schema classes."""
+        self.build_xsi_cache()
+        for classes in self.xsi_cache.values():
+            for clazz in classes:
+                self.build( clazz )
+
+
+@cache
+def get_xml_context() -> SchemaXmlContext:
+    """Get the serialization context shared by the whole application.
+
+    The schema module is imported and its metadata compiled on the first call only.
+    """
+    context = SchemaXmlContext()
+    context.build_schema_metadata()
+    return context
@@ -2,19 +2,22 @@
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Lionel Untereiner
 import os
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
+import funcy
 from lxml import etree as ElementTree  # type: ignore[import-untyped]
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
-from xsdata.utils import text
-from xsdata_pydantic.bindings import DictEncoder, XmlContext, XmlParser, XmlSerializer
+from xsdata_pydantic.bindings import DictEncoder, XmlParser, XmlSerializer
 
 from geos.trame.app.data_types.renderable import Renderable
+from geos.trame.app.deck.context import get_xml_context
 from geos.trame.app.geosTrameException import GeosTrameException
 from geos.trame.app.io.xml_parser import XMLParser
 from geos.trame.app.utils.file_utils import normalize_path
-from geos.trame.schema_generated.schema_mod import ProblemType
+
+if TYPE_CHECKING:
+    from geos.trame.schema_generated.schema_mod import ProblemType
 
 
 class DeckFile( object ):
@@ -73,10 +76,9 @@ class DeckFile( object ):
         self.xml_parser.build()
         simulation_deck = self.xml_parser.get_simulation_deck()
 
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        from geos.trame.schema_generated.schema_mod import ProblemType
+
+        context = get_xml_context()
         parser = XmlParser( context=context, config=ParserConfig() )
         try:
             self.problem = parser.parse( simulation_deck, ProblemType )
@@ -85,16 +87,51 @@ class DeckFile( object ):
             raise GeosTrameException( msg ) from e
 
         encoder = DictEncoder( context=context, config=SerializerConfig( indent="  " ) )
-        self.pb_dict = { "Problem": encoder.encode( self.problem ) }
-        self.inspect_tree = build_inspect_tree( encoder.encode( self.problem ) )
+        problem_dict = encoder.encode( self.problem )
+        self.pb_dict = { "Problem": problem_dict }
+        self.inspect_tree = build_inspect_tree( problem_dict )
+
+    def rename_inspect_node( self, path: list, name: str ) -> None:
+        """Update the title of the inspect tree node located at the given path.
+
+        Input:
+            path: path of the node in the problem, e.g. ["Events", 0, "PeriodicEvent", 3]
+            name: new name of the node
+        """
+        assert self.inspect_tree is not None
+        node = _find_inspect_node( self.inspect_tree, path )
+        if node is not None:
+            node[ "title" ] = name
+
+    def refresh_inspect_children( self, path: list ) -> None:
+        """Rebuild the inspect tree nodes of the list located at the given path, leaving the rest of the tree untouched.
+
+        Input:
+            path: path of the list in the problem, e.g. ["Events", 0, "PeriodicEvent"]
+        """
+        assert self.inspect_tree is not None and self.pb_dict is not None
+        parent = _find_inspect_node( self.inspect_tree, path[ :-1 ] )
+        if parent is None:
+            return
+
+        key = path[ -1 ]
+        items = funcy.get_in( self.pb_dict[ "Problem" ], path, [] )
+        new_children = [
+            _build_inspect_tree_inner( key, item, path + [ idx ] ) for idx, item in enumerate( items )
+            if isinstance( item, dict )
+        ] if isinstance( items, list ) else []
+
+        prefix = _inspect_id( path ) + "/"
+        children = parent[ "children" ]
+        positions = [ idx for idx, child in enumerate( children ) if child[ "id" ].startswith( prefix ) ]
+        insert_at = positions[ 0 ] if positions else len( children )
+        kept = [ child for child in children if not child[ "id" ].startswith( prefix ) ]
+        parent[ "children" ] = kept[ :insert_at ] + new_children + kept[ insert_at: ]
 
     def to_str( self ) -> str:
         """Get the problem as a string."""
         config = SerializerConfig( indent="  ", xml_declaration=False )
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        context = get_xml_context()
         serializer = XmlSerializer( context=context, config=config )
         return serializer.render( self.problem )
 
@@ -137,6 +174,22 @@ def _build_inspect_tree_inner( key: str, obj: dict, path: list ) -> dict:
                     # for another_result in more_results:
                     sub_node[ "children" ].append( more_results )
 
-    sub_node[ "id" ] = "Problem/" + "/".join( map( str, path ) )
+    sub_node[ "id" ] = _inspect_id( path )
 
     return sub_node
+
+
+def _inspect_id( path: list ) -> str:
+    return "Problem/" + "/".join( map( str, path ) )
+
+
+def _find_inspect_node( inspect_tree: dict, path: list ) -> dict | None:
+    """Walk down the inspect tree following the (key, index) pairs of the given path."""
+    node = inspect_tree
+    for depth in range( 2, len( path ) + 1, 2 ):
+        node_id = _inspect_id( path[ :depth ] )
+        child = next( ( child for child in node[ "children" ] if child[ "id" ] == node_id ), None )
+        if child is None:
+            return None
+        node = child
+    return node
@@ -3,7 +3,7 @@
 # SPDX-FileContributor: Lionel Untereiner
 import os
 from collections import defaultdict
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from datetime import timedelta, datetime
 
 import dpath
@@ -12,17 +12,19 @@ from pydantic import BaseModel
 
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
-from xsdata.utils import text
-from xsdata_pydantic.bindings import DictDecoder, XmlContext, XmlSerializer, DictEncoder
+from xsdata_pydantic.bindings import DictDecoder, XmlSerializer, DictEncoder
 
 from trame_server.controller import Controller
 from trame_simput import get_simput_manager
 
+from geos.trame.app.deck.context import get_xml_context
 from geos.trame.app.deck.file import DeckFile
 from geos.trame.app.geosTrameException import GeosTrameException
-from geos.trame.schema_generated.schema_mod import ProblemType, Included, File, Functions
 from geos.trame.app.utils.file_utils import normalize_path, format_xml
 
+if TYPE_CHECKING:
+    from geos.trame.schema_generated.schema_mod import ProblemType, Functions
+
 import logging
 
 date_fmt = "%Y-%m-%d"
@@ -46,6 +48,10 @@ class DeckTree( object ):
         self._ctrl = ctrl
         self.world_origin_time = datetime( 1924, 3, 28 ).strftime( date_fmt )  # Total start date !!
         self.registered_targets: dict = {}
+        # decoded nodes by path, invalidated on update/drop of the corresponding subtree
+        self._decoded: dict[ str, BaseModel ] = {}
+        # last rendered xml of each file, reused on save while its content is unchanged
+        self._rendered_files: dict[ str, tuple[ dict, str ] ] = {}
 
     def set_input_file( self, input_filename: str ) -> None:
         """Set a new input file.
@@ -57,6 +63,8 @@ class DeckTree( object ):
         """
         try:
             self.input_filename = input_filename
+            self._decoded.clear()
+            self._rendered_files.clear()
             self.input_file = DeckFile( self.input_filename )
             self.input_folder = os.path.dirname( self.input_file.filename )
         except GeosTrameException:
@@ -84,16 +92,50 @@ class DeckTree( object ):
 
     def update( self, path: str, key: str, value: Any ) -> None:
         """Update the tree."""
-        new_path = [ int( x ) if x.isdigit() else x for x in path.split( "/" ) ]
-        new_path.append( key )
+        new_path = DeckTree._convert_to_path( path )
+        assert self.input_file is not None and self.input_file.pb_dict is not None
+        self.input_file.pb_dict = funcy.set_in( self.input_file.pb_dict, new_path + [ key ], value )
+        self._invalidate( new_path )
+        if key == "name":
+            self.input_file.rename_inspect_node( new_path[ 1: ], value )
+
+    def append( self, path: str, value: dict ) -> None:
+        """Append an encoded node to the list located at the given path."""
+        new_path = DeckTree._convert_to_path( path )
         assert self.input_file is not None and self.input_file.pb_dict is not None
-        self.input_file.pb_dict = funcy.set_in( self.input_file.pb_dict, new_path, value )
+        self.input_file.pb_dict = funcy.update_in( self.input_file.pb_dict, new_path, lambda nodes: nodes + [ value ] )
+        self._invalidate( new_path )
+        self.input_file.refresh_inspect_children( new_path[ 1: ] )
 
     def drop( self, path: str ) -> None:
         """Remove in the tree."""
-        new_path = [ int( x ) if x.isdigit() else x for x in path.split( "/" ) ]
+        new_path = DeckTree._convert_to_path( path )
         assert self.input_file is not None and self.input_file.pb_dict is not None
         self.input_file.pb_dict = funcy.del_in( self.input_file.pb_dict, new_path )
+        # removing an item of a list shifts the indexes of its next siblings
+        container_path = new_path[ :-1 ] if isinstance( new_path[ -1 ], int ) else new_path
+        self._invalidate( container_path )
+        self.input_file.refresh_inspect_children( container_path[ 1: ] )
+
+    @staticmethod
+    def _convert_to_path( path: str ) -> list[ str | int ]:
+        return [ int( x ) if x.isdigit() else x for x in path.split( "/" ) ]
+
+    @staticmethod
+    def _memo_key( path: str | list ) -> str:
+        """Normalize a node path, given as a string or a list of keys and indexes, to memoize its decoded node."""
+        parts = path.split( "/" ) if isinstance( path, str ) else map( str, path )
+        return "/".join( part for part in parts if part )
+
+    def _invalidate( self, path: list ) -> None:
+        """Forget the decoded nodes containing or contained in the given path."""
+        changed = DeckTree._memo_key( path )
+        self._decoded = {
+            node_path: node
+            for node_path, node in self._decoded.items()
+            if not ( node_path == changed or node_path.startswith( changed + "/" ) or changed.startswith( node_path +
+                                                                                                          "/" ) )
+        }
 
     def _search( self, path: str ) -> list | None:
         new_path = path.split( "/" )
@@ -103,36 +145,36 @@ class DeckTree( object ):
         return dpath.values( self.input_file.pb_dict, new_path )
 
     def decode( self, path: str ) -> BaseModel | None:
-        """Decode the given file to a BaseModel."""
-        data = self._search( path )
+        """Decode the given file to a BaseModel.
+
+        Decoded nodes are memoized by path until their subtree is updated or dropped.
+        """
+        key = DeckTree._memo_key( path )
+        if key in self._decoded:
+            return self._decoded[ key ]
+
+        data = self._search( key )
         if data is None:
             return None
 
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        context = get_xml_context()
         decoder = DictDecoder( context=context, config=ParserConfig() )
-        return decoder.decode( data[ 0 ] )
+        node: BaseModel = decoder.decode( data[ 0 ] )
+        self._decoded[ key ] = node
+        return node
 
     @staticmethod
     def encode_data( data: BaseModel ) -> dict:
         """Convert a data to a xml serializable file."""
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        context = get_xml_context()
         encoder = DictEncoder( context=context, config=SerializerConfig( indent="  " ) )
         nodeDict: dict = encoder.encode( data )
         return nodeDict
 
     @staticmethod
-    def decode_data( data: dict ) -> ProblemType:
+    def decode_data( data: dict ) -> "ProblemType":
         """Convert a data to a xml serializable file."""
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        context = get_xml_context()
         decoder = DictDecoder( context=context, config=ParserConfig() )
         node: ProblemType = decoder.decode( data )
         return node
@@ -140,10 +182,7 @@ class DeckTree( object ):
     @staticmethod
     def to_xml( obj: BaseModel ) -> str:
         """Convert the given obj to xml."""
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
+        context = get_xml_context()
 
         config = SerializerConfig( indent="  ", xml_declaration=False, ignore_default_attributes=True )
         serializer = XmlSerializer( context=context, config=config )
@@ -187,7 +226,7 @@ class DeckTree( object ):
 
         return timeline
 
-    def plots( self ) -> list[ Functions ]:
+    def plots( self ) -> list[ "Functions" ]:
         """Get the functions in the current problem."""
         assert self.input_file is not None and self.input_file.problem is not None
         return self.input_file.problem.functions
@@ -198,17 +237,25 @@ class DeckTree( object ):
         if pb is None:
             return
         files = self._split( pb )
+        has_changed_properties = self._has_changed_properties()
 
         for filepath, content in files.items():
-            model_loaded: ProblemType = DeckTree.decode_data( content )
-            model_with_changes: ProblemType = self._apply_changed_properties( model_loaded )
+            # pb_dict is updated by copy, so the unchanged tags are the same objects as in the rendered
+            # content and == compares them quickly, Python comparing the identical elements by identity first
+            rendered = self._rendered_files.get( filepath )
+            if rendered is not None and rendered[ 0 ] == content and not has_changed_properties:
+                model_as_xml: str = rendered[ 1 ]
+            else:
+                model_loaded: ProblemType = DeckTree.decode_data( content )
+                model_with_changes: ProblemType = self._apply_changed_properties( model_loaded )
 
-            assert ( self.input_file is not None and self.input_file.xml_parser is not None )
-            if self.input_file.xml_parser.contains_include_files():
-                includeName: str = self.input_file.xml_parser.get_relative_path_of_file( filepath )
-                DeckTree._append_include_file( model_with_changes, includeName )
+                assert ( self.input_file is not None and self.input_file.xml_parser is not None )
+                if self.input_file.xml_parser.contains_include_files():
+                    includeName: str = self.input_file.xml_parser.get_relative_path_of_file( filepath )
+                    DeckTree._append_include_file( model_with_changes, includeName )
 
-            model_as_xml: str = DeckTree.to_xml( model_with_changes )
+                model_as_xml = DeckTree.to_xml( model_with_changes )
+                self._rendered_files[ filepath ] = ( content, model_as_xml )
 
             basename = os.path.basename( filepath )
             assert self.input_folder is not None
@@ -221,7 +268,7 @@ class DeckTree( object ):
             self._ctrl.on_add_success( title="File saved", message=f"File {basename} has been saved." )
 
     @staticmethod
-    def _append_include_file( model: ProblemType, included_file_path: str ) -> None:
+    def _append_include_file( model: "ProblemType", included_file_path: str ) -> None:
         """Append an Included object which follows this structure according to the documentation.
 
         <Included>
@@ -235,6 +282,8 @@ class DeckTree( object ):
         if len( included_file_path ) == 0:
             return
 
+        from geos.trame.schema_generated.schema_mod import File, Included
+
         includedTag = Included()
         includedTag.file.append( File( name=DeckTree._append_id( included_file_path ) ) )
 
@@ -278,7 +327,12 @@ class DeckTree( object ):
         """
         return "".join( [ "_" + char.lower() if char.isupper() else char for char in content ] ).lstrip( "_" )
 
-    def _apply_changed_properties( self, model: ProblemType ) -> ProblemType:
+    def _has_changed_properties( self ) -> bool:
+        """Whether some 'properties' edited in the simput_manager are not committed yet."""
+        manager = get_simput_manager( self._sm_id )
+        return len( manager.proxymanager.dirty_proxy_data ) > 0
+
+    def _apply_changed_properties( self, model: "ProblemType" ) -> "ProblemType":
         """Retrieves all edited 'properties' from the simput_manager and apply it to a given model."""
         manager = get_simput_manager( self._sm_id )
         modified_proxy_ids: set[ str ] = manager.proxymanager.dirty_proxy_data
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Kitware
-from typing import Type, Any
+from typing import Type, Any, TYPE_CHECKING
 
 import numpy as np
 from trame_client.widgets.core import AbstractElement
@@ -12,12 +12,9 @@ from geos.trame.app.geosTrameException import GeosTrameException
 from geos.trame.app.ui.viewer.regionViewer import RegionViewer
 from geos.trame.app.ui.viewer.wellViewer import WellViewer
 from geos.trame.app.utils.pv_utils import read_unstructured_grid, split_vector_arrays
-from geos.trame.schema_generated.schema_mod import (
-    Vtkmesh,
-    Vtkwell,
-    Perforation,
-    InternalWell,
-)
+
+if TYPE_CHECKING:
+    from geos.trame.schema_generated.schema_mod import InternalWell, Vtkmesh, Vtkwell
 
 
 class DataLoader( AbstractElement ):
@@ -42,12 +39,15 @@ class DataLoader( AbstractElement ):
 
     def load_vtkmesh_from_id( self, node_id: str ) -> None:
         """Load the data at the given id if none is already loaded."""
+        from geos.trame.schema_generated.schema_mod import Vtkmesh
+
         if self.region_viewer.input.number_of_cells == 0:
             active_block = self.source.decode( node_id )
             if isinstance( active_block, Vtkmesh ):
                 self._read_mesh( active_block )
 
     def _update_object_state( self, object_state: tuple[ str, bool ], **_: dict ) -> None:
+        from geos.trame.schema_generated.schema_mod import InternalWell, Perforation, Vtkmesh, Vtkwell
 
         path, show_obj = object_state
 
@@ -88,21 +88,21 @@ class DataLoader( AbstractElement ):
 
         self.ctrl.update_viewer( active_block, path, show_obj )
 
-    def _update_vtkmesh( self, mesh: Vtkmesh, show: bool ) -> None:
+    def _update_vtkmesh( self, mesh: "Vtkmesh", show: bool ) -> None:
         if not show:
             self.region_viewer.reset()
             return
 
         self._read_mesh( mesh )
 
-    def _read_mesh( self, mesh: Vtkmesh ) -> None:
+    def _read_mesh( self, mesh: "Vtkmesh" ) -> None:
         unstructured_grid = read_unstructured_grid( self.source.get_abs_path( mesh.file ) )
         split_vector_arrays( unstructured_grid )
 
         unstructured_grid.set_active_scalars( unstructured_grid.cell_data.keys()[ 0 ] )
         self.region_viewer.add_mesh( unstructured_grid )
 
-    def _update_vtkwell( self, well: Vtkwell, path: str, show: bool ) -> None:
+    def _update_vtkwell( self, well: "Vtkwell", path: str, show: bool ) -> None:
         if not show:
             self.well_viewer.remove( path )
             return
@@ -112,7 +112,7 @@ class DataLoader( AbstractElement ):
             raise GeosTrameException( f"Expected PolyData, got {type(well_polydata).__name__}" )
         self.well_viewer.add_mesh( well_polydata, path )
 
-    def _update_internalwell( self, well: InternalWell, path: str, show: bool ) -> None:
+    def _update_internalwell( self, well: "InternalWell", path: str, show: bool ) -> None:
         """Used to control the visibility of the InternalWellType.
 
         This method will create the mesh if it doesn't exist.
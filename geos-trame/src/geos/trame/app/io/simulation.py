@@ -9,6 +9,7 @@ from trame_server.core import Server
 
 from geos.trame.app.io.ssh_tools import Authentificator
 from geos.trame.app.utils.async_file_watcher import AsyncPeriodicRunner
+from geos.trame.app.utils.job_monitor import JobMonitor, LogTail, parse_progress
 
 from jinja2 import Environment, FileSystemLoader
 import paramiko
@@ -64,6 +65,9 @@ class Simulation:
         }
         self._job_status_watcher: Optional[ AsyncPeriodicRunner ] = None
         self._job_status_watcher_period_ms = 2000
+        # logs readable from this machine are followed on change, the others are read remotely from their last offset
+        self._job_monitor: Optional[ JobMonitor ] = None
+        self._remote_logs: dict[ str, LogTail ] = {}
 
         #define triggers
         @controller.trigger( "run_try_login" )
@@ -177,51 +181,99 @@ class Simulation:
     def _stop_result_streams( self ) -> None:
         if self._job_status_watcher is not None:
             self._job_status_watcher.stop()
+        if self._job_monitor is not None:
+            self._job_monitor.close()
+            self._job_monitor = None
+        self._remote_logs.clear()
 
     def _start_result_streams( self ) -> None:
         self._stop_result_streams()
         self._job_status_watcher = AsyncPeriodicRunner( self.check_jobs, period_ms=self._job_status_watcher_period_ms )
 
+        # when the cluster shares the remote folder with this machine, the logs are followed through filesystem
+        # notifications
+        cluster = Authentificator.get_cluster( self._server.state.selected_cluster_name )
+        if cluster is None or not cluster.shared_filesystem or not self._server.state.simulation_remote_path:
+            return
+        log_dir = Path( os.path.expandvars( self._server.state.simulation_remote_path ) )
+        if not log_dir.is_dir():
+            print( f"Shared simulation folder {log_dir} is not mounted here, the job logs are read remotely." )
+            return
+        self._job_monitor = JobMonitor( self._on_job_changed )
+        for job in self._server.state.job_ids:
+            self._job_monitor.add_job( job[ 'job_id' ], log_dir / f"job_GEOS_{job['job_id']}.out" )
+
+    def _on_job_changed( self, job_id: str, changes: dict[ str, str ] ) -> None:
+        """Push the changes of a job followed by the job monitor to the UI."""
+        jid = self._server.state.job_ids
+        for job in jid:
+            if job[ 'job_id' ] == job_id:
+                # the scheduler status is kept once known
+                job.update( { key: value for key, value in changes.items() if key != 'status' or 'status' not in job } )
+        self._server.state.job_ids = jid
+        self._server.state.dirty( "job_ids" )
+        self._server.state.flush()
+
     def check_jobs( self ) -> None:
-        """Check on running jobs and update their names and progresses."""
-        if Authentificator.ssh_client:
-            jid = self._server.state.job_ids
-            for index, job in enumerate( jid ):
-                job_id = job[ 'job_id' ]
-                _, sout, _ = Authentificator._execute_remote_command(
-                    Authentificator.ssh_client, f'sacct -j {job_id} -o JobID,JobName,State --noheader' )
-                job_line = sout.strip().split( "\n" )[ -1 ]
-
-                jid[ index ][ 'status' ] = job_line.split()[ 2 ]
-                jid[ index ][ 'name' ] = job_line.split()[ 1 ]
-
-                if ( jid[ index ][ 'status' ] == 'RUNNING' ):
-                    _, sout, _ = Authentificator._execute_remote_command(
-                        Authentificator.ssh_client,
-                        f"sacct -j {job_id} -o ElapsedRaw,TimelimitRaw --noheader --parsable2 | head -n 1 " )
-                    progress_line = sout.strip().split( "|" )
-                    jid[ index ][ 'slprogress' ] = str(
-                        float( progress_line[ 0 ] ) / float( progress_line[ 1 ] ) / 60 * 100 )
-
-                    # getthe completed status
-                    pattern = re.compile( r'\((\d+(?:\.\d+)?)%\s*completed\)' )
-                    _, sout, _ = Authentificator._execute_remote_command(
-                        Authentificator.ssh_client,
-                        f"grep \"completed\" {self._server.state.simulation_remote_path}/job_GEOS_{job_id}.out | tail -1"
-                    )
-                    m = pattern.search( sout.strip() )
-                    if m:
-                        jid[ index ][ 'simprogress' ] = str( m.group( 1 ) )
-
-                print(
-                    f"{job_line}-{job_id}\n job id:{jid[index]['job_id']}\n status:{jid[index]['status']}\n name:{jid[index]['name']} \n --- \n"
-                )
+        """Check on running jobs and update their names and progresses.
+
+        The scheduler is queried once for all the jobs, the logs are only read from where the
+        previous check stopped and the UI is only updated if a job changed.
+        """
+        jid = self._server.state.job_ids
+        if not Authentificator.ssh_client or not jid:
+            return None
+
+        job_ids = ",".join( job[ 'job_id' ] for job in jid )
+        _, sout, _ = Authentificator._execute_remote_command(
+            Authentificator.ssh_client,
+            f'sacct -j {job_ids} -X -o JobID,JobName,State,ElapsedRaw,TimelimitRaw --noheader --parsable2' )
+        job_lines = { line.split( "|" )[ 0 ]: line.split( "|" ) for line in sout.strip().split( "\n" ) if line }
+
+        changed = False
+        for job in jid:
+            job_id = job[ 'job_id' ]
+            if job_id not in job_lines:
+                continue
+            _, name, status, elapsed, time_limit = job_lines[ job_id ][ :5 ]
+            update = { 'status': status.split()[ 0 ] if status else status, 'name': name }
+
+            if update[ 'status' ] == 'RUNNING':
+                if elapsed and time_limit and float( time_limit ) > 0:
+                    update[ 'slprogress' ] = str( float( elapsed ) / float( time_limit ) / 60 * 100 )
+                if self._job_monitor is None:
+                    progress = self._read_remote_progress( job_id )
+                    if progress is not None:
+                        update[ 'simprogress' ] = progress
+
+            if any( job.get( key ) != value for key, value in update.items() ):
+                job.update( update )
+                changed = True
+                print( f"job id:{job_id}\n status:{job['status']}\n name:{job['name']} \n --- \n" )
+
+        if changed:
             self._server.state.job_ids = jid
             self._server.state.dirty( "job_ids" )
             self._server.state.flush()
 
         return None
 
+    def _read_remote_progress( self, job_id: str ) -> Optional[ str ]:
+        """Get the last progress written in the remote log of a job since the previous read."""
+        tail = self._remote_logs.setdefault(
+            job_id, LogTail( Path( self._server.state.simulation_remote_path ) / f"job_GEOS_{job_id}.out" ) )
+        # the size is read first so that the offset matches the bytes read,
+        # a log truncated or replaced since the previous read is read again from the start
+        _, sout, _ = Authentificator._execute_remote_command(
+            Authentificator.ssh_client, f"size=$(stat -c %s {tail.path}) && echo $size && offset={tail.offset} && "
+            "if [ $size -lt $offset ]; then offset=0; fi && "
+            f"tail -c +$(( offset + 1 )) {tail.path} | head -c $(( size - offset )) | grep completed | tail -1" )
+        lines = sout.strip().split( "\n" )
+        if not lines[ 0 ].isdigit():
+            return None
+        tail.offset = int( lines[ 0 ] )
+        return parse_progress( lines[ 1: ] )
+
     @staticmethod
     def render_and_run( template_name: str, dest_name: str, server: Server, **kwargs: Any ) -> str:
         """Render the slurm template and run it. Return it job_id."""
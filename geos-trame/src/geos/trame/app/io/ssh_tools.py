@@ -28,6 +28,8 @@ class SimulationConstant:
     n_nodes: int
     cores_per_node: int
     mem_per_node: int
+    # whether simulation_remote_path is also mounted on the machine running the UI
+    shared_filesystem: bool = False
 
 
 #If proxyJump are needed
@@ -3,16 +3,63 @@
 # SPDX-FileContributor: Lionel Untereiner
 import sys
 import re
+from copy import deepcopy
 from os.path import expandvars
 from pathlib import Path
 
 from lxml import etree as ElementTree
 from lxml.etree import XMLSyntaxError
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 from geos.trame.app.geosTrameException import GeosTrameException
 
+# whitespaces used for indentation inside attribute values
+_INDENTATION = re.compile( r"\s{2,}" )
+
+# maximum number of parsed files kept in memory
+MAX_PARSED_FILES = 32
+
+# parsed files by resolved path, with the modification time and size they were parsed at,
+# from the least to the most recently used
+_parsed_files: OrderedDict[ Path, tuple[ tuple[ int, int ], ElementTree.Element ] ] = OrderedDict()
+
+
+def load_xml_file( path: Path ) -> ElementTree.Element:
+    """Load a xml file, reusing the previous parsing while the file is not modified.
+
+    Comments and blank text are removed and the indentation whitespaces of the attribute
+    values are collapsed. The cached tree is never exposed, a copy of it is returned
+    since the caller may merge it into another tree. Only the MAX_PARSED_FILES most
+    recently loaded files are kept parsed.
+
+    Args:
+        path (Path): The path of the xml file.
+
+    Returns:
+        lxml.etree.Element: A copy of the root node of the file.
+
+    Raises:
+        XMLSyntaxError: If the file is not a valid xml file.
+    """
+    path = path.resolve()
+    stat = path.stat()
+    signature = ( stat.st_mtime_ns, stat.st_size )
+    cached = _parsed_files.get( path )
+    if cached is None or cached[ 0 ] != signature:
+        parser = ElementTree.XMLParser( remove_comments=True, remove_blank_text=True )
+        root = ElementTree.parse( path, parser=parser ).getroot()
+        for node in root.iter():
+            for key, value in node.attrib.items():
+                if _INDENTATION.search( value ):
+                    node.set( key, _INDENTATION.sub( " ", value ) )
+        cached = ( signature, root )
+        _parsed_files[ path ] = cached
+    _parsed_files.move_to_end( path )
+    while len( _parsed_files ) > MAX_PARSED_FILES:
+        _parsed_files.popitem( last=False )
+    return deepcopy( cached[ 1 ] )
+
 
 class XMLParser( object ):
     """Class used to parse a valid XML geos file and construct a link between each file when they are included.
@@ -31,9 +78,7 @@ class XMLParser( object ):
         self._is_valid = True
 
         try:
-            parser = ElementTree.XMLParser( remove_comments=True, remove_blank_text=True )
-            tree = ElementTree.parse( expanded_file, parser=parser )
-            self.root = tree.getroot()
+            self.root = load_xml_file( expanded_file )
         except XMLSyntaxError as err:
             error_msg = "Invalid XML file. Cannot load " + str( expanded_file )
             error_msg += ". Outputted error:\n" + err.msg
@@ -87,12 +132,7 @@ class XMLParser( object ):
         for include_node in self.root.findall( "Included" ):
             self.root.remove( include_node )
 
-        for neighbor in self.root.iter():
-            for key in neighbor.attrib:
-                # remove unnecessary whitespaces for indentation
-                s = re.sub( r"\s{2,}", " ", neighbor.get( key ) )
-                neighbor.set( key, s )
-
+        # whitespaces of the attributes were already collapsed when loading the files
         self.simulation_deck = self.root
 
     def _merge_xml_nodes(
@@ -188,11 +228,9 @@ class XMLParser( object ):
             )
             raise Exception( "Check included file path!" )
 
-        # Load target xml
+        # Load target xml, only parsed again if modified
         try:
-            parser = ElementTree.XMLParser( remove_comments=True, remove_blank_text=True )
-            includeTree = ElementTree.parse( included_file_path, parser )
-            includeRoot = includeTree.getroot()
+            includeRoot = load_xml_file( included_file_path )
         except XMLSyntaxError as err:
             print( "\nCould not load included file: %s" % included_file_path )
             print( err.msg )
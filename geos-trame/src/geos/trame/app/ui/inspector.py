@@ -15,7 +15,6 @@ from geos.trame.app.data_types.renderable import Renderable
 from geos.trame.app.data_types.tree_node import TreeNode
 from geos.trame.app.deck.tree import DeckTree
 from geos.trame.app.utils.dict_utils import iterate_nested_dict
-from geos.trame.schema_generated.schema_mod import ProblemType
 
 vuetify.enable_lab()
 
@@ -57,7 +56,8 @@ class DeckInspector( vuetify.VTreeview ):
         if source.input_file is None:
             return
 
-        self._set_source( source.input_file.problem )
+        assert source.input_file.pb_dict is not None
+        self._set_source( source.input_file.pb_dict[ "Problem" ] )
 
         def _on_change( topic: str, ids: list | None = None ) -> None:
             if ids is not None and topic == "changed":
@@ -109,31 +109,14 @@ class DeckInspector( vuetify.VTreeview ):
         """Getter for source."""
         return self._source
 
-    # TODO
-    # v should be a proxy like the one in paraview simple
-    # maybe it can be Any of schema_mod (e.g. Problem)
-    def _set_source( self, v: ProblemType | None ) -> None:
-
-        # TODO replace this snippet
-        from xsdata.formats.dataclass.serializers.config import SerializerConfig
-        from xsdata.utils import text
-        from xsdata_pydantic.bindings import DictEncoder, XmlContext
-
-        context = XmlContext(
-            element_name_generator=text.pascal_case,
-            attribute_name_generator=text.camel_case,
-        )
-
-        encoder = DictEncoder( context=context, config=SerializerConfig( indent="  " ) )
-        self._source = encoder.encode( v )
-        assert self._source is not None
-        # with this one by passing v as Problem
-        # self._source = v
+    def _set_source( self, v: dict | None ) -> None:
+        # v is the problem as encoded by the deck file, no need to encode it again
+        self._source = v
 
         if v is None:
             self.state.deck_tree = []
         else:
-            self.state.deck_tree = _object_to_tree( self._source ).get( "children", [] )
+            self.state.deck_tree = _object_to_tree( v ).get( "children", [] )
 
         for path in iterate_nested_dict( self.state.deck_tree ):
 
@@ -9,7 +9,6 @@ import logging
 from geos.trame.app.gantt_chart.widgets.gantt_chart import Gantt
 from trame.widgets import vuetify3 as vuetify
 from trame_simput import get_simput_manager
-from geos.trame.schema_generated.schema_mod import PeriodicEvent
 
 from geos.trame.app.deck.tree import DeckTree
 
@@ -55,6 +54,7 @@ class TimelineEditor( vuetify.VCard ):
             # self.simput_manager.proxymanager.on( _on_change )
 
     def _updated_tasks( self, *tasks: Any, **_: Any ) -> None:
+        from geos.trame.schema_generated.schema_mod import PeriodicEvent
 
         rm_list = ( { t_id
                       for t in self.state.tasks if ( t_id := t.get( "id" ) ) is not None } -
@@ -83,8 +83,8 @@ class TimelineEditor( vuetify.VCard ):
 
             #if added Event then
             if not self.tree._search( f'Problem/Events/0/PeriodicEvent/{t["id"]}' ):
-                self.tree.input_file.pb_dict[ 'Problem' ][ 'Events' ][ 0 ][ 'PeriodicEvent' ].append(
-                    self.tree.encode_data( PeriodicEvent( name="test" ) ) )
+                self.tree.append( 'Problem/Events/0/PeriodicEvent',
+                                  self.tree.encode_data( PeriodicEvent( name="test" ) ) )
                 proxy = self.simput_manager.proxymanager.create( proxy_type='PeriodicEvent',
                                                                  proxy_id=f'Problem/Events/0/PeriodicEvent/{t["id"]}',
                                                                  initial_values=self.tree.encode_data(
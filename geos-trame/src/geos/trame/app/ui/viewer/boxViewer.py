@@ -3,11 +3,13 @@
 # SPDX-FileContributor: Lucas Givord - Kitware
 import pyvista as pv
 
-from geos.trame.schema_generated.schema_mod import Box
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 import re
 
+if TYPE_CHECKING:
+    from geos.trame.schema_generated.schema_mod import Box
+
 
 class BoxViewer:
     """A BoxViewer represents a Box and its intersected cell in a mesh.
@@ -15,11 +17,11 @@ class BoxViewer:
     This mesh is represented in GEOS with a Box.
     """
 
-    def __init__( self, mesh: pv.UnstructuredGrid, box: Box ) -> None:
+    def __init__( self, mesh: pv.UnstructuredGrid, box: "Box" ) -> None:
         """Initialize the BoxViewer with a mesh and a box."""
         self._mesh: pv.UnstructuredGrid = mesh
 
-        self._box: Box = box
+        self._box: "Box" = box
         self._box_polydata: pv.PolyData | None = None
         self._box_polydata_actor: pv.Actor | None = None
 
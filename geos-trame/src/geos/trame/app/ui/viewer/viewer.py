@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Lucas Givord - Kitware
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 import pyvista as pv
 from pydantic import BaseModel
@@ -15,7 +15,9 @@ from geos.trame.app.ui.viewer.boxViewer import BoxViewer
 from geos.trame.app.ui.viewer.perforationViewer import PerforationViewer
 from geos.trame.app.ui.viewer.regionViewer import RegionViewer
 from geos.trame.app.ui.viewer.wellViewer import WellViewer
-from geos.trame.schema_generated.schema_mod import Box, Vtkmesh, Vtkwell, InternalWell, Perforation
+
+if TYPE_CHECKING:
+    from geos.trame.schema_generated.schema_mod import Box, Perforation
 
 pv.OFF_SCREEN = True
 
@@ -131,6 +133,8 @@ class DeckViewer( vuetify.VCard ):
 
         object_state  : array used to store path to the data and if we want to show it or not.
         """
+        from geos.trame.schema_generated.schema_mod import Box, Vtkmesh, Vtkwell, InternalWell, Perforation
+
         if isinstance( active_block, Vtkmesh ):
             self._update_vtkmesh( show_obj )
 
@@ -334,7 +338,7 @@ class DeckViewer( vuetify.VCard ):
                                        tubing=False,
                                        outline_translation=False )
 
-    def _update_perforation( self, perforation: Perforation, show: bool, path: str ) -> None:
+    def _update_perforation( self, perforation: "Perforation", show: bool, path: str ) -> None:
         """Generate VTK dataset from a perforation."""
         if not show:
             if path in self._perforations:
@@ -391,7 +395,7 @@ class DeckViewer( vuetify.VCard ):
 
         self._perforations[ path ] = saved_perforation
 
-    def _update_box( self, active_block: Box, show_obj: bool ) -> None:
+    def _update_box( self, active_block: "Box", show_obj: bool ) -> None:
         """Generate and display a Box and inner cell(s) from the mesh."""
         if self.region_engine.input.number_of_cells == 0 and show_obj:
             self.ctrl.on_add_warning(
@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Jacques Franc
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+from geos.trame.app.utils.async_file_watcher import AsyncPeriodicRunner
+
+# progress reported by GEOS in its log, e.g. "(12.5% completed)"
+PROGRESS_PATTERN = re.compile( r"\((\d+(?:\.\d+)?)%\s*completed\)" )
+
+# inotify events of a file written, closed or moved into a watched directory
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+# header of an inotify event: watch descriptor, mask, cookie and length of the name
+_EVENT_HEADER = struct.Struct( "iIII" )
+
+
+def _load_inotify() -> Optional[ ctypes.CDLL ]:
+    """Return the C library if it provides inotify, None otherwise."""
+    if not sys.platform.startswith( "linux" ):
+        return None
+    try:
+        libc = ctypes.CDLL( ctypes.util.find_library( "c" ) or "libc.so.6", use_errno=True )
+    except OSError:
+        return None
+    if not hasattr( libc, "inotify_init1" ):
+        return None
+    return libc
+
+
+def parse_progress( lines: list[ str ] ) -> Optional[ str ]:
+    """Return the last progress reported in the given log lines, None if there is none."""
+    for line in reversed( lines ):
+        match = PROGRESS_PATTERN.search( line )
+        if match:
+            return match.group( 1 )
+    return None
+
+
+class LogTail:
+    """Reads the lines appended to a log file since the previous read.
+
+    The byte offset of the end of the last read is kept, so a log is never read twice.
+    An incomplete last line is kept until its end is written.
+    """
+
+    def __init__( self, path: Path ) -> None:
+        """Init the tail at the beginning of the file."""
+        self.path = path
+        self.offset = 0
+        self._partial = b""
+
+    def read_lines( self ) -> list[ str ]:
+        """Read the complete lines appended to the file, the file is read again from the start if truncated."""
+        try:
+            with open( self.path, "rb" ) as file:
+                if os.fstat( file.fileno() ).st_size < self.offset:
+                    self.offset = 0
+                    self._partial = b""
+                file.seek( self.offset )
+                data = file.read()
+        except FileNotFoundError:
+            return []
+        return self.feed( data )
+
+    def feed( self, data: bytes ) -> list[ str ]:
+        """Append the given bytes read after the current offset and return the completed lines."""
+        self.offset += len( data )
+        *lines, self._partial = ( self._partial + data ).split( b"\n" )
+        return [ line.decode( errors="replace" ).rstrip( "\r" ) for line in lines ]
+
+
+class DirectoryWatcher:
+    """Calls back with the path of the files created or modified in the watched directories.
+
+    Relies on inotify notifications on Linux. On other platforms, or if inotify cannot be
+    initialized, the content of the watched directories is polled at the given period.
+    The watcher must be created from the running event loop which calls back.
+    """
+
+    def __init__( self, callback: Callable[ [ Path ], None ], poll_period_ms: int = 1000 ) -> None:
+        """Init the watcher, without any directory watched."""
+        # raises before any resource is acquired if there is no running loop
+        self._loop = asyncio.get_running_loop()
+        self.callback = callback
+        self.poll_period_ms = poll_period_ms
+        self._directories: dict[ Path, int ] = {}
+        self._watched_dirs: dict[ int, Path ] = {}
+        self._snapshots: dict[ Path, dict[ Path, tuple[ int, int ] ] ] = {}
+        self._poller: Optional[ AsyncPeriodicRunner ] = None
+        self._fd = -1
+
+        self._libc = _load_inotify()
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1( os.O_NONBLOCK | os.O_CLOEXEC )
+        if self._fd >= 0:
+            self._loop.add_reader( self._fd, self._read_events )
+        else:
+            self._poller = AsyncPeriodicRunner( self._poll_directories, period_ms=poll_period_ms )
+
+    def __del__( self ) -> None:
+        """Release the notifications on destruction."""
+        self.close()
+
+    @property
+    def uses_notifications( self ) -> bool:
+        """Whether filesystem notifications are used instead of polling."""
+        return self._fd >= 0
+
+    def watch( self, directory: Path ) -> None:
+        """Start watching the given existing directory."""
+        directory = Path( directory ).resolve()
+        if directory in self._directories:
+            return
+        if not directory.is_dir():
+            raise FileNotFoundError( f"Cannot watch {directory}, it is not a directory." )
+
+        if self._fd >= 0:
+            assert self._libc is not None
+            wd = self._libc.inotify_add_watch( self._fd, os.fsencode( directory ), _WATCH_MASK )
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError( errno, os.strerror( errno ), str( directory ) )
+            self._watched_dirs[ wd ] = directory
+        else:
+            wd = -1
+            self._snapshots[ directory ] = self._scan( directory )
+        self._directories[ directory ] = wd
+
+    def unwatch( self, directory: Path ) -> None:
+        """Stop watching the given directory."""
+        wd = self._directories.pop( Path( directory ).resolve(), None )
+        if wd is None:
+            return
+        if wd >= 0:
+            assert self._libc is not None
+            self._watched_dirs.pop( wd, None )
+            self._libc.inotify_rm_watch( self._fd, wd )
+        else:
+            self._snapshots.pop( Path( directory ).resolve(), None )
+
+    def close( self ) -> None:
+        """Stop watching all the directories, also called on a watcher whose init failed."""
+        if getattr( self, "_fd", -1 ) >= 0:
+            # the event loop may already be closed
+            with contextlib.suppress( RuntimeError ):
+                self._loop.remove_reader( self._fd )
+            os.close( self._fd )
+            self._fd = -1
+        if getattr( self, "_poller", None ) is not None:
+            self._poller.stop()
+            self._poller = None
+        for watched in ( "_directories", "_watched_dirs", "_snapshots" ):
+            getattr( self, watched, {} ).clear()
+
+    def _read_events( self ) -> None:
+        """Read the pending inotify events and call back once per modified file."""
+        changed: dict[ Path, None ] = {}
+        while True:
+            try:
+                data = os.read( self._fd, 64 * 1024 )
+            except BlockingIOError:
+                break
+            position = 0
+            while position < len( data ):
+                wd, _, _, length = _EVENT_HEADER.unpack_from( data, position )
+                position += _EVENT_HEADER.size
+                name = data[ position:position + length ].rstrip( b"\0" )
+                position += length
+                directory = self._watched_dirs.get( wd )
+                if directory is not None and name:
+                    changed[ directory / os.fsdecode( name ) ] = None
+
+        for path in changed:
+            self.callback( path )
+
+    @staticmethod
+    def _scan( directory: Path ) -> dict[ Path, tuple[ int, int ] ]:
+        """Return the modification time and size of the files of a directory."""
+        try:
+            entries = list( os.scandir( directory ) )
+        except FileNotFoundError:
+            return {}
+        snapshot = {}
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[ Path( entry.path ) ] = ( stat.st_mtime_ns, stat.st_size )
+        return snapshot
+
+    def _poll_directories( self ) -> None:
+        """Call back with the files that changed since the previous scan."""
+        for directory in list( self._snapshots ):
+            snapshot = self._scan( directory )
+            previous = self._snapshots[ directory ]
+            self._snapshots[ directory ] = snapshot
+            for path, signature in snapshot.items():
+                if previous.get( path ) != signature:
+                    self.callback( path )
+
+
+class JobMonitor:
+    """Follows the GEOS logs of local jobs and reports the changes of their state.
+
+    The logs are only read when they are modified, starting from where the previous read
+    stopped, and the callback is only called when the state of a job changes. The monitor
+    must be created from the running event loop which calls back.
+    """
+
+    def __init__( self, on_change: Callable[ [ str, dict[ str, str ] ], None ], poll_period_ms: int = 1000 ) -> None:
+        """Init the monitor.
+
+        Args:
+            on_change: called with the job id and the fields of the job state that changed
+            poll_period_ms: period of the directory polling when notifications are not available
+        """
+        self.on_change = on_change
+        self._logs: dict[ Path, tuple[ str, LogTail ] ] = {}
+        self._states: dict[ str, dict[ str, str ] ] = {}
+        self._watcher = DirectoryWatcher( self._on_file_changed, poll_period_ms )
+
+    def __del__( self ) -> None:
+        """Stop watching on destruction."""
+        self.close()
+
+    def add_job( self, job_id: str, log_file: Path ) -> None:
+        """Start following the log of a job, its directory must exist."""
+        log_file = Path( log_file ).resolve()
+        self._logs[ log_file ] = ( job_id, LogTail( log_file ) )
+        self._states[ job_id ] = {}
+        self._watcher.watch( log_file.parent )
+        self._on_file_changed( log_file )
+
+    def remove_job( self, job_id: str ) -> None:
+        """Stop following the log of a job."""
+        self._states.pop( job_id, None )
+        for log_file, ( log_job_id, _ ) in list( self._logs.items() ):
+            if log_job_id == job_id:
+                del self._logs[ log_file ]
+                if all( path.parent != log_file.parent for path in self._logs ):
+                    self._watcher.unwatch( log_file.parent )
+
+    def get_state( self, job_id: str ) -> dict[ str, str ]:
+        """Return the last known state of a job."""
+        return dict( self._states.get( job_id, {} ) )
+
+    def close( self ) -> None:
+        """Stop following all the jobs, also called on a monitor whose init failed."""
+        if hasattr( self, "_watcher" ):
+            self._watcher.close()
+        self._logs.clear()
+
+    def _on_file_changed( self, path: Path ) -> None:
+        log = self._logs.get( path )
+        if log is None:
+            return
+
+        job_id, tail = log
+        lines = tail.read_lines()
+        if not lines:
+            return
+
+        state = self._states[ job_id ]
+        changes = { "status": "RUNNING" } if not state else {}
+        progress = parse_progress( lines )
+        if progress is not None and progress != state.get( "simprogress" ):
+            changes[ "simprogress" ] = progress
+
+        if changes:
+            state.update( changes )
+            self.on_change( job_id, changes )
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Lionel Untereiner
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.utils import text
+from xsdata_pydantic.bindings import DictDecoder, XmlContext
+
+from geos.trame.app.deck.context import SCHEMA_MODULE, get_xml_context
+from geos.trame.app.deck.tree import DeckTree
+from geos.trame.app.utils.dict_utils import iterate_nested_dict
+
+# run the subprocesses with the same import paths as the test session
+ENV = { **os.environ, "PYTHONPATH": os.pathsep.join( sys.path ) }
+
+
+def _deck_paths( tree: DeckTree ) -> list[ str ]:
+    return list( iterate_nested_dict( tree.get_tree()[ "children" ] ) )
+
+
+def test_context_is_shared() -> None:
+    """Test that the serialization context is created once and only indexes schema classes."""
+    context = get_xml_context()
+    assert context is get_xml_context()
+    assert all( clazz.__module__ == SCHEMA_MODULE for classes in context.xsi_cache.values() for clazz in classes )
+
+
+def test_context_import_is_lazy() -> None:
+    """Test that the schema is only imported when the context is requested."""
+    code = ( "import sys\n"
+             "from geos.trame.app.deck.context import get_xml_context\n"
+             f"assert '{SCHEMA_MODULE}' not in sys.modules\n"
+             "get_xml_context()\n"
+             f"assert '{SCHEMA_MODULE}' in sys.modules\n" )
+    subprocess.run( [ sys.executable, "-c", code ], check=True, env=ENV )
+
+
+def test_app_import_is_lazy() -> None:
+    """Test that importing the application does not import the schema."""
+    code = ( "import sys\n"
+             "import geos.trame.app.main\n"
+             f"assert '{SCHEMA_MODULE}' not in sys.modules\n" )
+    subprocess.run( [ sys.executable, "-c", code ], check=True, env=ENV )
+
+
+def test_decode_with_shared_context( monkeypatch: pytest.MonkeyPatch ) -> None:
+    """Test that decoding the inspector nodes reuses the shared context and its compiled metadata."""
+    tree = DeckTree()
+    tree.set_input_file( "tests/data/singlePhaseFlow/FieldCaseTutorial3_smoke.xml" )
+    paths = _deck_paths( tree )
+    assert paths
+
+    shared_context = get_xml_context()
+    compiled = dict( shared_context.cache )
+    created: list[ XmlContext ] = []
+    xml_context_init = XmlContext.__init__
+
+    def _counting_init( self: XmlContext, *args: Any, **kwargs: Any ) -> None:
+        created.append( self )
+        xml_context_init( self, *args, **kwargs )
+
+    with monkeypatch.context() as patch:
+        patch.setattr( XmlContext, "__init__", _counting_init )
+        decoded = [ tree.decode( path ) for path in paths ]
+
+    assert not created
+    assert shared_context.cache == compiled
+
+    expected = []
+    for path in paths:
+        context = XmlContext(
+            element_name_generator=text.pascal_case,
+            attribute_name_generator=text.camel_case,
+        )
+        data = tree._search( path )
+        assert data is not None
+        expected.append( DictDecoder( context=context, config=ParserConfig() ).decode( data[ 0 ] ) )
+
+    assert decoded == expected
+    assert [ type( node ) for node in decoded ] == [ type( node ) for node in expected ]
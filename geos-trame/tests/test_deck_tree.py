@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Lionel Untereiner
+from geos.trame.app.deck.file import build_inspect_tree
+from geos.trame.app.deck.tree import DeckTree
+from geos.trame.schema_generated.schema_mod import PeriodicEvent
+
+EVENTS = "Problem/Events/0"
+PERIODIC_EVENTS = EVENTS + "/PeriodicEvent"
+
+
+def _load_tree() -> DeckTree:
+    tree = DeckTree()
+    tree.set_input_file( "tests/data/singlePhaseFlow/FieldCaseTutorial3_smoke.xml" )
+    return tree
+
+
+def _events_children( tree: DeckTree ) -> list[ tuple[ str, str ] ]:
+    events = next( child for child in tree.get_tree()[ "children" ] if child[ "id" ] == EVENTS )
+    return [ ( child[ "id" ], child[ "title" ] ) for child in events[ "children" ] ]
+
+
+def _assert_inspect_tree_is_up_to_date( tree: DeckTree ) -> None:
+    assert tree.input_file is not None and tree.input_file.pb_dict is not None
+    assert tree.get_tree() == build_inspect_tree( tree.input_file.pb_dict[ "Problem" ] )
+
+
+def test_decode_is_memoized() -> None:
+    """Test that decoded nodes are reused until their subtree changes."""
+    tree = _load_tree()
+    event = tree.decode( PERIODIC_EVENTS + "/0" )
+    events = tree.decode( EVENTS )
+    mesh = tree.decode( "Problem/Mesh/0" )
+    assert tree.decode( PERIODIC_EVENTS + "/0" ) is event
+
+    tree.update( PERIODIC_EVENTS + "/0", "beginTime", "10" )
+
+    updated_event = tree.decode( PERIODIC_EVENTS + "/0" )
+    assert updated_event is not event
+    assert updated_event.begin_time == "10"
+    assert tree.decode( EVENTS ) is not events
+    assert tree.decode( EVENTS ).periodic_event[ 0 ].begin_time == "10"
+    assert tree.decode( "Problem/Mesh/0" ) is mesh
+
+
+def test_decode_memo_key_is_normalized() -> None:
+    """Test that the decoded nodes are memoized and invalidated by the same normalized path."""
+    tree = _load_tree()
+    event = tree.decode( "/" + PERIODIC_EVENTS + "/0/" )
+    assert tree.decode( PERIODIC_EVENTS + "/0" ) is event
+    assert DeckTree._memo_key( "/" + PERIODIC_EVENTS + "/0/" ) == DeckTree._memo_key(
+        DeckTree._convert_to_path( PERIODIC_EVENTS + "/0" ) )
+
+    tree.update( PERIODIC_EVENTS + "/0", "beginTime", "10" )
+
+    assert tree.decode( "/" + PERIODIC_EVENTS + "/0/" ).begin_time == "10"
+
+
+def test_inspect_tree_is_patched() -> None:
+    """Test that renaming, appending and dropping nodes patches the inspect tree."""
+    tree = _load_tree()
+    assert _events_children( tree ) == [ ( PERIODIC_EVENTS + "/0", "solverApplications" ),
+                                         ( PERIODIC_EVENTS + "/1", "outputs" ) ]
+
+    tree.update( PERIODIC_EVENTS + "/1", "name", "newOutputs" )
+    assert _events_children( tree )[ 1 ] == ( PERIODIC_EVENTS + "/1", "newOutputs" )
+    _assert_inspect_tree_is_up_to_date( tree )
+
+    tree.append( PERIODIC_EVENTS, DeckTree.encode_data( PeriodicEvent( name="added" ) ) )
+    assert _events_children( tree )[ 2 ] == ( PERIODIC_EVENTS + "/2", "added" )
+    assert tree.decode( PERIODIC_EVENTS + "/2" ).name == "added"
+    _assert_inspect_tree_is_up_to_date( tree )
+
+    solver_event = tree.decode( PERIODIC_EVENTS + "/0" )
+    tree.drop( PERIODIC_EVENTS + "/0" )
+    assert _events_children( tree ) == [ ( PERIODIC_EVENTS + "/0", "newOutputs" ), ( PERIODIC_EVENTS + "/1", "added" ) ]
+    assert tree.decode( PERIODIC_EVENTS + "/0" ) is not solver_event
+    assert tree.decode( PERIODIC_EVENTS + "/0" ).name == "newOutputs"
+    _assert_inspect_tree_is_up_to_date( tree )
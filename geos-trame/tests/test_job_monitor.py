@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Jacques Franc
+import asyncio
+import gc
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from geos.trame.app.utils import job_monitor
+from geos.trame.app.utils.job_monitor import JobMonitor, LogTail
+
+# fake GEOS job writing its progress in its log, line by line
+FAKE_JOB = """
+import sys, time
+with open( sys.argv[ 1 ], "w" ) as log:
+    for step in range( 5 ):
+        log.write( f"Time: {step}s, dt: 1s, Cycle: {step}" )
+        log.flush()
+        time.sleep( 0.05 )
+        log.write( f" ({( step + 1 ) * 20}% completed)\\n" )
+        log.flush()
+        time.sleep( 0.05 )
+"""
+
+
+def test_log_tail( tmp_path: Path ) -> None:
+    """Test that only the completed lines appended since the previous read are returned."""
+    log_file = tmp_path / "job.out"
+    tail = LogTail( log_file )
+    assert tail.read_lines() == []
+
+    log_file.write_text( "first line\nsecond" )
+    assert tail.read_lines() == [ "first line" ]
+    with open( log_file, "a" ) as log:
+        log.write( " line\r\nthird line\n" )
+    assert tail.read_lines() == [ "second line", "third line" ]
+    assert tail.read_lines() == []
+    assert tail.offset == log_file.stat().st_size
+
+    # truncated logs are read again
+    log_file.write_text( "new run\n" )
+    assert tail.read_lines() == [ "new run" ]
+
+
+async def _run_fake_jobs( tmp_path: Path, nb_jobs: int ) -> tuple[ JobMonitor, dict[ str, list[ dict[ str, str ] ] ] ]:
+    changes: dict[ str, list[ dict[ str, str ] ] ] = { str( job_id ): [] for job_id in range( nb_jobs ) }
+    monitor = JobMonitor( lambda job_id, change: changes[ job_id ].append( change ), poll_period_ms=20 )
+    for job_id in changes:
+        monitor.add_job( job_id, tmp_path / f"job_GEOS_{job_id}.out" )
+
+    processes = [
+        await asyncio.create_subprocess_exec( sys.executable, "-c", FAKE_JOB,
+                                              str( tmp_path / f"job_GEOS_{job_id}.out" ) ) for job_id in changes
+    ]
+    for process in processes:
+        assert await process.wait() == 0
+
+    # let the last modifications be notified
+    for _ in range( 50 ):
+        if all( monitor.get_state( job_id ).get( "simprogress" ) == "100" for job_id in changes ):
+            break
+        await asyncio.sleep( 0.02 )
+    monitor.close()
+    return monitor, changes
+
+
+@pytest.mark.parametrize( "notifications", [ True, False ] )
+def test_job_monitor( tmp_path: Path, monkeypatch: pytest.MonkeyPatch, notifications: bool ) -> None:
+    """Test that the changes of the states of local fake jobs are reported once, as they occur."""
+    if not notifications:
+        monkeypatch.setattr( job_monitor, "_load_inotify", lambda: None )
+    elif job_monitor._load_inotify() is None:
+        pytest.skip( "inotify is not available" )
+
+    monitor, changes = asyncio.run( _run_fake_jobs( tmp_path, 3 ) )
+    for job_id, job_changes in changes.items():
+        assert job_changes[ 0 ][ "status" ] == "RUNNING"
+        assert all( "status" not in change for change in job_changes[ 1: ] )
+        progresses = [ float( change[ "simprogress" ] ) for change in job_changes if "simprogress" in change ]
+        assert progresses == sorted( set( progresses ) )
+        assert progresses[ -1 ] == 100.0
+        assert monitor.get_state( job_id ) == { "status": "RUNNING", "simprogress": "100" }
+
+
+def test_job_monitor_without_loop( monkeypatch: pytest.MonkeyPatch ) -> None:
+    """Test that a monitor created outside of a running loop fails without leaking its notifications."""
+    unraisable: list[ object ] = []
+    monkeypatch.setattr( sys, "unraisablehook", unraisable.append )
+    nb_fds = len( os.listdir( "/proc/self/fd" ) ) if os.path.isdir( "/proc/self/fd" ) else None
+
+    with pytest.raises( RuntimeError ):
+        JobMonitor( lambda job_id, change: None )
+    gc.collect()
+    # the destructors of the partly initialized objects do not fail
+    assert unraisable == []
+    if nb_fds is not None:
+        assert len( os.listdir( "/proc/self/fd" ) ) == nb_fds
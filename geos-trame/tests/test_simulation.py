@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Jacques Franc
+# ruff: noqa
+import pytest
+from _pytest.capture import CaptureFixture
+from trame_server import Server
+from trame_server.state import State
+from trame_vuetify.ui.vuetify3 import VAppLayout
+
+from geos.trame.app.io.simulation import Simulation
+from geos.trame.app.io.ssh_tools import Authentificator
+from tests.trame_fixtures import trame_server_layout, trame_state
+
+SACCT_OUTPUT = "1|deck_a|RUNNING|30|60\n2|deck_b|CANCELLED by 42|10|60\n"
+
+
+@pytest.fixture
+def remote_commands( monkeypatch: pytest.MonkeyPatch ) -> list[ str ]:
+    """Replace the ssh connection by fake sacct and log outputs, returning the commands run."""
+    commands: list[ str ] = []
+
+    def execute( client: object, command: str ) -> tuple[ int, str, str ]:
+        commands.append( command )
+        if command.startswith( "sacct" ):
+            return ( 0, SACCT_OUTPUT, "" )
+        return ( 0, "120\nTime: 2s, dt: 1s, Cycle: 2 (60% completed)\n", "" )
+
+    monkeypatch.setattr( Authentificator, "ssh_client", object() )
+    monkeypatch.setattr( Authentificator, "_execute_remote_command", execute )
+    return commands
+
+
+def test_check_jobs( trame_server_layout: tuple[ Server, VAppLayout ], trame_state: State, remote_commands: list[ str ],
+                     capsys: CaptureFixture[ str ] ) -> None:
+    """Test that the jobs are checked with a single sacct call and only updated when they change."""
+    trame_state.simulation_remote_path = "/work"
+    simulation = Simulation( trame_server_layout[ 0 ] )
+    trame_state.job_ids = [ { 'job_id': '1' }, { 'job_id': '2' }, { 'job_id': '3' } ]
+
+    simulation.check_jobs()
+    assert remote_commands[ 0 ].startswith( "sacct -j 1,2,3 " )
+    # only the log of the running job is read, from its beginning
+    assert len( remote_commands ) == 2 and "/work/job_GEOS_1.out" in remote_commands[ 1 ]
+    assert "tail -c +1 " in remote_commands[ 1 ]
+    assert trame_state.job_ids == [
+        {
+            'job_id': '1',
+            'status': 'RUNNING',
+            'name': 'deck_a',
+            'slprogress': str( 30 / 60 / 60 * 100 ),
+            'simprogress': '60'
+        },
+        {
+            'job_id': '2',
+            'status': 'CANCELLED',
+            'name': 'deck_b'
+        },
+        {
+            'job_id': '3'
+        },
+    ]
+    assert capsys.readouterr().out.count( "job id:" ) == 2
+
+    # the log is read again from where the previous check stopped, and unchanged jobs are not reported
+    simulation.check_jobs()
+    assert "tail -c +121 " in remote_commands[ 3 ]
+    assert "job id:" not in capsys.readouterr().out
+
+
+def test_on_job_changed( trame_server_layout: tuple[ Server, VAppLayout ], trame_state: State ) -> None:
+    """Test that the changes of the job monitor are merged into the jobs, keeping the scheduler status."""
+    simulation = Simulation( trame_server_layout[ 0 ] )
+    trame_state.job_ids = [ { 'job_id': '1' }, { 'job_id': '2', 'status': 'COMPLETING' } ]
+
+    simulation._on_job_changed( '1', { 'status': 'RUNNING', 'simprogress': '20' } )
+    simulation._on_job_changed( '2', { 'status': 'RUNNING', 'simprogress': '100' } )
+    simulation._on_job_changed( '3', { 'status': 'RUNNING' } )
+    assert trame_state.job_ids == [
+        {
+            'job_id': '1',
+            'status': 'RUNNING',
+            'simprogress': '20'
+        },
+        {
+            'job_id': '2',
+            'status': 'COMPLETING',
+            'simprogress': '100'
+        },
+    ]
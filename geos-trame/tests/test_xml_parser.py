@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Lionel Untereiner
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from geos.trame.app.io import xml_parser
+from geos.trame.app.io.xml_parser import XMLParser
+
+DATA = Path( "tests/data/singlePhaseFlow" )
+MAIN_FILE = "FieldCaseTutorial3_smoke.xml"
+INCLUDED_FILE = "FieldCaseTutorial3_base.xml"
+
+
+def _copy_deck( tmp_path: Path ) -> Path:
+    for name in ( MAIN_FILE, INCLUDED_FILE ):
+        shutil.copy( DATA / name, tmp_path / name )
+    return tmp_path / MAIN_FILE
+
+
+def _build( filename: Path ) -> XMLParser:
+    parser = XMLParser( str( filename ) )
+    parser.build()
+    return parser
+
+
+def test_included_files_are_merged( tmp_path: Path ) -> None:
+    """Test that the nodes of the included files are merged into the deck."""
+    parser = _build( _copy_deck( tmp_path ) )
+    deck = parser.get_simulation_deck()
+    assert len( deck.findall( "Included" ) ) == 0
+    assert deck.find( "Functions" ).findall( "TableFunction" )[ 2 ].get( "name" ) == "permxFunc"
+
+
+def test_parsed_files_are_cached( tmp_path: Path ) -> None:
+    """Test that a deck read again only parses the modified files."""
+    main_file = _copy_deck( tmp_path )
+    included_file = tmp_path / INCLUDED_FILE
+    _build( main_file )
+    main_root = xml_parser._parsed_files[ main_file.resolve() ][ 1 ]
+    included_root = xml_parser._parsed_files[ included_file.resolve() ][ 1 ]
+
+    # the merge does not alter the cached trees
+    _build( main_file )
+    assert main_root.findall( "Functions" ) == []
+    assert xml_parser._parsed_files[ included_file.resolve() ][ 1 ] is included_root
+
+    content = included_file.read_text().replace( 'name="permxFunc"', 'name="newPermxFunc"' )
+    included_file.write_text( content )
+    stat = included_file.stat()
+    os.utime( included_file, ns=( stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000 ) )
+
+    reloaded = _build( main_file )
+    assert xml_parser._parsed_files[ main_file.resolve() ][ 1 ] is main_root
+    assert xml_parser._parsed_files[ included_file.resolve() ][ 1 ] is not included_root
+    table_functions = reloaded.get_simulation_deck().find( "Functions" ).findall( "TableFunction" )
+    assert table_functions[ 2 ].get( "name" ) == "newPermxFunc"
+
+
+def test_parsed_files_are_bounded( tmp_path: Path, monkeypatch: pytest.MonkeyPatch ) -> None:
+    """Test that only the most recently loaded files are kept parsed."""
+    monkeypatch.setattr( xml_parser, "_parsed_files", OrderedDict() )
+    monkeypatch.setattr( xml_parser, "MAX_PARSED_FILES", 1 )
+    main_file = _copy_deck( tmp_path )
+    _build( main_file )
+    assert list( xml_parser._parsed_files ) == [ ( tmp_path / INCLUDED_FILE ).resolve() ]
+
+    xml_parser.load_xml_file( main_file )
+    assert list( xml_parser._parsed_files ) == [ main_file.resolve() ]
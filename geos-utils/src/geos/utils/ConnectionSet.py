@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Martin Lemay
-import copy
-from collections.abc import Iterable, Iterator, MutableSet
-from typing import Optional
+from collections.abc import Iterable, Iterator, MutableSet, Set
+from typing import Any, Optional
 
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import Self
 
 __doc__ = """ Defines connection set and connection set collection data
 structures.
+
+The collection indexes its connection sets by reference cell id, and can be
+built from or exported to flat arrays of (reference cell id, connected cell id,
+side) in compressed sparse row layout for bulk processing.
 """
 
 
@@ -27,7 +32,7 @@ class ConnectionSet:
             connectedCellIds (int): map of connected cell ids with the side.
         """
         self.m_cellIdRef: int = cellIdRef
-        self.m_connectedCellIds: dict[ int, bool ] = copy.deepcopy( connectedCellIds )
+        self.m_connectedCellIds: dict[ int, bool ] = dict( connectedCellIds )
 
     def __repr__( self: Self ) -> str:
         """Get the string description of the FaceConnectionSet.
@@ -97,7 +102,7 @@ class ConnectionSet:
             connectedCellIds (dict[int, bool]): map of connected cell ids with
                 side.
         """
-        self.m_connectedCellIds = copy.deepcopy( connectedCellIds )
+        self.m_connectedCellIds = dict( connectedCellIds )
 
     def addConnectedCells( self: Self, connectedCellsToAdd: dict[ int, bool ] ) -> None:
         """Add connected cells to the existing map of connected cells.
@@ -126,9 +131,88 @@ class ConnectionSetCollection( MutableSet ):
         """Define a collection of ConnectionSet.
 
         Because ConnectionSet relies on cell unique id, the collection imposes
-        uniqueness of reference cell id.
+        uniqueness of reference cell id. ConnectionSet are indexed by their
+        reference cell id for constant time lookups.
+        """
+        self._items: dict[ int, ConnectionSet ] = {}
+
+    @classmethod
+    def _from_iterable( cls, items: Iterable[ Any ] ) -> Self:
+        """Create a collection from an iterable of ConnectionSet, used by set operators.
+
+        Args:
+            items (Iterable[Any]): ConnectionSet to add or update.
+
+        Returns:
+            ConnectionSetCollection: new collection.
+        """
+        collection = cls()
+        for item in items:
+            collection.update( item )
+        return collection
+
+    @classmethod
+    def fromArrays( cls, cellIdRefs: npt.ArrayLike, connectedCellIds: npt.ArrayLike, sides: npt.ArrayLike ) -> Self:
+        """Create a collection from flat arrays of connections.
+
+        Each connection i connects cellIdRefs[i] to connectedCellIds[i] on the
+        side sides[i]. If a connection is repeated, the last side is kept.
+
+        Args:
+            cellIdRefs (npt.ArrayLike): reference cell id of each connection.
+            connectedCellIds (npt.ArrayLike): connected cell id of each connection.
+            sides (npt.ArrayLike): side of each connection.
+
+        Returns:
+            ConnectionSetCollection: new collection.
         """
-        self._items: set[ ConnectionSet ] = set()
+        refs: npt.NDArray[ np.int64 ] = np.asarray( cellIdRefs, dtype=np.int64 ).ravel()
+        connected: npt.NDArray[ np.int64 ] = np.asarray( connectedCellIds, dtype=np.int64 ).ravel()
+        sidesArray: npt.NDArray[ np.bool_ ] = np.asarray( sides, dtype=bool ).ravel()
+        if not ( refs.size == connected.size == sidesArray.size ):
+            raise ValueError( "Connection arrays must have the same size." )
+
+        # group connections by reference cell id, keeping the connection order
+        order = np.argsort( refs, kind="stable" )
+        uniqueRefs, starts = np.unique( refs[ order ], return_index=True )
+        offsets: list[ int ] = np.append( starts, refs.size ).tolist()
+        connectedSorted: list[ int ] = connected[ order ].tolist()
+        sidesSorted: list[ bool ] = sidesArray[ order ].tolist()
+
+        collection = cls()
+        for row, cellIdRef in enumerate( uniqueRefs.tolist() ):
+            begin, end = offsets[ row ], offsets[ row + 1 ]
+            collection._items[ cellIdRef ] = ConnectionSet(
+                cellIdRef, dict( zip( connectedSorted[ begin:end ], sidesSorted[ begin:end ], strict=True ) ) )
+        return collection
+
+    def toArrays(
+        self: Self
+    ) -> tuple[ npt.NDArray[ np.int64 ], npt.NDArray[ np.int64 ], npt.NDArray[ np.int64 ], npt.NDArray[ np.bool_ ] ]:
+        """Export the collection in compressed sparse row layout.
+
+        Connected cells of the i-th reference cell id are
+        connectedCellIds[offsets[i]:offsets[i+1]] with sides
+        sides[offsets[i]:offsets[i+1]].
+
+        Returns:
+            tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+                reference cell ids, offsets, connected cell ids and sides.
+        """
+        cellIdRefs = np.fromiter( self._items.keys(), dtype=np.int64, count=len( self._items ) )
+        counts = np.fromiter( ( len( cs.getConnectedCellIds() ) for cs in self._items.values() ),
+                              dtype=np.int64,
+                              count=len( self._items ) )
+        offsets = np.zeros( len( self._items ) + 1, dtype=np.int64 )
+        np.cumsum( counts, out=offsets[ 1: ] )
+        connectedCellIds = np.fromiter(
+            ( cellId for cs in self._items.values() for cellId in cs.getConnectedCellIds() ),
+            dtype=np.int64,
+            count=offsets[ -1 ] )
+        sides = np.fromiter( ( side for cs in self._items.values() for side in cs.getConnectedCellIds().values() ),
+                             dtype=bool,
+                             count=offsets[ -1 ] )
+        return cellIdRefs, offsets, connectedCellIds, sides
 
     def __contains__( self: Self, item: object ) -> bool:
         """Redefine contains method.
@@ -141,7 +225,7 @@ class ConnectionSetCollection( MutableSet ):
         """
         if not isinstance( item, ConnectionSet ):
             return False
-        return any( obj.getCellIdRef() == item.getCellIdRef() for obj in self._items )
+        return item.getCellIdRef() in self._items
 
     def __iter__( self: Self ) -> Iterator[ ConnectionSet ]:
         """Iterator on the collection.
@@ -149,7 +233,7 @@ class ConnectionSetCollection( MutableSet ):
         Returns:
             Iterator[ConnectionSet]: Iterator of ConnectionSet.
         """
-        return iter( self._items )
+        return iter( self._items.values() )
 
     def __len__( self: Self ) -> int:
         """Get the number of elements of the collection.
@@ -180,8 +264,7 @@ class ConnectionSetCollection( MutableSet ):
         Returns:
             bool: True if a ConnectionSet is present, False otherwise.
         """
-        connectionSet: Optional[ ConnectionSet ] = self.get( cellIdRef )
-        return connectionSet is not None
+        return cellIdRef in self._items
 
     def add( self: Self, item: ConnectionSet ) -> None:
         """Add a ConnectionSet to the collection.
@@ -190,7 +273,7 @@ class ConnectionSetCollection( MutableSet ):
             item (ConnectionSet): ConnectionSet to add.
         """
         assert item not in self, f"ConnectionSet {item} is already in the collection."
-        self._items.add( item.copy() )
+        self._items[ item.getCellIdRef() ] = item.copy()
 
     def addMultiple( self: Self, items: Iterable[ ConnectionSet ] ) -> None:
         """Add an iterable of ConnectionSet to the collection.
@@ -231,10 +314,7 @@ class ConnectionSetCollection( MutableSet ):
         Returns:
             Optional[ConnectionSet]: ConnectionSet with cellIdRef.
         """
-        for connectionSet in self._items:
-            if connectionSet.getCellIdRef() == cellIdRef:
-                return connectionSet
-        return None
+        return self._items.get( cellIdRef )
 
     def discard( self: Self, item: ConnectionSet ) -> None:
         """Remove a ConnectionSet to the collection.
@@ -245,7 +325,8 @@ class ConnectionSetCollection( MutableSet ):
         Args:
             item (ConnectionSet): ConnectionSet to remove.
         """
-        self._items.discard( item )
+        if self.containsEqual( item ):
+            del self._items[ item.getCellIdRef() ]
 
     def discardCellIdRef( self: Self, cellIdRef: int ) -> None:
         """Remove a ConnectionSet to the collection using the reference cell id.
@@ -253,9 +334,66 @@ class ConnectionSetCollection( MutableSet ):
         Args:
             cellIdRef (int): reference cell id to remove.
         """
-        item: Optional[ ConnectionSet ] = self.get( cellIdRef )
-        if item is not None:
-            self.discard( item )
+        self._items.pop( cellIdRef, None )
+
+    def union( self: Self, other: "ConnectionSetCollection" ) -> Self:
+        """Get the union of two collections.
+
+        ConnectionSet with the same reference cell id are merged as with update method.
+
+        Args:
+            other (ConnectionSetCollection): other collection.
+
+        Returns:
+            ConnectionSetCollection: new collection.
+        """
+        collection = type( self )()
+        collection._items = { cellIdRef: cs.copy() for cellIdRef, cs in self._items.items() }
+        for item in other:
+            collection.update( item )
+        return collection
+
+    def intersection( self: Self, other: "ConnectionSetCollection" ) -> Self:
+        """Get the ConnectionSet whose reference cell id is also in the other collection.
+
+        Args:
+            other (ConnectionSetCollection): other collection.
+
+        Returns:
+            ConnectionSetCollection: new collection.
+        """
+        collection = type( self )()
+        collection._items = {
+            cellIdRef: cs.copy()
+            for cellIdRef, cs in self._items.items() if other.containsCellIdRef( cellIdRef )
+        }
+        return collection
+
+    def __or__( self: Self, other: Set[ Any ] ) -> Self:
+        """Get the union of two collections, see union method.
+
+        Args:
+            other (Set[Any]): other collection.
+
+        Returns:
+            ConnectionSetCollection: new collection.
+        """
+        if not isinstance( other, ConnectionSetCollection ):
+            return NotImplemented
+        return self.union( other )
+
+    def __and__( self: Self, other: Set[ Any ] ) -> Self:
+        """Get the intersection of two collections, see intersection method.
+
+        Args:
+            other (Set[Any]): other collection.
+
+        Returns:
+            ConnectionSetCollection: new collection.
+        """
+        if not isinstance( other, ConnectionSetCollection ):
+            return NotImplemented
+        return self.intersection( other )
 
     def __repr__( self: Self ) -> str:
         """Representation of ConnectionSetCollection.
@@ -263,7 +401,7 @@ class ConnectionSetCollection( MutableSet ):
         Returns:
             str: representation.
         """
-        return f"{self.__class__.__name__}({list(self._items)})"
+        return f"{self.__class__.__name__}({list(self._items.values())})"
 
     def getReversedConnectionSetCollection( self: Self ) -> Self:
         """Get the set of reversed connection set.
@@ -271,9 +409,7 @@ class ConnectionSetCollection( MutableSet ):
         Returns:
             ConnectionSetCollection: reversed collection of ConnectionSet
         """
-        connectionSetCollection: ConnectionSetCollection = ConnectionSetCollection()
-        for face2VolumeCS in self._items:
-            for cellId, side in face2VolumeCS.getConnectedCellIds().items():
-                newConnectionSet: ConnectionSet = ConnectionSet( cellId, { face2VolumeCS.getCellIdRef(): side } )
-                connectionSetCollection.update( newConnectionSet )
-        return connectionSetCollection  # type: ignore  # noqa: F821
+        cellIdRefs, offsets, connectedCellIds, sides = self.toArrays()
+        # each connected cell becomes the reference of the reversed connection
+        reversedConnectedCellIds = np.repeat( cellIdRefs, np.diff( offsets ) )
+        return self.fromArrays( connectedCellIds, reversedConnectedCellIds, sides )
@@ -151,12 +151,12 @@ def getAttributeVectorFromMatrix( attrMatrix: npt.NDArray[ np.float64 ],
     attrArray[ :, 2 ] = attrMatrix[ :, 2, 2 ]
 
     # shear stress components
-    if attrArray.size == 6:
+    if shape[ 1 ] == 6:
         attrArray[ :, 3 ] = attrMatrix[ :, 1, 2 ]
         attrArray[ :, 4 ] = attrMatrix[ :, 0, 2 ]
         attrArray[ :, 5 ] = attrMatrix[ :, 0, 1 ]
 
-    elif attrArray.size == 9:
+    elif shape[ 1 ] == 9:
         attrArray[ :, 3 ] = attrMatrix[ :, 1, 2 ]
         attrArray[ :, 4 ] = attrMatrix[ :, 0, 2 ]
         attrArray[ :, 5 ] = attrMatrix[ :, 0, 1 ]
@@ -4,11 +4,10 @@
 from typing import Any
 
 import numpy as np
-from scipy.linalg import polar
-from packaging.version import Version
-from scipy import __version__ as __scipy_version__
 import numpy.typing as npt
 
+from geos.utils.algebraFunctions import ( getAttributeMatrixFromVector, getAttributeVectorFromMatrix )
+
 __doc__ = """Functions to permform geometry calculations."""
 
 CANONICAL_BASIS_3D: npt.NDArray[ np.float64 ] = np.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 1.0, 0.0 ], [ 0.0, 0.0, 1.0 ] ] )
@@ -37,19 +36,13 @@ def _cross( vec1: npt.NDArray[ np.float64 ], vec2: npt.NDArray[ np.float64 ] ) -
 
 
 def _normBasis( basis: npt.NDArray[ np.float64 ] ) -> npt.NDArray[ np.float64 ]:
-    """Norm and orthonormalize basis vector wise."""
-    # Q, R = np.linalg.qr( basis )
-    if Version( __scipy_version__ ) > Version( "1.15.3" ):
-        U, _ = polar( basis )
-    else:
-        U = np.zeros_like( basis )
-        for i in range( basis.shape[ 0 ] ):
-            U[ i, :, : ], _ = polar( basis[ i, :, : ] )
-
-    # det = np.linalg.det( Q )
-    # Q[ det < 0 ] *= -1
+    """Norm and orthonormalize basis vector wise.
 
-    return U
+    The orthonormal basis is the unitary factor of the polar decomposition of the
+    input basis, computed for all the bases at once from their singular value decomposition.
+    """
+    W, _, Vh = np.linalg.svd( basis )
+    return W @ Vh
 
 
 def getChangeOfBasisMatrix(
@@ -73,9 +66,10 @@ def getChangeOfBasisMatrix(
         npt.NDArray[np.float64 Change of basis matrix.
     """
     basisFrom = _normBasis( basisFrom )
-    if len( basisTo.shape ) < len( basisFrom.shape ):
-        basisTo = np.repeat( basisTo[ None, : ], basisFrom.shape[ 0 ], axis=0 )
+    # a single destination basis is normalized once and shared by all origin bases
     basisTo = _normBasis( basisTo )
+    if len( basisTo.shape ) < len( basisFrom.shape ):
+        basisTo = np.broadcast_to( basisTo, basisFrom.shape )
 
     assert ( basisFrom.shape[ 1 ] == basisFrom.shape[ 2 ] ), (
         f"Origin space vectors must have the same size. shape: {basisFrom.shape}" )
@@ -86,12 +80,75 @@ def getChangeOfBasisMatrix(
     # B = np.transpose( np.array( basisFrom ) )
     # C = np.transpose( np.array( basisTo ) )
     # no need to compute the inverse of C as it is orthonormal checked - transpose is enough
-    assert np.linalg.norm(
-        _transposeProd( basisTo, basisTo ) - np.repeat( np.eye( 3 )[ None, : ], basisFrom.shape[ 0 ], axis=0 ) ) < 1e-6
+    assert np.linalg.norm( _transposeProd( basisTo, basisTo ) - np.eye( 3 ) ) < 1e-6
     # get the change of basis matrix
     return _transposeProd( basisTo, basisFrom )
 
 
+def getLocalFrameMatrices(
+    normals: npt.NDArray[ np.float64 ],
+    tangents: npt.NDArray[ np.float64 ],
+    referenceDirection: npt.NDArray[ np.float64 ] | None = None,
+) -> npt.NDArray[ np.float64 ]:
+    """Get the rotation matrices from the canonic basis to local (normal, tangent) frames.
+
+    The rows of each matrix are the normal, the first tangent and the second tangent
+    of the frame, so that R.v gives the local coordinates of a vector v. Normals are
+    normalized, tangents are orthogonalized against the normals and normalized, and
+    second tangents are computed as normal x tangent so that all the frames are direct.
+
+    Args:
+        normals (npt.NDArray[np.float64]): Normal vectors, of shape (n, 3).
+        tangents (npt.NDArray[np.float64]): First tangent vectors, of shape (n, 3).
+        referenceDirection (npt.NDArray[np.float64] | None, optional): If given, frames
+            whose normal points against this direction are flipped so that all
+            normals are consistently oriented. Defaults to None.
+
+    Raises:
+        ValueError: Normal and tangent vectors do not have the same (n, 3) shape.
+
+    Returns:
+        npt.NDArray[np.float64]: Rotation matrices, of shape (n, 3, 3).
+    """
+    if normals.shape != tangents.shape or normals.shape[ -1 ] != 3:
+        raise ValueError( f"Normals and tangents must be of shape (n, 3), got {normals.shape} and {tangents.shape}." )
+
+    normals = _normalize( normals )
+    if referenceDirection is not None:
+        # flipping the normal also flips the second tangent, frames stay direct
+        normals = normals * np.where( normals @ referenceDirection < 0, -1.0, 1.0 )[ :, None ]
+    tangents = tangents - np.einsum( 'ni,ni->n', tangents, normals )[ :, None ] * normals
+    tangents = _normalize( tangents )
+    return np.stack( ( normals, tangents, _cross( normals, tangents ) ), axis=1 )
+
+
+def rotateVoigtTensors( tensors: npt.NDArray[ np.float64 ],
+                        rotationMatrices: npt.NDArray[ np.float64 ] ) -> npt.NDArray[ np.float64 ]:
+    """Express tensors given in GEOS vector notation in rotated bases.
+
+    Each tensor T is transformed into R.T.R^T with a single einsum over all the tensors.
+
+    Args:
+        tensors (npt.NDArray[np.float64]): Tensors of shape (n, 6) in Voigt notation
+            (xx, yy, zz, yz, xz, xy), or (n, 9) for non symmetrical tensors.
+        rotationMatrices (npt.NDArray[np.float64]): Rotation matrices of shape (n, 3, 3),
+            such as the ones from getLocalFrameMatrices, or a single (3, 3) matrix.
+
+    Raises:
+        ValueError: Tensors do not have 6 or 9 components.
+
+    Returns:
+        npt.NDArray[np.float64]: Rotated tensors with the same shape as the input tensors.
+    """
+    if tensors.shape[ 1 ] not in ( 6, 9 ):
+        raise ValueError( f"Tensors must have 6 or 9 components, got {tensors.shape[ 1 ]}." )
+
+    rotationMatrices = np.broadcast_to( rotationMatrices, ( tensors.shape[ 0 ], 3, 3 ) )
+    matrices: npt.NDArray[ np.float64 ] = getAttributeMatrixFromVector( tensors )
+    rotated: npt.NDArray[ np.float64 ] = np.einsum( 'nik,nkl,njl->nij', rotationMatrices, matrices, rotationMatrices )
+    return getAttributeVectorFromMatrix( rotated, tensors.shape )
+
+
 # def computeCoordinatesInNewBasis( vec: npt.NDArray[ np.float64 ],
 #                                   changeOfBasisMatrix: npt.NDArray[ np.float64 ] ) -> Any:
 #     """Computes the coordinates of a matrix from a basis B in the new basis B'.
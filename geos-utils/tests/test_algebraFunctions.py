@@ -72,3 +72,12 @@ class TestAttributeVectorFromMatrix( TestCase ):
                 expectedVector = np.array( self.expected[ :, :size ] )
                 self.assertTrue(
                     np.array_equal( expectedVector, getAttributeVectorFromMatrix( self.rdMatrix, ( 1, size ) ) ) )
+
+    def test_severalTensors( self: Self ) -> None:
+        """Test that the shear components of every tensor are kept."""
+        matrices = np.stack( [ self.rdMatrix[ 0 ], 2 * self.rdMatrix[ 0 ] ] )
+        for size in ( 6, 9 ):
+            with self.subTest( size ):
+                expectedVector = np.vstack( [ self.expected[ :, :size ], 2 * self.expected[ :, :size ] ] )
+                self.assertTrue( np.array_equal( expectedVector, getAttributeVectorFromMatrix( matrices,
+                                                                                               ( 2, size ) ) ) )
@@ -18,6 +18,11 @@ cellIdSide2: dict[ int, bool ] = { 6: True, 7: False, 4: True }
 cellIdSide3: dict[ int, bool ] = { 3: True, 6: False, 5: True }
 
 
+def _contents( csc: ConnectionSetCollection ) -> list[ tuple[ int, dict[ int, bool ] ] ]:
+    """Get the reference cell ids and connected cells of a collection, sorted by reference cell id."""
+    return sorted( ( ( cs.getCellIdRef(), cs.getConnectedCellIds() ) for cs in csc ), key=lambda item: item[ 0 ] )
+
+
 class TestsConnectionSet( unittest.TestCase ):
 
     def test_ConnectionSetInit( self: Self ) -> None:
@@ -233,3 +238,45 @@ class TestsConnectionSet( unittest.TestCase ):
 
         obtained: ConnectionSetCollection = csc.getReversedConnectionSetCollection()
         self.assertEqual( obtained, expected )
+
+    def test_ConnectionSetCollectionArrays( self: Self ) -> None:
+        """Test ConnectionSetCollection fromArrays and toArrays methods."""
+        csc: ConnectionSetCollection = ConnectionSetCollection.fromArrays(
+            [ faceId2, faceId1, faceId2, faceId1, faceId1, faceId2 ], [ 6, 3, 7, 4, 5, 4 ],
+            [ True, True, False, False, True, True ] )
+        self.assertEqual( len( csc ), 2 )
+        self.assertTrue( csc.containsEqual( ConnectionSet( faceId1, cellIdSide1 ) ) )
+        self.assertTrue( csc.containsEqual( ConnectionSet( faceId2, cellIdSide2 ) ) )
+
+        cellIdRefs, offsets, connectedCellIds, sides = csc.toArrays()
+        self.assertEqual( cellIdRefs.tolist(), [ faceId1, faceId2 ] )
+        self.assertEqual( offsets.tolist(), [ 0, 3, 6 ] )
+        self.assertEqual( connectedCellIds.tolist(), [ 3, 4, 5, 6, 7, 4 ] )
+        self.assertEqual( sides.tolist(), [ True, False, True, True, False, True ] )
+
+        with self.assertRaises( ValueError ):
+            ConnectionSetCollection.fromArrays( [ faceId1 ], [ 3, 4 ], [ True ] )
+
+    def test_ConnectionSetCollectionUnionIntersection( self: Self ) -> None:
+        """Test ConnectionSetCollection union and intersection methods."""
+        csc1: ConnectionSetCollection = ConnectionSetCollection()
+        csc1.addMultiple( ( ConnectionSet( faceId1, cellIdSide1 ), ConnectionSet( faceId2, cellIdSide2 ) ) )
+        csc2: ConnectionSetCollection = ConnectionSetCollection()
+        csc2.addMultiple( ( ConnectionSet( faceId2, cellIdSide3 ), ConnectionSet( faceId3, cellIdSide3 ) ) )
+
+        cs: ConnectionSet = ConnectionSet( faceId2, cellIdSide2 )
+        cs.addConnectedCells( cellIdSide3 )
+        union: ConnectionSetCollection = csc1.union( csc2 )
+        self.assertEqual( len( union ), 3 )
+        self.assertTrue( union.containsEqual( cs ) )
+        self.assertTrue( union.containsEqual( ConnectionSet( faceId3, cellIdSide3 ) ) )
+        # inputs are left unchanged
+        self.assertTrue( csc1.containsEqual( ConnectionSet( faceId2, cellIdSide2 ) ) )
+        self.assertEqual( _contents( csc1 | csc2 ), _contents( union ) )
+
+        intersection: ConnectionSetCollection = csc1.intersection( csc2 )
+        self.assertEqual( len( intersection ), 1 )
+        self.assertTrue( intersection.containsEqual( ConnectionSet( faceId2, cellIdSide2 ) ) )
+        self.assertEqual( _contents( csc1 & csc2 ), _contents( intersection ) )
+        self.assertEqual( _contents( csc1 & csc2 ), [ ( faceId2, cellIdSide2 ) ] )
+        self.assertEqual( _contents( csc2 & csc1 ), [ ( faceId2, cellIdSide3 ) ] )
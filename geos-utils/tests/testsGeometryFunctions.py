@@ -4,7 +4,10 @@
 # ruff: noqa: E402 # disable Module level import not at top of file
 import numpy as np
 import numpy.typing as npt
+import pytest
+from scipy.linalg import polar
 import geos.utils.geometryFunctions as fcts
+from geos.utils.algebraFunctions import getAttributeMatrixFromVector
 
 basisCanon: npt.NDArray[ np.float64 ] = np.array( [ [ [ 1.0, 0.0, 0.0 ], [ 0.0, 1.0, 0.0 ], [ 0.0, 0.0, 1.0 ] ] ] )
 # destination basis according to canonic coordinates
@@ -27,6 +30,56 @@ def test_getChangeOfBasisMatrixToCanonic() -> None:
     assert np.linalg.norm( obtained - expected ) < 10e-12, f"Expected array is {np.round( expected, 2 ).tolist()}"
 
 
+def test_normBasisBatch() -> None:
+    """Test that bases are orthonormalized all at once as their polar decomposition."""
+    bases: npt.NDArray[ np.float64 ] = np.random.default_rng( 0 ).normal( size=( 50, 3, 3 ) )
+    obtained: npt.NDArray[ np.float64 ] = fcts._normBasis( bases )
+    expected: npt.NDArray[ np.float64 ] = np.array( [ polar( basis )[ 0 ] for basis in bases ] )
+    assert np.allclose( obtained, expected )
+
+
+def test_getLocalFrameMatrices() -> None:
+    """Test rotation matrices of local frames."""
+    rng = np.random.default_rng( 0 )
+    normals: npt.NDArray[ np.float64 ] = rng.normal( size=( 100, 3 ) )
+    tangents: npt.NDArray[ np.float64 ] = rng.normal( size=( 100, 3 ) )
+    rotations: npt.NDArray[ np.float64 ] = fcts.getLocalFrameMatrices( normals, tangents )
+    assert rotations.shape == ( 100, 3, 3 )
+    # direct orthonormal frames with the normal as first vector
+    assert np.allclose( np.einsum( 'nij,nkj->nik', rotations, rotations ), np.eye( 3 ) )
+    assert np.allclose( np.linalg.det( rotations ), 1.0 )
+    assert np.allclose( rotations[ :, 0 ], normals / np.linalg.norm( normals, axis=1, keepdims=True ) )
+
+    up: npt.NDArray[ np.float64 ] = np.array( [ 0.0, 0.0, 1.0 ] )
+    oriented: npt.NDArray[ np.float64 ] = fcts.getLocalFrameMatrices( normals, tangents, up )
+    assert np.all( oriented[ :, 0, 2 ] >= 0 )
+    assert np.allclose( np.linalg.det( oriented ), 1.0 )
+    assert np.allclose( np.abs( oriented ), np.abs( rotations ) )
+
+    with pytest.raises( ValueError ):
+        fcts.getLocalFrameMatrices( normals, tangents[ :-1 ] )
+
+
+def test_rotateVoigtTensors() -> None:
+    """Test batched rotation of tensors against a rotation tensor by tensor."""
+    rng = np.random.default_rng( 0 )
+    tensors: npt.NDArray[ np.float64 ] = rng.normal( size=( 100, 6 ) )
+    rotations: npt.NDArray[ np.float64 ] = fcts.getLocalFrameMatrices( rng.normal( size=( 100, 3 ) ),
+                                                                       rng.normal( size=( 100, 3 ) ) )
+    obtained: npt.NDArray[ np.float64 ] = fcts.rotateVoigtTensors( tensors, rotations )
+    matrices: npt.NDArray[ np.float64 ] = getAttributeMatrixFromVector( tensors )
+    for rotation, matrix, rotated in zip( rotations, matrices, obtained, strict=True ):
+        expected: npt.NDArray[ np.float64 ] = rotation @ matrix @ rotation.T
+        assert np.allclose( rotated, [
+            expected[ 0, 0 ], expected[ 1, 1 ], expected[ 2, 2 ], expected[ 1, 2 ], expected[ 0, 2 ], expected[ 0, 1 ]
+        ] )
+
+    # a single rotation is applied to all the tensors
+    assert np.allclose( fcts.rotateVoigtTensors( tensors, np.eye( 3 ) ), tensors )
+    with pytest.raises( ValueError ):
+        fcts.rotateVoigtTensors( tensors[ :, :3 ], rotations )
+
+
 # def test_computeCoordinatesInNewBasis() -> None:
 #     """Test calculation of coordinates of a vector in another basis."""
 #     vec: npt.NDArray[ np.float64 ] = np.array( [[ 3.0, -3.0, 0.0 ], [0.0, 0.0, 50.0]] )
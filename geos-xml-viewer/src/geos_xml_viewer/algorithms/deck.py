@@ -16,6 +16,7 @@ import vtk  # type: ignore[import-untyped]
 from lxml import etree as ElementTree  # type: ignore[import-untyped]
 from lxml.etree import XMLSyntaxError  # type: ignore[import-untyped]
 from vtk.util.numpy_support import numpy_to_vtk as numpy_to_vtk_
+from vtk.util.numpy_support import vtk_to_numpy
 
 tr = str.maketrans( "{}", "[]" )
 
@@ -342,6 +343,76 @@ def _read_mesh(
     #     raise Exception("\nNeither VTKMesh or InternalMesh node were found")
 
 
+SURFACE_CELL_TYPES = ( vtk.VTK_QUAD, vtk.VTK_TRIANGLE, vtk.VTK_POLYGON )
+
+VOLUME_CELL_TYPES = (
+    vtk.VTK_HEXAHEDRON,
+    vtk.VTK_TETRA,
+    vtk.VTK_WEDGE,
+    vtk.VTK_PYRAMID,
+    vtk.VTK_VOXEL,
+    vtk.VTK_PENTAGONAL_PRISM,
+    vtk.VTK_HEXAGONAL_PRISM,
+    vtk.VTK_POLYHEDRON,
+)
+
+
+def _split_cells_by_region(
+        ugrid: vtk.vtkUnstructuredGrid,
+        attr: str ) -> tuple[ dict[ int, npt.NDArray[ np.int64 ] ], dict[ int, npt.NDArray[ np.int64 ] ] ]:
+    """Sorts the cell ids of the mesh by region marker and cell dimension in a single pass.
+
+    Only cells with an integer marker are kept, regions without any cell are not returned.
+
+    Args:
+        ugrid (vtk.vtkUnstructuredGrid): Mesh to split
+        attr (str): Cell attribute name to use as region marker
+
+    Returns:
+        tuple[dict[int, npt.NDArray[np.int64]], dict[int, npt.NDArray[np.int64]]]: Sorted cell ids of the
+            surface cells and of the volume cells, for each region marker
+    """
+    markers: npt.NDArray[ Any ] = vtk_to_numpy( ugrid.GetCellData().GetArray( attr ) )
+    cell_types: npt.NDArray[ np.uint8 ] = vtk_to_numpy( ugrid.GetCellTypesArray() )
+    is_marked: npt.NDArray[ np.bool_ ] = np.isfinite( markers ) & ( markers == np.floor( markers ) )
+
+    partitions: list[ dict[ int, npt.NDArray[ np.int64 ] ] ] = []
+    for types in ( SURFACE_CELL_TYPES, VOLUME_CELL_TYPES ):
+        cell_ids: npt.NDArray[ np.int64 ] = np.flatnonzero( is_marked & np.isin( cell_types, types ) )
+        # stable sort keeps cell ids sorted inside each region
+        cell_ids = cell_ids[ np.argsort( markers[ cell_ids ], kind="stable" ) ]
+        region_ids, starts = np.unique( markers[ cell_ids ], return_index=True )
+        partitions.append( {
+            int( region_id ): ids
+            for region_id, ids in zip( region_ids.tolist(), np.split( cell_ids, starts[ 1: ] ) )
+        } )
+
+    return partitions[ 0 ], partitions[ 1 ]
+
+
+def _extract_cells( ugrid: vtk.vtkUnstructuredGrid, cell_ids: npt.NDArray[ np.int64 ] ) -> vtk.vtkUnstructuredGrid:
+    """Extracts the given cells of the mesh.
+
+    Args:
+        ugrid (vtk.vtkUnstructuredGrid): Input mesh
+        cell_ids (npt.NDArray[np.int64]): Sorted and unique ids of the cells to extract
+
+    Returns:
+        vtk.vtkUnstructuredGrid: Mesh made of the extracted cells
+    """
+    extract = vtk.vtkExtractCells()
+    extract.SetInputData( ugrid )
+    extract.SetCellIds( cell_ids, cell_ids.size )
+    extract.AssumeSortedAndUniqueIdsOn()
+    extract.Update()
+
+    output: vtk.vtkUnstructuredGrid = extract.GetOutputDataObject( 0 )
+    # vtkExtractCells adds an original cell ids array that vtkThreshold did not provide
+    if not ugrid.GetCellData().HasArray( "vtkOriginalCellIds" ):
+        output.GetCellData().RemoveArray( "vtkOriginalCellIds" )
+    return output
+
+
 def _read_vtk_data_repository(
     file_path: str,
     mesh: ElementTree.Element,
@@ -386,73 +457,39 @@ def _read_vtk_data_repository(
 
         ugrid: vtk.vtkUnstructuredGrid = reader.GetOutputDataObject( 0 )  # use pv.wrap()
 
-        attr_array = ugrid.GetCellData().GetArray( attr )
-        [ attr_min, attr_max ] = attr_array.GetRange()
+        surfaces, regions = _split_cells_by_region( ugrid, attr )
 
         # load surfaces
-        for i in range( int( attr_min ), int( attr_max + 1 ) ):
-            threshold = vtk.vtkThreshold()
-            threshold.SetInputData( ugrid )
-            threshold.SetUpperThreshold( i )
-            threshold.SetLowerThreshold( i )
-            threshold.SetInputArrayToProcess( 0, 0, 0, vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS, attr )
-
-            extract = vtk.vtkExtractCellsByType()
-            extract.SetInputConnection( threshold.GetOutputPort() )
-            extract.AddCellType( vtk.VTK_QUAD )
-            extract.AddCellType( vtk.VTK_TRIANGLE )
-            extract.AddCellType( vtk.VTK_POLYGON )
-            extract.Update()
-
-            if extract.GetOutputDataObject( 0 ).GetNumberOfCells() != 0:
-                p = vtk.vtkPartitionedDataSet()
-                p.SetNumberOfPartitions( 1 )
-                p.SetPartition( 0, extract.GetOutputDataObject( 0 ) )
-                collection.SetPartitionedDataSet( count, p )
-
-                collection.GetMetaData( count ).Set( vtk.vtkCompositeDataSet.NAME(), "Surface" + str( i - 1 ) )
-
-                node = assembly.AddNode( "Surface", id_surf )  # + str(i - 1)
-                assembly.SetAttribute( node, "label", "Surface" + str( i - 1 ) )
-                # assembly.SetAttribute(id_surf_i, "type", TreeViewNodeType.REPRESENTATION)
-                # assembly.SetAttribute(id_surf_i, "number_of_partitions", collection.GetNumberOfPartitions(count));
-                assembly.AddDataSetIndex( node, count )
-                count = count + 1
+        for i, cell_ids in surfaces.items():
+            p = vtk.vtkPartitionedDataSet()
+            p.SetNumberOfPartitions( 1 )
+            p.SetPartition( 0, _extract_cells( ugrid, cell_ids ) )
+            collection.SetPartitionedDataSet( count, p )
+
+            collection.GetMetaData( count ).Set( vtk.vtkCompositeDataSet.NAME(), "Surface" + str( i - 1 ) )
+
+            node = assembly.AddNode( "Surface", id_surf )  # + str(i - 1)
+            assembly.SetAttribute( node, "label", "Surface" + str( i - 1 ) )
+            # assembly.SetAttribute(id_surf_i, "type", TreeViewNodeType.REPRESENTATION)
+            # assembly.SetAttribute(id_surf_i, "number_of_partitions", collection.GetNumberOfPartitions(count));
+            assembly.AddDataSetIndex( node, count )
+            count = count + 1
 
         # load regions
-        for i in range( int( attr_min ), int( attr_max + 1 ) ):
-            threshold = vtk.vtkThreshold()
-            threshold.SetInputData( ugrid )
-            threshold.SetUpperThreshold( i )
-            threshold.SetLowerThreshold( i )
-            threshold.SetInputArrayToProcess( 0, 0, 0, vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS, attr )
-
-            extract = vtk.vtkExtractCellsByType()
-            extract.SetInputConnection( threshold.GetOutputPort() )
-            extract.AddCellType( vtk.VTK_HEXAHEDRON )
-            extract.AddCellType( vtk.VTK_TETRA )
-            extract.AddCellType( vtk.VTK_WEDGE )
-            extract.AddCellType( vtk.VTK_PYRAMID )
-            extract.AddCellType( vtk.VTK_VOXEL )
-            extract.AddCellType( vtk.VTK_PENTAGONAL_PRISM )
-            extract.AddCellType( vtk.VTK_HEXAGONAL_PRISM )
-            extract.AddCellType( vtk.VTK_POLYHEDRON )
-            extract.Update()
-
-            if extract.GetOutputDataObject( 0 ).GetNumberOfCells() != 0:
-                p = vtk.vtkPartitionedDataSet()
-                p.SetNumberOfPartitions( 1 )
-                p.SetPartition( 0, extract.GetOutputDataObject( 0 ) )
-                collection.SetPartitionedDataSet( count, p )
-
-                collection.GetMetaData( count ).Set( vtk.vtkCompositeDataSet.NAME(), "Region" + str( i - 1 ) )
-
-                node = assembly.AddNode( "Region", id_mesh )  # + str(i - 1)
-                assembly.SetAttribute( node, "label", "Region" + str( i - 1 ) )
-                # assembly.SetAttribute(node, "type", TreeViewNodeType.REPRESENTATION)
-                # assembly.SetAttribute(node, "number_of_partitions", collection.GetNumberOfPartitions(count));
-                assembly.AddDataSetIndex( node, count )
-                count = count + 1
+        for i, cell_ids in regions.items():
+            p = vtk.vtkPartitionedDataSet()
+            p.SetNumberOfPartitions( 1 )
+            p.SetPartition( 0, _extract_cells( ugrid, cell_ids ) )
+            collection.SetPartitionedDataSet( count, p )
+
+            collection.GetMetaData( count ).Set( vtk.vtkCompositeDataSet.NAME(), "Region" + str( i - 1 ) )
+
+            node = assembly.AddNode( "Region", id_mesh )  # + str(i - 1)
+            assembly.SetAttribute( node, "label", "Region" + str( i - 1 ) )
+            # assembly.SetAttribute(node, "type", TreeViewNodeType.REPRESENTATION)
+            # assembly.SetAttribute(node, "number_of_partitions", collection.GetNumberOfPartitions(count));
+            assembly.AddDataSetIndex( node, count )
+            count = count + 1
 
     elif path.suffix in COMPOSITE_DATA_READERS:
         try:
@@ -16,7 +16,6 @@ from vtkmodules.vtkRenderingCore import vtkActor
 from vtkmodules.vtkFiltersCore import vtkExtractCells
 
 from geos_xml_viewer.filters.geosDeckReader import GeosDeckReader
-from geos_xml_viewer.geos.models.schema import Problem
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
@@ -184,6 +183,8 @@ class SetVisibilitiesCallback:
 
 def find_surfaces( xmlFile: str ) -> list[ str ]:
     """Find all surfaces in xml file."""
+    from geos_xml_viewer.geos.models.schema import Problem
+
     config = ParserConfig(
         base_url=None,
         load_dtd=False,
@@ -2,201 +2,12 @@
 # SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
 # SPDX-FileContributor: Lionel Untereiner
 
-from geos_xml_viewer.geos.models.schema import (
-    AcousticFirstOrderSemtype,
-    AcousticSemtype,
-    AcousticVtisemtype,
-    AquiferType,
-    BenchmarksType,
-    BiotPorosityType,
-    BlackOilFluidType,
-    BlueprintType,
-    BoxType,
-    BrooksCoreyBakerRelativePermeabilityType,
-    BrooksCoreyCapillaryPressureType,
-    BrooksCoreyRelativePermeabilityType,
-    BrooksCoreyStone2RelativePermeabilityType,
-    CarmanKozenyPermeabilityType,
-    CellElementRegionType,
-    CeramicDamageType,
-    ChomboIotype,
-    Co2BrineEzrokhiFluidType,
-    Co2BrineEzrokhiThermalFluidType,
-    Co2BrinePhillipsFluidType,
-    Co2BrinePhillipsThermalFluidType,
-    CompositeFunctionType,
-    CompositionalMultiphaseFluidType,
-    CompositionalMultiphaseFvmtype,
-    CompositionalMultiphaseHybridFvmtype,
-    CompositionalMultiphaseReservoirPoromechanicsInitializationType,
-    CompositionalMultiphaseReservoirPoromechanicsType,
-    CompositionalMultiphaseReservoirType,
-    CompositionalMultiphaseStatisticsType,
-    CompositionalMultiphaseWellType,
-    CompositonalTwoPhaseFluidPengRobinsonType,
-    CompositonalTwoPhaseFluidSoaveRedlichKwongType,
-    CompressibleSinglePhaseFluidType,
-    CompressibleSolidCarmanKozenyPermeabilityType,
-    CompressibleSolidConstantPermeabilityType,
-    CompressibleSolidExponentialDecayPermeabilityType,
-    CompressibleSolidParallelPlatesPermeabilityType,
-    CompressibleSolidSlipDependentPermeabilityType,
-    CompressibleSolidWillisRichardsPermeabilityType,
-    ConstantDiffusionType,
-    ConstantPermeabilityType,
-    ConstitutiveType,
-    CoulombType,
-    CrusherType,
-    CustomPolarObjectType,
-    CylinderType,
-    DamageElasticIsotropicType,
-    DamageSpectralElasticIsotropicType,
-    DamageVolDevElasticIsotropicType,
-    DeadOilFluidType,
-    DelftEggType,
-    DirichletType,
-    DiscType,
-    DruckerPragerType,
-    ElasticFirstOrderSemtype,
-    ElasticIsotropicPressureDependentType,
-    ElasticIsotropicType,
-    ElasticOrthotropicType,
-    ElasticSemtype,
-    ElasticTransverseIsotropicType,
-    ElementRegionsType,
-    EmbeddedSurfaceGeneratorType,
-    EventsType,
-    ExponentialDecayPermeabilityType,
-    ExtendedDruckerPragerType,
-    FieldSpecificationsType,
-    FieldSpecificationType,
-    FileType,
-    FiniteElementSpaceType,
-    FiniteElementsType,
-    FiniteVolumeType,
-    FlowProppantTransportType,
-    FrictionlessContactType,
-    FunctionsType,
-    GeometryType,
-    HaltEventType,
-    HybridMimeticDiscretizationType,
-    HydrofractureType,
-    HydrostaticEquilibriumType,
-    IncludedType,
-    InternalMeshType,
-    InternalWellboreType,
-    InternalWellType,
-    JfunctionCapillaryPressureType,
-    LagrangianContactType,
-    LaplaceFemtype,
-    LassenType,
-    LinearIsotropicDispersionType,
-    LinearSolverParametersType,
-    MeshType,
-    ModifiedCamClayType,
-    MultiPhaseConstantThermalConductivityType,
-    MultiphasePoromechanicsInitializationType,
-    MultiphasePoromechanicsReservoirType,
-    MultiphasePoromechanicsType,
-    MultiPhaseVolumeWeightedThermalConductivityType,
-    MultivariableTableFunctionType,
-    NonlinearSolverParametersType,
-    NullModelType,
-    NumericalMethodsType,
-    OutputsType,
-    PackCollectionType,
-    ParallelPlatesPermeabilityType,
-    ParametersType,
-    ParameterType,
-    ParticleFluidType,
-    ParticleMeshType,
-    ParticleRegionsType,
-    ParticleRegionType,
-    PerfectlyPlasticType,
-    PerforationType,
-    PeriodicEventType,
-    PermeabilityBaseType,
-    PhaseFieldDamageFemtype,
-    PhaseFieldFractureType,
-    Pmltype,
-    PorousDelftEggType,
-    PorousDruckerPragerType,
-    PorousElasticIsotropicType,
-    PorousElasticOrthotropicType,
-    PorousElasticTransverseIsotropicType,
-    PorousExtendedDruckerPragerType,
-    PorousModifiedCamClayType,
-    PressurePorosityType,
-    Problem,
-    ProblemType,
-    ProppantPermeabilityType,
-    ProppantPorosityType,
-    ProppantSlurryFluidType,
-    ProppantSolidProppantPermeabilityType,
-    ProppantTransportType,
-    PvtdriverType,
-    PythonType,
-    QuartzType,
-    ReactiveBrineThermalType,
-    ReactiveBrineType,
-    ReactiveCompositionalMultiphaseObltype,
-    ReactiveFluidDriverType,
-    RectangleType,
-    RelpermDriverType,
-    RestartType,
-    RunType,
-    SiloType,
-    SinglePhaseConstantThermalConductivityType,
-    SinglePhaseFvmtype,
-    SinglePhaseHybridFvmtype,
-    SinglePhasePoromechanicsConformingFracturesType,
-    SinglePhasePoromechanicsEmbeddedFracturesType,
-    SinglePhasePoromechanicsInitializationType,
-    SinglePhasePoromechanicsReservoirType,
-    SinglePhasePoromechanicsType,
-    SinglePhaseProppantFvmtype,
-    SinglePhaseReservoirPoromechanicsInitializationType,
-    SinglePhaseReservoirPoromechanicsType,
-    SinglePhaseReservoirType,
-    SinglePhaseStatisticsType,
-    SinglePhaseWellType,
-    SlipDependentPermeabilityType,
-    SolidInternalEnergyType,
-    SolidMechanicsEmbeddedFracturesType,
-    SolidMechanicsLagrangianFemtype,
-    SolidMechanicsLagrangianSsletype,
-    SolidMechanicsMpmtype,
-    SolidMechanicsStateResetType,
-    SolidMechanicsStatisticsType,
-    SoloEventType,
-    SolversType,
-    SourceFluxType,
-    SurfaceElementRegionType,
-    SurfaceGeneratorType,
-    SymbolicFunctionType,
-    TableCapillaryPressureType,
-    TableFunctionType,
-    TableRelativePermeabilityHysteresisType,
-    TableRelativePermeabilityType,
-    TasksType,
-    ThermalCompressibleSinglePhaseFluidType,
-    ThickPlaneType,
-    TimeHistoryType,
-    TractionType,
-    TriaxialDriverType,
-    TwoPointFluxApproximationType,
-    VanGenuchtenBakerRelativePermeabilityType,
-    VanGenuchtenCapillaryPressureType,
-    VanGenuchtenStone2RelativePermeabilityType,
-    ViscoDruckerPragerType,
-    ViscoExtendedDruckerPragerType,
-    ViscoModifiedCamClayType,
-    VtkmeshType,
-    Vtktype,
-    WellControlsType,
-    WellElementRegionType,
-    WillisRichardsPermeabilityType,
-)
+import importlib
+from typing import Any
+
+# The schema module holds several hundreds of dataclasses: it is only imported
+# when one of its types is accessed for the first time.
+_SCHEMA_MODULE = "geos_xml_viewer.geos.models.schema"
 
 __all__ = [
     "AcousticFirstOrderSemtype",
@@ -393,3 +204,17 @@ __all__ = [
     "LassenType",
     "QuartzType",
 ]
+
+
+def __getattr__( name: str ) -> Any:
+    """Load the schema type ``name`` on first access."""
+    if name not in __all__:
+        raise AttributeError( f"module {__name__!r} has no attribute {name!r}" )
+    value = getattr( importlib.import_module( _SCHEMA_MODULE ), name )
+    globals()[ name ] = value
+    return value
+
+
+def __dir__() -> list[ str ]:
+    """List the module attributes including the lazily loaded schema types."""
+    return sorted( set( globals() ) | set( __all__ ) )
@@ -4,6 +4,11 @@
 
 from pathlib import Path
 
+import numpy as np
+import vtk  # type: ignore[import-untyped]
+from vtk.util.numpy_support import numpy_to_vtk
+
+from geos_xml_viewer.algorithms.deck import _split_cells_by_region
 from geos_xml_viewer.filters.geosDeckReader import GeosDeckReader
 
 # Dir containing the files
@@ -21,3 +26,26 @@ def test_DeckReader() -> None:
     reader.Update()
     assert ( reader.GetOutputDataObject( 0 ).GetClassName() == "vtkPartitionedDataSetCollection" )
     assert reader.GetOutputDataObject( 0 ).GetNumberOfPartitionedDataSets() == 5
+
+
+def test_SplitCellsByRegion() -> None:
+    """Test the single pass partitioning of the cells by region marker and dimension."""
+    image = vtk.vtkImageData()
+    image.SetDimensions( 4, 2, 2 )
+    append = vtk.vtkAppendFilter()
+    append.AddInputData( image )
+    append.Update()
+    ugrid = append.GetOutput()
+    # add two triangles
+    for ids in ( ( 0, 1, 4 ), ( 1, 2, 5 ) ):
+        ugrid.InsertNextCell( vtk.VTK_TRIANGLE, 3, ids )
+    markers = numpy_to_vtk( np.array( [ 5.0, 1.0, 5.0, 1.0, 3.5 ] ) )
+    markers.SetName( "attribute" )
+    ugrid.GetCellData().AddArray( markers )
+
+    surfaces, regions = _split_cells_by_region( ugrid, "attribute" )
+    assert list( surfaces.keys() ) == [ 1 ]
+    assert surfaces[ 1 ].tolist() == [ 3 ]
+    assert list( regions.keys() ) == [ 1, 5 ]
+    assert regions[ 1 ].tolist() == [ 1 ]
+    assert regions[ 5 ].tolist() == [ 0, 2 ]
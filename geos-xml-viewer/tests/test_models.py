@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright 2023-2024 TotalEnergies.
+# SPDX-FileContributor: Lionel Untereiner
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCHEMA_MODULE = "geos_xml_viewer.geos.models.schema"
+# run the subprocesses with the same import paths as the test session
+ENV = { **os.environ, "PYTHONPATH": os.pathsep.join( sys.path ) }
+
+
+def test_lazyModels() -> None:
+    """Test that schema types are only loaded on first access."""
+    code = ( "import sys\n"
+             "import geos_xml_viewer.geos.models as models\n"
+             f"assert '{SCHEMA_MODULE}' not in sys.modules\n"
+             "assert 'BoxType' in dir(models)\n"
+             "box = models.BoxType\n"
+             f"assert '{SCHEMA_MODULE}' in sys.modules\n"
+             f"assert box is sys.modules['{SCHEMA_MODULE}'].BoxType\n" )
+    subprocess.run( [ sys.executable, "-c", code ], check=True, env=ENV )
+
+
+def test_unknownModel() -> None:
+    """Test that unknown names still raise AttributeError."""
+    import geos_xml_viewer.geos.models as models
+
+    with pytest.raises( AttributeError ):
+        models.NotASchemaType  # noqa: B018
+
+
+def test_modelsExportSchemaTypes() -> None:
+    """Test that every exported name resolves to the schema type of the same name."""
+    import geos_xml_viewer.geos.models as models
+
+    schema = importlib.import_module( SCHEMA_MODULE )
+    assert models.__all__
+    for name in models.__all__:
+        assert getattr( models, name ) is getattr( schema, name )